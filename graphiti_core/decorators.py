@@ -19,92 +19,81 @@ import inspect
 from collections.abc import Awaitable, Callable
 from typing import Any, TypeVar
 
-from graphiti_core.driver.driver import GraphProvider
 from graphiti_core.helpers import semaphore_gather
-from graphiti_core.search.search_config import SearchResults
 
 F = TypeVar('F', bound=Callable[..., Awaitable[Any]])
 
 
 def handle_multiple_group_ids(func: F) -> F:
     """
-    Decorator for FalkorDB methods that need to handle multiple group_ids.
-    Runs the function for each group_id separately and merges results.
+    Decorator for methods that need to handle group_ids stored in several databases, like
+    FalkorDB graphs or routed Neo4j databases. Runs the function for the group_ids of each
+    database separately and concatenates the results. Searches merge across databases
+    themselves, ranking the results of every database together.
     """
+    # Resolved once, rather than on every call
+    signature = _signature(func)
 
     @functools.wraps(func)
     async def wrapper(self, *args, **kwargs):
-        group_ids_func_pos = get_parameter_position(func, 'group_ids')
-        group_ids_pos = (
-            group_ids_func_pos - 1 if group_ids_func_pos is not None else None
-        )  # Adjust for zero-based index
-        group_ids = kwargs.get('group_ids')
-
-        # If not in kwargs and position exists, get from args
-        if group_ids is None and group_ids_pos is not None and len(args) > group_ids_pos:
-            group_ids = args[group_ids_pos]
-
-        # Only handle FalkorDB with multiple group_ids
-        if (
-            hasattr(self, 'clients')
-            and hasattr(self.clients, 'driver')
-            and self.clients.driver.provider == GraphProvider.FALKORDB
-            and group_ids
-            and len(group_ids) > 1
-        ):
-            # Execute for each group_id concurrently
-            driver = self.clients.driver
-
-            async def execute_for_group(gid: str):
-                # Remove group_ids from args if it was passed positionally
-                filtered_args = list(args)
-                if group_ids_pos is not None and len(args) > group_ids_pos:
-                    filtered_args.pop(group_ids_pos)
-
-                return await func(
-                    self,
-                    *filtered_args,
-                    **{**kwargs, 'group_ids': [gid], 'driver': driver.clone(database=gid)},
-                )
-
-            results = await semaphore_gather(
-                *[execute_for_group(gid) for gid in group_ids],
-                max_coroutines=getattr(self, 'max_coroutines', None),
-            )
-
-            # Merge results based on type
-            if isinstance(results[0], SearchResults):
-                return SearchResults.merge(results)
-            elif isinstance(results[0], list):
-                return [item for result in results for item in result]
-            elif isinstance(results[0], tuple):
-                # Handle tuple outputs (like build_communities returning (nodes, edges))
-                merged_tuple = []
-                for i in range(len(results[0])):
-                    component_results = [result[i] for result in results]
-                    if isinstance(component_results[0], list):
-                        merged_tuple.append(
-                            [item for component in component_results for item in component]
-                        )
-                    else:
-                        merged_tuple.append(component_results)
-                return tuple(merged_tuple)
-            else:
-                return results
-
-        # Normal execution
-        return await func(self, *args, **kwargs)
+        bound = signature.bind(self, *args, **kwargs)
+        group_ids = bound.arguments.get('group_ids')
+
+        shards = (
+            self.clients.driver.shard_group_ids(group_ids)
+            if hasattr(self, 'clients') and hasattr(self.clients, 'driver') and group_ids
+            else []
+        )
+        if len(shards) == 1 and bound.arguments.get('driver') is None:
+            # A single database is still routed to, rather than the default one
+            bound.arguments['driver'] = shards[0][0]
+            return await func(*bound.args, **bound.kwargs)
+        if len(shards) < 2:
+            return await func(self, *args, **kwargs)
+
+        async def execute_for_shard(driver, shard_group_ids: list[str] | None):
+            shard_call = signature.bind(self, *args, **kwargs)
+            shard_call.arguments['group_ids'] = shard_group_ids
+            shard_call.arguments['driver'] = driver
+            return await func(*shard_call.args, **shard_call.kwargs)
+
+        results = await semaphore_gather(
+            *[execute_for_shard(driver, shard_group_ids) for driver, shard_group_ids in shards],
+            max_coroutines=getattr(self, 'max_coroutines', None),
+        )
+
+        # Merge results based on type
+        if isinstance(results[0], list):
+            return [item for result in results for item in result]
+        elif isinstance(results[0], tuple):
+            # Handle tuple outputs (like build_communities returning (nodes, edges))
+            merged_tuple = []
+            for i in range(len(results[0])):
+                component_results = [result[i] for result in results]
+                if isinstance(component_results[0], list):
+                    merged_tuple.append(
+                        [item for component in component_results for item in component]
+                    )
+                else:
+                    merged_tuple.append(component_results)
+            return tuple(merged_tuple)
+        else:
+            return results
 
     return wrapper  # type: ignore
 
 
+@functools.cache
+def _signature(func: Callable) -> inspect.Signature:
+    return inspect.signature(func)
+
+
 def get_parameter_position(func: Callable, param_name: str) -> int | None:
     """
     Returns the positional index of a parameter in the function signature.
     If the parameter is not found, returns None.
     """
-    sig = inspect.signature(func)
-    for idx, (name, _param) in enumerate(sig.parameters.items()):
+    for idx, name in enumerate(_signature(func).parameters):
         if name == param_name:
             return idx
     return None
@@ -18,15 +18,19 @@ import copy
 import logging
 import os
 from abc import ABC, abstractmethod
-from collections.abc import Coroutine
+from collections.abc import Awaitable, Callable, Coroutine
 from enum import Enum
-from typing import Any
+from time import monotonic
+from typing import TYPE_CHECKING, Any
 
 from dotenv import load_dotenv
 
 from graphiti_core.driver.graph_operations.graph_operations import GraphOperationsInterface
 from graphiti_core.driver.search_interface.search_interface import SearchInterface
 
+if TYPE_CHECKING:
+    from graphiti_core.search.adjacency_cache import AdjacencyCache
+
 logger = logging.getLogger(__name__)
 
 DEFAULT_SIZE = 10
@@ -38,6 +42,9 @@ EPISODE_INDEX_NAME = os.environ.get('EPISODE_INDEX_NAME', 'episodes')
 COMMUNITY_INDEX_NAME = os.environ.get('COMMUNITY_INDEX_NAME', 'communities')
 ENTITY_EDGE_INDEX_NAME = os.environ.get('ENTITY_EDGE_INDEX_NAME', 'entity_edges')
 
+# How long a missing vector index is cached before checking again, e.g. while it populates
+VECTOR_INDEX_RECHECK_SECONDS = float(os.getenv('VECTOR_INDEX_RECHECK_SECONDS', 60))
+
 
 class GraphProvider(Enum):
     NEO4J = 'neo4j'
@@ -46,6 +53,33 @@ class GraphProvider(Enum):
     NEPTUNE = 'neptune'
 
 
+class VectorIndexCache:
+    """
+    Remembers which vector indexes are ready to query in each database. A missing index is
+    looked up again after VECTOR_INDEX_RECHECK_SECONDS, so one that is still populating is
+    picked up once it comes online.
+    """
+
+    def __init__(self):
+        self._listings: dict[str, tuple[float, set[str]]] = {}
+
+    async def exists(
+        self, database: str, name: str, list_indices: Callable[[], Awaitable[set[str]]]
+    ) -> bool:
+        listing = self._listings.get(database)
+        if listing is not None:
+            listed_at, names = listing
+            if name in names or monotonic() - listed_at < VECTOR_INDEX_RECHECK_SECONDS:
+                return name in names
+
+        names = await list_indices()
+        self._listings[database] = (monotonic(), names)
+        return name in names
+
+    def invalidate(self, database: str):
+        self._listings.pop(database, None)
+
+
 class GraphDriverSession(ABC):
     provider: GraphProvider
 
@@ -79,6 +113,7 @@ class GraphDriver(ABC):
     default_group_id: str = ''
     search_interface: SearchInterface | None = None
     graph_operations_interface: GraphOperationsInterface | None = None
+    adjacency_cache: 'AdjacencyCache | None' = None
 
     @abstractmethod
     def execute_query(self, cypher_query_: str, **kwargs: Any) -> Coroutine:
@@ -110,10 +145,39 @@ class GraphDriver(ABC):
     async def build_indices_and_constraints(self, delete_existing: bool = False):
         raise NotImplementedError()
 
+    async def vector_index_exists(self, name: str) -> bool:
+        """
+        Whether the named vector index exists and can be queried. Searches fall back to
+        scoring every candidate when it does not.
+        """
+        return False
+
+    async def index_embeddings(self, nodes: list[Any], edges: list[Any]) -> None:
+        """
+        Called after entity nodes and edges are saved, for drivers that keep embeddings in
+        vector indexes of their own rather than indexing the stored properties.
+        """
+        return None
+
+    async def remove_embeddings(
+        self, uuids: list[str] | None = None, group_id: str | None = None
+    ) -> None:
+        """Called after entity nodes and edges are deleted, by uuid or by group."""
+        return None
+
     def clone(self, database: str) -> 'GraphDriver':
         """Clone the driver with a different database or graph name."""
         return self
 
+    def shard_group_ids(
+        self, group_ids: list[str] | None
+    ) -> list[tuple['GraphDriver', list[str] | None]]:
+        """
+        Splits group_ids across the databases that hold them, returning the driver and group_ids
+        to search in each. Searches spanning several shards query each one and merge the results.
+        """
+        return [(self, group_ids)]
+
     def build_fulltext_query(
         self, query: str, group_ids: list[str] | None = None, max_query_length: int = 128
     ) -> str:
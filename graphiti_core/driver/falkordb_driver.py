@@ -33,8 +33,18 @@ else:
             'Install it with: pip install graphiti-core[falkordb]'
         ) from None
 
-from graphiti_core.driver.driver import GraphDriver, GraphDriverSession, GraphProvider
-from graphiti_core.graph_queries import get_fulltext_indices, get_range_indices
+from graphiti_core.driver.driver import (
+    GraphDriver,
+    GraphDriverSession,
+    GraphProvider,
+    VectorIndexCache,
+)
+from graphiti_core.graph_queries import (
+    VECTOR_INDEX_FIELDS,
+    get_fulltext_indices,
+    get_range_indices,
+    get_vector_indices,
+)
 from graphiti_core.utils.datetime_utils import convert_datetimes_to_strings
 
 logger = logging.getLogger(__name__)
@@ -143,6 +153,9 @@ class FalkorDriver(GraphDriver):
         """
         super().__init__()
         self._database = database
+        self._vector_index_cache = VectorIndexCache()
+        # Drivers for the other graphs on this connection, shared by all of them
+        self._clones: dict[str, FalkorDriver] = {}
         if falkor_db is not None:
             # If a FalkorDB instance is provided, use it directly
             self.client = falkor_db
@@ -245,9 +258,33 @@ class FalkorDriver(GraphDriver):
     async def build_indices_and_constraints(self, delete_existing=False):
         if delete_existing:
             await self.delete_all_indexes()
-        index_queries = get_range_indices(self.provider) + get_fulltext_indices(self.provider)
+        index_queries = (
+            get_range_indices(self.provider)
+            + get_fulltext_indices(self.provider)
+            + get_vector_indices(self.provider)
+        )
         for query in index_queries:
             await self.execute_query(query)
+        self._vector_index_cache.invalidate(self._database)
+
+    async def vector_index_exists(self, name: str) -> bool:
+        return await self._vector_index_cache.exists(
+            self._database, name, self._list_vector_indices
+        )
+
+    async def _list_vector_indices(self) -> set[str]:
+        result = await self.execute_query('CALL db.indexes()')
+        if not result:
+            return set()
+
+        records, _, _ = result
+        indexed_fields = {
+            (record['label'], field_name)
+            for record in records
+            for field_name, index_type in record['types'].items()
+            if 'VECTOR' in index_type
+        }
+        return {name for name, fields in VECTOR_INDEX_FIELDS.items() if fields in indexed_fields}
 
     def clone(self, database: str) -> 'GraphDriver':
         """
@@ -255,13 +292,22 @@ class FalkorDriver(GraphDriver):
         Reuses the same connection (e.g. FalkorDB, Neo4j).
         """
         if database == self._database:
-            cloned = self
-        elif database == self.default_group_id:
-            cloned = FalkorDriver(falkor_db=self.client)
-        else:
-            # Create a new instance of FalkorDriver with the same connection but a different database
-            cloned = FalkorDriver(falkor_db=self.client, database=database)
-
+            return self
+
+        cloned = self._clones.get(database)
+        if cloned is None:
+            if database == self.default_group_id:
+                cloned = FalkorDriver(falkor_db=self.client)
+            else:
+                # Create a new instance of FalkorDriver with the same connection but a different database
+                cloned = FalkorDriver(falkor_db=self.client, database=database)
+            # Clones are kept, so the indices of each graph are only built the first time
+            cloned._clones = self._clones
+            cloned._vector_index_cache = self._vector_index_cache
+            self._clones[database] = cloned
+
+        cloned.search_interface = self.search_interface
+        cloned.adjacency_cache = self.adjacency_cache
         return cloned
 
     async def health_check(self) -> None:
@@ -328,6 +374,20 @@ class FalkorDriver(GraphDriver):
         sanitized = ' '.join(sanitized.split())
         return sanitized
 
+    def shard_group_ids(
+        self, group_ids: list[str] | None
+    ) -> list[tuple['GraphDriver', list[str] | None]]:
+        # Each group is stored in a graph of its own, the default group in this driver's graph
+        if not group_ids:
+            return [(self, group_ids)]
+        return [
+            (
+                self if group_id == self.default_group_id else self.clone(database=group_id),
+                [group_id],
+            )
+            for group_id in dict.fromkeys(group_ids)
+        ]
+
     def build_fulltext_query(
         self, query: str, group_ids: list[str] | None = None, max_query_length: int = 128
     ) -> str:
@@ -340,12 +400,6 @@ class FalkorDriver(GraphDriver):
         - AND is implicit with space: (@group_id:value) (text)
         - OR uses pipe within parentheses: (@group_id:value1|value2)
         """
-        if group_ids is None or len(group_ids) == 0:
-            group_filter = ''
-        else:
-            group_values = '|'.join(group_ids)
-            group_filter = f'(@group_id:{group_values})'
-
         sanitized_query = self.sanitize(query)
 
         # Remove stopwords from the sanitized query
@@ -354,9 +408,18 @@ class FalkorDriver(GraphDriver):
         sanitized_query = ' | '.join(filtered_words)
 
         # If the query is too long return no query
-        if len(sanitized_query.split(' ')) + len(group_ids or '') >= max_query_length:
+        query_length = len(sanitized_query.split(' '))
+        if query_length >= max_query_length:
             return ''
 
+        # Past the length limit the groups are left out of the index query, fulltext searches
+        # also filter their matches by group_id
+        if not group_ids or query_length + len(group_ids) >= max_query_length:
+            group_filter = ''
+        else:
+            group_values = '|'.join(group_ids)
+            group_filter = f'(@group_id:{group_values})'
+
         full_query = group_filter + ' (' + sanitized_query + ')'
 
         return full_query
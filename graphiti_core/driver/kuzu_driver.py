@@ -15,11 +15,16 @@ limitations under the License.
 """
 
 import logging
-from typing import Any
+from typing import Any, cast
 
 import kuzu
 
 from graphiti_core.driver.driver import GraphDriver, GraphDriverSession, GraphProvider
+from graphiti_core.graph_queries import (
+    EDGE_FACT_EMBEDDING_INDEX,
+    ENTITY_NAME_EMBEDDING_INDEX,
+    KUZU_VECTOR_INDEX_TABLES,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -90,6 +95,19 @@ SCHEMA_QUERIES = """
 """
 
 
+def get_vector_schema_queries(embedding_dim: int) -> str:
+    return '\n'.join(
+        f"""
+        CREATE NODE TABLE IF NOT EXISTS {table} (
+            uuid STRING PRIMARY KEY,
+            group_id STRING,
+            embedding FLOAT[{embedding_dim}]
+        );
+        """
+        for table, _ in KUZU_VECTOR_INDEX_TABLES.values()
+    )
+
+
 class KuzuDriver(GraphDriver):
     provider: GraphProvider = GraphProvider.KUZU
     aoss_client: None = None
@@ -98,9 +116,17 @@ class KuzuDriver(GraphDriver):
         self,
         db: str = ':memory:',
         max_concurrent_queries: int = 1,
+        embedding_dim: int | None = None,
     ):
+        """
+        When `embedding_dim` is set, entity name and fact embeddings of that dimension are also
+        stored in HNSW vector indexes from Kuzu's vector extension, and similarity searches
+        query those instead of scoring every row.
+        """
         super().__init__()
         self.db = kuzu.Database(db)
+        self.embedding_dim = embedding_dim
+        self._vector_indices: set[str] = set()
 
         self.setup_schema()
 
@@ -149,8 +175,81 @@ class KuzuDriver(GraphDriver):
     def setup_schema(self):
         conn = kuzu.Connection(self.db)
         conn.execute(SCHEMA_QUERIES)
+        if self.embedding_dim is not None:
+            self._setup_vector_indices(conn, self.embedding_dim)
         conn.close()
 
+    def _setup_vector_indices(self, conn: kuzu.Connection, embedding_dim: int):
+        conn.execute('INSTALL VECTOR; LOAD VECTOR;')
+        conn.execute(get_vector_schema_queries(embedding_dim))
+
+        result = conn.execute('CALL SHOW_INDEXES() RETURN index_name')
+        assert isinstance(result, kuzu.QueryResult)
+        existing = {row[0] for row in cast(list[list[Any]], result.get_all())}
+        for name, (table, _) in KUZU_VECTOR_INDEX_TABLES.items():
+            if name not in existing:
+                conn.execute(
+                    f"CALL CREATE_VECTOR_INDEX('{table}', '{name}', 'embedding', metric := 'cosine')"
+                )
+            self._vector_indices.add(name)
+
+    async def vector_index_exists(self, name: str) -> bool:
+        return name in self._vector_indices
+
+    async def index_embeddings(self, nodes: list[Any], edges: list[Any]) -> None:
+        if not self._vector_indices:
+            return
+
+        await self._replace_embeddings(
+            KUZU_VECTOR_INDEX_TABLES[ENTITY_NAME_EMBEDDING_INDEX][0],
+            [(node.uuid, node.group_id, node.name_embedding) for node in nodes],
+        )
+        await self._replace_embeddings(
+            KUZU_VECTOR_INDEX_TABLES[EDGE_FACT_EMBEDDING_INDEX][0],
+            [(edge.uuid, edge.group_id, edge.fact_embedding) for edge in edges],
+        )
+
+    async def remove_embeddings(
+        self, uuids: list[str] | None = None, group_id: str | None = None
+    ) -> None:
+        if not self._vector_indices:
+            return
+
+        for table, _ in KUZU_VECTOR_INDEX_TABLES.values():
+            if uuids is not None:
+                await self.execute_query(
+                    f'MATCH (x:{table}) WHERE x.uuid IN $uuids DELETE x', uuids=uuids
+                )
+            if group_id is not None:
+                await self.execute_query(
+                    f'MATCH (x:{table} {{group_id: $group_id}}) DELETE x', group_id=group_id
+                )
+
+    async def _replace_embeddings(
+        self, table: str, rows: list[tuple[str, str, list[float] | None]]
+    ):
+        if not rows:
+            return
+
+        # Indexed columns cannot be updated, so rows are deleted and inserted again
+        await self.execute_query(
+            f'MATCH (x:{table}) WHERE x.uuid IN $uuids DELETE x',
+            uuids=[uuid for uuid, _, _ in rows],
+        )
+        embeddings = [
+            {'uuid': uuid, 'group_id': group_id, 'embedding': embedding}
+            for uuid, group_id, embedding in rows
+            if embedding is not None and len(embedding) == self.embedding_dim
+        ]
+        if embeddings:
+            await self.execute_query(
+                f"""
+                UNWIND $embeddings AS row
+                CREATE (:{table} {{uuid: row.uuid, group_id: row.group_id, embedding: row.embedding}})
+                """,
+                embeddings=embeddings,
+            )
+
 
 class KuzuDriverSession(GraphDriverSession):
     provider = GraphProvider.KUZU
@@ -16,14 +16,23 @@ limitations under the License.
 
 import logging
 from collections.abc import Coroutine
-from typing import Any
+from typing import Any, cast
 
 from neo4j import AsyncGraphDatabase, EagerResult
 from neo4j.exceptions import ClientError
 from typing_extensions import LiteralString
 
-from graphiti_core.driver.driver import GraphDriver, GraphDriverSession, GraphProvider
-from graphiti_core.graph_queries import get_fulltext_indices, get_range_indices
+from graphiti_core.driver.driver import (
+    GraphDriver,
+    GraphDriverSession,
+    GraphProvider,
+    VectorIndexCache,
+)
+from graphiti_core.graph_queries import (
+    get_fulltext_indices,
+    get_range_indices,
+    get_vector_indices,
+)
 from graphiti_core.helpers import semaphore_gather
 
 logger = logging.getLogger(__name__)
@@ -39,13 +48,22 @@ class Neo4jDriver(GraphDriver):
         user: str | None,
         password: str | None,
         database: str = 'neo4j',
+        group_databases: dict[str, str] | None = None,
     ):
+        """
+        group_databases routes group_ids to the databases holding them. Episodes of a routed group
+        are written to its database, and searches over groups in several databases query each of
+        them and merge the results. Other groups are kept in `database`.
+        """
         super().__init__()
         self.client = AsyncGraphDatabase.driver(
             uri=uri,
             auth=(user or '', password or ''),
         )
         self._database = database
+        self._default_database = database
+        self.group_databases = group_databases or {}
+        self._vector_index_cache = VectorIndexCache()
 
         # Schedule the indices and constraints to be built
         import asyncio
@@ -87,6 +105,7 @@ class Neo4jDriver(GraphDriver):
     def delete_all_indexes(self) -> Coroutine:
         return self.client.execute_query(
             'CALL db.indexes() YIELD name DROP INDEX name',
+            database_=self._database,
         )
 
     async def _execute_index_query(self, query: LiteralString) -> EagerResult | None:
@@ -104,7 +123,44 @@ class Neo4jDriver(GraphDriver):
                 return None
             raise
 
+    def clone(self, database: str) -> 'GraphDriver':
+        """Returns the driver for the database a group_id is routed to."""
+        if not self.group_databases:
+            return self
+        target = self.group_databases.get(database, self._default_database)
+        return self if target == self._database else self.with_database(target)
+
+    def shard_group_ids(
+        self, group_ids: list[str] | None
+    ) -> list[tuple['GraphDriver', list[str] | None]]:
+        if not self.group_databases:
+            return [(self, group_ids)]
+
+        if group_ids is None:
+            databases = dict.fromkeys([self._default_database, *self.group_databases.values()])
+            return [(self.with_database(database), None) for database in databases]
+
+        shards: dict[str, list[str]] = {}
+        for group_id in group_ids:
+            database = self.group_databases.get(group_id, self._default_database)
+            shards.setdefault(database, []).append(group_id)
+
+        return [
+            (self if database == self._database else self.with_database(database), shard)
+            for database, shard in shards.items()
+        ]
+
     async def build_indices_and_constraints(self, delete_existing: bool = False):
+        # Every database groups are routed to needs its own indices
+        databases = dict.fromkeys([self._database, *self.group_databases.values()])
+        await semaphore_gather(
+            *[
+                cast(Neo4jDriver, self.with_database(database))._build_indices(delete_existing)
+                for database in databases
+            ]
+        )
+
+    async def _build_indices(self, delete_existing: bool):
         if delete_existing:
             await self.delete_all_indexes()
 
@@ -112,9 +168,34 @@ class Neo4jDriver(GraphDriver):
 
         fulltext_indices: list[LiteralString] = get_fulltext_indices(self.provider)
 
-        index_queries: list[LiteralString] = range_indices + fulltext_indices
+        vector_indices: list[LiteralString] = get_vector_indices(self.provider)
+
+        index_queries: list[LiteralString] = range_indices + fulltext_indices + vector_indices
 
         await semaphore_gather(*[self._execute_index_query(query) for query in index_queries])
+        self._vector_index_cache.invalidate(self._database)
+
+    async def vector_index_exists(self, name: str) -> bool:
+        return await self._vector_index_cache.exists(
+            self._database, name, self._list_vector_indices
+        )
+
+    async def _list_vector_indices(self) -> set[str]:
+        try:
+            records, _, _ = await self.execute_query(
+                """
+                SHOW VECTOR INDEXES YIELD name, state
+                WHERE state = 'ONLINE'
+                RETURN name
+                """,
+                routing_='r',
+            )
+        except ClientError as e:
+            # Neo4j versions without vector indexes
+            logger.debug(f'Could not list vector indexes: {e}')
+            return set()
+
+        return {record['name'] for record in records}
 
     async def health_check(self) -> None:
         """Check Neo4j connectivity by running the driver's verify_connectivity method."""
@@ -0,0 +1,384 @@
+"""
+Copyright 2024, Zep Software, Inc.
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+import asyncio
+import json
+import logging
+import shutil
+from collections.abc import Iterable
+from hashlib import sha1
+from pathlib import Path
+from typing import Any
+
+from pydantic import PrivateAttr
+
+from graphiti_core.driver.search_interface.search_interface import SearchInterface
+from graphiti_core.edges import EntityEdge
+from graphiti_core.nodes import EntityNode
+from graphiti_core.search.search_filters import SearchFilters
+from graphiti_core.search.vector_index import (
+    DEFAULT_NPROBE,
+    DEFAULT_QUANTIZATION,
+    IVFFlatIndex,
+    Quantization,
+)
+
+logger = logging.getLogger(__name__)
+
+NODE_PARTITION = 'node'
+EDGE_PARTITION = 'edge'
+ENTITY_LABEL = 'Entity'
+
+GROUPS_FILE = 'groups.json'
+PARTITIONS_FILE = 'partitions.json'
+
+PartitionKey = tuple[str, str, str]
+
+
+class LocalVectorSearchInterface(SearchInterface):
+    """
+    Serves node and edge similarity search from an in-process vector index.
+
+    Each group_id has its own index partitions: entity nodes are indexed under 'Entity' and
+    under each of their custom labels, and entity edges under their edge name, so label and
+    edge type filters only search the matching partitions. A group is loaded from the database
+    the first time it is searched, and the save and delete hooks keep loaded groups in sync.
+    Matches are hydrated from the database, which drops anything deleted behind our back.
+
+    Searches the index cannot answer (no group_ids, date or property filters, endpoint
+    filters, fulltext) raise NotImplementedError, so search_utils runs them against the
+    database instead.
+
+    When `path` is set, the partitions are memory-mapped under that directory and loaded
+    groups survive restarts. The index assumes this process writes every loaded group.
+
+    `quantization` stores float16, int8 or binary codes next to the vectors and scans those,
+    rescoring the best candidates with the full-precision vectors (see IVFFlatIndex).
+    """
+
+    path: str | None = None
+    nprobe: int = DEFAULT_NPROBE
+    quantization: Quantization = DEFAULT_QUANTIZATION
+    rescore_factor: int | None = None
+    bootstrap_page_size: int = 1000
+
+    _partitions: dict[PartitionKey, IVFFlatIndex] = PrivateAttr(default_factory=dict)
+    _partition_dirs: dict[str, PartitionKey] = PrivateAttr(default_factory=dict)
+    _loaded_groups: set[str] = PrivateAttr(default_factory=set)
+    _loading_groups: set[str] = PrivateAttr(default_factory=set)
+    _group_locks: dict[str, asyncio.Lock] = PrivateAttr(default_factory=dict)
+    _dirty: set[PartitionKey] = PrivateAttr(default_factory=set)
+
+    def model_post_init(self, __context: Any):
+        if self.path is None:
+            return
+
+        root = Path(self.path)
+        root.mkdir(parents=True, exist_ok=True)
+        if not (root / GROUPS_FILE).exists():
+            return
+
+        loaded_groups = set(json.loads((root / GROUPS_FILE).read_text()))
+        for directory, key in json.loads((root / PARTITIONS_FILE).read_text()).items():
+            partition_key: PartitionKey = (key[0], key[1], key[2])
+            try:
+                index = IVFFlatIndex.open(
+                    root / directory, nprobe=self.nprobe, rescore_factor=self.rescore_factor
+                )
+            except FileNotFoundError:
+                # The partition was never flushed, so its group has to be reloaded
+                loaded_groups.discard(partition_key[1])
+                continue
+            self._partitions[partition_key] = index
+            self._partition_dirs[directory] = partition_key
+
+        self._loaded_groups = loaded_groups
+        logger.debug(f'Opened local vector index with {len(loaded_groups)} groups')
+
+    async def node_similarity_search(
+        self,
+        driver: Any,
+        search_vector: list[float],
+        search_filter: Any,
+        group_ids: list[str] | None = None,
+        limit: int = 100,
+        min_score: float = 0.7,
+    ) -> list[Any]:
+        if group_ids is None:
+            raise NotImplementedError
+
+        await self._ensure_loaded(driver, group_ids)
+
+        labels = search_filter.node_labels or [ENTITY_LABEL]
+        matches = self._search(
+            [(NODE_PARTITION, group_id, label) for group_id in group_ids for label in labels],
+            search_vector,
+            limit,
+            min_score,
+        )
+
+        return _in_score_order(
+            await EntityNode.get_by_uuids(driver, [uuid for uuid, _ in matches]), matches
+        )
+
+    async def edge_similarity_search(
+        self,
+        driver: Any,
+        search_vector: list[float],
+        source_node_uuid: str | None,
+        target_node_uuid: str | None,
+        search_filter: Any,
+        group_ids: list[str] | None = None,
+        limit: int = 100,
+        min_score: float = 0.7,
+    ) -> list[Any]:
+        if (
+            group_ids is None
+            or source_node_uuid is not None
+            or target_node_uuid is not None
+            or not _is_edge_index_filter(search_filter)
+        ):
+            raise NotImplementedError
+
+        await self._ensure_loaded(driver, group_ids)
+
+        keys = [
+            key
+            for key in self._partitions
+            if key[0] == EDGE_PARTITION
+            and key[1] in group_ids
+            and (search_filter.edge_types is None or key[2] in search_filter.edge_types)
+        ]
+        if search_filter.edge_uuids is None:
+            matches = self._search(keys, search_vector, limit, min_score)
+        else:
+            matches = self._score(keys, search_vector, search_filter.edge_uuids, limit, min_score)
+
+        return _in_score_order(
+            await EntityEdge.get_by_uuids(driver, [uuid for uuid, _ in matches]), matches
+        )
+
+    async def index_entity_nodes(self, driver: Any, nodes: list[Any]) -> None:
+        if self._index_nodes(nodes):
+            self._flush()
+
+    async def index_entity_edges(self, driver: Any, edges: list[Any]) -> None:
+        if self._index_edges(edges):
+            self._flush()
+
+    async def remove_from_index(self, driver: Any, uuids: list[str]) -> None:
+        for key, index in self._partitions.items():
+            if any(uuid in index for uuid in uuids):
+                index.remove(uuids)
+                self._dirty.add(key)
+        self._flush()
+
+    async def remove_group(self, driver: Any, group_id: str) -> None:
+        # The group stays loaded, its partitions are recreated as it is written again
+        for key in [key for key in self._partitions if key[1] == group_id]:
+            del self._partitions[key]
+            self._dirty.discard(key)
+        for directory, key in list(self._partition_dirs.items()):
+            if key[1] == group_id:
+                del self._partition_dirs[directory]
+                if self.path is not None:
+                    shutil.rmtree(Path(self.path) / directory, ignore_errors=True)
+        self._flush()
+
+    async def _ensure_loaded(self, driver: Any, group_ids: list[str]):
+        for group_id in group_ids:
+            if group_id in self._loaded_groups:
+                continue
+
+            lock = self._group_locks.setdefault(group_id, asyncio.Lock())
+            async with lock:
+                if group_id in self._loaded_groups:
+                    continue
+                await self._load_group(driver, group_id)
+
+    async def _load_group(self, driver: Any, group_id: str):
+        # Writes that land while the group is loading are indexed as well
+        self._loading_groups.add(group_id)
+        try:
+            node_count = 0
+            cursor: str | None = None
+            while True:
+                nodes = await EntityNode.get_by_group_ids(
+                    driver,
+                    [group_id],
+                    limit=self.bootstrap_page_size,
+                    uuid_cursor=cursor,
+                    with_embeddings=True,
+                )
+                node_count += self._index_nodes(nodes)
+                if len(nodes) < self.bootstrap_page_size:
+                    break
+                cursor = nodes[-1].uuid
+
+            edge_count = 0
+            cursor = None
+            while True:
+                edges = await EntityEdge.get_by_group_ids(
+                    driver,
+                    [group_id],
+                    limit=self.bootstrap_page_size,
+                    uuid_cursor=cursor,
+                    with_embeddings=True,
+                )
+                edge_count += self._index_edges(edges)
+                if len(edges) < self.bootstrap_page_size:
+                    break
+                cursor = edges[-1].uuid
+
+            self._loaded_groups.add(group_id)
+        finally:
+            self._loading_groups.discard(group_id)
+
+        self._flush()
+        logger.debug(
+            f'Loaded group {group_id} into local vector index: {node_count} nodes, {edge_count} edges'
+        )
+
+    def _index_nodes(self, nodes: Iterable[EntityNode]) -> int:
+        batches: dict[PartitionKey, list[tuple[str, list[float]]]] = {}
+        for node in nodes:
+            if not self._is_tracked(node.group_id) or node.name_embedding is None:
+                continue
+            labels = {ENTITY_LABEL, *node.labels}
+            self._remove_from_other_partitions(NODE_PARTITION, node.group_id, node.uuid, labels)
+            for label in labels:
+                key = (NODE_PARTITION, node.group_id, label)
+                batches.setdefault(key, []).append((node.uuid, node.name_embedding))
+
+        return self._upsert(batches)
+
+    def _index_edges(self, edges: Iterable[EntityEdge]) -> int:
+        batches: dict[PartitionKey, list[tuple[str, list[float]]]] = {}
+        for edge in edges:
+            if not self._is_tracked(edge.group_id) or edge.fact_embedding is None:
+                continue
+            self._remove_from_other_partitions(
+                EDGE_PARTITION, edge.group_id, edge.uuid, {edge.name}
+            )
+            key = (EDGE_PARTITION, edge.group_id, edge.name)
+            batches.setdefault(key, []).append((edge.uuid, edge.fact_embedding))
+
+        return self._upsert(batches)
+
+    def _upsert(self, batches: dict[PartitionKey, list[tuple[str, list[float]]]]) -> int:
+        uuids: set[str] = set()
+        for key, items in batches.items():
+            index = self._partitions.get(key)
+            if index is None:
+                index = self._create_partition(key, len(items[0][1]))
+            index.upsert([uuid for uuid, _ in items], [vector for _, vector in items])
+            self._dirty.add(key)
+            uuids.update(uuid for uuid, _ in items)
+
+        return len(uuids)
+
+    def _search(
+        self, keys: list[PartitionKey], search_vector: list[float], limit: int, min_score: float
+    ) -> list[tuple[str, float]]:
+        return _merge(
+            (
+                self._partitions[key].search(search_vector, limit, min_score)
+                for key in keys
+                if key in self._partitions
+            ),
+            limit,
+        )
+
+    def _score(
+        self,
+        keys: list[PartitionKey],
+        search_vector: list[float],
+        uuids: list[str],
+        limit: int,
+        min_score: float,
+    ) -> list[tuple[str, float]]:
+        return _merge(
+            (self._partitions[key].score(search_vector, uuids, min_score) for key in keys),
+            limit,
+        )
+
+    def _is_tracked(self, group_id: str) -> bool:
+        return group_id in self._loaded_groups or group_id in self._loading_groups
+
+    def _remove_from_other_partitions(self, kind: str, group_id: str, uuid: str, names: set[str]):
+        # Relabeled nodes and renamed edges move between partitions
+        for key, index in self._partitions.items():
+            if key[0] == kind and key[1] == group_id and key[2] not in names and uuid in index:
+                index.remove([uuid])
+                self._dirty.add(key)
+
+    def _create_partition(self, key: PartitionKey, dim: int) -> IVFFlatIndex:
+        path = None
+        if self.path is not None:
+            directory = sha1('\0'.join(key).encode()).hexdigest()[:16]
+            path = Path(self.path) / directory
+            self._partition_dirs[directory] = key
+
+        index = IVFFlatIndex(
+            dim,
+            path=path,
+            nprobe=self.nprobe,
+            quantization=self.quantization,
+            rescore_factor=self.rescore_factor,
+        )
+
+        self._partitions[key] = index
+        return index
+
+    def _flush(self):
+        dirty, self._dirty = self._dirty, set()
+        if self.path is None:
+            return
+
+        for key in dirty:
+            self._partitions[key].flush()
+
+        root = Path(self.path)
+        (root / PARTITIONS_FILE).write_text(
+            json.dumps({directory: list(key) for directory, key in self._partition_dirs.items()})
+        )
+        (root / GROUPS_FILE).write_text(json.dumps(sorted(self._loaded_groups)))
+
+
+def _is_edge_index_filter(search_filter: SearchFilters) -> bool:
+    return (
+        search_filter.node_labels is None
+        and search_filter.valid_at is None
+        and search_filter.invalid_at is None
+        and search_filter.created_at is None
+        and search_filter.expired_at is None
+        and search_filter.as_of is None
+        and search_filter.property_filters is None
+    )
+
+
+def _merge(results: Iterable[list[tuple[str, float]]], limit: int) -> list[tuple[str, float]]:
+    scores: dict[str, float] = {}
+    for result in results:
+        for uuid, score in result:
+            scores[uuid] = max(score, scores.get(uuid, score))
+
+    return sorted(scores.items(), key=lambda item: item[1], reverse=True)[:limit]
+
+
+def _in_score_order(items: list[Any], matches: list[tuple[str, float]]) -> list[Any]:
+    items_by_uuid = {item.uuid: item for item in items}
+    return [items_by_uuid[uuid] for uuid, _ in matches if uuid in items_by_uuid]
@@ -78,6 +78,21 @@ class SearchInterface(BaseModel):
     ) -> list[Any]:
         raise NotImplementedError
 
+    # ---------- INDEX MAINTENANCE ----------
+    # Called after entity nodes and edges are written or deleted, so implementations that
+    # keep their own index can stay in sync. The default implementation does nothing.
+    async def index_entity_nodes(self, driver: Any, nodes: list[Any]) -> None:
+        return None
+
+    async def index_entity_edges(self, driver: Any, edges: list[Any]) -> None:
+        return None
+
+    async def remove_from_index(self, driver: Any, uuids: list[str]) -> None:
+        return None
+
+    async def remove_group(self, driver: Any, group_id: str) -> None:
+        return None
+
     # ---------- SEARCH FILTERS (sync) ----------
     def build_node_search_filters(self, search_filters: Any) -> Any:
         raise NotImplementedError
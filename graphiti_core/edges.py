@@ -28,7 +28,7 @@ from typing_extensions import LiteralString
 from graphiti_core.driver.driver import GraphDriver, GraphProvider
 from graphiti_core.embedder import EmbedderClient
 from graphiti_core.errors import EdgeNotFoundError, GroupsEdgesNotFoundError
-from graphiti_core.helpers import parse_db_date
+from graphiti_core.helpers import get_embedding_prefix, parse_db_date
 from graphiti_core.models.edges.edge_db_queries import (
     COMMUNITY_EDGE_RETURN,
     EPISODIC_EDGE_RETURN,
@@ -80,6 +80,12 @@ class Edge(BaseModel, ABC):
                 uuid=self.uuid,
             )
 
+        await driver.remove_embeddings(uuids=[self.uuid])
+        if driver.search_interface:
+            await driver.search_interface.remove_from_index(driver, [self.uuid])
+        if driver.adjacency_cache:
+            driver.adjacency_cache.remove(driver, [self.uuid])
+
         logger.debug(f'Deleted Edge: {self.uuid}')
 
     @classmethod
@@ -114,6 +120,12 @@ class Edge(BaseModel, ABC):
                 uuids=uuids,
             )
 
+        await driver.remove_embeddings(uuids=uuids)
+        if driver.search_interface:
+            await driver.search_interface.remove_from_index(driver, uuids)
+        if driver.adjacency_cache:
+            driver.adjacency_cache.remove(driver, uuids)
+
         logger.debug(f'Deleted Edges: {uuids}')
 
     def __hash__(self):
@@ -306,11 +318,20 @@ class EntityEdge(Edge):
             )
         else:
             edge_data.update(self.attributes or {})
+            fact_embedding_prefix = get_embedding_prefix(driver.provider, self.fact_embedding)
+            if fact_embedding_prefix is not None:
+                edge_data['fact_embedding_prefix'] = fact_embedding_prefix
             result = await driver.execute_query(
                 get_entity_edge_save_query(driver.provider),
                 edge_data=edge_data,
             )
 
+        await driver.index_embeddings([], [self])
+        if driver.search_interface:
+            await driver.search_interface.index_entity_edges(driver, [self])
+        if driver.adjacency_cache:
+            driver.adjacency_cache.add_edges(driver, [self])
+
         logger.debug(f'Saved edge to Graph: {self.uuid}')
 
         return result
@@ -574,15 +595,17 @@ def get_episodic_edge_from_record(record: Any) -> EpisodicEdge:
 
 def get_entity_edge_from_record(record: Any, provider: GraphProvider) -> EntityEdge:
     episodes = record['episodes']
+    # Search candidates are returned without attributes
     if provider == GraphProvider.KUZU:
-        attributes = json.loads(record['attributes']) if record['attributes'] else {}
+        attributes = json.loads(record['attributes']) if record.get('attributes') else {}
     else:
-        attributes = record['attributes']
+        attributes = record.get('attributes') or {}
         attributes.pop('uuid', None)
         attributes.pop('source_node_uuid', None)
         attributes.pop('target_node_uuid', None)
         attributes.pop('fact', None)
         attributes.pop('fact_embedding', None)
+        attributes.pop('fact_embedding_prefix', None)
         attributes.pop('name', None)
         attributes.pop('group_id', None)
         attributes.pop('episodes', None)
@@ -21,6 +21,9 @@ from collections.abc import Iterable
 from pydantic import BaseModel, Field
 
 EMBEDDING_DIM = int(os.getenv('EMBEDDING_DIM', 1024))
+# When set, Neo4j also stores the first EMBEDDING_PREFIX_DIM dimensions of each entity name
+# and fact embedding for two-stage similarity search
+EMBEDDING_PREFIX_DIM = int(os.getenv('EMBEDDING_PREFIX_DIM', 0))
 
 
 class EmbedderConfig(BaseModel):
@@ -5,9 +5,13 @@ This module provides database-agnostic query generation for Neo4j and FalkorDB,
 supporting index creation, fulltext search, and bulk operations.
 """
 
+import os
+from typing import cast
+
 from typing_extensions import LiteralString
 
 from graphiti_core.driver.driver import GraphProvider
+from graphiti_core.embedder.client import EMBEDDING_DIM
 
 # Mapping from Neo4j fulltext index names to FalkorDB node labels
 NEO4J_TO_FALKORDB_MAPPING = {
@@ -24,6 +28,27 @@ INDEX_TO_LABEL_KUZU_MAPPING = {
     'edge_name_and_fact': 'RelatesToNode_',
 }
 
+# Vector index names
+ENTITY_NAME_EMBEDDING_INDEX = 'entity_name_embedding'
+COMMUNITY_NAME_EMBEDDING_INDEX = 'community_name_embedding'
+EDGE_FACT_EMBEDDING_INDEX = 'edge_fact_embedding'
+# FalkorDB identifies vector indexes by label and property rather than by name
+VECTOR_INDEX_FIELDS = {
+    ENTITY_NAME_EMBEDDING_INDEX: ('Entity', 'name_embedding'),
+    COMMUNITY_NAME_EMBEDDING_INDEX: ('Community', 'name_embedding'),
+    EDGE_FACT_EMBEDDING_INDEX: ('RELATES_TO', 'fact_embedding'),
+}
+# Kuzu vector indexes require fixed size arrays and cannot be updated in place, so embeddings
+# are mirrored into insert-only tables that carry the index
+KUZU_VECTOR_INDEX_TABLES = {
+    ENTITY_NAME_EMBEDDING_INDEX: ('EntityEmbedding_', 'Entity'),
+    EDGE_FACT_EMBEDDING_INDEX: ('RelatesToNodeEmbedding_', 'RelatesToNode_'),
+}
+
+# Vector indexes return the nearest neighbours across all groups, so searches fetch this many
+# candidates per requested result before filtering on group and search filters
+VECTOR_INDEX_OVERFETCH = int(os.getenv('VECTOR_INDEX_OVERFETCH', 4))
+
 
 def get_range_indices(provider: GraphProvider) -> list[LiteralString]:
     if provider == GraphProvider.FALKORDB:
@@ -71,8 +96,6 @@ def get_range_indices(provider: GraphProvider) -> list[LiteralString]:
 
 def get_fulltext_indices(provider: GraphProvider) -> list[LiteralString]:
     if provider == GraphProvider.FALKORDB:
-        from typing import cast
-
         from graphiti_core.driver.falkordb_driver import STOPWORDS
 
         # Convert to string representation for embedding in queries
@@ -127,6 +150,99 @@ def get_fulltext_indices(provider: GraphProvider) -> list[LiteralString]:
     ]
 
 
+def get_vector_indices(
+    provider: GraphProvider, embedding_dim: int = EMBEDDING_DIM
+) -> list[LiteralString]:
+    if provider == GraphProvider.FALKORDB:
+        options = f"OPTIONS {{dimension: {embedding_dim}, similarityFunction: 'cosine'}}"
+        return cast(
+            list[LiteralString],
+            [
+                f'CREATE VECTOR INDEX FOR (n:Entity) ON (n.name_embedding) {options}',
+                f'CREATE VECTOR INDEX FOR (n:Community) ON (n.name_embedding) {options}',
+                f'CREATE VECTOR INDEX FOR ()-[e:RELATES_TO]-() ON (e.fact_embedding) {options}',
+            ],
+        )
+
+    if provider != GraphProvider.NEO4J:
+        return []
+
+    options = (
+        f'OPTIONS {{indexConfig: {{`vector.dimensions`: {embedding_dim}, '
+        f"`vector.similarity_function`: 'cosine'}}}}"
+    )
+    return cast(
+        list[LiteralString],
+        [
+            f"""CREATE VECTOR INDEX {ENTITY_NAME_EMBEDDING_INDEX} IF NOT EXISTS
+            FOR (n:Entity) ON (n.name_embedding) {options}""",
+            f"""CREATE VECTOR INDEX {COMMUNITY_NAME_EMBEDDING_INDEX} IF NOT EXISTS
+            FOR (n:Community) ON (n.name_embedding) {options}""",
+            f"""CREATE VECTOR INDEX {EDGE_FACT_EMBEDDING_INDEX} IF NOT EXISTS
+            FOR ()-[e:RELATES_TO]-() ON (e.fact_embedding) {options}""",
+        ],
+    )
+
+
+def get_vector_index_nodes_query(
+    name: str, alias: str, vector: str, provider: GraphProvider, carry: list[str] | None = None
+) -> str:
+    """
+    Query the named node vector index, binding `alias` and its cosine `score` best first.
+    Variables in `carry` stay in scope for the rest of the query.
+    """
+    if provider == GraphProvider.KUZU:
+        return _get_kuzu_vector_index_query(name, alias, vector, carry)
+
+    if provider == GraphProvider.FALKORDB:
+        label, field = VECTOR_INDEX_FIELDS[name]
+        # FalkorDB yields cosine distance, convert it to the same score as the scan
+        return (
+            f"CALL db.idx.vector.queryNodes('{label}', '{field}', $vector_candidates, "
+            f'vecf32({vector})) YIELD node AS {alias}, score AS distance '
+            f'WITH {", ".join([*(carry or []), alias])}, (2 - distance) / 2 AS score'
+        )
+
+    return (
+        f"CALL db.index.vector.queryNodes('{name}', $vector_candidates, {vector}) "
+        f'YIELD node AS {alias}, score'
+    )
+
+
+def get_vector_index_relationships_query(
+    name: str, alias: str, vector: str, provider: GraphProvider
+) -> str:
+    """Query the named relationship vector index, binding `alias` and `score` best first."""
+    if provider == GraphProvider.KUZU:
+        return _get_kuzu_vector_index_query(name, alias, vector)
+
+    if provider == GraphProvider.FALKORDB:
+        label, field = VECTOR_INDEX_FIELDS[name]
+        return (
+            f"CALL db.idx.vector.queryRelationships('{label}', '{field}', $vector_candidates, "
+            f'vecf32({vector})) YIELD relationship AS {alias}, score AS distance '
+            f'WITH {alias}, (2 - distance) / 2 AS score'
+        )
+
+    return (
+        f"CALL db.index.vector.queryRelationships('{name}', $vector_candidates, {vector}) "
+        f'YIELD relationship AS {alias}, score'
+    )
+
+
+def _get_kuzu_vector_index_query(
+    name: str, alias: str, vector: str, carry: list[str] | None = None
+) -> str:
+    table, label = KUZU_VECTOR_INDEX_TABLES[name]
+    # Kuzu yields cosine distance, convert it to the same score as array_cosine_similarity
+    return (
+        f"CALL QUERY_VECTOR_INDEX('{table}', '{name}', {vector}, $vector_candidates) "
+        f'WITH {"".join(f"{var}, " for var in carry or [])}node AS embedding_, '
+        f'1 - distance AS score '
+        f'MATCH ({alias}:{label} {{uuid: embedding_.uuid}})'
+    )
+
+
 def get_nodes_query(name: str, query: str, limit: int, provider: GraphProvider) -> str:
     if provider == GraphProvider.FALKORDB:
         label = NEO4J_TO_FALKORDB_MAPPING[name]
@@ -139,6 +255,19 @@ def get_nodes_query(name: str, query: str, limit: int, provider: GraphProvider)
     return f'CALL db.index.fulltext.queryNodes("{name}", {query}, {{limit: $limit}})'
 
 
+def get_properties_without_embedding_query(
+    alias: str, embedding: str, provider: GraphProvider
+) -> str:
+    """
+    The properties of `alias` for an attributes map, with the embedding and its prefix nulled
+    out on Neo4j so they are not shipped back. Other providers return all properties.
+    """
+    if provider == GraphProvider.NEO4J:
+        return f'{alias} {{.*, {embedding}: null, {embedding}_prefix: null}}'
+
+    return f'properties({alias})'
+
+
 def get_vector_cosine_func_query(vec1, vec2, provider: GraphProvider) -> str:
     if provider == GraphProvider.FALKORDB:
         # FalkorDB uses a different syntax for regular cosine similarity and Neo4j uses normalized cosine similarity
@@ -150,6 +279,21 @@ def get_vector_cosine_func_query(vec1, vec2, provider: GraphProvider) -> str:
     return f'vector.similarity.cosine({vec1}, {vec2})'
 
 
+def get_embedding_prefix_candidates_query(carry: str, embedding: str) -> str:
+    """
+    First stage of a two-stage Neo4j similarity scan: keep the $prefix_candidates rows whose
+    stored embedding prefix is most similar to $search_prefix.
+
+    Rows saved before prefixes were enabled are compared on a slice of the full embedding.
+    """
+    prefix = f'coalesce({embedding}_prefix, {embedding}[0..size($search_prefix)])'
+    return f"""
+        WITH {carry}, vector.similarity.cosine({prefix}, $search_prefix) AS prefix_score
+        ORDER BY prefix_score DESC
+        LIMIT $prefix_candidates
+    """
+
+
 def get_relationships_query(name: str, limit: int, provider: GraphProvider) -> str:
     if provider == GraphProvider.FALKORDB:
         label = NEO4J_TO_FALKORDB_MAPPING[name]
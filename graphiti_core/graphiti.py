@@ -15,6 +15,7 @@ limitations under the License.
 """
 
 import logging
+from collections.abc import AsyncIterator
 from datetime import datetime
 from time import time
 
@@ -25,7 +26,7 @@ from typing_extensions import LiteralString
 from graphiti_core.cross_encoder.client import CrossEncoderClient
 from graphiti_core.cross_encoder.openai_reranker_client import OpenAIRerankerClient
 from graphiti_core.decorators import handle_multiple_group_ids
-from graphiti_core.driver.driver import GraphDriver
+from graphiti_core.driver.driver import GraphDriver, GraphProvider
 from graphiti_core.driver.neo4j_driver import Neo4jDriver
 from graphiti_core.edges import (
     CommunityEdge,
@@ -35,6 +36,7 @@ from graphiti_core.edges import (
     create_entity_edge_embeddings,
 )
 from graphiti_core.embedder import EmbedderClient, OpenAIEmbedder
+from graphiti_core.errors import NodeNotFoundError
 from graphiti_core.graphiti_types import GraphitiClients
 from graphiti_core.helpers import (
     get_default_group_id,
@@ -42,7 +44,9 @@ from graphiti_core.helpers import (
     validate_excluded_entity_types,
     validate_group_id,
 )
+from graphiti_core.http_client import SharedHttpClientFactory
 from graphiti_core.llm_client import LLMClient, OpenAIClient
+from graphiti_core.models.nodes.node_db_queries import ENTITY_NODE_STATISTICS_UPDATE
 from graphiti_core.nodes import (
     CommunityNode,
     EntityNode,
@@ -51,7 +55,8 @@ from graphiti_core.nodes import (
     Node,
     create_entity_node_embeddings,
 )
-from graphiti_core.search.search import SearchConfig, search
+from graphiti_core.search.search import SearchConfig, search, search_stream
+from graphiti_core.search.search_cache import SearchResultCache
 from graphiti_core.search.search_config import DEFAULT_SEARCH_LIMIT, SearchResults
 from graphiti_core.search.search_config_recipes import (
     COMBINED_HYBRID_SEARCH_CROSS_ENCODER,
@@ -82,7 +87,7 @@ from graphiti_core.utils.maintenance.community_operations import (
 )
 from graphiti_core.utils.maintenance.edge_operations import (
     build_episodic_edges,
-    extract_edges,
+    extract_edges_with_candidates,
     resolve_extracted_edge,
     resolve_extracted_edges,
 )
@@ -96,6 +101,7 @@ from graphiti_core.utils.maintenance.node_operations import (
     resolve_extracted_nodes,
 )
 from graphiti_core.utils.ontology_utils.entity_types_utils import validate_entity_types
+from graphiti_core.utils.scheduling import GroupFairScheduler
 
 logger = logging.getLogger(__name__)
 
@@ -125,6 +131,13 @@ class AddTripletResults(BaseModel):
     edges: list[EntityEdge]
 
 
+def _with_as_of(search_filter: SearchFilters | None, as_of: datetime | None) -> SearchFilters:
+    search_filter = search_filter if search_filter is not None else SearchFilters()
+    if as_of is None:
+        return search_filter
+    return search_filter.model_copy(update={'as_of': as_of})
+
+
 class Graphiti:
     def __init__(
         self,
@@ -139,6 +152,9 @@ class Graphiti:
         max_coroutines: int | None = None,
         tracer: Tracer | None = None,
         trace_span_prefix: str = 'graphiti',
+        http_client_factory: SharedHttpClientFactory | None = None,
+        scheduler: GroupFairScheduler | None = None,
+        search_cache: SearchResultCache | None = None,
     ):
         """
         Initialize a Graphiti instance.
@@ -175,6 +191,15 @@ class Graphiti:
             An OpenTelemetry tracer instance for distributed tracing. If not provided, tracing is disabled (no-op).
         trace_span_prefix : str, optional
             Prefix to prepend to all span names. Defaults to 'graphiti'.
+        http_client_factory : SharedHttpClientFactory | None, optional
+            Factory for a pooled httpx client shared by the LLM, embedder and reranker clients.
+            If not provided, each client keeps its own connection pool.
+        scheduler : GroupFairScheduler | None, optional
+            Weighted fair scheduler that shares LLM and embedder capacity across group_ids.
+            If not provided, work is not scheduled by group.
+        search_cache : SearchResultCache | None, optional
+            Cache for search and search_ results, invalidated per group by the writes made
+            through this instance. If not provided, search results are not cached.
 
         Returns
         -------
@@ -217,6 +242,13 @@ class Graphiti:
         else:
             self.cross_encoder = OpenAIRerankerClient()
 
+        # Share one connection pool across all provider clients
+        self.http_client_factory = http_client_factory
+        self.search_cache = search_cache
+        if http_client_factory is not None:
+            for client in (self.llm_client, self.embedder, self.cross_encoder):
+                http_client_factory.inject(client)
+
         # Initialize tracer
         self.tracer = create_tracer(tracer, trace_span_prefix)
 
@@ -229,6 +261,7 @@ class Graphiti:
             embedder=self.embedder,
             cross_encoder=self.cross_encoder,
             tracer=self.tracer,
+            scheduler=scheduler,
         )
 
         # Capture telemetry event
@@ -317,6 +350,8 @@ class Graphiti:
                 graphiti.close()
         """
         await self.driver.close()
+        if self.http_client_factory is not None:
+            await self.http_client_factory.close()
 
     async def build_indices_and_constraints(self, delete_existing: bool = False):
         """
@@ -352,8 +387,29 @@ class Graphiti:
         """
         await self.driver.build_indices_and_constraints(delete_existing)
 
+    def _clients_for_group(self, group_id: str) -> GraphitiClients:
+        """
+        Clients whose driver points at the database group_id is stored in, such as its FalkorDB
+        graph or routed Neo4j database. The shared driver is never reassigned, so concurrent calls
+        for different groups each write to their own database.
+        """
+        if group_id == get_default_group_id(self.driver.provider):
+            return self.clients
+
+        driver = self.driver.clone(database=group_id)
+        if driver is self.clients.driver:
+            return self.clients
+        return self.clients.model_copy(update={'driver': driver})
+
+    def _drivers_for_lookup(self, group_id: str | None) -> list[GraphDriver]:
+        """The database group_id is stored in, or every database when the group is not known."""
+        if group_id is not None:
+            return [self._clients_for_group(group_id).driver]
+        return [driver for driver, _ in self.driver.shard_group_ids(None)]
+
     async def _extract_and_resolve_nodes(
         self,
+        clients: GraphitiClients,
         episode: EpisodicNode,
         previous_episodes: list[EpisodicNode],
         entity_types: dict[str, type[BaseModel]] | None,
@@ -361,11 +417,11 @@ class Graphiti:
     ) -> tuple[list[EntityNode], dict[str, str], list[tuple[EntityNode, EntityNode]]]:
         """Extract nodes from episode and resolve against existing graph."""
         extracted_nodes = await extract_nodes(
-            self.clients, episode, previous_episodes, entity_types, excluded_entity_types
+            clients, episode, previous_episodes, entity_types, excluded_entity_types
         )
 
         nodes, uuid_map, duplicates = await resolve_extracted_nodes(
-            self.clients,
+            clients,
             extracted_nodes,
             episode,
             previous_episodes,
@@ -376,6 +432,7 @@ class Graphiti:
 
     async def _extract_and_resolve_edges(
         self,
+        clients: GraphitiClients,
         episode: EpisodicNode,
         extracted_nodes: list[EntityNode],
         previous_episodes: list[EpisodicNode],
@@ -385,32 +442,37 @@ class Graphiti:
         nodes: list[EntityNode],
         uuid_map: dict[str, str],
     ) -> tuple[list[EntityEdge], list[EntityEdge]]:
-        """Extract edges from episode and resolve against existing graph."""
-        extracted_edges = await extract_edges(
-            self.clients,
+        """Extract edges from episode and resolve against existing graph.
+
+        Extraction is streamed so that resolution candidates for early edges are fetched
+        while the LLM is still generating the later ones.
+        """
+        edges, edge_candidates = await extract_edges_with_candidates(
+            clients,
             episode,
             extracted_nodes,
             previous_episodes,
             edge_type_map,
+            uuid_map,
             group_id,
             edge_types,
         )
 
-        edges = resolve_edge_pointers(extracted_edges, uuid_map)
-
         resolved_edges, invalidated_edges = await resolve_extracted_edges(
-            self.clients,
+            clients,
             edges,
             episode,
             nodes,
             edge_types or {},
             edge_type_map,
+            edge_candidates,
         )
 
         return resolved_edges, invalidated_edges
 
     async def _process_episode_data(
         self,
+        driver: GraphDriver,
         episode: EpisodicNode,
         nodes: list[EntityNode],
         entity_edges: list[EntityEdge],
@@ -424,7 +486,7 @@ class Graphiti:
             episode.content = ''
 
         await add_nodes_and_edges_bulk(
-            self.driver,
+            driver,
             [episode],
             episodic_edges,
             nodes,
@@ -436,6 +498,7 @@ class Graphiti:
 
     async def _extract_and_dedupe_nodes_bulk(
         self,
+        clients: GraphitiClients,
         episode_context: list[tuple[EpisodicNode, list[EpisodicNode]]],
         edge_type_map: dict[tuple[str, str], list[str]],
         edge_types: dict[str, type[BaseModel]] | None,
@@ -449,7 +512,7 @@ class Graphiti:
         """Extract nodes and edges from all episodes and deduplicate."""
         # Extract all nodes and edges for each episode
         extracted_nodes_bulk, extracted_edges_bulk = await extract_nodes_and_edges_bulk(
-            self.clients,
+            clients,
             episode_context,
             edge_type_map=edge_type_map,
             edge_types=edge_types,
@@ -459,13 +522,14 @@ class Graphiti:
 
         # Dedupe extracted nodes in memory
         nodes_by_episode, uuid_map = await dedupe_nodes_bulk(
-            self.clients, extracted_nodes_bulk, episode_context, entity_types
+            clients, extracted_nodes_bulk, episode_context, entity_types
         )
 
         return nodes_by_episode, uuid_map, extracted_edges_bulk
 
     async def _resolve_nodes_and_edges_bulk(
         self,
+        clients: GraphitiClients,
         nodes_by_episode: dict[str, list[EntityNode]],
         edges_by_episode: dict[str, list[EntityEdge]],
         episode_context: list[tuple[EpisodicNode, list[EpisodicNode]]],
@@ -494,7 +558,7 @@ class Graphiti:
         node_results = await semaphore_gather(
             *[
                 resolve_extracted_nodes(
-                    self.clients,
+                    clients,
                     nodes_by_episode_unique[episode.uuid],
                     episode,
                     previous_episodes,
@@ -527,7 +591,7 @@ class Graphiti:
         hydrated_nodes_results: list[list[EntityNode]] = await semaphore_gather(
             *[
                 extract_attributes_from_nodes(
-                    self.clients,
+                    clients,
                     nodes_by_episode_unique[episode.uuid],
                     episode,
                     previous_episodes,
@@ -554,7 +618,7 @@ class Graphiti:
         edge_results = await semaphore_gather(
             *[
                 resolve_extracted_edges(
-                    self.clients,
+                    clients,
                     edges_by_episode_unique[episode.uuid],
                     episode,
                     final_hydrated_nodes,
@@ -573,6 +637,10 @@ class Graphiti:
 
         return final_hydrated_nodes, resolved_edges, invalidated_edges, uuid_map
 
+    def _invalidate_search_cache(self, group_ids: list[str] | None):
+        if self.search_cache is not None:
+            self.search_cache.invalidate(group_ids)
+
     @handle_multiple_group_ids
     async def retrieve_episodes(
         self,
@@ -695,10 +763,9 @@ class Graphiti:
             group_id = get_default_group_id(self.driver.provider)
         else:
             validate_group_id(group_id)
-            if group_id != self.driver._database:
-                # if group_id is provided, use it as the database name
-                self.driver = self.driver.clone(database=group_id)
-                self.clients.driver = self.driver
+        # if group_id is provided, the episode is written to the database it is stored in
+        clients = self._clients_for_group(group_id)
+        driver = clients.driver
 
         with self.tracer.start_span('add_episode') as span:
             try:
@@ -709,14 +776,15 @@ class Graphiti:
                         last_n=RELEVANT_SCHEMA_LIMIT,
                         group_ids=[group_id],
                         source=source,
+                        driver=driver,
                     )
                     if previous_episode_uuids is None
-                    else await EpisodicNode.get_by_uuids(self.driver, previous_episode_uuids)
+                    else await EpisodicNode.get_by_uuids(driver, previous_episode_uuids)
                 )
 
                 # Get or create episode
                 episode = (
-                    await EpisodicNode.get_by_uuid(self.driver, uuid)
+                    await EpisodicNode.get_by_uuid(driver, uuid)
                     if uuid is not None
                     else EpisodicNode(
                         name=name,
@@ -739,11 +807,11 @@ class Graphiti:
 
                 # Extract and resolve nodes
                 extracted_nodes = await extract_nodes(
-                    self.clients, episode, previous_episodes, entity_types, excluded_entity_types
+                    clients, episode, previous_episodes, entity_types, excluded_entity_types
                 )
 
                 nodes, uuid_map, _ = await resolve_extracted_nodes(
-                    self.clients,
+                    clients,
                     extracted_nodes,
                     episode,
                     previous_episodes,
@@ -752,6 +820,7 @@ class Graphiti:
 
                 # Extract and resolve edges in parallel with attribute extraction
                 resolved_edges, invalidated_edges = await self._extract_and_resolve_edges(
+                    clients,
                     episode,
                     extracted_nodes,
                     previous_episodes,
@@ -764,14 +833,14 @@ class Graphiti:
 
                 # Extract node attributes
                 hydrated_nodes = await extract_attributes_from_nodes(
-                    self.clients, nodes, episode, previous_episodes, entity_types
+                    clients, nodes, episode, previous_episodes, entity_types
                 )
 
                 entity_edges = resolved_edges + invalidated_edges
 
                 # Process and save episode data
                 episodic_edges, episode = await self._process_episode_data(
-                    episode, hydrated_nodes, entity_edges, now
+                    driver, episode, hydrated_nodes, entity_edges, now
                 )
 
                 # Update communities if requested
@@ -780,12 +849,14 @@ class Graphiti:
                 if update_communities:
                     communities, community_edges = await semaphore_gather(
                         *[
-                            update_community(self.driver, self.llm_client, self.embedder, node)
+                            update_community(driver, self.llm_client, self.embedder, node)
                             for node in nodes
                         ],
                         max_coroutines=self.max_coroutines,
                     )
 
+                self._invalidate_search_cache([group_id])
+
                 end = time()
 
                 # Add span attributes
@@ -819,6 +890,8 @@ class Graphiti:
                 )
 
             except Exception as e:
+                # Some of the episode may already have been written
+                self._invalidate_search_cache([group_id])
                 span.set_status('error', str(e))
                 span.record_exception(e)
                 raise e
@@ -880,10 +953,8 @@ class Graphiti:
                     group_id = get_default_group_id(self.driver.provider)
                 else:
                     validate_group_id(group_id)
-                    if group_id != self.driver._database:
-                        # if group_id is provided, use it as the database name
-                        self.driver = self.driver.clone(database=group_id)
-                        self.clients.driver = self.driver
+                clients = self._clients_for_group(group_id)
+                driver = clients.driver
 
                 # Create default edge type map
                 edge_type_map_default = (
@@ -893,7 +964,7 @@ class Graphiti:
                 )
 
                 episodes = [
-                    await EpisodicNode.get_by_uuid(self.driver, episode.uuid)
+                    await EpisodicNode.get_by_uuid(driver, episode.uuid)
                     if episode.uuid is not None
                     else EpisodicNode(
                         name=episode.name,
@@ -910,7 +981,7 @@ class Graphiti:
 
                 # Save all episodes
                 await add_nodes_and_edges_bulk(
-                    driver=self.driver,
+                    driver=driver,
                     episodic_nodes=episodes,
                     episodic_edges=[],
                     entity_nodes=[],
@@ -919,7 +990,7 @@ class Graphiti:
                 )
 
                 # Get previous episode context for each episode
-                episode_context = await retrieve_previous_episodes_bulk(self.driver, episodes)
+                episode_context = await retrieve_previous_episodes_bulk(driver, episodes)
 
                 # Extract and dedupe nodes and edges
                 (
@@ -927,6 +998,7 @@ class Graphiti:
                     uuid_map,
                     extracted_edges_bulk,
                 ) = await self._extract_and_dedupe_nodes_bulk(
+                    clients,
                     episode_context,
                     edge_type_map or edge_type_map_default,
                     edge_types,
@@ -945,7 +1017,7 @@ class Graphiti:
                 ]
 
                 edges_by_episode = await dedupe_edges_bulk(
-                    self.clients,
+                    clients,
                     extracted_edges_bulk_updated,
                     episode_context,
                     [],
@@ -960,6 +1032,7 @@ class Graphiti:
                     invalidated_edges,
                     final_uuid_map,
                 ) = await self._resolve_nodes_and_edges_bulk(
+                    clients,
                     nodes_by_episode,
                     edges_by_episode,
                     episode_context,
@@ -974,7 +1047,7 @@ class Graphiti:
 
                 # save data to KG
                 await add_nodes_and_edges_bulk(
-                    self.driver,
+                    driver,
                     episodes,
                     resolved_episodic_edges,
                     final_hydrated_nodes,
@@ -982,6 +1055,8 @@ class Graphiti:
                     self.embedder,
                 )
 
+                self._invalidate_search_cache([group_id])
+
                 end = time()
 
                 # Add span attributes
@@ -1006,6 +1081,7 @@ class Graphiti:
                 )
 
             except Exception as e:
+                self._invalidate_search_cache([group_id] if group_id is not None else None)
                 bulk_span.set_status('error', str(e))
                 bulk_span.record_exception(e)
                 raise e
@@ -1045,9 +1121,10 @@ class Graphiti:
             max_coroutines=self.max_coroutines,
         )
 
+        self._invalidate_search_cache(group_ids)
+
         return community_nodes, community_edges
 
-    @handle_multiple_group_ids
     async def search(
         self,
         query: str,
@@ -1056,6 +1133,7 @@ class Graphiti:
         num_results=DEFAULT_SEARCH_LIMIT,
         search_filter: SearchFilters | None = None,
         driver: GraphDriver | None = None,
+        as_of: datetime | None = None,
     ) -> list[EntityEdge]:
         """
         Perform a hybrid search on the knowledge graph.
@@ -1076,6 +1154,8 @@ class Graphiti:
             The graph partitions to return data from.
         num_results : int, optional
             The maximum number of results to return. Defaults to 10.
+        as_of : datetime, optional
+            Only return facts that were valid, and not yet expired, at this time.
 
         Returns
         -------
@@ -1101,9 +1181,10 @@ class Graphiti:
                 query,
                 group_ids,
                 search_config,
-                search_filter if search_filter is not None else SearchFilters(),
+                _with_as_of(search_filter, as_of),
                 driver=driver,
                 center_node_uuid=center_node_uuid,
+                cache=self.search_cache,
             )
         ).edges
 
@@ -1123,7 +1204,6 @@ class Graphiti:
             query, config, group_ids, center_node_uuid, bfs_origin_node_uuids, search_filter
         )
 
-    @handle_multiple_group_ids
     async def search_(
         self,
         query: str,
@@ -1133,11 +1213,28 @@ class Graphiti:
         bfs_origin_node_uuids: list[str] | None = None,
         search_filter: SearchFilters | None = None,
         driver: GraphDriver | None = None,
+        timeout: float | None = None,
+        explain: bool = False,
+        as_of: datetime | None = None,
     ) -> SearchResults:
         """search_ (replaces _search) is our advanced search method that returns Graph objects (nodes and edges) rather
         than a list of facts. This endpoint allows the end user to utilize more advanced features such as filters and
         different search and reranker methodologies across different layers in the graph.
 
+        With a timeout (in seconds), search methods and rerankers still running when it expires are dropped, BFS
+        first, and the rerankers fall back to RRF. A query embedding that takes more than half the time is dropped
+        too, along with the cosine similarity searches and MMR that need it. results.metadata records which methods
+        contributed to each layer.
+
+        With explain=True, results.profile holds the time and candidate count of each search method, reranker and
+        the query embedding, the database queries executed and any cache hit, and each step is traced as a span.
+
+        With as_of, only edges valid at that time and not yet expired by then are returned, as the graph stood at
+        that point. Set search_filter.include_expired to also return edges expired since.
+
+        Group ids stored in different databases, such as FalkorDB graphs or Neo4j databases routed with
+        group_databases, are searched in each and their results ranked together within the limit.
+
         For different config recipes refer to search/search_config_recipes.
         """
 
@@ -1146,23 +1243,83 @@ class Graphiti:
             query,
             group_ids,
             config,
-            search_filter if search_filter is not None else SearchFilters(),
+            _with_as_of(search_filter, as_of),
+            center_node_uuid,
+            bfs_origin_node_uuids,
+            driver=driver,
+            cache=self.search_cache,
+            timeout=timeout,
+            explain=explain,
+        )
+
+    async def search_stream(
+        self,
+        query: str,
+        config: SearchConfig = COMBINED_HYBRID_SEARCH_CROSS_ENCODER,
+        group_ids: list[str] | None = None,
+        center_node_uuid: str | None = None,
+        bfs_origin_node_uuids: list[str] | None = None,
+        search_filter: SearchFilters | None = None,
+        driver: GraphDriver | None = None,
+        timeout: float | None = None,
+        as_of: datetime | None = None,
+    ) -> AsyncIterator[SearchResults]:
+        """Streaming variant of search_ that yields partial results as each search stage completes.
+
+        Snapshots are tagged with their stage in results.metadata.stage: fulltext (bm25) hits first, then the
+        rrf-fused candidates ahead of any slower reranker, and finally the reranked results, which match what
+        search_ returns. Earlier snapshots hold candidates without their attributes loaded.
+        """
+        async for results in search_stream(
+            self.clients,
+            query,
+            group_ids,
+            config,
+            _with_as_of(search_filter, as_of),
             center_node_uuid,
             bfs_origin_node_uuids,
             driver=driver,
+            cache=self.search_cache,
+            timeout=timeout,
+        ):
+            yield results
+
+    async def get_nodes_and_edges_by_episode(
+        self, episode_uuids: list[str], group_id: str | None = None
+    ) -> SearchResults:
+        """
+        Returns the nodes and edges of the given episodes, from the database of group_id when it
+        is set. Otherwise the driver's own database is searched, along with any databases Neo4j
+        group_databases routes to.
+        """
+        results = await semaphore_gather(
+            *[
+                self._get_nodes_and_edges_by_episode(driver, episode_uuids)
+                for driver in self._drivers_for_lookup(group_id)
+            ],
+            max_coroutines=self.max_coroutines,
+        )
+
+        return SearchResults(
+            edges=[edge for result in results for edge in result.edges],
+            nodes=[node for result in results for node in result.nodes],
         )
 
-    async def get_nodes_and_edges_by_episode(self, episode_uuids: list[str]) -> SearchResults:
-        episodes = await EpisodicNode.get_by_uuids(self.driver, episode_uuids)
+    async def _get_nodes_and_edges_by_episode(
+        self, driver: GraphDriver, episode_uuids: list[str]
+    ) -> SearchResults:
+        episodes = await EpisodicNode.get_by_uuids(driver, episode_uuids)
+        if not episodes:
+            return SearchResults()
 
         edges_list = await semaphore_gather(
-            *[EntityEdge.get_by_uuids(self.driver, episode.entity_edges) for episode in episodes],
+            *[EntityEdge.get_by_uuids(driver, episode.entity_edges) for episode in episodes],
             max_coroutines=self.max_coroutines,
         )
 
         edges: list[EntityEdge] = [edge for lst in edges_list for edge in lst]
 
-        nodes = await get_mentioned_nodes(self.driver, episodes)
+        nodes = await get_mentioned_nodes(driver, episodes)
 
         return SearchResults(edges=edges, nodes=nodes)
 
@@ -1176,20 +1333,23 @@ class Graphiti:
         if edge.fact_embedding is None:
             await edge.generate_embedding(self.embedder)
 
+        # The triplet is written to the database its group is stored in
+        clients = self._clients_for_group(edge.group_id)
+
         nodes, uuid_map, _ = await resolve_extracted_nodes(
-            self.clients,
+            clients,
             [source_node, target_node],
         )
 
         updated_edge = resolve_edge_pointers([edge], uuid_map)[0]
 
         valid_edges = await EntityEdge.get_between_nodes(
-            self.driver, edge.source_node_uuid, edge.target_node_uuid
+            clients.driver, edge.source_node_uuid, edge.target_node_uuid
         )
 
         related_edges = (
             await search(
-                self.clients,
+                clients,
                 updated_edge.fact,
                 group_ids=[updated_edge.group_id],
                 config=EDGE_HYBRID_SEARCH_RRF,
@@ -1198,7 +1358,7 @@ class Graphiti:
         ).edges
         existing_edges = (
             await search(
-                self.clients,
+                clients,
                 updated_edge.fact,
                 group_ids=[updated_edge.group_id],
                 config=EDGE_HYBRID_SEARCH_RRF,
@@ -1229,15 +1389,21 @@ class Graphiti:
         await create_entity_edge_embeddings(self.embedder, edges)
         await create_entity_node_embeddings(self.embedder, nodes)
 
-        await add_nodes_and_edges_bulk(self.driver, [], [], nodes, edges, self.embedder)
+        await add_nodes_and_edges_bulk(clients.driver, [], [], nodes, edges, self.embedder)
+        self._invalidate_search_cache(list({node.group_id for node in nodes} | {edge.group_id}))
         return AddTripletResults(edges=edges, nodes=nodes)
 
-    async def remove_episode(self, episode_uuid: str):
-        # Find the episode to be deleted
-        episode = await EpisodicNode.get_by_uuid(self.driver, episode_uuid)
+    async def remove_episode(self, episode_uuid: str, group_id: str | None = None):
+        """
+        Removes an episode and the nodes and edges only it created. The episode is looked up in
+        the database of group_id when it is set. Otherwise the driver's own database is searched,
+        along with any databases Neo4j group_databases routes to.
+        """
+        # Find the episode to be deleted, and the database it is stored in
+        driver, episode = await self._find_episode(episode_uuid, group_id)
 
         # Find edges mentioned by the episode
-        edges = await EntityEdge.get_by_uuids(self.driver, episode.entity_edges)
+        edges = await EntityEdge.get_by_uuids(driver, episode.entity_edges)
 
         # We should only delete edges created by the episode
         edges_to_delete: list[EntityEdge] = []
@@ -1246,18 +1412,43 @@ class Graphiti:
                 edges_to_delete.append(edge)
 
         # Find nodes mentioned by the episode
-        nodes = await get_mentioned_nodes(self.driver, [episode])
+        nodes = await get_mentioned_nodes(driver, [episode])
         # We should delete all nodes that are only mentioned in the deleted episode
         nodes_to_delete: list[EntityNode] = []
         for node in nodes:
             query: LiteralString = 'MATCH (e:Episodic)-[:MENTIONS]->(n:Entity {uuid: $uuid}) RETURN count(*) AS episode_count'
-            records, _, _ = await self.driver.execute_query(query, uuid=node.uuid, routing_='r')
+            records, _, _ = await driver.execute_query(query, uuid=node.uuid, routing_='r')
 
             for record in records:
                 if record['episode_count'] == 1:
                     nodes_to_delete.append(node)
 
-        await Edge.delete_by_uuids(self.driver, [edge.uuid for edge in edges_to_delete])
-        await Node.delete_by_uuids(self.driver, [node.uuid for node in nodes_to_delete])
+        await Edge.delete_by_uuids(driver, [edge.uuid for edge in edges_to_delete])
+        await Node.delete_by_uuids(driver, [node.uuid for node in nodes_to_delete])
+
+        await episode.delete(driver)
+
+        if driver.provider != GraphProvider.KUZU:
+            deleted_node_uuids = {node.uuid for node in nodes_to_delete}
+            touched_node_uuids = (
+                {node.uuid for node in nodes}
+                | {edge.source_node_uuid for edge in edges_to_delete}
+                | {edge.target_node_uuid for edge in edges_to_delete}
+            )
+            await driver.execute_query(
+                ENTITY_NODE_STATISTICS_UPDATE,
+                uuids=list(touched_node_uuids - deleted_node_uuids),
+            )
 
-        await episode.delete(self.driver)
+        self._invalidate_search_cache([episode.group_id])
+
+    async def _find_episode(
+        self, episode_uuid: str, group_id: str | None
+    ) -> tuple[GraphDriver, EpisodicNode]:
+        drivers = self._drivers_for_lookup(group_id)
+        for driver in drivers[:-1]:
+            try:
+                return driver, await EpisodicNode.get_by_uuid(driver, episode_uuid)
+            except NodeNotFoundError:
+                continue
+        return drivers[-1], await EpisodicNode.get_by_uuid(drivers[-1], episode_uuid)
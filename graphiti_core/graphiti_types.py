@@ -21,6 +21,7 @@ from graphiti_core.driver.driver import GraphDriver
 from graphiti_core.embedder import EmbedderClient
 from graphiti_core.llm_client import LLMClient
 from graphiti_core.tracer import Tracer
+from graphiti_core.utils.scheduling import GroupFairScheduler
 
 
 class GraphitiClients(BaseModel):
@@ -29,5 +30,6 @@ class GraphitiClients(BaseModel):
     embedder: EmbedderClient
     cross_encoder: CrossEncoderClient
     tracer: Tracer
+    scheduler: GroupFairScheduler | None = None
 
     model_config = ConfigDict(arbitrary_types_allowed=True)
@@ -28,6 +28,7 @@ from numpy._typing import NDArray
 from pydantic import BaseModel
 
 from graphiti_core.driver.driver import GraphProvider
+from graphiti_core.embedder.client import EMBEDDING_PREFIX_DIM
 from graphiti_core.errors import GroupIdValidationError
 
 load_dotenv()
@@ -102,6 +103,15 @@ def normalize_l2(embedding: list[float]) -> NDArray:
     return np.where(norm == 0, embedding_array, embedding_array / norm)
 
 
+def get_embedding_prefix(
+    provider: GraphProvider, embedding: list[float] | None
+) -> list[float] | None:
+    """The truncated embedding stored alongside the full one, if the provider uses it."""
+    if provider != GraphProvider.NEO4J or not EMBEDDING_PREFIX_DIM or embedding is None:
+        return None
+    return embedding[:EMBEDDING_PREFIX_DIM]
+
+
 # Use this instead of asyncio.gather() to bound coroutines
 async def semaphore_gather(
     *coroutines: Coroutine,
@@ -0,0 +1,228 @@
+"""
+Copyright 2024, Zep Software, Inc.
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+import importlib.util
+import inspect
+import logging
+from typing import Any
+
+import httpx
+from pydantic import BaseModel, Field
+
+try:
+    from google import genai
+except ImportError:
+    genai = None
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_CONNECTIONS = 100
+DEFAULT_MAX_KEEPALIVE_CONNECTIONS = 50
+DEFAULT_KEEPALIVE_EXPIRY = 60.0
+DEFAULT_TIMEOUT = 600.0
+
+
+class HttpClientConfig(BaseModel):
+    http2: bool = Field(
+        default=False, description='Negotiate HTTP/2 where the provider supports it'
+    )
+    max_connections: int = Field(default=DEFAULT_MAX_CONNECTIONS)
+    max_keepalive_connections: int = Field(default=DEFAULT_MAX_KEEPALIVE_CONNECTIONS)
+    keepalive_expiry: float = Field(default=DEFAULT_KEEPALIVE_EXPIRY)
+    timeout: float = Field(default=DEFAULT_TIMEOUT)
+
+
+class SharedHttpClientFactory:
+    """
+    Builds a single pooled httpx.AsyncClient shared by every provider client of a Graphiti
+    instance, so LLM, embedder and reranker requests reuse the same TLS connections.
+    """
+
+    def __init__(self, config: HttpClientConfig | None = None):
+        self.config = config or HttpClientConfig()
+        self._client: httpx.AsyncClient | None = None
+        self._requests = 0
+        # Provider clients pointed at the shared client, and the SDK clients they replaced
+        self._providers: list[Any] = []
+        self._replaced: list[Any] = []
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        if self._client is None or self._client.is_closed:
+            self._client = self._create_client()
+        return self._client
+
+    def _create_client(self) -> httpx.AsyncClient:
+        if self.config.http2 and importlib.util.find_spec('h2') is None:
+            raise ImportError(
+                'h2 is required for HTTP/2 support. Install it with: pip install httpx[http2]'
+            )
+
+        limits = httpx.Limits(
+            max_connections=self.config.max_connections,
+            max_keepalive_connections=self.config.max_keepalive_connections,
+            keepalive_expiry=self.config.keepalive_expiry,
+        )
+
+        return httpx.AsyncClient(
+            http2=self.config.http2,
+            limits=limits,
+            timeout=httpx.Timeout(self.config.timeout, connect=5.0),
+            follow_redirects=True,
+            event_hooks={'request': [self._on_request]},
+        )
+
+    async def _on_request(self, request: httpx.Request):
+        self._requests += 1
+
+    def pool_stats(self) -> dict[str, Any]:
+        """Return request counters and the state of the underlying connection pool."""
+        stats: dict[str, Any] = {
+            'requests': self._requests,
+            'connections': 0,
+            'idle_connections': 0,
+            'http2_connections': 0,
+            'max_connections': self.config.max_connections,
+        }
+        if self._client is None:
+            return stats
+
+        # httpx does not expose pool state publicly, so read it from the httpcore pool if present.
+        # These are private attributes; if their shape changes the pool counters stay at zero.
+        try:
+            pool = getattr(getattr(self._client, '_transport', None), '_pool', None)
+            connections = list(getattr(pool, 'connections', None) or [])
+            idle_connections = sum(1 for conn in connections if conn.is_idle())
+            http2_connections = sum(1 for conn in connections if 'HTTP/2' in conn.info())
+        except (AttributeError, TypeError) as e:
+            logger.debug(f'Could not read http connection pool state: {e}')
+            return stats
+
+        stats['connections'] = len(connections)
+        stats['idle_connections'] = idle_connections
+        stats['http2_connections'] = http2_connections
+
+        return stats
+
+    def inject(self, provider_client: Any) -> bool:
+        """
+        Point a provider client at the shared client, see `inject_http_client`. The factory
+        closes the SDK client that was replaced when it is closed, and points the provider
+        client at the new shared client it creates then.
+        """
+        replaced = _replace_sdk_client(provider_client, self.client)
+        if replaced is None:
+            return False
+
+        self._providers.append(provider_client)
+        self._replaced.append(replaced)
+        return True
+
+    async def close(self):
+        replaced, self._replaced = self._replaced, []
+        for sdk_client in replaced:
+            await _close_sdk_client(sdk_client)
+
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+        # Injected provider clients would otherwise keep using the closed client. The new client
+        # opens no connections until a provider makes a request.
+        for provider_client in self._providers:
+            replaced_client = _replace_sdk_client(provider_client, self.client)
+            if replaced_client is not None:
+                self._replaced.append(replaced_client)
+
+
+def inject_http_client(provider_client: Any, http_client: httpx.AsyncClient) -> bool:
+    """
+    Point a provider client's SDK client at the shared httpx client.
+
+    Works for clients that wrap an SDK exposing `with_options(http_client=...)` on their
+    `client` attribute (OpenAI, Azure OpenAI, Anthropic, Groq), and for the google-genai
+    client of the Gemini clients, which is rebuilt with `HttpOptions(httpx_async_client=...)`.
+    Returns False when the provider client cannot be rewired, in which case it keeps its own
+    connection pool. The replaced SDK client is left open, SharedHttpClientFactory.inject
+    closes it.
+    """
+    return _replace_sdk_client(provider_client, http_client) is not None
+
+
+def _replace_sdk_client(provider_client: Any, http_client: httpx.AsyncClient) -> Any | None:
+    # Returns the SDK client that was replaced, or None when the provider client was not rewired
+    name = provider_client.__class__.__name__
+    sdk_client = getattr(provider_client, 'client', None)
+    if genai is not None and isinstance(sdk_client, genai.Client):
+        return _replace_genai_client(provider_client, sdk_client, http_client)
+
+    with_options = getattr(sdk_client, 'with_options', None)
+    if with_options is None:
+        logger.warning(
+            f'{name} does not support a shared http client, it keeps its own connection pool'
+        )
+        return None
+
+    try:
+        provider_client.client = with_options(http_client=http_client)
+    except TypeError as e:
+        logger.warning(f'Could not share http client with {name}: {e}')
+        return None
+
+    return sdk_client
+
+
+def _replace_genai_client(
+    provider_client: Any, sdk_client: Any, http_client: httpx.AsyncClient
+) -> Any | None:
+    # genai.Client takes its httpx client when it is built, so it is rebuilt with the settings
+    # the original resolved
+    try:
+        api_client = sdk_client._api_client
+        vertexai = bool(api_client.vertexai)
+        provider_client.client = type(sdk_client)(
+            vertexai=vertexai,
+            api_key=api_client.api_key,
+            credentials=None if api_client.api_key else api_client._credentials,
+            project=api_client.project if vertexai else None,
+            location=api_client.location if vertexai else None,
+            http_options=api_client._http_options.model_copy(
+                update={'httpx_async_client': http_client}
+            ),
+        )
+    except (AttributeError, ValueError) as e:
+        logger.warning(
+            f'Could not share http client with {provider_client.__class__.__name__}: {e}'
+        )
+        return None
+
+    return sdk_client
+
+
+async def _close_sdk_client(sdk_client: Any):
+    # Closes the connection pools of an SDK client replaced by the shared client. google-genai
+    # clients also hold a sync pool, and leave an httpx client they were given open.
+    if genai is not None and isinstance(sdk_client, genai.Client):
+        sdk_client.close()
+        await sdk_client.aio.aclose()
+        return
+
+    close = getattr(sdk_client, 'close', None)
+    if close is None:
+        return
+    result = close()
+    if inspect.isawaitable(result):
+        await result
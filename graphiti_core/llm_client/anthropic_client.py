@@ -18,15 +18,17 @@ import json
 import logging
 import os
 import typing
+from collections.abc import AsyncIterator
 from json import JSONDecodeError
 from typing import TYPE_CHECKING, Literal
 
-from pydantic import BaseModel, ValidationError
+from pydantic import BaseModel
 
 from ..prompts.models import Message
 from .client import LLMClient
 from .config import DEFAULT_MAX_TOKENS, LLMConfig, ModelSize
 from .errors import RateLimitError, RefusalError
+from .json_repair import parse_json_output
 
 if TYPE_CHECKING:
     import anthropic
@@ -120,6 +122,10 @@ class AnthropicClient(LLMClient):
     """
 
     model: AnthropicModel
+    supports_streaming = True
+    # The response model is passed as a tool schema, and the SDK retries transient errors itself
+    appends_response_schema = False
+    backoff_retries = False
 
     def __init__(
         self,
@@ -164,16 +170,17 @@ class AnthropicClient(LLMClient):
             ValueError: If JSON cannot be extracted or parsed
         """
         try:
-            json_start = text.find('{')
-            json_end = text.rfind('}') + 1
-            if json_start >= 0 and json_end > json_start:
-                json_str = text[json_start:json_end]
-                return json.loads(json_str)
-            else:
+            result = parse_json_output(text)
+            if not isinstance(result, dict):
                 raise ValueError(f'Could not extract JSON from model response: {text}')
+            return result
         except (JSONDecodeError, ValueError) as e:
             raise ValueError(f'Could not extract JSON from model response: {text}') from e
 
+    def _is_reaskable(self, error: Exception) -> bool:
+        # Unparseable tool input and text surface as ValueError (including JSON and schema errors)
+        return isinstance(error, ValueError)
+
     def _create_tool(
         self, response_model: type[BaseModel] | None = None
     ) -> tuple[list[ToolUnionParam], ToolChoiceParam]:
@@ -330,100 +337,35 @@ class AnthropicClient(LLMClient):
         except Exception as e:
             raise e
 
-    async def generate_response(
+    async def _generate_response_stream(
         self,
         messages: list[Message],
-        response_model: type[BaseModel] | None = None,
-        max_tokens: int | None = None,
+        response_model: type[BaseModel],
+        max_tokens: int = DEFAULT_MAX_TOKENS,
         model_size: ModelSize = ModelSize.medium,
-        group_id: str | None = None,
-        prompt_name: str | None = None,
-    ) -> dict[str, typing.Any]:
-        """
-        Generate a response from the LLM.
-
-        Args:
-            messages: List of message objects to send to the LLM.
-            response_model: Optional Pydantic model to use for structured output.
-            max_tokens: Maximum number of tokens to generate.
-
-        Returns:
-            Dictionary containing the structured response from the LLM.
-
-        Raises:
-            RateLimitError: If the rate limit is exceeded.
-            RefusalError: If the LLM refuses to respond.
-            Exception: If an error occurs during the generation process.
-        """
-        if max_tokens is None:
-            max_tokens = self.max_tokens
-
-        # Wrap entire operation in tracing span
-        with self.tracer.start_span('llm.generate') as span:
-            attributes = {
-                'llm.provider': 'anthropic',
-                'model.size': model_size.value,
-                'max_tokens': max_tokens,
-            }
-            if prompt_name:
-                attributes['prompt.name'] = prompt_name
-            span.add_attributes(attributes)
-
-            retry_count = 0
-            max_retries = 2
-            last_error: Exception | None = None
-
-            while retry_count <= max_retries:
-                try:
-                    response = await self._generate_response(
-                        messages, response_model, max_tokens, model_size
-                    )
-
-                    # If we have a response_model, attempt to validate the response
-                    if response_model is not None:
-                        # Validate the response against the response_model
-                        model_instance = response_model(**response)
-                        return model_instance.model_dump()
-
-                    # If no validation needed, return the response
-                    return response
-
-                except (RateLimitError, RefusalError):
-                    # These errors should not trigger retries
-                    span.set_status('error', str(last_error))
-                    raise
-                except Exception as e:
-                    last_error = e
-
-                    if retry_count >= max_retries:
-                        if isinstance(e, ValidationError):
-                            logger.error(
-                                f'Validation error after {retry_count}/{max_retries} attempts: {e}'
-                            )
-                        else:
-                            logger.error(f'Max retries ({max_retries}) exceeded. Last error: {e}')
-                        span.set_status('error', str(e))
-                        span.record_exception(e)
-                        raise e
-
-                    if isinstance(e, ValidationError):
-                        response_model_cast = typing.cast(type[BaseModel], response_model)
-                        error_context = f'The previous response was invalid. Please provide a valid {response_model_cast.__name__} object. Error: {e}'
-                    else:
-                        error_context = (
-                            f'The previous response attempt was invalid. '
-                            f'Error type: {e.__class__.__name__}. '
-                            f'Error details: {str(e)}. '
-                            f'Please try again with a valid response.'
-                        )
-
-                    # Common retry logic
-                    retry_count += 1
-                    messages.append(Message(role='user', content=error_context))
-                    logger.warning(
-                        f'Retrying after error (attempt {retry_count}/{max_retries}): {e}'
-                    )
+    ) -> AsyncIterator[str]:
+        """Stream the tool input JSON produced by the Anthropic LLM."""
+        system_message = messages[0]
+        user_messages = [{'role': m.role, 'content': m.content} for m in messages[1:]]
+        user_messages_cast = typing.cast(list[MessageParam], user_messages)
+        max_creation_tokens: int = self._resolve_max_tokens(max_tokens, self.model)
 
-            # If we somehow get here, raise the last error
-            span.set_status('error', str(last_error))
-            raise last_error or Exception('Max retries exceeded with no specific error')
+        try:
+            tools, tool_choice = self._create_tool(response_model)
+            # temperature is not a typed parameter of the streaming overload in every supported
+            # SDK version, so it is sent in the request body directly
+            stream = await self.client.messages.create(
+                system=system_message.content,
+                max_tokens=max_creation_tokens,
+                messages=user_messages_cast,
+                model=self.model,
+                tools=tools,
+                tool_choice=tool_choice,
+                stream=True,
+                extra_body={'temperature': self.temperature},
+            )
+            async for event in stream:
+                if event.type == 'content_block_delta' and event.delta.type == 'input_json_delta':
+                    yield event.delta.partial_json
+        except anthropic.RateLimitError as e:
+            raise RateLimitError(f'Rate limit exceeded. Please try again later. Error: {e}') from e
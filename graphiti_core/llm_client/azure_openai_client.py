@@ -15,7 +15,8 @@ limitations under the License.
 """
 
 import logging
-from typing import ClassVar
+from collections.abc import AsyncIterator
+from typing import Any, ClassVar
 
 from openai import AsyncAzureOpenAI, AsyncOpenAI
 from openai.types.chat import ChatCompletionMessageParam
@@ -35,6 +36,7 @@ class AzureOpenAILLMClient(BaseOpenAIClient):
 
     # Class-level constants
     MAX_RETRIES: ClassVar[int] = 2
+    supports_streaming = True
 
     def __init__(
         self,
@@ -64,12 +66,48 @@ class AzureOpenAILLMClient(BaseOpenAIClient):
         verbosity: str | None,
     ):
         """Create a structured completion using Azure OpenAI's responses.parse API."""
+        request_kwargs = self._build_structured_request_kwargs(
+            model, messages, temperature, max_tokens, response_model, reasoning, verbosity
+        )
+
+        return await self.client.responses.parse(**request_kwargs)
+
+    async def _create_structured_completion_stream(
+        self,
+        model: str,
+        messages: list[ChatCompletionMessageParam],
+        temperature: float | None,
+        max_tokens: int,
+        response_model: type[BaseModel],
+        reasoning: str | None,
+        verbosity: str | None,
+    ) -> AsyncIterator[str]:
+        """Stream a structured completion using Azure OpenAI's responses.stream API."""
+        request_kwargs = self._build_structured_request_kwargs(
+            model, messages, temperature, max_tokens, response_model, reasoning, verbosity
+        )
+
+        async with self.client.responses.stream(**request_kwargs) as stream:
+            async for event in stream:
+                if event.type == 'response.output_text.delta':
+                    yield event.delta
+
+    def _build_structured_request_kwargs(
+        self,
+        model: str,
+        messages: list[ChatCompletionMessageParam],
+        temperature: float | None,
+        max_tokens: int,
+        response_model: type[BaseModel],
+        reasoning: str | None,
+        verbosity: str | None,
+    ) -> dict[str, Any]:
         supports_reasoning = self._supports_reasoning_features(model)
-        request_kwargs = {
+        request_kwargs: dict[str, Any] = {
             'model': model,
             'input': messages,
             'max_output_tokens': max_tokens,
-            'text_format': response_model,  # type: ignore
+            'text_format': response_model,
         }
 
         temperature_value = temperature if not supports_reasoning else None
@@ -77,12 +115,12 @@ class AzureOpenAILLMClient(BaseOpenAIClient):
             request_kwargs['temperature'] = temperature_value
 
         if supports_reasoning and reasoning:
-            request_kwargs['reasoning'] = {'effort': reasoning}  # type: ignore
+            request_kwargs['reasoning'] = {'effort': reasoning}
 
         if supports_reasoning and verbosity:
-            request_kwargs['text'] = {'verbosity': verbosity}  # type: ignore
+            request_kwargs['text'] = {'verbosity': verbosity}
 
-        return await self.client.responses.parse(**request_kwargs)
+        return request_kwargs
 
     async def _create_completion(
         self,
@@ -19,19 +19,23 @@ import json
 import logging
 import typing
 from abc import ABC, abstractmethod
+from collections.abc import AsyncIterator
 
 import httpx
 from diskcache import Cache
-from pydantic import BaseModel
+from pydantic import BaseModel, ValidationError
 from tenacity import retry, retry_if_exception, stop_after_attempt, wait_random_exponential
 
 from ..prompts.models import Message
 from ..tracer import NoOpTracer, Tracer
 from .config import DEFAULT_MAX_TOKENS, LLMConfig, ModelSize
-from .errors import RateLimitError
+from .errors import RateLimitError, StreamInterruptedError
+from .routing import ModelRoutingMetrics
+from .streaming import IncrementalJSONArrayParser
 
 DEFAULT_TEMPERATURE = 0
 DEFAULT_CACHE_DIR = './llm_cache'
+MAX_STRUCTURED_OUTPUT_REASKS = 2
 
 
 def get_extraction_language_instruction(group_id: str | None = None) -> str:
@@ -58,8 +62,22 @@ def get_extraction_language_instruction(group_id: str | None = None) -> str:
 logger = logging.getLogger(__name__)
 
 
+def _get_rejected_output(response: typing.Any, error: BaseException) -> str | None:
+    """Return the model output that failed parsing or validation, if it can be recovered."""
+    if response is not None:
+        return json.dumps(response)
+
+    cause: BaseException | None = error
+    while cause is not None:
+        if isinstance(cause, json.JSONDecodeError):
+            return cause.doc
+        cause = cause.__cause__ or cause.__context__
+    return None
+
+
 def is_server_or_retry_error(exception):
-    if isinstance(exception, RateLimitError | json.decoder.JSONDecodeError):
+    # Malformed output is handled by an immediate corrective re-ask instead of a backoff retry
+    if isinstance(exception, RateLimitError):
         return True
 
     return (
@@ -68,6 +86,15 @@ def is_server_or_retry_error(exception):
 
 
 class LLMClient(ABC):
+    # Providers that implement _generate_response_stream set this to True
+    supports_streaming: typing.ClassVar[bool] = False
+    # Corrective re-asks allowed after the first attempt returns malformed or invalid output
+    max_reasks: typing.ClassVar[int] = MAX_STRUCTURED_OUTPUT_REASKS
+    # Providers that pass the response model to the API natively set this to False
+    appends_response_schema: typing.ClassVar[bool] = True
+    # Providers whose SDK already retries rate limits and server errors set this to False
+    backoff_retries: typing.ClassVar[bool] = True
+
     def __init__(self, config: LLMConfig | None, cache: bool = False):
         if config is None:
             config = LLMConfig()
@@ -80,6 +107,8 @@ class LLMClient(ABC):
         self.cache_enabled = cache
         self.cache_dir = None
         self.tracer: Tracer = NoOpTracer()
+        self.routing_policy = config.routing_policy
+        self.routing_metrics = ModelRoutingMetrics()
 
         # Only create the cache directory if caching is enabled
         if self.cache_enabled:
@@ -89,6 +118,34 @@ class LLMClient(ABC):
         """Set the tracer for this LLM client."""
         self.tracer = tracer
 
+    def _route_model_size(
+        self, messages: list[Message], model_size: ModelSize, prompt_name: str | None
+    ) -> ModelSize:
+        """Pick the model size for a call according to the routing policy, if any."""
+        if self.routing_policy is None:
+            return model_size
+
+        routed_size = self.routing_policy.route(messages, model_size, prompt_name)
+        self.routing_metrics.record_route(prompt_name, routed_size)
+        if routed_size != model_size:
+            logger.debug(f'Routed {prompt_name} from {model_size.value} to {routed_size.value}')
+
+        return routed_size
+
+    def _get_fallback_model_size(
+        self, model_size: ModelSize, requested_size: ModelSize, prompt_name: str | None
+    ) -> ModelSize:
+        """Return the requested model size if routing downgraded a call whose output failed."""
+        if model_size == requested_size:
+            return model_size
+
+        self.routing_metrics.record_fallback(prompt_name)
+        logger.warning(
+            f'Falling back from {model_size.value} to {requested_size.value} model for {prompt_name}'
+        )
+
+        return requested_size
+
     def _clean_input(self, input: str) -> str:
         """Clean input string of invalid unicode and control characters.
 
@@ -134,6 +191,70 @@ class LLMClient(ABC):
         except (httpx.HTTPStatusError, RateLimitError) as e:
             raise e
 
+    async def _generate_validated_response(
+        self,
+        messages: list[Message],
+        response_model: type[BaseModel] | None = None,
+        max_tokens: int = DEFAULT_MAX_TOKENS,
+        model_size: ModelSize = ModelSize.medium,
+        requested_size: ModelSize | None = None,
+        prompt_name: str | None = None,
+    ) -> dict[str, typing.Any]:
+        """Generate a response and validate it against the response model.
+
+        Malformed or invalid output (after JSON repair in the provider) is answered with a short
+        corrective re-ask straight away rather than a backoff retry of the full generation. If
+        routing downgraded the call to the small model, the re-ask uses the requested model.
+        """
+        # Re-asks extend a private copy so the caller's messages are left untouched
+        messages = list(messages)
+        generate = (
+            self._generate_response_with_retry if self.backoff_retries else self._generate_response
+        )
+        reasks = 0
+        while True:
+            response = None
+            try:
+                response = await generate(messages, response_model, max_tokens, model_size)
+                if response_model is not None:
+                    response_model.model_validate(response)
+                return response
+            except Exception as e:
+                if not self._is_reaskable(e):
+                    raise
+                if reasks >= self.max_reasks:
+                    logger.error(f'Invalid structured output after {reasks} re-asks: {e}')
+                    raise
+                reasks += 1
+                logger.warning(
+                    f'Re-asking after invalid structured output '
+                    f'(attempt {reasks}/{self.max_reasks}): {e}'
+                )
+                # Show the model its rejected output before asking it to correct it
+                previous_output = _get_rejected_output(response, e)
+                if previous_output:
+                    messages.append(Message(role='assistant', content=previous_output))
+                messages.append(Message(role='user', content=self._get_corrective_prompt(e)))
+                model_size = self._get_fallback_model_size(
+                    model_size, requested_size or model_size, prompt_name
+                )
+
+    def _is_reaskable(self, error: Exception) -> bool:
+        """Whether an error means the output was unusable and a corrective re-ask may fix it."""
+        return isinstance(error, (json.JSONDecodeError, ValidationError))
+
+    def _get_corrective_prompt(self, error: Exception) -> str:
+        if isinstance(error, json.JSONDecodeError):
+            details = f'it was not valid JSON ({error.msg} at position {error.pos})'
+        elif isinstance(error, ValidationError):
+            details = f'it did not match the required schema: {error}'
+        else:
+            details = f'it could not be parsed: {error}'
+        return (
+            f'Your previous response could not be used because {details}. '
+            'Respond again with only the corrected JSON object in the required format.'
+        )
+
     @abstractmethod
     async def _generate_response(
         self,
@@ -144,6 +265,17 @@ class LLMClient(ABC):
     ) -> dict[str, typing.Any]:
         pass
 
+    async def _generate_response_stream(
+        self,
+        messages: list[Message],
+        response_model: type[BaseModel],
+        max_tokens: int = DEFAULT_MAX_TOKENS,
+        model_size: ModelSize = ModelSize.medium,
+    ) -> AsyncIterator[str]:
+        """Yield the raw response text as it is generated."""
+        raise NotImplementedError(f'{self.__class__.__name__} does not support streaming')
+        yield ''
+
     def _get_cache_key(self, messages: list[Message]) -> str:
         # Create a unique cache key based on the messages and model
         message_str = json.dumps([m.model_dump() for m in messages], sort_keys=True)
@@ -162,7 +294,23 @@ class LLMClient(ABC):
         if max_tokens is None:
             max_tokens = self.max_tokens
 
-        if response_model is not None:
+        routed_size = self._route_model_size(messages, model_size, prompt_name)
+        return await self._generate_routed_response(
+            messages, response_model, max_tokens, routed_size, model_size, group_id, prompt_name
+        )
+
+    async def _generate_routed_response(
+        self,
+        messages: list[Message],
+        response_model: type[BaseModel] | None,
+        max_tokens: int,
+        model_size: ModelSize,
+        requested_size: ModelSize,
+        group_id: str | None,
+        prompt_name: str | None,
+    ) -> dict[str, typing.Any]:
+        """Run generate_response for a call whose model size has already been routed."""
+        if response_model is not None and self.appends_response_schema:
             serialized_model = json.dumps(response_model.model_json_schema())
             messages[
                 -1
@@ -181,6 +329,7 @@ class LLMClient(ABC):
             attributes = {
                 'llm.provider': self._get_provider_type(),
                 'model.size': model_size.value,
+                'model.requested_size': requested_size.value,
                 'max_tokens': max_tokens,
                 'cache.enabled': self.cache_enabled,
             }
@@ -189,8 +338,8 @@ class LLMClient(ABC):
             span.add_attributes(attributes)
 
             # Check cache first
+            cache_key = self._get_cache_key(messages) if self.cache_enabled else None
             if self.cache_enabled and self.cache_dir is not None:
-                cache_key = self._get_cache_key(messages)
                 cached_response = self.cache_dir.get(cache_key)
                 if cached_response is not None:
                     logger.debug(f'Cache hit for {cache_key}')
@@ -201,21 +350,110 @@ class LLMClient(ABC):
 
             # Execute LLM call
             try:
-                response = await self._generate_response_with_retry(
-                    messages, response_model, max_tokens, model_size
+                response = await self._generate_validated_response(
+                    messages, response_model, max_tokens, model_size, requested_size, prompt_name
                 )
             except Exception as e:
                 span.set_status('error', str(e))
                 span.record_exception(e)
                 raise
 
-            # Cache response if enabled
+            # Cache response if enabled (keyed on the messages before any corrective re-asks)
             if self.cache_enabled and self.cache_dir is not None:
-                cache_key = self._get_cache_key(messages)
                 self.cache_dir.set(cache_key, response)
 
             return response
 
+    async def generate_response_stream(
+        self,
+        messages: list[Message],
+        response_model: type[BaseModel],
+        items_field: str,
+        max_tokens: int | None = None,
+        model_size: ModelSize = ModelSize.medium,
+        group_id: str | None = None,
+        prompt_name: str | None = None,
+    ) -> AsyncIterator[dict[str, typing.Any]]:
+        """Yield the items of a list field of the response as soon as each one is generated.
+
+        Providers without streaming support (or with caching enabled) fall back to a regular
+        generate_response call. The same fallback is used when the stream fails before any item
+        was emitted. A stream that fails or ends early after emitting items raises
+        StreamInterruptedError, so the caller can discard those items and request the full
+        response instead.
+
+        Args:
+            messages: Prompt messages.
+            response_model: Pydantic model describing the full response.
+            items_field: Name of the list field in the response whose items should be yielded.
+            max_tokens: Maximum number of tokens to generate.
+            model_size: Size of the model to use.
+            group_id: Optional partition identifier for the graph.
+            prompt_name: Optional prompt name for tracing.
+        """
+        if not self.supports_streaming or self.cache_enabled:
+            response = await self.generate_response(
+                messages, response_model, max_tokens, model_size, group_id, prompt_name
+            )
+            for item in response.get(items_field) or []:
+                yield item
+            return
+
+        if max_tokens is None:
+            max_tokens = self.max_tokens
+
+        requested_size = model_size
+        model_size = self._route_model_size(messages, model_size, prompt_name)
+
+        # Work on copies so the fallback path receives the original prompt
+        stream_messages = [message.model_copy() for message in messages]
+        stream_messages[0].content += get_extraction_language_instruction(group_id)
+        for message in stream_messages:
+            message.content = self._clean_input(message.content)
+
+        parser = IncrementalJSONArrayParser(items_field)
+        emitted = 0
+        with self.tracer.start_span('llm.generate_stream') as span:
+            attributes = {
+                'llm.provider': self._get_provider_type(),
+                'model.size': model_size.value,
+                'max_tokens': max_tokens,
+            }
+            if prompt_name:
+                attributes['prompt.name'] = prompt_name
+            span.add_attributes(attributes)
+
+            try:
+                async for chunk in self._generate_response_stream(
+                    stream_messages, response_model, max_tokens, model_size
+                ):
+                    for item in parser.feed(chunk):
+                        emitted += 1
+                        yield item
+            except Exception as e:
+                span.record_exception(e)
+                if emitted > 0:
+                    span.set_status('error', str(e))
+                    raise StreamInterruptedError(
+                        f'Streaming generation failed after {emitted} items: {e}'
+                    ) from e
+                logger.warning(f'Streaming generation failed, falling back to full response: {e}')
+
+            span.add_attributes({'stream.items': emitted, 'stream.complete': parser.complete})
+
+        if parser.complete:
+            return
+
+        if emitted > 0:
+            raise StreamInterruptedError(f'Streamed response ended after {emitted} items')
+
+        # The model size was already routed for the stream, so the fallback is not routed again
+        response = await self._generate_routed_response(
+            messages, response_model, max_tokens, model_size, requested_size, group_id, prompt_name
+        )
+        for item in response.get(items_field) or []:
+            yield item
+
     def _get_provider_type(self) -> str:
         """Get provider type from class name."""
         class_name = self.__class__.__name__.lower()
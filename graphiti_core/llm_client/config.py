@@ -15,6 +15,10 @@ limitations under the License.
 """
 
 from enum import Enum
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .routing import ModelRoutingPolicy
 
 DEFAULT_MAX_TOKENS = 8192
 DEFAULT_TEMPERATURE = 1
@@ -42,6 +46,7 @@ class LLMConfig:
         temperature: float = DEFAULT_TEMPERATURE,
         max_tokens: int = DEFAULT_MAX_TOKENS,
         small_model: str | None = None,
+        routing_policy: 'ModelRoutingPolicy | None' = None,
     ):
         """
         Initialize the LLMConfig with the provided parameters.
@@ -59,6 +64,10 @@ class LLMConfig:
 
                 small_model (str, optional): The specific LLM model to use for generating responses of simpler prompts.
                                                                 Defaults to "gpt-4.1-nano".
+
+                routing_policy (ModelRoutingPolicy, optional): Policy used to route medium-sized calls
+                                                                with simple prompts to the small model.
+                                                                Defaults to None, which disables routing.
         """
         self.base_url = base_url
         self.api_key = api_key
@@ -66,3 +75,4 @@ class LLMConfig:
         self.small_model = small_model
         self.temperature = temperature
         self.max_tokens = max_tokens
+        self.routing_policy = routing_policy
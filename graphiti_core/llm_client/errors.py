@@ -37,3 +37,15 @@ class EmptyResponseError(Exception):
     def __init__(self, message: str):
         self.message = message
         super().__init__(self.message)
+
+
+class StreamInterruptedError(Exception):
+    """Exception raised when a streamed response breaks off after some of its items were yielded.
+
+    The caller has already consumed those items, so it should discard them and request the full
+    response again instead of mixing items from two generations.
+    """
+
+    def __init__(self, message: str):
+        self.message = message
+        super().__init__(self.message)
@@ -23,9 +23,10 @@ from typing import TYPE_CHECKING, ClassVar
 from pydantic import BaseModel
 
 from ..prompts.models import Message
-from .client import LLMClient, get_extraction_language_instruction
+from .client import LLMClient
 from .config import LLMConfig, ModelSize
-from .errors import RateLimitError
+from .errors import RateLimitError, RefusalError
+from .json_repair import parse_json_output
 
 if TYPE_CHECKING:
     from google import genai
@@ -88,6 +89,11 @@ class GeminiClient(LLMClient):
 
     # Class-level constants
     MAX_RETRIES: ClassVar[int] = 2
+    # MAX_RETRIES counts the first attempt
+    max_reasks: ClassVar[int] = MAX_RETRIES - 1
+    # The response model is passed as the response schema, and the SDK retries transient errors
+    appends_response_schema: ClassVar[bool] = False
+    backoff_retries: ClassVar[bool] = False
 
     def __init__(
         self,
@@ -273,11 +279,12 @@ class GeminiClient(LLMClient):
                 system_prompt = f'{messages[0].content}\n\n {system_prompt}'
                 messages = messages[1:]
 
-            # Add the rest of the messages
+            # Add the rest of the messages (Gemini names the assistant role "model")
             for m in messages:
                 m.content = self._clean_input(m.content)
+                role = 'model' if m.role == 'assistant' else m.role
                 gemini_messages.append(
-                    types.Content(role=m.role, parts=[types.Part.from_text(text=m.content)])
+                    types.Content(role=role, parts=[types.Part.from_text(text=m.content)])
                 )
 
             # Get the appropriate model for the requested size
@@ -316,7 +323,7 @@ class GeminiClient(LLMClient):
                     if not raw_output:
                         raise ValueError('No response text')
 
-                    validated_model = response_model.model_validate(json.loads(raw_output))
+                    validated_model = response_model.model_validate(parse_json_output(raw_output))
 
                     # Return as a dictionary for API consistency
                     return validated_model.model_dump()
@@ -347,100 +354,13 @@ class GeminiClient(LLMClient):
             ):
                 raise RateLimitError from e
 
+            # Safety blocks are not retried, as the same content will be blocked again
+            if 'safety' in error_message or 'blocked' in error_message:
+                logger.warning(f'Content blocked by safety filters: {e}')
+                raise RefusalError(f'Content blocked by safety filters: {e}') from e
+
             logger.error(f'Error in generating LLM response: {e}')
             raise Exception from e
 
-    async def generate_response(
-        self,
-        messages: list[Message],
-        response_model: type[BaseModel] | None = None,
-        max_tokens: int | None = None,
-        model_size: ModelSize = ModelSize.medium,
-        group_id: str | None = None,
-        prompt_name: str | None = None,
-    ) -> dict[str, typing.Any]:
-        """
-        Generate a response from the Gemini language model with retry logic and error handling.
-        This method overrides the parent class method to provide a direct implementation with advanced retry logic.
-
-        Args:
-            messages (list[Message]): A list of messages to send to the language model.
-            response_model (type[BaseModel] | None): An optional Pydantic model to parse the response into.
-            max_tokens (int | None): The maximum number of tokens to generate in the response.
-            model_size (ModelSize): The size of the model to use (small or medium).
-            group_id (str | None): Optional partition identifier for the graph.
-            prompt_name (str | None): Optional name of the prompt for tracing.
-
-        Returns:
-            dict[str, typing.Any]: The response from the language model.
-        """
-        # Add multilingual extraction instructions
-        messages[0].content += get_extraction_language_instruction(group_id)
-
-        # Wrap entire operation in tracing span
-        with self.tracer.start_span('llm.generate') as span:
-            attributes = {
-                'llm.provider': 'gemini',
-                'model.size': model_size.value,
-                'max_tokens': max_tokens or self.max_tokens,
-            }
-            if prompt_name:
-                attributes['prompt.name'] = prompt_name
-            span.add_attributes(attributes)
-
-            retry_count = 0
-            last_error = None
-            last_output = None
-
-            while retry_count < self.MAX_RETRIES:
-                try:
-                    response = await self._generate_response(
-                        messages=messages,
-                        response_model=response_model,
-                        max_tokens=max_tokens,
-                        model_size=model_size,
-                    )
-                    last_output = (
-                        response.get('content')
-                        if isinstance(response, dict) and 'content' in response
-                        else None
-                    )
-                    return response
-                except RateLimitError as e:
-                    # Rate limit errors should not trigger retries (fail fast)
-                    span.set_status('error', str(e))
-                    raise e
-                except Exception as e:
-                    last_error = e
-
-                    # Check if this is a safety block - these typically shouldn't be retried
-                    error_text = str(e) or (str(e.__cause__) if e.__cause__ else '')
-                    if 'safety' in error_text.lower() or 'blocked' in error_text.lower():
-                        logger.warning(f'Content blocked by safety filters: {e}')
-                        span.set_status('error', str(e))
-                        raise Exception(f'Content blocked by safety filters: {e}') from e
-
-                    retry_count += 1
-
-                    # Construct a detailed error message for the LLM
-                    error_context = (
-                        f'The previous response attempt was invalid. '
-                        f'Error type: {e.__class__.__name__}. '
-                        f'Error details: {str(e)}. '
-                        f'Please try again with a valid response, ensuring the output matches '
-                        f'the expected format and constraints.'
-                    )
-
-                    error_message = Message(role='user', content=error_context)
-                    messages.append(error_message)
-                    logger.warning(
-                        f'Retrying after application error (attempt {retry_count}/{self.MAX_RETRIES}): {e}'
-                    )
-
-            # If we exit the loop without returning, all retries are exhausted
-            logger.error('🦀 LLM generation failed and retries are exhausted.')
-            logger.error(self._get_failed_generation_log(messages, last_output))
-            logger.error(f'Max retries ({self.MAX_RETRIES}) exceeded. Last error: {last_error}')
-            span.set_status('error', str(last_error))
-            span.record_exception(last_error) if last_error else None
-            raise last_error or Exception('Max retries exceeded')
+    def _is_reaskable(self, error: Exception) -> bool:
+        return not isinstance(error, (RateLimitError, RefusalError))
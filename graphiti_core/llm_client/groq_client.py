@@ -14,7 +14,6 @@ See the License for the specific language governing permissions and
 limitations under the License.
 """
 
-import json
 import logging
 import typing
 from typing import TYPE_CHECKING
@@ -38,6 +37,7 @@ from ..prompts.models import Message
 from .client import LLMClient
 from .config import LLMConfig, ModelSize
 from .errors import RateLimitError
+from .json_repair import parse_json_output
 
 logger = logging.getLogger(__name__)
 
@@ -77,7 +77,7 @@ class GroqClient(LLMClient):
                 response_format={'type': 'json_object'},
             )
             result = response.choices[0].message.content or ''
-            return json.loads(result)
+            return parse_json_output(result)
         except groq.RateLimitError as e:
             raise RateLimitError from e
         except Exception as e:
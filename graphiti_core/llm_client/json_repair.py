@@ -0,0 +1,135 @@
+"""
+Copyright 2024, Zep Software, Inc.
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+import json
+import logging
+import re
+import typing
+
+logger = logging.getLogger(__name__)
+
+CODE_FENCE_PATTERN = re.compile(r'```(?:json|JSON)?\s*\n?(.*?)(?:\n?```|$)', re.DOTALL)
+CLOSING_BRACKETS = {'{': '}', '[': ']'}
+
+
+def _strip_code_fences(text: str) -> str:
+    match = CODE_FENCE_PATTERN.search(text)
+    if match:
+        return match.group(1)
+    return text
+
+
+def repair_json(text: str) -> list[str]:
+    """
+    Deterministically repair common defects in LLM-generated JSON.
+
+    Handles markdown code fences, prose around the JSON, trailing commas, and output that
+    was truncated mid-way (unterminated strings and unclosed brackets).
+
+    Args:
+        text: The raw output from the LLM.
+
+    Returns:
+        Candidate repairs, most faithful first. The second candidate, when present,
+        drops a trailing element that was cut off mid-value.
+    """
+    text = _strip_code_fences(text)
+
+    starts = [idx for idx in (text.find('{'), text.find('[')) if idx >= 0]
+    if not starts:
+        return []
+    text = text[min(starts) :]
+
+    output: list[str] = []
+    stack: list[str] = []
+    in_string = False
+    escape = False
+    # Output length and open brackets at the last comma outside of a string
+    last_comma: tuple[int, list[str]] | None = None
+
+    for char in text:
+        if in_string:
+            output.append(char)
+            if escape:
+                escape = False
+            elif char == '\\':
+                escape = True
+            elif char == '"':
+                in_string = False
+            continue
+
+        if char == '"':
+            in_string = True
+        elif char in CLOSING_BRACKETS:
+            stack.append(char)
+        elif char in '}]':
+            # Drop trailing commas before a closing bracket
+            while output and output[-1].isspace():
+                output.pop()
+            if output and output[-1] == ',':
+                output.pop()
+            if stack:
+                stack.pop()
+            output.append(char)
+            if not stack:
+                break
+            continue
+        elif char == ',':
+            last_comma = (len(output), list(stack))
+
+        output.append(char)
+
+    repaired = ''.join(output)
+    if in_string:
+        if escape:
+            repaired = repaired[:-1]
+        repaired += '"'
+    repaired = repaired.rstrip().rstrip(',')
+
+    candidates = [repaired + ''.join(CLOSING_BRACKETS[b] for b in reversed(stack))]
+    if stack and last_comma is not None:
+        length, comma_stack = last_comma
+        candidates.append(
+            ''.join(output[:length]) + ''.join(CLOSING_BRACKETS[b] for b in reversed(comma_stack))
+        )
+
+    return candidates
+
+
+def parse_json_output(raw_output: str) -> typing.Any:
+    """
+    Parse JSON produced by an LLM, falling back to deterministic repair when it is malformed.
+
+    Args:
+        raw_output: The raw output from the LLM.
+
+    Returns:
+        The decoded JSON value.
+
+    Raises:
+        json.JSONDecodeError: If the output cannot be parsed even after repair.
+    """
+    try:
+        return json.loads(raw_output)
+    except json.JSONDecodeError as e:
+        for candidate in repair_json(raw_output):
+            try:
+                result = json.loads(candidate)
+            except json.JSONDecodeError:
+                continue
+            logger.warning(f'Repaired malformed JSON output from LLM: {e}')
+            return result
+        raise
@@ -14,10 +14,9 @@ See the License for the specific language governing permissions and
 limitations under the License.
 """
 
-import json
 import logging
-import typing
 from abc import abstractmethod
+from collections.abc import AsyncIterator
 from typing import Any, ClassVar
 
 import openai
@@ -25,9 +24,10 @@ from openai.types.chat import ChatCompletionMessageParam
 from pydantic import BaseModel
 
 from ..prompts.models import Message
-from .client import LLMClient, get_extraction_language_instruction
+from .client import LLMClient
 from .config import DEFAULT_MAX_TOKENS, LLMConfig, ModelSize
 from .errors import RateLimitError, RefusalError
+from .json_repair import parse_json_output
 
 logger = logging.getLogger(__name__)
 
@@ -47,6 +47,10 @@ class BaseOpenAIClient(LLMClient):
 
     # Class-level constants
     MAX_RETRIES: ClassVar[int] = 2
+    max_reasks: ClassVar[int] = MAX_RETRIES
+    # Structured outputs pass the response model to the API, and the SDK retries on its own
+    appends_response_schema: ClassVar[bool] = False
+    backoff_retries: ClassVar[bool] = False
 
     def __init__(
         self,
@@ -93,6 +97,20 @@ class BaseOpenAIClient(LLMClient):
         """Create a structured completion using the specific client implementation."""
         pass
 
+    async def _create_structured_completion_stream(
+        self,
+        model: str,
+        messages: list[ChatCompletionMessageParam],
+        temperature: float | None,
+        max_tokens: int,
+        response_model: type[BaseModel],
+        reasoning: str | None,
+        verbosity: str | None,
+    ) -> AsyncIterator[str]:
+        """Stream a structured completion, yielding output text deltas."""
+        raise NotImplementedError(f'{self.__class__.__name__} does not support streaming')
+        yield ''
+
     def _convert_messages_to_openai_format(
         self, messages: list[Message]
     ) -> list[ChatCompletionMessageParam]:
@@ -104,6 +122,8 @@ class BaseOpenAIClient(LLMClient):
                 openai_messages.append({'role': 'user', 'content': m.content})
             elif m.role == 'system':
                 openai_messages.append({'role': 'system', 'content': m.content})
+            elif m.role == 'assistant':
+                openai_messages.append({'role': 'assistant', 'content': m.content})
         return openai_messages
 
     def _get_model_for_size(self, model_size: ModelSize) -> str:
@@ -118,7 +138,7 @@ class BaseOpenAIClient(LLMClient):
         response_object = response.output_text
 
         if response_object:
-            return json.loads(response_object)
+            return parse_json_output(response_object)
         elif response_object.refusal:
             raise RefusalError(response_object.refusal)
         else:
@@ -127,7 +147,7 @@ class BaseOpenAIClient(LLMClient):
     def _handle_json_response(self, response: Any) -> dict[str, Any]:
         """Handle JSON response parsing."""
         result = response.choices[0].message.content or '{}'
-        return json.loads(result)
+        return parse_json_output(result)
 
     async def _generate_response(
         self,
@@ -181,81 +201,40 @@ class BaseOpenAIClient(LLMClient):
                 logger.error(f'Error in generating LLM response: {e}')
             raise
 
-    async def generate_response(
+    async def _generate_response_stream(
         self,
         messages: list[Message],
-        response_model: type[BaseModel] | None = None,
-        max_tokens: int | None = None,
+        response_model: type[BaseModel],
+        max_tokens: int = DEFAULT_MAX_TOKENS,
         model_size: ModelSize = ModelSize.medium,
-        group_id: str | None = None,
-        prompt_name: str | None = None,
-    ) -> dict[str, typing.Any]:
-        """Generate a response with retry logic and error handling."""
-        if max_tokens is None:
-            max_tokens = self.max_tokens
-
-        # Add multilingual extraction instructions
-        messages[0].content += get_extraction_language_instruction(group_id)
-
-        # Wrap entire operation in tracing span
-        with self.tracer.start_span('llm.generate') as span:
-            attributes = {
-                'llm.provider': 'openai',
-                'model.size': model_size.value,
-                'max_tokens': max_tokens,
-            }
-            if prompt_name:
-                attributes['prompt.name'] = prompt_name
-            span.add_attributes(attributes)
-
-            retry_count = 0
-            last_error = None
-
-            while retry_count <= self.MAX_RETRIES:
-                try:
-                    response = await self._generate_response(
-                        messages, response_model, max_tokens, model_size
-                    )
-                    return response
-                except (RateLimitError, RefusalError):
-                    # These errors should not trigger retries
-                    span.set_status('error', str(last_error))
-                    raise
-                except (
-                    openai.APITimeoutError,
-                    openai.APIConnectionError,
-                    openai.InternalServerError,
-                ):
-                    # Let OpenAI's client handle these retries
-                    span.set_status('error', str(last_error))
-                    raise
-                except Exception as e:
-                    last_error = e
-
-                    # Don't retry if we've hit the max retries
-                    if retry_count >= self.MAX_RETRIES:
-                        logger.error(f'Max retries ({self.MAX_RETRIES}) exceeded. Last error: {e}')
-                        span.set_status('error', str(e))
-                        span.record_exception(e)
-                        raise
-
-                    retry_count += 1
-
-                    # Construct a detailed error message for the LLM
-                    error_context = (
-                        f'The previous response attempt was invalid. '
-                        f'Error type: {e.__class__.__name__}. '
-                        f'Error details: {str(e)}. '
-                        f'Please try again with a valid response, ensuring the output matches '
-                        f'the expected format and constraints.'
-                    )
+    ) -> AsyncIterator[str]:
+        """Stream a structured response using the appropriate client implementation."""
+        openai_messages = self._convert_messages_to_openai_format(messages)
+        model = self._get_model_for_size(model_size)
 
-                    error_message = Message(role='user', content=error_context)
-                    messages.append(error_message)
-                    logger.warning(
-                        f'Retrying after application error (attempt {retry_count}/{self.MAX_RETRIES}): {e}'
-                    )
+        try:
+            async for delta in self._create_structured_completion_stream(
+                model=model,
+                messages=openai_messages,
+                temperature=self.temperature,
+                max_tokens=max_tokens or self.max_tokens,
+                response_model=response_model,
+                reasoning=self.reasoning,
+                verbosity=self.verbosity,
+            ):
+                yield delta
+        except openai.RateLimitError as e:
+            raise RateLimitError from e
 
-            # If we somehow get here, raise the last error
-            span.set_status('error', str(last_error))
-            raise last_error or Exception('Max retries exceeded with no specific error')
+    def _is_reaskable(self, error: Exception) -> bool:
+        # Rate limits and refusals fail fast; OpenAI's client retries transport and server errors
+        return not isinstance(
+            error,
+            (
+                RateLimitError,
+                RefusalError,
+                openai.APITimeoutError,
+                openai.APIConnectionError,
+                openai.InternalServerError,
+            ),
+        )
@@ -15,6 +15,7 @@ limitations under the License.
 """
 
 import typing
+from collections.abc import AsyncIterator
 
 from openai import AsyncOpenAI
 from openai.types.chat import ChatCompletionMessageParam
@@ -35,6 +36,8 @@ class OpenAIClient(BaseOpenAIClient):
         client (AsyncOpenAI): The OpenAI client used to interact with the API.
     """
 
+    supports_streaming = True
+
     def __init__(
         self,
         config: LLMConfig | None = None,
@@ -90,6 +93,35 @@ class OpenAIClient(BaseOpenAIClient):
 
         return response
 
+    async def _create_structured_completion_stream(
+        self,
+        model: str,
+        messages: list[ChatCompletionMessageParam],
+        temperature: float | None,
+        max_tokens: int,
+        response_model: type[BaseModel],
+        reasoning: str | None = None,
+        verbosity: str | None = None,
+    ) -> AsyncIterator[str]:
+        """Stream a structured completion using OpenAI's responses streaming API."""
+        # Reasoning models (gpt-5 family) don't support temperature
+        is_reasoning_model = (
+            model.startswith('gpt-5') or model.startswith('o1') or model.startswith('o3')
+        )
+
+        async with self.client.responses.stream(
+            model=model,
+            input=messages,  # type: ignore
+            temperature=temperature if not is_reasoning_model else None,
+            max_output_tokens=max_tokens,
+            text_format=response_model,  # type: ignore
+            reasoning={'effort': reasoning} if reasoning is not None else None,  # type: ignore
+            text={'verbosity': verbosity} if verbosity is not None else None,  # type: ignore
+        ) as stream:
+            async for event in stream:
+                if event.type == 'response.output_text.delta':
+                    yield event.delta
+
     async def _create_completion(
         self,
         model: str,
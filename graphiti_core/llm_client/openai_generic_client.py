@@ -14,9 +14,9 @@ See the License for the specific language governing permissions and
 limitations under the License.
 """
 
-import json
 import logging
 import typing
+from collections.abc import AsyncIterator
 from typing import Any, ClassVar
 
 import openai
@@ -25,9 +25,10 @@ from openai.types.chat import ChatCompletionMessageParam
 from pydantic import BaseModel
 
 from ..prompts.models import Message
-from .client import LLMClient, get_extraction_language_instruction
+from .client import LLMClient
 from .config import DEFAULT_MAX_TOKENS, LLMConfig, ModelSize
 from .errors import RateLimitError, RefusalError
+from .json_repair import parse_json_output
 
 logger = logging.getLogger(__name__)
 
@@ -57,6 +58,11 @@ class OpenAIGenericClient(LLMClient):
 
     # Class-level constants
     MAX_RETRIES: ClassVar[int] = 2
+    max_reasks: ClassVar[int] = MAX_RETRIES
+    supports_streaming = True
+    # The response model is passed as a JSON schema, and the SDK retries transient errors itself
+    appends_response_schema = False
+    backoff_retries = False
 
     def __init__(
         self,
@@ -106,6 +112,8 @@ class OpenAIGenericClient(LLMClient):
                 openai_messages.append({'role': 'user', 'content': m.content})
             elif m.role == 'system':
                 openai_messages.append({'role': 'system', 'content': m.content})
+            elif m.role == 'assistant':
+                openai_messages.append({'role': 'assistant', 'content': m.content})
         try:
             # Prepare response format
             response_format: dict[str, Any] = {'type': 'json_object'}
@@ -128,87 +136,61 @@ class OpenAIGenericClient(LLMClient):
                 response_format=response_format,  # type: ignore[arg-type]
             )
             result = response.choices[0].message.content or ''
-            return json.loads(result)
+            return parse_json_output(result)
         except openai.RateLimitError as e:
             raise RateLimitError from e
         except Exception as e:
             logger.error(f'Error in generating LLM response: {e}')
             raise
 
-    async def generate_response(
+    async def _generate_response_stream(
         self,
         messages: list[Message],
-        response_model: type[BaseModel] | None = None,
-        max_tokens: int | None = None,
+        response_model: type[BaseModel],
+        max_tokens: int = DEFAULT_MAX_TOKENS,
         model_size: ModelSize = ModelSize.medium,
-        group_id: str | None = None,
-        prompt_name: str | None = None,
-    ) -> dict[str, typing.Any]:
-        if max_tokens is None:
-            max_tokens = self.max_tokens
-
-        # Add multilingual extraction instructions
-        messages[0].content += get_extraction_language_instruction(group_id)
-
-        # Wrap entire operation in tracing span
-        with self.tracer.start_span('llm.generate') as span:
-            attributes = {
-                'llm.provider': 'openai',
-                'model.size': model_size.value,
-                'max_tokens': max_tokens,
-            }
-            if prompt_name:
-                attributes['prompt.name'] = prompt_name
-            span.add_attributes(attributes)
-
-            retry_count = 0
-            last_error = None
-
-            while retry_count <= self.MAX_RETRIES:
-                try:
-                    response = await self._generate_response(
-                        messages, response_model, max_tokens=max_tokens, model_size=model_size
-                    )
-                    return response
-                except (RateLimitError, RefusalError):
-                    # These errors should not trigger retries
-                    span.set_status('error', str(last_error))
-                    raise
-                except (
-                    openai.APITimeoutError,
-                    openai.APIConnectionError,
-                    openai.InternalServerError,
-                ):
-                    # Let OpenAI's client handle these retries
-                    span.set_status('error', str(last_error))
-                    raise
-                except Exception as e:
-                    last_error = e
-
-                    # Don't retry if we've hit the max retries
-                    if retry_count >= self.MAX_RETRIES:
-                        logger.error(f'Max retries ({self.MAX_RETRIES}) exceeded. Last error: {e}')
-                        span.set_status('error', str(e))
-                        span.record_exception(e)
-                        raise
-
-                    retry_count += 1
-
-                    # Construct a detailed error message for the LLM
-                    error_context = (
-                        f'The previous response attempt was invalid. '
-                        f'Error type: {e.__class__.__name__}. '
-                        f'Error details: {str(e)}. '
-                        f'Please try again with a valid response, ensuring the output matches '
-                        f'the expected format and constraints.'
-                    )
-
-                    error_message = Message(role='user', content=error_context)
-                    messages.append(error_message)
-                    logger.warning(
-                        f'Retrying after application error (attempt {retry_count}/{self.MAX_RETRIES}): {e}'
-                    )
-
-            # If we somehow get here, raise the last error
-            span.set_status('error', str(last_error))
-            raise last_error or Exception('Max retries exceeded with no specific error')
+    ) -> AsyncIterator[str]:
+        openai_messages: list[ChatCompletionMessageParam] = []
+        for m in messages:
+            if m.role == 'user':
+                openai_messages.append({'role': 'user', 'content': m.content})
+            elif m.role == 'system':
+                openai_messages.append({'role': 'system', 'content': m.content})
+            elif m.role == 'assistant':
+                openai_messages.append({'role': 'assistant', 'content': m.content})
+
+        response_format: dict[str, Any] = {
+            'type': 'json_schema',
+            'json_schema': {
+                'name': getattr(response_model, '__name__', 'structured_response'),
+                'schema': response_model.model_json_schema(),
+            },
+        }
+
+        try:
+            stream = await self.client.chat.completions.create(
+                model=self.model or DEFAULT_MODEL,
+                messages=openai_messages,
+                temperature=self.temperature,
+                max_tokens=self.max_tokens,
+                response_format=response_format,  # type: ignore[arg-type]
+                stream=True,
+            )
+            async for chunk in stream:
+                if chunk.choices and chunk.choices[0].delta.content:
+                    yield chunk.choices[0].delta.content
+        except openai.RateLimitError as e:
+            raise RateLimitError from e
+
+    def _is_reaskable(self, error: Exception) -> bool:
+        # Rate limits and refusals fail fast; OpenAI's client retries transport and server errors
+        return not isinstance(
+            error,
+            (
+                RateLimitError,
+                RefusalError,
+                openai.APITimeoutError,
+                openai.APIConnectionError,
+                openai.InternalServerError,
+            ),
+        )
@@ -0,0 +1,102 @@
+"""
+Copyright 2024, Zep Software, Inc.
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+import os
+from collections import Counter
+from typing import Any
+
+from ..prompts.models import Message
+from .config import ModelSize
+
+APPROX_CHARS_PER_TOKEN = 4
+DEFAULT_SMALL_MODEL_MAX_PROMPT_TOKENS = int(os.getenv('SMALL_MODEL_MAX_PROMPT_TOKENS', 1500))
+
+# The episode source type selects the node extraction prompt, so source type rules are
+# expressed as prompt rules. JSON episodes keep the stronger model regardless of size.
+DEFAULT_PROMPT_RULES: dict[str, ModelSize | int] = {
+    'extract_nodes.extract_json': ModelSize.medium,
+}
+
+
+class ModelRoutingPolicy:
+    """
+    Routes medium-sized LLM calls to the small model when the prompt is simple enough.
+
+    Calls that explicitly request the small model are never upgraded. A medium call is
+    routed to the small model when its estimated prompt size is within the token limit of
+    its prompt rule (or the default limit). A rule may also pin a prompt to a ModelSize.
+    """
+
+    def __init__(
+        self,
+        small_model_max_prompt_tokens: int = DEFAULT_SMALL_MODEL_MAX_PROMPT_TOKENS,
+        prompt_rules: dict[str, ModelSize | int] | None = None,
+    ):
+        """
+        Initialize the ModelRoutingPolicy.
+
+        Args:
+            small_model_max_prompt_tokens: Largest estimated prompt size, in tokens, that is
+                routed to the small model when no prompt rule applies.
+            prompt_rules: Per-prompt rules keyed by prompt name. A ModelSize pins the prompt
+                to that model, an int overrides the token limit for that prompt. Merged over
+                DEFAULT_PROMPT_RULES.
+        """
+        self.small_model_max_prompt_tokens = small_model_max_prompt_tokens
+        self.prompt_rules = {**DEFAULT_PROMPT_RULES, **(prompt_rules or {})}
+
+    def route(
+        self, messages: list[Message], model_size: ModelSize, prompt_name: str | None = None
+    ) -> ModelSize:
+        if model_size == ModelSize.small:
+            return model_size
+
+        rule = self.prompt_rules.get(prompt_name) if prompt_name else None
+        if isinstance(rule, ModelSize):
+            return rule
+
+        max_tokens = rule if rule is not None else self.small_model_max_prompt_tokens
+        if estimate_prompt_tokens(messages) <= max_tokens:
+            return ModelSize.small
+
+        return model_size
+
+
+class ModelRoutingMetrics:
+    """Counts routing decisions and validation fallbacks per prompt."""
+
+    def __init__(self):
+        self.routed: Counter[tuple[str, str]] = Counter()
+        self.fallbacks: Counter[str] = Counter()
+
+    def record_route(self, prompt_name: str | None, model_size: ModelSize):
+        self.routed[(prompt_name or 'unknown', model_size.value)] += 1
+
+    def record_fallback(self, prompt_name: str | None):
+        self.fallbacks[prompt_name or 'unknown'] += 1
+
+    def snapshot(self) -> dict[str, Any]:
+        return {
+            'routed': {
+                f'{prompt_name}:{model_size}': count
+                for (prompt_name, model_size), count in self.routed.items()
+            },
+            'fallbacks': dict(self.fallbacks),
+        }
+
+
+def estimate_prompt_tokens(messages: list[Message]) -> int:
+    return sum(len(message.content) for message in messages) // APPROX_CHARS_PER_TOKEN
@@ -0,0 +1,134 @@
+"""
+Copyright 2024, Zep Software, Inc.
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+import json
+import logging
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+
+class IncrementalJSONArrayParser:
+    """
+    Incrementally parse the items of a list field in a streamed JSON object.
+
+    Text chunks are fed as they arrive from the LLM. Every time an item of the
+    top-level `field` array is closed it is decoded and returned, so callers can
+    start processing early items while later ones are still being generated.
+    Only object items are emitted; anything outside the target field
+    (including markdown fences or prose around the JSON) is ignored.
+    """
+
+    def __init__(self, field: str):
+        self.field = field
+        self.complete = False
+
+        self._buffer = ''
+        self._pos = 0
+        self._stack: list[str] = []
+        self._in_string = False
+        self._escape = False
+        self._string_start = -1
+        self._last_key: str | None = None
+        self._array_depth: int | None = None
+        self._item_start = -1
+
+    def feed(self, chunk: str) -> list[dict[str, Any]]:
+        """Consume a chunk of text and return any items completed by it."""
+        self._buffer += chunk
+        items: list[dict[str, Any]] = []
+
+        buffer = self._buffer
+        pos = self._pos
+        while pos < len(buffer):
+            char = buffer[pos]
+
+            if self._in_string:
+                if self._escape:
+                    self._escape = False
+                elif char == '\\':
+                    self._escape = True
+                elif char == '"':
+                    self._in_string = False
+                    if len(self._stack) == 1 and self._stack[0] == '{':
+                        self._last_key = buffer[self._string_start + 1 : pos]
+                pos += 1
+                continue
+
+            if char == '"':
+                self._in_string = True
+                self._string_start = pos
+            elif char in '{[':
+                if (
+                    char == '['
+                    and self._array_depth is None
+                    and not self.complete
+                    and len(self._stack) == 1
+                    and self._last_key == self.field
+                ):
+                    self._array_depth = len(self._stack) + 1
+                elif self._array_depth is not None and len(self._stack) == self._array_depth:
+                    self._item_start = pos
+                self._stack.append(char)
+            elif char in '}]':
+                if self._stack:
+                    self._stack.pop()
+                if self._array_depth is not None:
+                    if len(self._stack) == self._array_depth and self._item_start >= 0:
+                        item = self._decode(buffer[self._item_start : pos + 1])
+                        if item is not None:
+                            items.append(item)
+                        self._item_start = -1
+                    elif len(self._stack) < self._array_depth:
+                        self._array_depth = None
+                        self.complete = True
+            elif char == ',' and len(self._stack) == 1:
+                self._last_key = None
+            pos += 1
+
+        self._pos = pos
+        self._compact()
+
+        return items
+
+    def _decode(self, text: str) -> dict[str, Any] | None:
+        try:
+            item = json.loads(text)
+        except json.JSONDecodeError as e:
+            logger.warning(f'Skipping malformed streamed item for {self.field}: {e}')
+            return None
+
+        if not isinstance(item, dict):
+            return None
+
+        return item
+
+    def _compact(self):
+        # Keep only the text that may still be needed to decode a pending item or key
+        keep_from = self._pos
+        if self._item_start >= 0:
+            keep_from = min(keep_from, self._item_start)
+        if self._in_string:
+            keep_from = min(keep_from, self._string_start)
+        if keep_from == 0:
+            return
+
+        self._buffer = self._buffer[keep_from:]
+        self._pos -= keep_from
+        if self._item_start >= 0:
+            self._item_start -= keep_from
+        if self._string_start >= 0:
+            self._string_start -= keep_from
@@ -222,6 +222,35 @@ def get_entity_edge_return_query(provider: GraphProvider) -> str:
     )
 
 
+def get_entity_edge_candidate_return_query(
+    provider: GraphProvider, with_embedding: bool = False
+) -> str:
+    # Search candidates carry the fields rerankers read but not `attributes`, which on most
+    # providers holds every stored property including the embeddings.
+    return (
+        """
+        e.uuid AS uuid,
+        n.uuid AS source_node_uuid,
+        m.uuid AS target_node_uuid,
+        e.group_id AS group_id,
+        e.created_at AS created_at,
+        e.name AS name,
+        e.fact AS fact,
+        """
+        + (
+            "split(e.episodes, ',') AS episodes,"
+            if provider == GraphProvider.NEPTUNE
+            else 'e.episodes AS episodes,'
+        )
+        + """
+        e.expired_at AS expired_at,
+        e.valid_at AS valid_at,
+        e.invalid_at AS invalid_at
+        """
+        + (',e.fact_embedding AS fact_embedding' if with_embedding else '')
+    )
+
+
 def get_community_edge_save_query(provider: GraphProvider) -> str:
     match provider:
         case GraphProvider.FALKORDB:
@@ -126,13 +126,25 @@ EPISODIC_NODE_RETURN_NEPTUNE = """
 """
 
 
+# Entity saves replace every node property. These clauses carry the stored statistics (see
+# ENTITY_NODE_STATISTICS_UPDATE) across the replace so that a save does not wipe them.
+ENTITY_NODE_STATISTICS_CARRY = (
+    'n.mention_count AS mention_count, n.degree AS degree, n.centrality AS centrality'
+)
+ENTITY_NODE_STATISTICS_RESTORE = (
+    'SET n.mention_count = mention_count, n.degree = degree, n.centrality = centrality'
+)
+
+
 def get_entity_node_save_query(provider: GraphProvider, labels: str, has_aoss: bool = False) -> str:
     match provider:
         case GraphProvider.FALKORDB:
             return f"""
                 MERGE (n:Entity {{uuid: $entity_data.uuid}})
                 SET n:{labels}
+                WITH n, {ENTITY_NODE_STATISTICS_CARRY}
                 SET n = $entity_data
+                {ENTITY_NODE_STATISTICS_RESTORE}
                 SET n.name_embedding = vecf32($entity_data.name_embedding)
                 RETURN n.uuid AS uuid
             """
@@ -157,7 +169,9 @@ def get_entity_node_save_query(provider: GraphProvider, labels: str, has_aoss: b
             return f"""
                 MERGE (n:Entity {{uuid: $entity_data.uuid}})
                 {label_subquery}
+                WITH n, {ENTITY_NODE_STATISTICS_CARRY}
                 SET n = removeKeyFromMap(removeKeyFromMap($entity_data, "labels"), "name_embedding")
+                {ENTITY_NODE_STATISTICS_RESTORE}
                 SET n.name_embedding = join([x IN coalesce($entity_data.name_embedding, []) | toString(x) ], ",")
                 RETURN n.uuid AS uuid
             """
@@ -171,7 +185,9 @@ def get_entity_node_save_query(provider: GraphProvider, labels: str, has_aoss: b
                 f"""
                 MERGE (n:Entity {{uuid: $entity_data.uuid}})
                 SET n:{labels}
+                WITH n, {ENTITY_NODE_STATISTICS_CARRY}
                 SET n = $entity_data
+                {ENTITY_NODE_STATISTICS_RESTORE}
                 """
                 + save_embedding_query
                 + """
@@ -194,7 +210,9 @@ def get_entity_node_save_bulk_query(
                             UNWIND $nodes AS node
                             MERGE (n:Entity {{uuid: node.uuid}})
                             SET n:{label}
+                            WITH n, node, {ENTITY_NODE_STATISTICS_CARRY}
                             SET n = node
+                            {ENTITY_NODE_STATISTICS_RESTORE}
                             WITH n, node
                             SET n.name_embedding = vecf32(node.name_embedding)
                             RETURN n.uuid AS uuid
@@ -214,7 +232,9 @@ def get_entity_node_save_bulk_query(
                         UNWIND $nodes AS node
                         MERGE (n:Entity {{uuid: node.uuid}})
                         {labels}
+                        WITH n, node, {ENTITY_NODE_STATISTICS_CARRY}
                         SET n = removeKeyFromMap(removeKeyFromMap(node, "labels"), "name_embedding")
+                        {ENTITY_NODE_STATISTICS_RESTORE}
                         SET n.name_embedding = join([x IN coalesce(node.name_embedding, []) | toString(x) ], ",")
                         RETURN n.uuid AS uuid
                     """
@@ -240,11 +260,13 @@ def get_entity_node_save_bulk_query(
                 else ''
             )
             return (
-                """
+                f"""
                     UNWIND $nodes AS node
-                    MERGE (n:Entity {uuid: node.uuid})
+                    MERGE (n:Entity {{uuid: node.uuid}})
                     SET n:$(node.labels)
+                    WITH n, node, {ENTITY_NODE_STATISTICS_CARRY}
                     SET n = node
+                    {ENTITY_NODE_STATISTICS_RESTORE}
                     """
                 + save_embedding_query
                 + """
@@ -277,6 +299,36 @@ def get_entity_node_return_query(provider: GraphProvider) -> str:
     """
 
 
+def get_entity_node_candidate_return_query(
+    provider: GraphProvider, with_embedding: bool = False
+) -> str:
+    # Search candidates leave out the summary and `attributes`, which on most providers holds
+    # every stored property including the embedding.
+    return (
+        """
+        n.uuid AS uuid,
+        n.name AS name,
+        n.group_id AS group_id,
+        n.created_at AS created_at,
+        """
+        + ('n.labels AS labels' if provider == GraphProvider.KUZU else 'labels(n) AS labels')
+        + (',n.name_embedding AS name_embedding' if with_embedding else '')
+    )
+
+
+# Recomputes the stored mention count and degree of the given entities. Writers run this for every
+# entity whose mentions or edges they change.
+ENTITY_NODE_STATISTICS_UPDATE = """
+    UNWIND $uuids AS uuid
+    MATCH (n:Entity {uuid: uuid})
+    OPTIONAL MATCH (:Episodic)-[mention:MENTIONS]->(n)
+    WITH n, count(mention) AS mention_count
+    OPTIONAL MATCH (n)-[edge:RELATES_TO]-(:Entity)
+    WITH n, mention_count, count(edge) AS degree
+    SET n.mention_count = mention_count, n.degree = degree
+"""
+
+
 def get_community_node_save_query(provider: GraphProvider) -> str:
     match provider:
         case GraphProvider.FALKORDB:
@@ -32,7 +32,7 @@ from graphiti_core.driver.driver import (
 )
 from graphiti_core.embedder import EmbedderClient
 from graphiti_core.errors import NodeNotFoundError
-from graphiti_core.helpers import parse_db_date
+from graphiti_core.helpers import get_embedding_prefix, parse_db_date
 from graphiti_core.models.nodes.node_db_queries import (
     COMMUNITY_NODE_RETURN,
     COMMUNITY_NODE_RETURN_NEPTUNE,
@@ -98,6 +98,11 @@ class Node(BaseModel, ABC):
         if driver.graph_operations_interface:
             return await driver.graph_operations_interface.node_delete(self, driver)
 
+        # Incident entity edges are deleted with the node, so their embeddings are removed too
+        edge_uuids: list[str] = []
+        if driver.search_interface or driver.provider == GraphProvider.KUZU:
+            edge_uuids = await _get_incident_edge_uuids(driver, [self.uuid])
+
         match driver.provider:
             case GraphProvider.NEO4J:
                 records, _, _ = await driver.execute_query(
@@ -125,7 +130,7 @@ class Node(BaseModel, ABC):
                 # Explicitly delete the "edge" nodes first, then the entity node.
                 await driver.execute_query(
                     """
-                    MATCH (n:Entity {uuid: $uuid})-[:RELATES_TO]->(e:RelatesToNode_)
+                    MATCH (n:Entity {uuid: $uuid})-[:RELATES_TO]-(e:RelatesToNode_)
                     DETACH DELETE e
                     """,
                     uuid=self.uuid,
@@ -147,6 +152,12 @@ class Node(BaseModel, ABC):
                         uuid=self.uuid,
                     )
 
+        await driver.remove_embeddings(uuids=[self.uuid, *edge_uuids])
+        if driver.search_interface:
+            await driver.search_interface.remove_from_index(driver, [self.uuid, *edge_uuids])
+        if driver.adjacency_cache:
+            driver.adjacency_cache.remove(driver, [self.uuid])
+
         logger.debug(f'Deleted Node: {self.uuid}')
 
     def __hash__(self):
@@ -191,7 +202,7 @@ class Node(BaseModel, ABC):
                 # Explicitly delete the "edge" nodes first, then the entity node.
                 await driver.execute_query(
                     """
-                    MATCH (n:Entity {group_id: $group_id})-[:RELATES_TO]->(e:RelatesToNode_)
+                    MATCH (n:Entity {group_id: $group_id})-[:RELATES_TO]-(e:RelatesToNode_)
                     DETACH DELETE e
                     """,
                     group_id=group_id,
@@ -213,6 +224,12 @@ class Node(BaseModel, ABC):
                         group_id=group_id,
                     )
 
+        await driver.remove_embeddings(group_id=group_id)
+        if driver.search_interface:
+            await driver.search_interface.remove_group(driver, group_id)
+        if driver.adjacency_cache:
+            driver.adjacency_cache.remove_group(driver, group_id)
+
     @classmethod
     async def delete_by_uuids(cls, driver: GraphDriver, uuids: list[str], batch_size: int = 100):
         if driver.graph_operations_interface:
@@ -220,6 +237,10 @@ class Node(BaseModel, ABC):
                 cls, driver, uuids, group_id=None, batch_size=batch_size
             )
 
+        edge_uuids: list[str] = []
+        if driver.search_interface or driver.provider == GraphProvider.KUZU:
+            edge_uuids = await _get_incident_edge_uuids(driver, uuids)
+
         match driver.provider:
             case GraphProvider.FALKORDB:
                 for label in ['Entity', 'Episodic', 'Community']:
@@ -245,7 +266,7 @@ class Node(BaseModel, ABC):
                 # Explicitly delete the "edge" nodes first, then the entity node.
                 await driver.execute_query(
                     """
-                    MATCH (n:Entity)-[:RELATES_TO]->(e:RelatesToNode_)
+                    MATCH (n:Entity)-[:RELATES_TO]-(e:RelatesToNode_)
                     WHERE n.uuid IN $uuids
                     DETACH DELETE e
                     """,
@@ -285,6 +306,12 @@ class Node(BaseModel, ABC):
                         batch_size=batch_size,
                     )
 
+        await driver.remove_embeddings(uuids=[*uuids, *edge_uuids])
+        if driver.search_interface:
+            await driver.search_interface.remove_from_index(driver, [*uuids, *edge_uuids])
+        if driver.adjacency_cache:
+            driver.adjacency_cache.remove(driver, uuids)
+
     @classmethod
     async def get_by_uuid(cls, driver: GraphDriver, uuid: str): ...
 
@@ -496,6 +523,9 @@ class EntityNode(Node):
             )
         else:
             entity_data.update(self.attributes or {})
+            name_embedding_prefix = get_embedding_prefix(driver.provider, self.name_embedding)
+            if name_embedding_prefix is not None:
+                entity_data['name_embedding_prefix'] = name_embedding_prefix
             labels = ':'.join(self.labels + ['Entity'])
 
             result = await driver.execute_query(
@@ -503,6 +533,12 @@ class EntityNode(Node):
                 entity_data=entity_data,
             )
 
+        await driver.index_embeddings([self], [])
+        if driver.search_interface:
+            await driver.search_interface.index_entity_nodes(driver, [self])
+        if driver.adjacency_cache:
+            driver.adjacency_cache.add_nodes(driver, [self])
+
         logger.debug(f'Saved Node to Graph: {self.uuid}')
 
         return result
@@ -752,17 +788,22 @@ def get_episodic_node_from_record(record: Any) -> EpisodicNode:
 
 
 def get_entity_node_from_record(record: Any, provider: GraphProvider) -> EntityNode:
+    # Search candidates are returned without attributes or summary
     if provider == GraphProvider.KUZU:
-        attributes = json.loads(record['attributes']) if record['attributes'] else {}
+        attributes = json.loads(record['attributes']) if record.get('attributes') else {}
     else:
-        attributes = record['attributes']
+        attributes = record.get('attributes') or {}
         attributes.pop('uuid', None)
         attributes.pop('name', None)
         attributes.pop('group_id', None)
         attributes.pop('name_embedding', None)
+        attributes.pop('name_embedding_prefix', None)
         attributes.pop('summary', None)
         attributes.pop('created_at', None)
         attributes.pop('labels', None)
+        attributes.pop('mention_count', None)
+        attributes.pop('degree', None)
+        attributes.pop('centrality', None)
 
     labels = record.get('labels', [])
     group_id = record.get('group_id')
@@ -776,7 +817,7 @@ def get_entity_node_from_record(record: Any, provider: GraphProvider) -> EntityN
         group_id=group_id,
         labels=labels,
         created_at=parse_db_date(record['created_at']),  # type: ignore
-        summary=record['summary'],
+        summary=record.get('summary') or '',
         attributes=attributes,
     )
 
@@ -794,6 +835,26 @@ def get_community_node_from_record(record: Any) -> CommunityNode:
     )
 
 
+async def _get_incident_edge_uuids(driver: GraphDriver, uuids: list[str]) -> list[str]:
+    """Uuids of the entity edges that are deleted along with the given entity nodes."""
+    query: LiteralString = (
+        """
+        MATCH (n:Entity)-[:RELATES_TO]-(e:RelatesToNode_)
+        WHERE n.uuid IN $uuids
+        RETURN DISTINCT e.uuid AS uuid
+        """
+        if driver.provider == GraphProvider.KUZU
+        else """
+        MATCH (n:Entity)-[e:RELATES_TO]-(:Entity)
+        WHERE n.uuid IN $uuids
+        RETURN DISTINCT e.uuid AS uuid
+        """
+    )
+    records, _, _ = await driver.execute_query(query, uuids=uuids)
+
+    return [record['uuid'] for record in records]
+
+
 async def create_entity_node_embeddings(embedder: EmbedderClient, nodes: list[EntityNode]):
     # filter out falsey values from nodes
     filtered_nodes = [node for node in nodes if node.name]
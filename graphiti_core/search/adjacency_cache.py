@@ -0,0 +1,388 @@
+"""
+Copyright 2024, Zep Software, Inc.
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+import asyncio
+import logging
+import os
+from collections.abc import Iterable
+from typing import Any
+
+import numpy as np
+from numpy.typing import NDArray
+
+from graphiti_core.driver.driver import GraphDriver, GraphProvider
+
+logger = logging.getLogger(__name__)
+
+# Edges added since the CSR arrays were built stay in overflow lists until there are this
+# many of them, or a tenth of the built edges
+ADJACENCY_REBUILD_MIN_EDGES = int(os.getenv('ADJACENCY_REBUILD_MIN_EDGES', 1024))
+
+GroupKey = tuple[str, str]
+
+
+class GroupAdjacency:
+    """
+    Directed entity graph of one group in compressed sparse row form.
+
+    Entities and edges are numbered in the order they are added. `out_edges[out_indptr[i]:
+    out_indptr[i + 1]]` are the numbers of the edges leaving entity i, and `in_edges` the ones
+    entering it. Edges added after the arrays were built are kept in overflow lists and deletes
+    are tombstones, until the next rebuild.
+    """
+
+    def __init__(self):
+        self.node_uuids: list[str] = []
+        self.node_index: dict[str, int] = {}
+        self.node_alive: list[bool] = []
+
+        self.edge_uuids: list[str] = []
+        self.edge_index: dict[str, int] = {}
+        self.edge_sources: list[int] = []
+        self.edge_targets: list[int] = []
+        self.edge_alive: list[bool] = []
+
+        self.built_edges = 0
+        self.out_indptr: NDArray[np.int64] = np.zeros(1, dtype=np.int64)
+        self.out_edges: NDArray[np.int64] = np.zeros(0, dtype=np.int64)
+        self.in_indptr: NDArray[np.int64] = np.zeros(1, dtype=np.int64)
+        self.in_edges: NDArray[np.int64] = np.zeros(0, dtype=np.int64)
+        self.out_overflow: dict[int, list[int]] = {}
+        self.in_overflow: dict[int, list[int]] = {}
+
+        # Set while the group loads, so rows read before a concurrent delete stay deleted
+        self.loading = False
+        self.removed_while_loading: set[str] = set()
+
+    def __contains__(self, uuid: str) -> bool:
+        index = self.node_index.get(uuid)
+        return index is not None and self.node_alive[index]
+
+    def add_node(self, uuid: str, loaded: bool = False) -> int:
+        if loaded and uuid in self.removed_while_loading:
+            return -1
+
+        index = self.node_index.get(uuid)
+        if index is not None:
+            self.node_alive[index] = True
+            return index
+
+        index = len(self.node_uuids)
+        self.node_uuids.append(uuid)
+        self.node_index[uuid] = index
+        self.node_alive.append(True)
+        return index
+
+    def add_edge(self, uuid: str, source_uuid: str, target_uuid: str, loaded: bool = False):
+        if loaded and uuid in self.removed_while_loading:
+            return
+
+        source = self.add_node(source_uuid, loaded)
+        target = self.add_node(target_uuid, loaded)
+        if source < 0 or target < 0:
+            return
+
+        existing = self.edge_index.get(uuid)
+        if existing is not None:
+            if (
+                self.edge_alive[existing]
+                and self.edge_sources[existing] == source
+                and self.edge_targets[existing] == target
+            ):
+                return
+            self.edge_alive[existing] = False
+
+        edge = len(self.edge_uuids)
+        self.edge_uuids.append(uuid)
+        self.edge_index[uuid] = edge
+        self.edge_sources.append(source)
+        self.edge_targets.append(target)
+        self.edge_alive.append(True)
+        self.out_overflow.setdefault(source, []).append(edge)
+        self.in_overflow.setdefault(target, []).append(edge)
+
+        if edge + 1 - self.built_edges >= max(ADJACENCY_REBUILD_MIN_EDGES, self.built_edges // 10):
+            self.build()
+
+    def remove(self, uuid: str):
+        if self.loading:
+            self.removed_while_loading.add(uuid)
+
+        edge = self.edge_index.get(uuid)
+        if edge is not None:
+            self.edge_alive[edge] = False
+
+        node = self.node_index.get(uuid)
+        if node is not None:
+            # Deleting an entity deletes its edges
+            self.node_alive[node] = False
+            for incident in [*self._edges(node, outgoing=True), *self._edges(node, False)]:
+                self.edge_alive[incident] = False
+
+    def build(self):
+        edge_count = len(self.edge_uuids)
+        node_count = len(self.node_uuids)
+        alive = np.flatnonzero(np.asarray(self.edge_alive, dtype=bool))
+        sources = np.asarray(self.edge_sources, dtype=np.int64)[alive]
+        targets = np.asarray(self.edge_targets, dtype=np.int64)[alive]
+
+        self.out_edges = alive[np.argsort(sources, kind='stable')]
+        self.out_indptr = np.concatenate(
+            ([0], np.cumsum(np.bincount(sources, minlength=node_count)))
+        )
+        self.in_edges = alive[np.argsort(targets, kind='stable')]
+        self.in_indptr = np.concatenate(
+            ([0], np.cumsum(np.bincount(targets, minlength=node_count)))
+        )
+
+        self.out_overflow = {}
+        self.in_overflow = {}
+        self.built_edges = edge_count
+
+    def bfs(self, origins: Iterable[str], max_depth: int) -> tuple[list[str], list[str]]:
+        """
+        Entities reachable from the origins over 1 to max_depth outgoing edges, and the edges
+        on those paths, both in the order they are reached.
+        """
+        reached_nodes: list[int] = []
+        reached_edges: list[int] = []
+        seen_nodes: set[int] = set()
+        seen_edges: set[int] = set()
+        expanded: set[int] = set()
+
+        frontier = [self.node_index[uuid] for uuid in origins if uuid in self]
+        for _ in range(max_depth):
+            next_frontier: list[int] = []
+            for node in frontier:
+                if node in expanded:
+                    continue
+                expanded.add(node)
+                for edge in self._edges(node, outgoing=True):
+                    target = self.edge_targets[edge]
+                    if not self.node_alive[target]:
+                        continue
+                    if edge not in seen_edges:
+                        seen_edges.add(edge)
+                        reached_edges.append(edge)
+                    if target not in seen_nodes:
+                        seen_nodes.add(target)
+                        reached_nodes.append(target)
+                    next_frontier.append(target)
+            frontier = next_frontier
+
+        return (
+            [self.node_uuids[node] for node in reached_nodes],
+            [self.edge_uuids[edge] for edge in reached_edges],
+        )
+
+    def neighbors(self, uuid: str) -> set[str]:
+        """Entities sharing an edge with the entity in either direction."""
+        if uuid not in self:
+            return set()
+
+        return {self.node_uuids[neighbor] for neighbor in self._neighbors(self.node_index[uuid])}
+
+    def distances(self, uuid: str, max_depth: int) -> dict[str, int]:
+        """
+        Number of hops from the entity to every entity within max_depth hops, following edges in
+        either direction.
+        """
+        if uuid not in self:
+            return {}
+
+        distances = {self.node_index[uuid]: 0}
+        frontier = [self.node_index[uuid]]
+        for depth in range(1, max_depth + 1):
+            next_frontier: list[int] = []
+            for node in frontier:
+                for neighbor in self._neighbors(node):
+                    if neighbor not in distances:
+                        distances[neighbor] = depth
+                        next_frontier.append(neighbor)
+            frontier = next_frontier
+
+        return {self.node_uuids[node]: distance for node, distance in distances.items()}
+
+    def _neighbors(self, node: int) -> set[int]:
+        neighbors = {self.edge_targets[edge] for edge in self._edges(node, outgoing=True)}
+        neighbors.update(self.edge_sources[edge] for edge in self._edges(node, outgoing=False))
+        return {neighbor for neighbor in neighbors if self.node_alive[neighbor]}
+
+    def _edges(self, node: int, outgoing: bool) -> list[int]:
+        indptr, edges, overflow = (
+            (self.out_indptr, self.out_edges, self.out_overflow)
+            if outgoing
+            else (self.in_indptr, self.in_edges, self.in_overflow)
+        )
+        built: list[int] = []
+        if node + 1 < len(indptr):
+            built = edges[indptr[node] : indptr[node + 1]].tolist()
+        return [edge for edge in built + overflow.get(node, []) if self.edge_alive[edge]]
+
+
+class AdjacencyCache:
+    """
+    In-memory entity adjacency that BFS search and the node distance reranker use instead of
+    variable-length path queries.
+
+    Set it as `driver.adjacency_cache`. A group is loaded from the database the first time one
+    of its entities is a BFS origin or reranker center, and the save and delete hooks keep
+    loaded groups in sync. Like LocalVectorSearchInterface, it assumes this process writes
+    every loaded group. Searches that start from episodes or from entities it cannot place
+    fall back to the database.
+    """
+
+    def __init__(self):
+        self._groups: dict[GroupKey, GroupAdjacency] = {}
+        self._locks: dict[GroupKey, asyncio.Lock] = {}
+
+    async def bfs(
+        self, driver: GraphDriver, origin_uuids: list[str], max_depth: int
+    ) -> tuple[list[str], list[str]] | None:
+        """
+        Entity and edge uuids reachable from the origins, or None when some origin is not a
+        cached entity and the search has to run against the database.
+        """
+        if not await self._load_groups_of(driver, origin_uuids):
+            return None
+
+        node_uuids: list[str] = []
+        edge_uuids: list[str] = []
+        for key, group in self._groups.items():
+            origins = [uuid for uuid in origin_uuids if uuid in group]
+            if key[0] != _database(driver) or not origins:
+                continue
+            group_nodes, group_edges = group.bfs(origins, max_depth)
+            node_uuids.extend(group_nodes)
+            edge_uuids.extend(group_edges)
+
+        return node_uuids, edge_uuids
+
+    async def distances(
+        self, driver: GraphDriver, uuid: str, max_depth: int
+    ) -> dict[str, int] | None:
+        """
+        Hop counts from the entity to the entities within max_depth hops, or None when it is not
+        a cached entity.
+        """
+        if not await self._load_groups_of(driver, [uuid]):
+            return None
+
+        group = self._group_of(driver, uuid)
+        return group.distances(uuid, max_depth) if group is not None else None
+
+    def add_nodes(self, driver: GraphDriver, nodes: list[Any]):
+        for node in nodes:
+            group = self._groups.get((_database(driver), node.group_id))
+            if group is not None:
+                group.add_node(node.uuid)
+
+    def add_edges(self, driver: GraphDriver, edges: list[Any]):
+        for edge in edges:
+            group = self._groups.get((_database(driver), edge.group_id))
+            if group is not None:
+                group.add_edge(edge.uuid, edge.source_node_uuid, edge.target_node_uuid)
+
+    def remove(self, driver: GraphDriver, uuids: list[str]):
+        for key, group in self._groups.items():
+            if key[0] == _database(driver):
+                for uuid in uuids:
+                    group.remove(uuid)
+
+    def remove_group(self, driver: GraphDriver, group_id: str):
+        self._groups.pop((_database(driver), group_id), None)
+
+    def _group_of(self, driver: GraphDriver, uuid: str) -> GroupAdjacency | None:
+        for key, group in self._groups.items():
+            if key[0] == _database(driver) and not group.loading and uuid in group:
+                return group
+        return None
+
+    async def _load_groups_of(self, driver: GraphDriver, uuids: list[str]) -> bool:
+        missing = [uuid for uuid in uuids if self._group_of(driver, uuid) is None]
+        if not missing:
+            return True
+
+        records, _, _ = await driver.execute_query(
+            """
+            MATCH (n:Entity)
+            WHERE n.uuid IN $uuids
+            RETURN DISTINCT n.group_id AS group_id
+            """,
+            uuids=missing,
+            routing_='r',
+        )
+        for record in records:
+            await self._ensure_loaded(driver, record['group_id'])
+
+        return all(self._group_of(driver, uuid) is not None for uuid in missing)
+
+    async def _ensure_loaded(self, driver: GraphDriver, group_id: str):
+        key = (_database(driver), group_id)
+        lock = self._locks.setdefault(key, asyncio.Lock())
+        async with lock:
+            if key in self._groups and not self._groups[key].loading:
+                return
+
+            # Writes that land while the group loads are applied to it as well
+            group = GroupAdjacency()
+            group.loading = True
+            self._groups[key] = group
+            try:
+                await self._load_group(driver, group_id, group)
+            except Exception:
+                self._groups.pop(key, None)
+                raise
+            group.build()
+            group.loading = False
+            group.removed_while_loading = set()
+
+        logger.debug(
+            f'Loaded group {group_id} into adjacency cache: '
+            f'{len(group.node_uuids)} entities, {len(group.edge_uuids)} edges'
+        )
+
+    async def _load_group(self, driver: GraphDriver, group_id: str, group: GroupAdjacency):
+        nodes, _, _ = await driver.execute_query(
+            """
+            MATCH (n:Entity {group_id: $group_id})
+            RETURN n.uuid AS uuid
+            """,
+            group_id=group_id,
+            routing_='r',
+        )
+        for record in nodes:
+            group.add_node(record['uuid'], loaded=True)
+
+        if driver.provider == GraphProvider.KUZU:
+            query = """
+                MATCH (n:Entity)-[:RELATES_TO]->(e:RelatesToNode_ {group_id: $group_id})-[:RELATES_TO]->(m:Entity)
+                RETURN e.uuid AS uuid, n.uuid AS source_node_uuid, m.uuid AS target_node_uuid
+            """
+        else:
+            query = """
+                MATCH (n:Entity)-[e:RELATES_TO {group_id: $group_id}]->(m:Entity)
+                RETURN e.uuid AS uuid, n.uuid AS source_node_uuid, m.uuid AS target_node_uuid
+            """
+        edges, _, _ = await driver.execute_query(query, group_id=group_id, routing_='r')
+        for record in edges:
+            group.add_edge(
+                record['uuid'], record['source_node_uuid'], record['target_node_uuid'], loaded=True
+            )
+
+
+def _database(driver: GraphDriver) -> str:
+    return getattr(driver, '_database', '') or ''
@@ -0,0 +1,222 @@
+"""
+Copyright 2024, Zep Software, Inc.
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+from collections.abc import Sequence
+
+import numpy as np
+from numpy.typing import ArrayLike, NDArray
+
+# Above this many candidates the full pairwise similarity matrix is not materialized and
+# greedy MMR computes one similarity column per selected candidate instead
+MMR_FULL_MATRIX_MAX_CANDIDATES = 2048
+
+# Number of set bits in each byte value
+POPCOUNT = np.array([bin(byte).count('1') for byte in range(256)], dtype=np.uint16)
+
+
+def as_matrix(vectors: ArrayLike) -> NDArray[np.float32]:
+    matrix = np.asarray(vectors, dtype=np.float32)
+    if matrix.ndim == 1:
+        matrix = matrix.reshape(1, -1)
+    return matrix
+
+
+def normalize_rows(matrix: ArrayLike) -> NDArray[np.float32]:
+    """L2-normalize each row, leaving zero rows as zeros."""
+    matrix = as_matrix(matrix)
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    return np.divide(matrix, norms, out=np.zeros_like(matrix), where=norms != 0)
+
+
+def cosine_similarities(query: ArrayLike, candidates: ArrayLike) -> NDArray[np.float32]:
+    """Cosine similarity of the query vector against every candidate row."""
+    candidate_matrix = normalize_rows(candidates)
+    if candidate_matrix.shape[0] == 0:
+        return np.zeros(0, dtype=np.float32)
+    return candidate_matrix @ normalize_rows(query)[0]
+
+
+def paired_cosine_similarities(left: ArrayLike, right: ArrayLike) -> NDArray[np.float32]:
+    """Row-wise cosine similarity of two equally shaped matrices."""
+    return np.einsum('ij,ij->i', normalize_rows(left), normalize_rows(right))
+
+
+def top_k_cosine(
+    query: ArrayLike, candidates: ArrayLike, k: int, min_score: float = -np.inf
+) -> tuple[NDArray[np.intp], NDArray[np.float32]]:
+    """
+    Indices and scores of the k candidates most similar to the query, best first.
+
+    Uses argpartition so only the top k scores are sorted.
+    """
+    scores = cosine_similarities(query, candidates)
+    indices = np.flatnonzero(scores >= min_score)
+    if k < len(indices):
+        indices = indices[np.argpartition(-scores[indices], k - 1)[:k]]
+    indices = indices[np.argsort(-scores[indices], kind='stable')]
+    return indices, scores[indices]
+
+
+def quantize_int8(matrix: ArrayLike) -> tuple[NDArray[np.int8], NDArray[np.float32]]:
+    """
+    Symmetric scalar quantization of each row to int8.
+
+    Returns the codes and the per-row scale that maps them back, so that
+    `codes * scales[:, None]` approximates the input.
+    """
+    matrix = as_matrix(matrix)
+    scales = np.abs(matrix).max(axis=1) / 127
+    codes = np.divide(
+        matrix, scales[:, None], out=np.zeros_like(matrix), where=scales[:, None] != 0
+    )
+    return np.rint(codes).astype(np.int8), scales.astype(np.float32)
+
+
+def int8_similarities(
+    query: ArrayLike, codes: NDArray[np.int8], scales: NDArray[np.float32]
+) -> NDArray[np.float32]:
+    """Approximate dot products of the query with int8 quantized rows."""
+    return (codes.astype(np.float32) @ as_matrix(query)[0]) * scales
+
+
+def pack_signs(matrix: ArrayLike) -> NDArray[np.uint8]:
+    """Binary quantization: one bit per dimension set when the value is positive."""
+    return np.packbits(as_matrix(matrix) > 0, axis=1)
+
+
+def hamming_similarities(query: ArrayLike, codes: NDArray[np.uint8]) -> NDArray[np.float32]:
+    """
+    Negated Hamming distance between the query's sign bits and binary codes.
+
+    Only the ordering is meaningful, higher is more similar.
+    """
+    distances = POPCOUNT[np.bitwise_xor(codes, pack_signs(query)[0])].sum(axis=1)
+    return -distances.astype(np.float32)
+
+
+def pagerank(
+    sources: ArrayLike,
+    targets: ArrayLike,
+    node_count: int,
+    damping: float = 0.85,
+    tolerance: float = 1e-6,
+    max_iterations: int = 100,
+) -> NDArray[np.float64]:
+    """
+    PageRank of each node of a directed graph given as parallel source and target index arrays,
+    by power iteration. Nodes without outgoing edges spread their rank evenly over all nodes.
+    """
+    if node_count == 0:
+        return np.zeros(0, dtype=np.float64)
+
+    source_array = np.asarray(sources, dtype=np.int64)
+    target_array = np.asarray(targets, dtype=np.int64)
+    out_degree = np.bincount(source_array, minlength=node_count).astype(np.float64)
+    dangling = out_degree == 0
+
+    ranks = np.full(node_count, 1.0 / node_count)
+    for _ in range(max_iterations):
+        shares = ranks[source_array] / out_degree[source_array]
+        spread = np.bincount(target_array, weights=shares, minlength=node_count)
+        updated = (1 - damping) / node_count + damping * (
+            spread + ranks[dangling].sum() / node_count
+        )
+        converged = np.abs(updated - ranks).sum() < tolerance
+        ranks = updated
+        if converged:
+            break
+
+    return ranks
+
+
+def greedy_mmr(
+    query: ArrayLike,
+    candidates: ArrayLike,
+    mmr_lambda: float,
+    k: int | None = None,
+    min_score: float = -2.0,
+) -> tuple[NDArray[np.intp], NDArray[np.float32]]:
+    """
+    Greedy maximal marginal relevance selection.
+
+    Each step picks the candidate maximizing
+    `mmr_lambda * sim(query, c) - (1 - mmr_lambda) * max(sim(c, selected))`, then updates the
+    running max similarity to the selected set with a single vector operation.
+
+    Returns the indices of the selected candidates in selection order and the MMR score each
+    had when it was selected. Selection stops after k candidates (all when None) or once the
+    best remaining score is below min_score.
+    """
+    matrix = normalize_rows(candidates)
+    n = matrix.shape[0]
+    limit = n if k is None else min(k, n)
+    if n == 0 or limit <= 0:
+        return np.zeros(0, dtype=np.intp), np.zeros(0, dtype=np.float32)
+
+    relevance = matrix @ normalize_rows(query)[0]
+    similarity = matrix @ matrix.T if n <= MMR_FULL_MATRIX_MAX_CANDIDATES else None
+
+    max_similarity = np.zeros(n, dtype=np.float32)
+    available = np.ones(n, dtype=bool)
+    selected = np.empty(limit, dtype=np.intp)
+    scores = np.empty(limit, dtype=np.float32)
+
+    count = 0
+    while count < limit:
+        mmr = mmr_lambda * relevance - (1 - mmr_lambda) * max_similarity
+        mmr[~available] = -np.inf
+        best = int(np.argmax(mmr))
+        if mmr[best] < min_score:
+            break
+
+        selected[count] = best
+        scores[count] = mmr[best]
+        count += 1
+        available[best] = False
+
+        column = similarity[:, best] if similarity is not None else matrix @ matrix[best]
+        if count == 1:
+            # Redundancy is zero until something is selected, then may be negative
+            max_similarity[:] = column
+        else:
+            np.maximum(max_similarity, column, out=max_similarity)
+
+    return selected[:count], scores[:count]
+
+
+def rrf(
+    rankings: Sequence[Sequence[str]], rank_const: int = 1, min_score: float = 0
+) -> tuple[list[str], list[float]]:
+    """
+    Reciprocal rank fusion of several rankings of uuids.
+
+    Ties keep the order in which the uuids were first seen.
+    """
+    index: dict[str, int] = {}
+    positions = [index.setdefault(uuid, len(index)) for ranking in rankings for uuid in ranking]
+    if not index:
+        return [], []
+
+    weights = np.concatenate(
+        [1 / (np.arange(len(ranking), dtype=np.float64) + rank_const) for ranking in rankings]
+    )
+    scores = np.bincount(positions, weights=weights, minlength=len(index))
+
+    order = np.argsort(-scores, kind='stable')
+    order = order[scores[order] >= min_score]
+
+    uuids = list(index)
+    return [uuids[i] for i in order], scores[order].tolist()
@@ -14,9 +14,13 @@ See the License for the specific language governing permissions and
 limitations under the License.
 """
 
+import asyncio
 import logging
 from collections import defaultdict
-from time import time
+from collections.abc import AsyncIterator, Callable, Coroutine
+from functools import partial
+from time import monotonic, perf_counter, time
+from typing import Any, TypeVar, cast
 
 from graphiti_core.cross_encoder.client import CrossEncoderClient
 from graphiti_core.driver.driver import GraphDriver
@@ -26,6 +30,7 @@ from graphiti_core.errors import SearchRerankerError
 from graphiti_core.graphiti_types import GraphitiClients
 from graphiti_core.helpers import semaphore_gather
 from graphiti_core.nodes import CommunityNode, EntityNode, EpisodicNode
+from graphiti_core.search.search_cache import SearchResultCache
 from graphiti_core.search.search_config import (
     DEFAULT_SEARCH_LIMIT,
     CommunityReranker,
@@ -36,34 +41,229 @@ from graphiti_core.search.search_config import (
     EdgeSearchMethod,
     EpisodeReranker,
     EpisodeSearchConfig,
+    EpisodeSearchMethod,
     NodeReranker,
     NodeSearchConfig,
     NodeSearchMethod,
     SearchConfig,
+    SearchLayerMetadata,
+    SearchMetadata,
     SearchResults,
+    SearchStage,
 )
 from graphiti_core.search.search_filters import SearchFilters
+from graphiti_core.search.search_profile import (
+    ProfilingDriver,
+    SearchProfile,
+    SearchProfiler,
+    count_results,
+    profile_step,
+    profiling,
+    record_cache_hit,
+)
 from graphiti_core.search.search_utils import (
     community_fulltext_search,
     community_similarity_search,
     edge_bfs_search,
     edge_fulltext_search,
+    edge_hybrid_search,
     edge_similarity_search,
     episode_fulltext_search,
     episode_mentions_reranker,
+    get_candidate_embeddings_for_edges,
+    get_candidate_embeddings_for_nodes,
     get_embeddings_for_communities,
-    get_embeddings_for_edges,
-    get_embeddings_for_nodes,
+    hydrate_edges,
+    hydrate_nodes,
     maximal_marginal_relevance,
     node_bfs_search,
     node_distance_reranker,
     node_fulltext_search,
+    node_hybrid_search,
     node_similarity_search,
     rrf,
+    supports_hybrid_search,
 )
 
 logger = logging.getLogger(__name__)
 
+T = TypeVar('T')
+
+_SCORE_FIELDS = {
+    'edges': 'edge_reranker_scores',
+    'nodes': 'node_reranker_scores',
+    'episodes': 'episode_reranker_scores',
+    'communities': 'community_reranker_scores',
+}
+
+# Rerankers whose scores mean the same in every shard (relevance, 1 / hops from the center node
+# and mmr), so shard results are ranked by score. Other rerankers return rrf scores, which only
+# rank results within a shard.
+_SHARD_COMPARABLE_RERANKERS = {'cross_encoder', 'node_distance', 'mmr'}
+
+# BFS walks out from the origin nodes and is usually the slowest search method, so with a deadline
+# it only gets this share of the remaining time and is cancelled ahead of the other methods
+BFS_TIME_SHARE = 0.5
+# Share of the time the query embedding may take, so that fulltext and BFS searches still have
+# time to run without it
+EMBEDDING_TIME_SHARE = 0.5
+
+LayerConfig = TypeVar('LayerConfig', EdgeSearchConfig, NodeSearchConfig, CommunitySearchConfig)
+
+# Receives a layer's intermediate results, with their scores, as each search stage completes
+SearchStageCallback = Callable[[SearchStage, list[Any], list[float]], None]
+
+
+def _requires_query_vector(config: SearchConfig) -> bool:
+    return bool(
+        config.edge_config
+        and EdgeSearchMethod.cosine_similarity in config.edge_config.search_methods
+        or config.edge_config
+        and EdgeReranker.mmr == config.edge_config.reranker
+        or config.node_config
+        and NodeSearchMethod.cosine_similarity in config.node_config.search_methods
+        or config.node_config
+        and NodeReranker.mmr == config.node_config.reranker
+        or (
+            config.community_config
+            and CommunitySearchMethod.cosine_similarity in config.community_config.search_methods
+        )
+        or (config.community_config and CommunityReranker.mmr == config.community_config.reranker)
+    )
+
+
+def _without_query_vector(
+    config: LayerConfig | None, metadata: SearchLayerMetadata
+) -> LayerConfig | None:
+    # Drops the search method and reranker that need the query embedding, recording them as skipped
+    if config is None:
+        return None
+
+    update: dict[str, Any] = {}
+    search_methods = [
+        method for method in config.search_methods if method.value != 'cosine_similarity'
+    ]
+    if len(search_methods) < len(config.search_methods):
+        metadata.skipped.append('cosine_similarity')
+        update['search_methods'] = search_methods
+    if config.reranker.value == 'mmr':
+        metadata.skipped.append('mmr')
+        update['reranker'] = type(config.reranker).rrf
+
+    return config.model_copy(update=update)
+
+
+def _deadline_passed(deadline: float | None) -> bool:
+    return deadline is not None and monotonic() >= deadline
+
+
+def _deadline_share(deadline: float | None, share: float) -> float | None:
+    # An earlier deadline, once the given share of the time left until this one has passed
+    if deadline is None:
+        return None
+    now = monotonic()
+    return now + max(deadline - now, 0) * share
+
+
+async def _await_until(deadline: float | None, coroutine: Coroutine[Any, Any, T]) -> T:
+    # Raises asyncio.TimeoutError if the coroutine is still running at the deadline
+    if deadline is None:
+        return await coroutine
+    return await asyncio.wait_for(coroutine, max(deadline - monotonic(), 0))
+
+
+def _report_fused(
+    on_stage: SearchStageCallback | None,
+    search_result_uuids: list[list[str]],
+    uuid_map: dict[str, Any],
+    min_score: float,
+) -> None:
+    # Reports the rrf order of the candidates ahead of a slower reranker
+    if on_stage is None:
+        return
+    fused_uuids, fused_scores = rrf(search_result_uuids, min_score=min_score)
+    on_stage(SearchStage.fused, [uuid_map[uuid] for uuid in fused_uuids], fused_scores)
+
+
+async def _profile_method(name: str, coroutine: Coroutine[Any, Any, T]) -> T:
+    with profile_step(name) as step:
+        result = await coroutine
+        if step is not None:
+            step.candidates = count_results(result)
+    return result
+
+
+async def _gather_until(
+    layer: str,
+    deadline: float | None,
+    search_tasks: dict[tuple[str, ...], Coroutine[Any, Any, Any]],
+    metadata: SearchLayerMetadata,
+    on_stage: SearchStageCallback | None = None,
+) -> list[list[Any]]:
+    """
+    Runs the search tasks, keyed by the methods each covers, concurrently. Tasks still running at
+    the deadline are cancelled and recorded as skipped, and the results of the others are returned
+    in task order. BFS is cancelled first, once it has used BFS_TIME_SHARE of the remaining time. A
+    task covering several methods returns one result list per method. Fulltext results are passed
+    to on_stage as soon as they arrive.
+    """
+    if not search_tasks:
+        return []
+
+    if _deadline_passed(deadline):
+        for methods, coroutine in search_tasks.items():
+            coroutine.close()
+            metadata.skipped.extend(methods)
+        return []
+
+    futures = {
+        methods: asyncio.ensure_future(_profile_method(f'{layer}.{"+".join(methods)}', coroutine))
+        for methods, coroutine in search_tasks.items()
+    }
+
+    def report_fulltext(methods: tuple[str, ...], future: asyncio.Future) -> None:
+        if on_stage is not None and not future.cancelled() and future.exception() is None:
+            result = future.result()
+            on_stage(
+                SearchStage.bm25, result[methods.index('bm25')] if len(methods) > 1 else result, []
+            )
+
+    for methods, future in futures.items():
+        if 'bm25' in methods:
+            future.add_done_callback(partial(report_fulltext, methods))
+
+    cancelled: set[asyncio.Future] = set()
+    bfs_futures = {
+        future for methods, future in futures.items() if EdgeSearchMethod.bfs.value in methods
+    }
+    if deadline is not None and bfs_futures:
+        _, pending = await asyncio.wait(
+            futures.values(), timeout=max(deadline - monotonic(), 0) * BFS_TIME_SHARE
+        )
+        for future in pending & bfs_futures:
+            future.cancel()
+            cancelled.add(future)
+
+    remaining = [future for future in futures.values() if future not in cancelled]
+    if remaining:
+        _, pending = await asyncio.wait(
+            remaining, timeout=None if deadline is None else max(deadline - monotonic(), 0)
+        )
+        for future in pending:
+            future.cancel()
+            cancelled.add(future)
+
+    search_results: list[list[Any]] = []
+    for methods, future in futures.items():
+        if future in cancelled:
+            metadata.skipped.extend(methods)
+            continue
+        result = future.result()
+        search_results.extend(result if len(methods) > 1 else [result])
+        metadata.search_methods.extend(methods)
+
+    return search_results
+
 
 async def search(
     clients: GraphitiClients,
@@ -75,8 +275,98 @@ async def search(
     bfs_origin_node_uuids: list[str] | None = None,
     query_vector: list[float] | None = None,
     driver: GraphDriver | None = None,
+    cache: SearchResultCache | None = None,
+    timeout: float | None = None,
+    on_stage: Callable[[str, SearchStage, list[Any], list[float]], None] | None = None,
+    explain: bool = False,
+) -> SearchResults:
+    if driver is None:
+        # Groups stored in several databases are searched in each and ranked together
+        shards = clients.driver.shard_group_ids(group_ids)
+        if len(shards) > 1:
+            return await _scatter_search(
+                clients,
+                shards,
+                query,
+                config,
+                search_filter,
+                center_node_uuid,
+                bfs_origin_node_uuids,
+                query_vector,
+                cache,
+                timeout,
+                on_stage,
+                explain,
+            )
+        if len(shards) == 1:
+            driver, group_ids = shards[0]
+
+    if not explain:
+        return await _search(
+            clients,
+            query,
+            group_ids,
+            config,
+            search_filter,
+            center_node_uuid,
+            bfs_origin_node_uuids,
+            query_vector,
+            driver,
+            cache,
+            timeout,
+            on_stage,
+        )
+
+    # With explain, time every step of the search and record the queries it runs in
+    # results.profile, mirroring the steps as spans
+    driver = driver or clients.driver
+    profiler = SearchProfiler(clients.tracer, driver.provider.value)
+    start = perf_counter()
+    with profiling(profiler), clients.tracer.start_span('search') as span:
+        results = await _search(
+            clients,
+            query,
+            group_ids,
+            config,
+            search_filter,
+            center_node_uuid,
+            bfs_origin_node_uuids,
+            query_vector,
+            cast(GraphDriver, ProfilingDriver(driver, profiler)),
+            cache,
+            timeout,
+            on_stage,
+        )
+        profiler.profile.duration_ms = (perf_counter() - start) * 1000
+        span.add_attributes(
+            {
+                'duration_ms': profiler.profile.duration_ms,
+                'cache_hit': profiler.profile.cache_hit,
+                'query_count': len(profiler.profile.queries),
+            }
+        )
+
+    results.profile = profiler.profile
+    return results
+
+
+async def _search(
+    clients: GraphitiClients,
+    query: str,
+    group_ids: list[str] | None,
+    config: SearchConfig,
+    search_filter: SearchFilters,
+    center_node_uuid: str | None = None,
+    bfs_origin_node_uuids: list[str] | None = None,
+    query_vector: list[float] | None = None,
+    driver: GraphDriver | None = None,
+    cache: SearchResultCache | None = None,
+    timeout: float | None = None,
+    on_stage: Callable[[str, SearchStage, list[Any], list[float]], None] | None = None,
 ) -> SearchResults:
     start = time()
+    # Search methods and rerankers still running at the deadline are dropped
+    deadline = monotonic() + timeout if timeout is not None else None
 
     driver = driver or clients.driver
     embedder = clients.embedder
@@ -85,31 +375,73 @@ async def search(
     if query.strip() == '':
         return SearchResults()
 
-    if (
-        config.edge_config
-        and EdgeSearchMethod.cosine_similarity in config.edge_config.search_methods
-        or config.edge_config
-        and EdgeReranker.mmr == config.edge_config.reranker
-        or config.node_config
-        and NodeSearchMethod.cosine_similarity in config.node_config.search_methods
-        or config.node_config
-        and NodeReranker.mmr == config.node_config.reranker
-        or (
-            config.community_config
-            and CommunitySearchMethod.cosine_similarity in config.community_config.search_methods
+    # if group_ids is empty, set it to None
+    group_ids = group_ids if group_ids and group_ids != [''] else None
+
+    cache_key = None
+    semantic_cache = cache.semantic_cache if cache is not None else None
+    if cache is not None:
+        cache_key = cache.make_key(
+            query,
+            group_ids,
+            config,
+            search_filter,
+            center_node_uuid,
+            bfs_origin_node_uuids,
+            query_vector,
+            getattr(driver, '_database', None),
         )
-        or (config.community_config and CommunityReranker.mmr == config.community_config.reranker)
+        cached_results = cache.get(cache_key)
+        if cached_results is not None:
+            logger.debug(f'search cache hit for query {query}')
+            record_cache_hit('exact')
+            return cached_results
+
+    edge_metadata = SearchLayerMetadata()
+    node_metadata = SearchLayerMetadata()
+    episode_metadata = SearchLayerMetadata()
+    community_metadata = SearchLayerMetadata()
+
+    # The semantic cache is looked up by query embedding
+    search_vector = [0.0] * EMBEDDING_DIM
+    embedding_timed_out = False
+    if semantic_cache is not None or _requires_query_vector(config):
+        if query_vector is not None:
+            search_vector = query_vector
+        else:
+            try:
+                with profile_step('embedding'):
+                    search_vector = await _await_until(
+                        _deadline_share(deadline, EMBEDDING_TIME_SHARE),
+                        embedder.create(input_data=[query.replace('\n', ' ')]),
+                    )
+            except asyncio.TimeoutError:
+                # Without the query embedding fulltext and BFS searches still run
+                logger.debug(f'query embedding timed out for query {query}')
+                embedding_timed_out = True
+                config = config.model_copy(
+                    update={
+                        'edge_config': _without_query_vector(config.edge_config, edge_metadata),
+                        'node_config': _without_query_vector(config.node_config, node_metadata),
+                        'community_config': _without_query_vector(
+                            config.community_config, community_metadata
+                        ),
+                    }
+                )
+
+    if (
+        cache is not None
+        and cache_key is not None
+        and semantic_cache is not None
+        and not embedding_timed_out
     ):
-        search_vector = (
-            query_vector
-            if query_vector is not None
-            else await embedder.create(input_data=[query.replace('\n', ' ')])
-        )
-    else:
-        search_vector = [0.0] * EMBEDDING_DIM
+        cached_results = semantic_cache.get(cache_key.scope, search_vector)
+        if cached_results is not None:
+            logger.debug(f'semantic search cache hit for query {query}')
+            record_cache_hit('semantic')
+            cache.put(cache_key, cached_results)
+            return cached_results
 
-    # if group_ids is empty, set it to None
-    group_ids = group_ids if group_ids and group_ids != [''] else None
     (
         (edges, edge_reranker_scores),
         (nodes, node_reranker_scores),
@@ -128,6 +460,9 @@ async def search(
             bfs_origin_node_uuids,
             config.limit,
             config.reranker_min_score,
+            deadline,
+            edge_metadata,
+            partial(on_stage, 'edges') if on_stage is not None else None,
         ),
         node_search(
             driver,
@@ -141,6 +476,9 @@ async def search(
             bfs_origin_node_uuids,
             config.limit,
             config.reranker_min_score,
+            deadline,
+            node_metadata,
+            partial(on_stage, 'nodes') if on_stage is not None else None,
         ),
         episode_search(
             driver,
@@ -152,6 +490,9 @@ async def search(
             search_filter,
             config.limit,
             config.reranker_min_score,
+            deadline,
+            episode_metadata,
+            partial(on_stage, 'episodes') if on_stage is not None else None,
         ),
         community_search(
             driver,
@@ -162,6 +503,9 @@ async def search(
             config.community_config,
             config.limit,
             config.reranker_min_score,
+            deadline,
+            community_metadata,
+            partial(on_stage, 'communities') if on_stage is not None else None,
         ),
     )
 
@@ -174,8 +518,20 @@ async def search(
         episode_reranker_scores=episode_reranker_scores,
         communities=communities,
         community_reranker_scores=community_reranker_scores,
+        metadata=SearchMetadata(
+            edges=edge_metadata if config.edge_config is not None else None,
+            nodes=node_metadata if config.node_config is not None else None,
+            episodes=episode_metadata if config.episode_config is not None else None,
+            communities=community_metadata if config.community_config is not None else None,
+        ),
     )
 
+    # Results missing methods that ran out of time are not cached
+    if cache is not None and cache_key is not None and not results.metadata.degraded:
+        cache.put(cache_key, results)
+        if semantic_cache is not None and not embedding_timed_out:
+            semantic_cache.put(cache_key.scope, search_vector, results)
+
     latency = (time() - start) * 1000
 
     logger.debug(f'search returned context for query {query} in {latency} ms')
@@ -183,6 +539,212 @@ async def search(
     return results
 
 
+async def _scatter_search(
+    clients: GraphitiClients,
+    shards: list[tuple[GraphDriver, list[str] | None]],
+    query: str,
+    config: SearchConfig,
+    search_filter: SearchFilters,
+    center_node_uuid: str | None,
+    bfs_origin_node_uuids: list[str] | None,
+    query_vector: list[float] | None,
+    cache: SearchResultCache | None,
+    timeout: float | None,
+    on_stage: Callable[[str, SearchStage, list[Any], list[float]], None] | None,
+    explain: bool,
+) -> SearchResults:
+    """
+    Searches every shard for the full limit, the most any shard can contribute to the global top
+    results, then ranks the results of all shards together and keeps the limit.
+    """
+    start = perf_counter()
+    if query.strip() == '':
+        return SearchResults()
+
+    # Embed the query once for every shard, the shards get the time left after it
+    deadline = monotonic() + timeout if timeout is not None else None
+    semantic_cache = cache.semantic_cache if cache is not None else None
+    if query_vector is None and (semantic_cache is not None or _requires_query_vector(config)):
+        try:
+            query_vector = await _await_until(
+                _deadline_share(deadline, EMBEDDING_TIME_SHARE),
+                clients.embedder.create(input_data=[query.replace('\n', ' ')]),
+            )
+        except asyncio.TimeoutError:
+            # The shards skip the searches that need the embedding
+            logger.debug(f'query embedding timed out for query {query}')
+    if deadline is not None:
+        timeout = max(deadline - monotonic(), 0)
+
+    # Latest stage results of each shard, merged every time a shard reports a stage
+    stage_results: dict[str, dict[int, tuple[list[Any], list[float]]]] = defaultdict(dict)
+
+    def shard_on_stage(
+        shard: int, layer: str, stage: SearchStage, results: list[Any], scores: list[float]
+    ):
+        if on_stage is None:
+            return
+        stage_results[layer][shard] = (results, scores)
+        merged, merged_scores = _merge_shard_layer(
+            list(stage_results[layer].values()), config.limit, by_score=False
+        )
+        on_stage(layer, stage, merged, merged_scores)
+
+    shard_results: list[SearchResults] = await semaphore_gather(
+        *[
+            search(
+                clients,
+                query,
+                shard_group_ids,
+                config,
+                search_filter,
+                center_node_uuid,
+                bfs_origin_node_uuids,
+                query_vector,
+                shard_driver,
+                cache,
+                timeout,
+                partial(shard_on_stage, shard) if on_stage is not None else None,
+                explain,
+            )
+            for shard, (shard_driver, shard_group_ids) in enumerate(shards)
+        ]
+    )
+
+    rerankers = {
+        'edges': config.edge_config.reranker if config.edge_config else None,
+        'nodes': config.node_config.reranker if config.node_config else None,
+        'episodes': config.episode_config.reranker if config.episode_config else None,
+        'communities': config.community_config.reranker if config.community_config else None,
+    }
+    merged = SearchResults.merge(shard_results)
+    for layer, reranker in rerankers.items():
+        results, scores = _merge_shard_layer(
+            [
+                (getattr(result, layer), getattr(result, _SCORE_FIELDS[layer]))
+                for result in shard_results
+            ],
+            config.limit,
+            by_score=reranker is not None and reranker.value in _SHARD_COMPARABLE_RERANKERS,
+        )
+        setattr(merged, layer, results)
+        setattr(merged, _SCORE_FIELDS[layer], scores)
+
+    if explain:
+        merged.profile = SearchProfile(
+            provider=clients.driver.provider.value,
+            duration_ms=(perf_counter() - start) * 1000,
+            steps=[
+                step.model_copy(
+                    update={'name': f'{getattr(driver, "_database", shard)}.{step.name}'}
+                )
+                for shard, ((driver, _), result) in enumerate(
+                    zip(shards, shard_results, strict=True)
+                )
+                if result.profile is not None
+                for step in result.profile.steps
+            ],
+            queries=[
+                profiled_query
+                for result in shard_results
+                if result.profile is not None
+                for profiled_query in result.profile.queries
+            ],
+        )
+
+    return merged
+
+
+def _merge_shard_layer(
+    shard_results: list[tuple[list[Any], list[float]]], limit: int, by_score: bool
+) -> tuple[list[Any], list[float]]:
+    """
+    Ranks the results of a layer from every shard together. Scores of rerankers that score each
+    result on its own are compared directly, other rankings are fused with rrf.
+    """
+    items = {item.uuid: item for results, _ in shard_results for item in results}
+    if by_score and all(len(results) == len(scores) for results, scores in shard_results):
+        scored = sorted(
+            (
+                (item.uuid, score)
+                for results, scores in shard_results
+                for item, score in zip(results, scores, strict=True)
+            ),
+            key=lambda pair: pair[1],
+            reverse=True,
+        )
+        # A result found in several shards keeps its best score
+        best: dict[str, float] = {}
+        for uuid, score in scored:
+            best.setdefault(uuid, score)
+        uuids, scores = list(best), list(best.values())
+    else:
+        uuids, scores = rrf([[item.uuid for item in results] for results, _ in shard_results])
+
+    return [items[uuid] for uuid in uuids[:limit]], scores[:limit]
+
+
+async def search_stream(
+    clients: GraphitiClients,
+    query: str,
+    group_ids: list[str] | None,
+    config: SearchConfig,
+    search_filter: SearchFilters,
+    center_node_uuid: str | None = None,
+    bfs_origin_node_uuids: list[str] | None = None,
+    query_vector: list[float] | None = None,
+    driver: GraphDriver | None = None,
+    cache: SearchResultCache | None = None,
+    timeout: float | None = None,
+) -> AsyncIterator[SearchResults]:
+    """
+    Like search, but yields a snapshot of the results every time a layer completes a stage:
+    fulltext hits as soon as they arrive, rrf-fused candidates ahead of a slower reranker, and
+    finally the complete results. Each snapshot holds the latest results of every layer and is
+    tagged with the stage that produced it in metadata.stage. Before the final snapshot results
+    are unhydrated candidates, and fulltext hits carry no scores.
+    """
+    queue: asyncio.Queue[SearchResults] = asyncio.Queue()
+    snapshot = SearchResults()
+
+    def on_stage(layer: str, stage: SearchStage, results: list[Any], scores: list[float]):
+        setattr(snapshot, layer, results[: config.limit])
+        setattr(snapshot, _SCORE_FIELDS[layer], scores[: config.limit])
+        queue.put_nowait(snapshot.model_copy(update={'metadata': SearchMetadata(stage=stage)}))
+
+    task = asyncio.ensure_future(
+        search(
+            clients,
+            query,
+            group_ids,
+            config,
+            search_filter,
+            center_node_uuid,
+            bfs_origin_node_uuids,
+            query_vector,
+            driver,
+            cache,
+            timeout,
+            on_stage,
+        )
+    )
+    try:
+        while True:
+            next_snapshot = asyncio.ensure_future(queue.get())
+            await asyncio.wait({next_snapshot, task}, return_when=asyncio.FIRST_COMPLETED)
+            if not next_snapshot.done():
+                next_snapshot.cancel()
+                break
+            yield next_snapshot.result()
+
+        while not queue.empty():
+            yield queue.get_nowait()
+        yield task.result()
+    finally:
+        # Stop searching if the caller stops iterating early
+        task.cancel()
+
+
 async def edge_search(
     driver: GraphDriver,
     cross_encoder: CrossEncoderClient,
@@ -195,115 +757,199 @@ async def edge_search(
     bfs_origin_node_uuids: list[str] | None = None,
     limit=DEFAULT_SEARCH_LIMIT,
     reranker_min_score: float = 0,
+    deadline: float | None = None,
+    metadata: SearchLayerMetadata | None = None,
+    on_stage: SearchStageCallback | None = None,
 ) -> tuple[list[EntityEdge], list[float]]:
     if config is None:
         return [], []
+    metadata = metadata if metadata is not None else SearchLayerMetadata()
 
-    # Build search tasks based on configured search methods
-    search_tasks = []
-    if EdgeSearchMethod.bm25 in config.search_methods:
-        search_tasks.append(
-            edge_fulltext_search(driver, query, search_filter, group_ids, 2 * limit)
-        )
-    if EdgeSearchMethod.cosine_similarity in config.search_methods:
-        search_tasks.append(
-            edge_similarity_search(
+    # Candidates are retrieved without their attributes, with embeddings only for MMR, and only
+    # the edges that survive reranking are loaded in full
+    with_embeddings = config.reranker == EdgeReranker.mmr
+
+    # On Neo4j fulltext and cosine similarity candidates come from a single query
+    hybrid = (
+        EdgeSearchMethod.bm25 in config.search_methods
+        and EdgeSearchMethod.cosine_similarity in config.search_methods
+        and supports_hybrid_search(driver)
+    )
+
+    # Build search tasks based on configured search methods, keyed by the methods they cover
+    search_tasks: dict[tuple[str, ...], Coroutine[Any, Any, Any]] = {}
+    if hybrid:
+        search_tasks[EdgeSearchMethod.bm25.value, EdgeSearchMethod.cosine_similarity.value] = (
+            edge_hybrid_search(
                 driver,
+                query,
                 query_vector,
-                None,
-                None,
                 search_filter,
                 group_ids,
                 2 * limit,
                 config.sim_min_score,
+                config.sim_prefix_rescore_factor,
+                hydrate=False,
+                with_embeddings=with_embeddings,
             )
         )
-    if EdgeSearchMethod.bfs in config.search_methods:
-        search_tasks.append(
-            edge_bfs_search(
-                driver,
-                bfs_origin_node_uuids,
-                config.bfs_max_depth,
-                search_filter,
-                group_ids,
-                2 * limit,
-            )
+    if EdgeSearchMethod.bm25 in config.search_methods and not hybrid:
+        search_tasks[(EdgeSearchMethod.bm25.value,)] = edge_fulltext_search(
+            driver,
+            query,
+            search_filter,
+            group_ids,
+            2 * limit,
+            hydrate=False,
+            with_embeddings=with_embeddings,
+        )
+    if EdgeSearchMethod.cosine_similarity in config.search_methods and not hybrid:
+        search_tasks[(EdgeSearchMethod.cosine_similarity.value,)] = edge_similarity_search(
+            driver,
+            query_vector,
+            None,
+            None,
+            search_filter,
+            group_ids,
+            2 * limit,
+            config.sim_min_score,
+            config.sim_prefix_rescore_factor,
+            hydrate=False,
+            with_embeddings=with_embeddings,
+        )
+    if EdgeSearchMethod.bfs in config.search_methods and bfs_origin_node_uuids is not None:
+        search_tasks[(EdgeSearchMethod.bfs.value,)] = edge_bfs_search(
+            driver,
+            bfs_origin_node_uuids,
+            config.bfs_max_depth,
+            search_filter,
+            group_ids,
+            2 * limit,
+            hydrate=False,
+            with_embeddings=with_embeddings,
         )
 
     # Execute only the configured search methods
-    search_results: list[list[EntityEdge]] = []
-    if search_tasks:
-        search_results = list(await semaphore_gather(*search_tasks))
+    search_results: list[list[EntityEdge]] = await _gather_until(
+        'edges', deadline, search_tasks, metadata, on_stage
+    )
 
     if EdgeSearchMethod.bfs in config.search_methods and bfs_origin_node_uuids is None:
         source_node_uuids = [edge.source_node_uuid for result in search_results for edge in result]
-        search_results.append(
-            await edge_bfs_search(
-                driver,
-                source_node_uuids,
-                config.bfs_max_depth,
-                search_filter,
-                group_ids,
-                2 * limit,
-            )
+        search_results += await _gather_until(
+            'edges',
+            deadline,
+            {
+                (EdgeSearchMethod.bfs.value,): edge_bfs_search(
+                    driver,
+                    source_node_uuids,
+                    config.bfs_max_depth,
+                    search_filter,
+                    group_ids,
+                    2 * limit,
+                    hydrate=False,
+                    with_embeddings=with_embeddings,
+                )
+            },
+            metadata,
         )
 
     edge_uuid_map = {edge.uuid: edge for result in search_results for edge in result}
+    search_result_uuids = [[edge.uuid for edge in result] for result in search_results]
 
-    reranked_uuids: list[str] = []
-    edge_scores: list[float] = []
-    if config.reranker == EdgeReranker.rrf or config.reranker == EdgeReranker.episode_mentions:
-        search_result_uuids = [[edge.uuid for edge in result] for result in search_results]
+    if config.reranker == EdgeReranker.node_distance and center_node_uuid is None:
+        raise SearchRerankerError('No center node provided for Node Distance reranker')
 
-        reranked_uuids, edge_scores = rrf(search_result_uuids, min_score=reranker_min_score)
-    elif config.reranker == EdgeReranker.mmr:
-        search_result_uuids_and_vectors = await get_embeddings_for_edges(
-            driver, list(edge_uuid_map.values())
-        )
-        reranked_uuids, edge_scores = maximal_marginal_relevance(
-            query_vector,
-            search_result_uuids_and_vectors,
-            config.mmr_lambda,
-            reranker_min_score,
-        )
-    elif config.reranker == EdgeReranker.cross_encoder:
-        fact_to_uuid_map = {edge.fact: edge.uuid for edge in list(edge_uuid_map.values())[:limit]}
-        reranked_facts = await cross_encoder.rank(query, list(fact_to_uuid_map.keys()))
-        reranked_uuids = [
-            fact_to_uuid_map[fact] for fact, score in reranked_facts if score >= reranker_min_score
-        ]
-        edge_scores = [score for _, score in reranked_facts if score >= reranker_min_score]
-    elif config.reranker == EdgeReranker.node_distance:
-        if center_node_uuid is None:
-            raise SearchRerankerError('No center node provided for Node Distance reranker')
-
-        # use rrf as a preliminary sort
-        sorted_result_uuids, node_scores = rrf(
-            [[edge.uuid for edge in result] for result in search_results],
-            min_score=reranker_min_score,
-        )
-        sorted_results = [edge_uuid_map[uuid] for uuid in sorted_result_uuids]
+    if config.reranker != EdgeReranker.rrf:
+        _report_fused(on_stage, search_result_uuids, edge_uuid_map, reranker_min_score)
 
-        # node distance reranking
-        source_to_edge_uuid_map = defaultdict(list)
-        for edge in sorted_results:
-            source_to_edge_uuid_map[edge.source_node_uuid].append(edge.uuid)
+    # Past the deadline rerankers that call the database or a model degrade to rrf
+    reranker = config.reranker
+    if reranker not in (EdgeReranker.rrf, EdgeReranker.episode_mentions) and _deadline_passed(
+        deadline
+    ):
+        metadata.skipped.append(reranker.value)
+        reranker = EdgeReranker.rrf
 
-        source_uuids = [source_node_uuid for source_node_uuid in source_to_edge_uuid_map]
+    with profile_step(f'edges.{reranker.value}') as step:
+        reranked_uuids: list[str] = []
+        edge_scores: list[float] = []
+        try:
+            if reranker == EdgeReranker.rrf or reranker == EdgeReranker.episode_mentions:
+                reranked_uuids, edge_scores = rrf(search_result_uuids, min_score=reranker_min_score)
+            elif reranker == EdgeReranker.mmr:
+                search_result_uuids_and_vectors = await _await_until(
+                    deadline,
+                    get_candidate_embeddings_for_edges(driver, list(edge_uuid_map.values())),
+                )
+                reranked_uuids, edge_scores = maximal_marginal_relevance(
+                    query_vector,
+                    search_result_uuids_and_vectors,
+                    config.mmr_lambda,
+                    reranker_min_score,
+                    limit,
+                )
+            elif reranker == EdgeReranker.cross_encoder:
+                fact_to_uuid_map = {
+                    edge.fact: edge.uuid for edge in list(edge_uuid_map.values())[:limit]
+                }
+                reranked_facts = await _await_until(
+                    deadline, cross_encoder.rank(query, list(fact_to_uuid_map.keys()))
+                )
+                reranked_uuids = [
+                    fact_to_uuid_map[fact]
+                    for fact, score in reranked_facts
+                    if score >= reranker_min_score
+                ]
+                edge_scores = [score for _, score in reranked_facts if score >= reranker_min_score]
+            elif reranker == EdgeReranker.node_distance and center_node_uuid is not None:
+                # use rrf as a preliminary sort
+                sorted_result_uuids, node_scores = rrf(
+                    search_result_uuids,
+                    min_score=reranker_min_score,
+                )
+                sorted_results = [edge_uuid_map[uuid] for uuid in sorted_result_uuids]
 
-        reranked_node_uuids, edge_scores = await node_distance_reranker(
-            driver, source_uuids, center_node_uuid, min_score=reranker_min_score
-        )
+                # node distance reranking
+                source_to_edge_uuid_map = defaultdict(list)
+                for edge in sorted_results:
+                    source_to_edge_uuid_map[edge.source_node_uuid].append(edge.uuid)
+
+                source_uuids = [source_node_uuid for source_node_uuid in source_to_edge_uuid_map]
+
+                reranked_node_uuids, node_distance_scores = await _await_until(
+                    deadline,
+                    node_distance_reranker(
+                        driver,
+                        source_uuids,
+                        center_node_uuid,
+                        min_score=reranker_min_score,
+                        max_depth=config.bfs_max_depth,
+                    ),
+                )
 
-        for node_uuid in reranked_node_uuids:
-            reranked_uuids.extend(source_to_edge_uuid_map[node_uuid])
+                # Every edge is scored by the distance of its source node
+                for node_uuid, score in zip(reranked_node_uuids, node_distance_scores, strict=True):
+                    for edge_uuid in source_to_edge_uuid_map[node_uuid]:
+                        reranked_uuids.append(edge_uuid)
+                        edge_scores.append(score)
+        except asyncio.TimeoutError:
+            metadata.skipped.append(reranker.value)
+            reranker = EdgeReranker.rrf
+            reranked_uuids, edge_scores = rrf(search_result_uuids, min_score=reranker_min_score)
+        metadata.reranker = reranker.value
+        if step is not None:
+            step.candidates = len(reranked_uuids)
 
     reranked_edges = [edge_uuid_map[uuid] for uuid in reranked_uuids]
 
-    if config.reranker == EdgeReranker.episode_mentions:
+    if reranker == EdgeReranker.episode_mentions:
         reranked_edges.sort(reverse=True, key=lambda edge: len(edge.episodes))
 
-    return reranked_edges[:limit], edge_scores[:limit]
+    with profile_step('edges.hydrate'):
+        hydrated_edges = await hydrate_edges(driver, reranked_edges[:limit])
+
+    return hydrated_edges, edge_scores[:limit]
 
 
 async def node_search(
@@ -318,102 +964,178 @@ async def node_search(
     bfs_origin_node_uuids: list[str] | None = None,
     limit=DEFAULT_SEARCH_LIMIT,
     reranker_min_score: float = 0,
+    deadline: float | None = None,
+    metadata: SearchLayerMetadata | None = None,
+    on_stage: SearchStageCallback | None = None,
 ) -> tuple[list[EntityNode], list[float]]:
     if config is None:
         return [], []
+    metadata = metadata if metadata is not None else SearchLayerMetadata()
 
-    # Build search tasks based on configured search methods
-    search_tasks = []
-    if NodeSearchMethod.bm25 in config.search_methods:
-        search_tasks.append(
-            node_fulltext_search(driver, query, search_filter, group_ids, 2 * limit)
-        )
-    if NodeSearchMethod.cosine_similarity in config.search_methods:
-        search_tasks.append(
-            node_similarity_search(
+    # Like edge_search, rerank lightweight candidates and load the final nodes in full
+    with_embeddings = config.reranker == NodeReranker.mmr
+
+    hybrid = (
+        NodeSearchMethod.bm25 in config.search_methods
+        and NodeSearchMethod.cosine_similarity in config.search_methods
+        and supports_hybrid_search(driver)
+    )
+
+    # Build search tasks based on configured search methods, keyed by the methods they cover
+    search_tasks: dict[tuple[str, ...], Coroutine[Any, Any, Any]] = {}
+    if hybrid:
+        search_tasks[NodeSearchMethod.bm25.value, NodeSearchMethod.cosine_similarity.value] = (
+            node_hybrid_search(
                 driver,
+                query,
                 query_vector,
                 search_filter,
                 group_ids,
                 2 * limit,
                 config.sim_min_score,
+                config.sim_prefix_rescore_factor,
+                hydrate=False,
+                with_embeddings=with_embeddings,
             )
         )
-    if NodeSearchMethod.bfs in config.search_methods:
-        search_tasks.append(
-            node_bfs_search(
-                driver,
-                bfs_origin_node_uuids,
-                search_filter,
-                config.bfs_max_depth,
-                group_ids,
-                2 * limit,
-            )
+    if NodeSearchMethod.bm25 in config.search_methods and not hybrid:
+        search_tasks[(NodeSearchMethod.bm25.value,)] = node_fulltext_search(
+            driver,
+            query,
+            search_filter,
+            group_ids,
+            2 * limit,
+            hydrate=False,
+            with_embeddings=with_embeddings,
+        )
+    if NodeSearchMethod.cosine_similarity in config.search_methods and not hybrid:
+        search_tasks[(NodeSearchMethod.cosine_similarity.value,)] = node_similarity_search(
+            driver,
+            query_vector,
+            search_filter,
+            group_ids,
+            2 * limit,
+            config.sim_min_score,
+            config.sim_prefix_rescore_factor,
+            hydrate=False,
+            with_embeddings=with_embeddings,
+        )
+    if NodeSearchMethod.bfs in config.search_methods and bfs_origin_node_uuids is not None:
+        search_tasks[(NodeSearchMethod.bfs.value,)] = node_bfs_search(
+            driver,
+            bfs_origin_node_uuids,
+            search_filter,
+            config.bfs_max_depth,
+            group_ids,
+            2 * limit,
+            hydrate=False,
+            with_embeddings=with_embeddings,
         )
 
     # Execute only the configured search methods
-    search_results: list[list[EntityNode]] = []
-    if search_tasks:
-        search_results = list(await semaphore_gather(*search_tasks))
+    search_results: list[list[EntityNode]] = await _gather_until(
+        'nodes', deadline, search_tasks, metadata, on_stage
+    )
 
     if NodeSearchMethod.bfs in config.search_methods and bfs_origin_node_uuids is None:
         origin_node_uuids = [node.uuid for result in search_results for node in result]
-        search_results.append(
-            await node_bfs_search(
-                driver,
-                origin_node_uuids,
-                search_filter,
-                config.bfs_max_depth,
-                group_ids,
-                2 * limit,
-            )
+        search_results += await _gather_until(
+            'nodes',
+            deadline,
+            {
+                (NodeSearchMethod.bfs.value,): node_bfs_search(
+                    driver,
+                    origin_node_uuids,
+                    search_filter,
+                    config.bfs_max_depth,
+                    group_ids,
+                    2 * limit,
+                    hydrate=False,
+                    with_embeddings=with_embeddings,
+                )
+            },
+            metadata,
         )
 
     search_result_uuids = [[node.uuid for node in result] for result in search_results]
     node_uuid_map = {node.uuid: node for result in search_results for node in result}
 
-    reranked_uuids: list[str] = []
-    node_scores: list[float] = []
-    if config.reranker == NodeReranker.rrf:
-        reranked_uuids, node_scores = rrf(search_result_uuids, min_score=reranker_min_score)
-    elif config.reranker == NodeReranker.mmr:
-        search_result_uuids_and_vectors = await get_embeddings_for_nodes(
-            driver, list(node_uuid_map.values())
-        )
+    if config.reranker == NodeReranker.node_distance and center_node_uuid is None:
+        raise SearchRerankerError('No center node provided for Node Distance reranker')
 
-        reranked_uuids, node_scores = maximal_marginal_relevance(
-            query_vector,
-            search_result_uuids_and_vectors,
-            config.mmr_lambda,
-            reranker_min_score,
-        )
-    elif config.reranker == NodeReranker.cross_encoder:
-        name_to_uuid_map = {node.name: node.uuid for node in list(node_uuid_map.values())}
-
-        reranked_node_names = await cross_encoder.rank(query, list(name_to_uuid_map.keys()))
-        reranked_uuids = [
-            name_to_uuid_map[name]
-            for name, score in reranked_node_names
-            if score >= reranker_min_score
-        ]
-        node_scores = [score for _, score in reranked_node_names if score >= reranker_min_score]
-    elif config.reranker == NodeReranker.episode_mentions:
-        reranked_uuids, node_scores = await episode_mentions_reranker(
-            driver, search_result_uuids, min_score=reranker_min_score
-        )
-    elif config.reranker == NodeReranker.node_distance:
-        if center_node_uuid is None:
-            raise SearchRerankerError('No center node provided for Node Distance reranker')
-        reranked_uuids, node_scores = await node_distance_reranker(
-            driver,
-            rrf(search_result_uuids, min_score=reranker_min_score)[0],
-            center_node_uuid,
-            min_score=reranker_min_score,
-        )
+    if config.reranker != NodeReranker.rrf:
+        _report_fused(on_stage, search_result_uuids, node_uuid_map, reranker_min_score)
+
+    reranker = config.reranker
+    if reranker != NodeReranker.rrf and _deadline_passed(deadline):
+        metadata.skipped.append(reranker.value)
+        reranker = NodeReranker.rrf
+
+    with profile_step(f'nodes.{reranker.value}') as step:
+        reranked_uuids: list[str] = []
+        node_scores: list[float] = []
+        try:
+            if reranker == NodeReranker.rrf:
+                reranked_uuids, node_scores = rrf(search_result_uuids, min_score=reranker_min_score)
+            elif reranker == NodeReranker.mmr:
+                search_result_uuids_and_vectors = await _await_until(
+                    deadline,
+                    get_candidate_embeddings_for_nodes(driver, list(node_uuid_map.values())),
+                )
+
+                reranked_uuids, node_scores = maximal_marginal_relevance(
+                    query_vector,
+                    search_result_uuids_and_vectors,
+                    config.mmr_lambda,
+                    reranker_min_score,
+                    limit,
+                )
+            elif reranker == NodeReranker.cross_encoder:
+                name_to_uuid_map = {node.name: node.uuid for node in list(node_uuid_map.values())}
+
+                reranked_node_names = await _await_until(
+                    deadline, cross_encoder.rank(query, list(name_to_uuid_map.keys()))
+                )
+                reranked_uuids = [
+                    name_to_uuid_map[name]
+                    for name, score in reranked_node_names
+                    if score >= reranker_min_score
+                ]
+                node_scores = [
+                    score for _, score in reranked_node_names if score >= reranker_min_score
+                ]
+            elif reranker == NodeReranker.episode_mentions:
+                reranked_uuids, node_scores = await _await_until(
+                    deadline,
+                    episode_mentions_reranker(
+                        driver, search_result_uuids, min_score=reranker_min_score
+                    ),
+                )
+            elif reranker == NodeReranker.node_distance and center_node_uuid is not None:
+                reranked_uuids, node_scores = await _await_until(
+                    deadline,
+                    node_distance_reranker(
+                        driver,
+                        rrf(search_result_uuids, min_score=reranker_min_score)[0],
+                        center_node_uuid,
+                        min_score=reranker_min_score,
+                        max_depth=config.bfs_max_depth,
+                    ),
+                )
+        except asyncio.TimeoutError:
+            metadata.skipped.append(reranker.value)
+            reranker = NodeReranker.rrf
+            reranked_uuids, node_scores = rrf(search_result_uuids, min_score=reranker_min_score)
+        metadata.reranker = reranker.value
+        if step is not None:
+            step.candidates = len(reranked_uuids)
 
     reranked_nodes = [node_uuid_map[uuid] for uuid in reranked_uuids]
 
-    return reranked_nodes[:limit], node_scores[:limit]
+    with profile_step('nodes.hydrate'):
+        hydrated_nodes = await hydrate_nodes(driver, reranked_nodes[:limit])
+
+    return hydrated_nodes, node_scores[:limit]
 
 
 async def episode_search(
@@ -426,39 +1148,72 @@ async def episode_search(
     search_filter: SearchFilters,
     limit=DEFAULT_SEARCH_LIMIT,
     reranker_min_score: float = 0,
+    deadline: float | None = None,
+    metadata: SearchLayerMetadata | None = None,
+    on_stage: SearchStageCallback | None = None,
 ) -> tuple[list[EpisodicNode], list[float]]:
     if config is None:
         return [], []
-    search_results: list[list[EpisodicNode]] = list(
-        await semaphore_gather(
-            *[
-                episode_fulltext_search(driver, query, search_filter, group_ids, 2 * limit),
-            ]
-        )
+    metadata = metadata if metadata is not None else SearchLayerMetadata()
+    search_results: list[list[EpisodicNode]] = await _gather_until(
+        'episodes',
+        deadline,
+        {
+            (EpisodeSearchMethod.bm25.value,): episode_fulltext_search(
+                driver, query, search_filter, group_ids, 2 * limit
+            ),
+        },
+        metadata,
+        on_stage,
     )
 
     search_result_uuids = [[episode.uuid for episode in result] for result in search_results]
     episode_uuid_map = {episode.uuid: episode for result in search_results for episode in result}
 
-    reranked_uuids: list[str] = []
-    episode_scores: list[float] = []
-    if config.reranker == EpisodeReranker.rrf:
-        reranked_uuids, episode_scores = rrf(search_result_uuids, min_score=reranker_min_score)
+    if config.reranker != EpisodeReranker.rrf:
+        _report_fused(on_stage, search_result_uuids, episode_uuid_map, reranker_min_score)
 
-    elif config.reranker == EpisodeReranker.cross_encoder:
-        # use rrf as a preliminary reranker
-        rrf_result_uuids, episode_scores = rrf(search_result_uuids, min_score=reranker_min_score)
-        rrf_results = [episode_uuid_map[uuid] for uuid in rrf_result_uuids][:limit]
+    reranker = config.reranker
+    if reranker != EpisodeReranker.rrf and _deadline_passed(deadline):
+        metadata.skipped.append(reranker.value)
+        reranker = EpisodeReranker.rrf
 
-        content_to_uuid_map = {episode.content: episode.uuid for episode in rrf_results}
+    with profile_step(f'episodes.{reranker.value}') as step:
+        reranked_uuids: list[str] = []
+        episode_scores: list[float] = []
+        try:
+            if reranker == EpisodeReranker.rrf:
+                reranked_uuids, episode_scores = rrf(
+                    search_result_uuids, min_score=reranker_min_score
+                )
 
-        reranked_contents = await cross_encoder.rank(query, list(content_to_uuid_map.keys()))
-        reranked_uuids = [
-            content_to_uuid_map[content]
-            for content, score in reranked_contents
-            if score >= reranker_min_score
-        ]
-        episode_scores = [score for _, score in reranked_contents if score >= reranker_min_score]
+            elif reranker == EpisodeReranker.cross_encoder:
+                # use rrf as a preliminary reranker
+                rrf_result_uuids, episode_scores = rrf(
+                    search_result_uuids, min_score=reranker_min_score
+                )
+                rrf_results = [episode_uuid_map[uuid] for uuid in rrf_result_uuids][:limit]
+
+                content_to_uuid_map = {episode.content: episode.uuid for episode in rrf_results}
+
+                reranked_contents = await _await_until(
+                    deadline, cross_encoder.rank(query, list(content_to_uuid_map.keys()))
+                )
+                reranked_uuids = [
+                    content_to_uuid_map[content]
+                    for content, score in reranked_contents
+                    if score >= reranker_min_score
+                ]
+                episode_scores = [
+                    score for _, score in reranked_contents if score >= reranker_min_score
+                ]
+        except asyncio.TimeoutError:
+            metadata.skipped.append(reranker.value)
+            reranker = EpisodeReranker.rrf
+            reranked_uuids, episode_scores = rrf(search_result_uuids, min_score=reranker_min_score)
+        metadata.reranker = reranker.value
+        if step is not None:
+            step.candidates = len(reranked_uuids)
 
     reranked_episodes = [episode_uuid_map[uuid] for uuid in reranked_uuids]
 
@@ -474,19 +1229,27 @@ async def community_search(
     config: CommunitySearchConfig | None,
     limit=DEFAULT_SEARCH_LIMIT,
     reranker_min_score: float = 0,
+    deadline: float | None = None,
+    metadata: SearchLayerMetadata | None = None,
+    on_stage: SearchStageCallback | None = None,
 ) -> tuple[list[CommunityNode], list[float]]:
     if config is None:
         return [], []
+    metadata = metadata if metadata is not None else SearchLayerMetadata()
 
-    search_results: list[list[CommunityNode]] = list(
-        await semaphore_gather(
-            *[
-                community_fulltext_search(driver, query, group_ids, 2 * limit),
-                community_similarity_search(
-                    driver, query_vector, group_ids, 2 * limit, config.sim_min_score
-                ),
-            ]
-        )
+    search_results: list[list[CommunityNode]] = await _gather_until(
+        'communities',
+        deadline,
+        {
+            (CommunitySearchMethod.bm25.value,): community_fulltext_search(
+                driver, query, group_ids, 2 * limit
+            ),
+            (CommunitySearchMethod.cosine_similarity.value,): community_similarity_search(
+                driver, query_vector, group_ids, 2 * limit, config.sim_min_score
+            ),
+        },
+        metadata,
+        on_stage,
     )
 
     search_result_uuids = [[community.uuid for community in result] for result in search_results]
@@ -494,25 +1257,59 @@ async def community_search(
         community.uuid: community for result in search_results for community in result
     }
 
-    reranked_uuids: list[str] = []
-    community_scores: list[float] = []
-    if config.reranker == CommunityReranker.rrf:
-        reranked_uuids, community_scores = rrf(search_result_uuids, min_score=reranker_min_score)
-    elif config.reranker == CommunityReranker.mmr:
-        search_result_uuids_and_vectors = await get_embeddings_for_communities(
-            driver, list(community_uuid_map.values())
-        )
+    if config.reranker != CommunityReranker.rrf:
+        _report_fused(on_stage, search_result_uuids, community_uuid_map, reranker_min_score)
 
-        reranked_uuids, community_scores = maximal_marginal_relevance(
-            query_vector, search_result_uuids_and_vectors, config.mmr_lambda, reranker_min_score
-        )
-    elif config.reranker == CommunityReranker.cross_encoder:
-        name_to_uuid_map = {node.name: node.uuid for result in search_results for node in result}
-        reranked_nodes = await cross_encoder.rank(query, list(name_to_uuid_map.keys()))
-        reranked_uuids = [
-            name_to_uuid_map[name] for name, score in reranked_nodes if score >= reranker_min_score
-        ]
-        community_scores = [score for _, score in reranked_nodes if score >= reranker_min_score]
+    reranker = config.reranker
+    if reranker != CommunityReranker.rrf and _deadline_passed(deadline):
+        metadata.skipped.append(reranker.value)
+        reranker = CommunityReranker.rrf
+
+    with profile_step(f'communities.{reranker.value}') as step:
+        reranked_uuids: list[str] = []
+        community_scores: list[float] = []
+        try:
+            if reranker == CommunityReranker.rrf:
+                reranked_uuids, community_scores = rrf(
+                    search_result_uuids, min_score=reranker_min_score
+                )
+            elif reranker == CommunityReranker.mmr:
+                search_result_uuids_and_vectors = await _await_until(
+                    deadline,
+                    get_embeddings_for_communities(driver, list(community_uuid_map.values())),
+                )
+
+                reranked_uuids, community_scores = maximal_marginal_relevance(
+                    query_vector,
+                    search_result_uuids_and_vectors,
+                    config.mmr_lambda,
+                    reranker_min_score,
+                    limit,
+                )
+            elif reranker == CommunityReranker.cross_encoder:
+                name_to_uuid_map = {
+                    node.name: node.uuid for result in search_results for node in result
+                }
+                reranked_nodes = await _await_until(
+                    deadline, cross_encoder.rank(query, list(name_to_uuid_map.keys()))
+                )
+                reranked_uuids = [
+                    name_to_uuid_map[name]
+                    for name, score in reranked_nodes
+                    if score >= reranker_min_score
+                ]
+                community_scores = [
+                    score for _, score in reranked_nodes if score >= reranker_min_score
+                ]
+        except asyncio.TimeoutError:
+            metadata.skipped.append(reranker.value)
+            reranker = CommunityReranker.rrf
+            reranked_uuids, community_scores = rrf(
+                search_result_uuids, min_score=reranker_min_score
+            )
+        metadata.reranker = reranker.value
+        if step is not None:
+            step.candidates = len(reranked_uuids)
 
     reranked_communities = [community_uuid_map[uuid] for uuid in reranked_uuids]
 
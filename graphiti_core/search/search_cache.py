@@ -0,0 +1,256 @@
+"""
+Copyright 2024, Zep Software, Inc.
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+import hashlib
+import logging
+import os
+from collections import OrderedDict
+from collections.abc import Hashable
+from typing import Any, NamedTuple
+
+import numpy as np
+from numpy.typing import NDArray
+
+from graphiti_core.helpers import normalize_l2
+from graphiti_core.search.search_config import SearchConfig, SearchResults
+from graphiti_core.search.search_filters import SearchFilters
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_SEARCH_CACHE_SIZE = int(os.getenv('SEARCH_CACHE_SIZE', 1024))
+DEFAULT_SEMANTIC_CACHE_THRESHOLD = float(os.getenv('SEMANTIC_CACHE_THRESHOLD', 0.95))
+DEFAULT_SEMANTIC_CACHE_QUERIES = int(os.getenv('SEMANTIC_CACHE_QUERIES', 64))
+
+
+def normalize_query(query: str) -> str:
+    return ' '.join(query.split()).casefold()
+
+
+def _model_hash(model: SearchConfig | SearchFilters) -> str:
+    return hashlib.sha1(model.model_dump_json().encode()).hexdigest()
+
+
+class SearchCacheMetrics:
+    def __init__(self):
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def snapshot(self) -> dict[str, Any]:
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'hit_rate': self.hit_rate,
+        }
+
+
+class GroupWriteEpochs:
+    """
+    Per-group write counters. Every write to a group bumps its epoch, which makes every
+    cached result computed against the previous epoch unreachable.
+    """
+
+    def __init__(self):
+        self._epochs: dict[str, int] = {}
+        # Bumped by every write, used for searches that are not scoped to groups
+        self._total = 0
+        # Bumped by writes to unknown groups, which invalidate every group
+        self._unscoped = 0
+
+    def bump(self, group_ids: list[str] | None):
+        self._total += 1
+        if group_ids is None:
+            self._unscoped += 1
+            return
+
+        for group_id in group_ids:
+            self._epochs[group_id] = self._epochs.get(group_id, 0) + 1
+
+    def snapshot(self, group_ids: list[str] | None) -> tuple[int, ...]:
+        if group_ids is None:
+            return (self._total,)
+
+        return (self._unscoped, *(self._epochs.get(group_id, 0) for group_id in group_ids))
+
+
+class SearchCacheKey(NamedTuple):
+    query: str
+    query_vector: tuple[float, ...] | None
+    # Everything except the query itself, including the write epochs of the searched groups
+    scope: Hashable
+
+
+class SemanticScopeEntry:
+    def __init__(self, dim: int, capacity: int):
+        self.vectors: NDArray[np.float32] = np.zeros((capacity, dim), dtype=np.float32)
+        self.results: list[SearchResults | None] = [None] * capacity
+        self.size = 0
+        self.next_row = 0
+
+
+class SemanticQueryCache:
+    """
+    Second-tier cache that matches near-duplicate queries by embedding similarity.
+
+    For every search scope (groups, config, filters, origins, database and write epochs) it
+    keeps a small matrix of recent normalized query vectors. A lookup returns the results of
+    the most similar cached query when its cosine similarity reaches `similarity_threshold`.
+    """
+
+    def __init__(
+        self,
+        similarity_threshold: float = DEFAULT_SEMANTIC_CACHE_THRESHOLD,
+        max_queries_per_scope: int = DEFAULT_SEMANTIC_CACHE_QUERIES,
+        max_scopes: int = DEFAULT_SEARCH_CACHE_SIZE,
+    ):
+        self.similarity_threshold = similarity_threshold
+        self.max_queries_per_scope = max_queries_per_scope
+        self.max_scopes = max_scopes
+        self.metrics = SearchCacheMetrics()
+        self._scopes: OrderedDict[Hashable, SemanticScopeEntry] = OrderedDict()
+
+    def get(self, scope: Hashable, query_vector: list[float]) -> SearchResults | None:
+        entry = self._scopes.get(scope)
+        if entry is None or entry.size == 0 or entry.vectors.shape[1] != len(query_vector):
+            self.metrics.misses += 1
+            return None
+
+        similarities = entry.vectors[: entry.size] @ normalize_l2(query_vector)
+        best = int(np.argmax(similarities))
+        results = entry.results[best]
+        if similarities[best] < self.similarity_threshold or results is None:
+            self.metrics.misses += 1
+            return None
+
+        self._scopes.move_to_end(scope)
+        self.metrics.hits += 1
+        return results.model_copy(deep=True)
+
+    def put(self, scope: Hashable, query_vector: list[float], results: SearchResults):
+        entry = self._scopes.get(scope)
+        if entry is None or entry.vectors.shape[1] != len(query_vector):
+            entry = SemanticScopeEntry(len(query_vector), self.max_queries_per_scope)
+            self._scopes[scope] = entry
+        self._scopes.move_to_end(scope)
+
+        # Overwrite the oldest query once the scope is full
+        row = entry.next_row
+        entry.vectors[row] = normalize_l2(query_vector)
+        entry.results[row] = results.model_copy(deep=True)
+        entry.next_row = (row + 1) % self.max_queries_per_scope
+        entry.size = min(entry.size + 1, self.max_queries_per_scope)
+
+        while len(self._scopes) > self.max_scopes:
+            self._scopes.popitem(last=False)
+            self.metrics.evictions += 1
+
+    def clear(self):
+        self._scopes.clear()
+
+
+class SearchResultCache:
+    """
+    LRU cache of SearchResults keyed by the exact search request.
+
+    The key covers the normalized query, the group_ids, the search config and filters, the
+    center and BFS origin nodes, the query vector, the target database, and the write epochs of
+    the searched groups. Graphiti bumps the epochs on every write it performs, so stale entries
+    are never returned; writes made directly against the driver are not tracked.
+
+    When `semantic_cache` is set, exact misses fall back to a lookup of similar recent queries
+    in the same scope. This requires the query embedding, but skips every database query.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = DEFAULT_SEARCH_CACHE_SIZE,
+        semantic_cache: SemanticQueryCache | None = None,
+    ):
+        self.max_entries = max_entries
+        self.semantic_cache = semantic_cache
+        self.epochs = GroupWriteEpochs()
+        self.metrics = SearchCacheMetrics()
+        self._entries: OrderedDict[Hashable, SearchResults] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def make_key(
+        self,
+        query: str,
+        group_ids: list[str] | None,
+        config: SearchConfig,
+        search_filter: SearchFilters,
+        center_node_uuid: str | None = None,
+        bfs_origin_node_uuids: list[str] | None = None,
+        query_vector: list[float] | None = None,
+        database: str | None = None,
+    ) -> SearchCacheKey:
+        groups = sorted(set(group_ids)) if group_ids else None
+        scope = (
+            tuple(groups) if groups is not None else None,
+            _model_hash(config),
+            _model_hash(search_filter),
+            center_node_uuid,
+            tuple(bfs_origin_node_uuids) if bfs_origin_node_uuids is not None else None,
+            database,
+            self.epochs.snapshot(groups),
+        )
+        return SearchCacheKey(
+            normalize_query(query),
+            tuple(query_vector) if query_vector is not None else None,
+            scope,
+        )
+
+    def get(self, key: Hashable) -> SearchResults | None:
+        results = self._entries.get(key)
+        if results is None:
+            self.metrics.misses += 1
+            return None
+
+        self._entries.move_to_end(key)
+        self.metrics.hits += 1
+        # Callers may mutate the returned graph objects, so never hand out the cached instance
+        return results.model_copy(deep=True)
+
+    def put(self, key: Hashable, results: SearchResults):
+        self._entries[key] = results.model_copy(deep=True)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.metrics.evictions += 1
+
+    def invalidate(self, group_ids: list[str] | None = None):
+        """Record a write to group_ids (or to unknown groups when None)."""
+        self.epochs.bump(group_ids)
+        logger.debug(f'Invalidated search cache for groups {group_ids}')
+
+    def clear(self):
+        self._entries.clear()
+        if self.semantic_cache is not None:
+            self.semantic_cache.clear()
+
+    def stats(self) -> dict[str, Any]:
+        stats: dict[str, Any] = {**self.metrics.snapshot(), 'size': len(self._entries)}
+        if self.semantic_cache is not None:
+            stats['semantic'] = self.semantic_cache.metrics.snapshot()
+        return stats
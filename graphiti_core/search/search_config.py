@@ -20,6 +20,7 @@ from pydantic import BaseModel, Field
 
 from graphiti_core.edges import EntityEdge
 from graphiti_core.nodes import CommunityNode, EntityNode, EpisodicNode
+from graphiti_core.search.search_profile import SearchProfile
 from graphiti_core.search.search_utils import (
     DEFAULT_MIN_SCORE,
     DEFAULT_MMR_LAMBDA,
@@ -81,6 +82,11 @@ class EdgeSearchConfig(BaseModel):
     search_methods: list[EdgeSearchMethod]
     reranker: EdgeReranker = Field(default=EdgeReranker.rrf)
     sim_min_score: float = Field(default=DEFAULT_MIN_SCORE)
+    sim_prefix_rescore_factor: int | None = Field(
+        default=None,
+        description='Scan embedding prefixes first and rescore this many candidates per result '
+        'with the full embedding (requires EMBEDDING_PREFIX_DIM)',
+    )
     mmr_lambda: float = Field(default=DEFAULT_MMR_LAMBDA)
     bfs_max_depth: int = Field(default=MAX_SEARCH_DEPTH)
 
@@ -89,6 +95,11 @@ class NodeSearchConfig(BaseModel):
     search_methods: list[NodeSearchMethod]
     reranker: NodeReranker = Field(default=NodeReranker.rrf)
     sim_min_score: float = Field(default=DEFAULT_MIN_SCORE)
+    sim_prefix_rescore_factor: int | None = Field(
+        default=None,
+        description='Scan embedding prefixes first and rescore this many candidates per result '
+        'with the full embedding (requires EMBEDDING_PREFIX_DIM)',
+    )
     mmr_lambda: float = Field(default=DEFAULT_MMR_LAMBDA)
     bfs_max_depth: int = Field(default=MAX_SEARCH_DEPTH)
 
@@ -118,6 +129,56 @@ class SearchConfig(BaseModel):
     reranker_min_score: float = Field(default=0)
 
 
+class SearchStage(Enum):
+    bm25 = 'bm25'
+    fused = 'fused'
+    reranked = 'reranked'
+
+
+class SearchLayerMetadata(BaseModel):
+    search_methods: list[str] = Field(
+        default_factory=list, description='search methods whose candidates were used'
+    )
+    reranker: str | None = Field(default=None, description='reranker applied to the candidates')
+    skipped: list[str] = Field(
+        default_factory=list,
+        description='search methods and rerankers skipped or cancelled at the search deadline',
+    )
+
+    @classmethod
+    def merge(cls, layers: list['SearchLayerMetadata | None']) -> 'SearchLayerMetadata | None':
+        present = [layer for layer in layers if layer is not None]
+        if not present:
+            return None
+
+        return cls(
+            search_methods=list(
+                dict.fromkeys(method for layer in present for method in layer.search_methods)
+            ),
+            reranker=next((layer.reranker for layer in present if layer.reranker), None),
+            skipped=list(dict.fromkeys(name for layer in present for name in layer.skipped)),
+        )
+
+
+class SearchMetadata(BaseModel):
+    stage: SearchStage = Field(
+        default=SearchStage.reranked,
+        description='search stage that produced the results, earlier stages are only streamed',
+    )
+    edges: SearchLayerMetadata | None = Field(default=None)
+    nodes: SearchLayerMetadata | None = Field(default=None)
+    episodes: SearchLayerMetadata | None = Field(default=None)
+    communities: SearchLayerMetadata | None = Field(default=None)
+
+    @property
+    def degraded(self) -> bool:
+        """Whether any layer skipped a search method or reranker to meet the deadline."""
+        return any(
+            layer is not None and layer.skipped
+            for layer in (self.edges, self.nodes, self.episodes, self.communities)
+        )
+
+
 class SearchResults(BaseModel):
     edges: list[EntityEdge] = Field(default_factory=list)
     edge_reranker_scores: list[float] = Field(default_factory=list)
@@ -127,6 +188,10 @@ class SearchResults(BaseModel):
     episode_reranker_scores: list[float] = Field(default_factory=list)
     communities: list[CommunityNode] = Field(default_factory=list)
     community_reranker_scores: list[float] = Field(default_factory=list)
+    metadata: SearchMetadata = Field(default_factory=SearchMetadata)
+    profile: SearchProfile | None = Field(
+        default=None, description='timings and queries of the search, set with explain=True'
+    )
 
     @classmethod
     def merge(cls, results_list: list['SearchResults']) -> 'SearchResults':
@@ -157,4 +222,15 @@ class SearchResults(BaseModel):
             merged.communities.extend(result.communities)
             merged.community_reranker_scores.extend(result.community_reranker_scores)
 
+        merged.metadata = SearchMetadata(
+            edges=SearchLayerMetadata.merge([result.metadata.edges for result in results_list]),
+            nodes=SearchLayerMetadata.merge([result.metadata.nodes for result in results_list]),
+            episodes=SearchLayerMetadata.merge(
+                [result.metadata.episodes for result in results_list]
+            ),
+            communities=SearchLayerMetadata.merge(
+                [result.metadata.communities for result in results_list]
+            ),
+        )
+
         return merged
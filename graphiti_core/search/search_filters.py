@@ -64,6 +64,13 @@ class SearchFilters(BaseModel):
     expired_at: list[list[DateFilter]] | None = Field(default=None)
     edge_uuids: list[str] | None = Field(default=None)
     property_filters: list[PropertyFilter] | None = Field(default=None)
+    as_of: datetime | None = Field(
+        default=None,
+        description='Only match edges valid at this time that had not been expired by then',
+    )
+    include_expired: bool = Field(
+        default=False, description='With as_of, also match edges that had been expired by then'
+    )
 
 
 def cypher_to_opensearch_operator(op: ComparisonOperator) -> str:
@@ -115,6 +122,17 @@ def edge_search_filter_query_constructor(
     filter_queries: list[str] = []
     filter_params: dict[str, Any] = {}
 
+    if filters.as_of is not None:
+        # A single-parameter validity predicate, in place of chains of DateFilters
+        as_of_filter = (
+            '(e.valid_at IS NULL OR e.valid_at <= $as_of)'
+            ' AND (e.invalid_at IS NULL OR e.invalid_at > $as_of)'
+        )
+        if not filters.include_expired:
+            as_of_filter += ' AND (e.expired_at IS NULL OR e.expired_at > $as_of)'
+        filter_queries.append(as_of_filter)
+        filter_params['as_of'] = filters.as_of
+
     if filters.edge_types is not None:
         edge_types = filters.edge_types
         filter_queries.append('e.name in $edge_types')
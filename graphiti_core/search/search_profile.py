@@ -0,0 +1,163 @@
+"""
+Copyright 2024, Zep Software, Inc.
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+from collections.abc import Generator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from time import perf_counter
+from typing import Any
+
+from pydantic import BaseModel, Field
+
+from graphiti_core.driver.driver import GraphDriver
+from graphiti_core.tracer import Tracer
+
+
+class SearchStepProfile(BaseModel):
+    name: str = Field(
+        description='layer and search method, reranker or other step, e.g. edges.bm25'
+    )
+    duration_ms: float
+    candidates: int | None = Field(default=None, description='results returned by the step')
+    error: str | None = Field(default=None)
+
+
+class SearchQueryProfile(BaseModel):
+    step: str | None = Field(description='step that issued the query')
+    query: str
+    duration_ms: float
+    records: int | None = Field(default=None)
+
+
+class SearchProfile(BaseModel):
+    provider: str | None = Field(default=None)
+    duration_ms: float = Field(default=0)
+    cache_hit: str | None = Field(default=None, description="'exact' or 'semantic' on a cache hit")
+    steps: list[SearchStepProfile] = Field(default_factory=list)
+    queries: list[SearchQueryProfile] = Field(default_factory=list)
+
+
+def count_results(result: Any) -> int | None:
+    # Search methods return a list, hybrid searches a list per method and rerankers (uuids, scores)
+    if isinstance(result, tuple):
+        return len(result[0])
+    if isinstance(result, list):
+        if result and all(isinstance(item, list) for item in result):
+            return sum(len(item) for item in result)
+        return len(result)
+    return None
+
+
+class SearchProfiler:
+    """Collects a SearchProfile, mirroring each step as a child span of the search span."""
+
+    def __init__(self, tracer: Tracer, provider: str | None = None):
+        self.tracer = tracer
+        self.profile = SearchProfile(provider=provider)
+
+    @contextmanager
+    def step(self, name: str) -> Generator[SearchStepProfile, None, None]:
+        profile = SearchStepProfile(name=name, duration_ms=0)
+        error: Exception | None = None
+        token = _current_step.set(name)
+        start = perf_counter()
+        with self.tracer.start_span(f'search.{name}') as span:
+            try:
+                yield profile
+            except Exception as e:
+                # Re-raised once the span is closed, tracers only expect their own exceptions
+                error = e
+                profile.error = type(e).__name__
+                span.record_exception(e)
+                span.set_status('error', str(e))
+            except BaseException as e:
+                profile.error = type(e).__name__
+                raise
+            finally:
+                _current_step.reset(token)
+                profile.duration_ms = (perf_counter() - start) * 1000
+                self.profile.steps.append(profile)
+                span.add_attributes(
+                    {
+                        'duration_ms': profile.duration_ms,
+                        'candidates': profile.candidates,
+                        'error': profile.error,
+                    }
+                )
+
+        if error is not None:
+            raise error
+
+    def record_query(self, query: str, duration_ms: float, records: int | None):
+        self.profile.queries.append(
+            SearchQueryProfile(
+                step=_current_step.get(), query=query, duration_ms=duration_ms, records=records
+            )
+        )
+
+
+class ProfilingDriver:
+    """Delegates to a driver, recording every query it executes in the profiler."""
+
+    def __init__(self, driver: GraphDriver, profiler: SearchProfiler):
+        self._profiled_driver = driver
+        self._profiler = profiler
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._profiled_driver, name)
+
+    async def execute_query(self, cypher_query_: str, **kwargs: Any):
+        start = perf_counter()
+        result = await self._profiled_driver.execute_query(cypher_query_, **kwargs)
+        try:
+            records = len(result[0]) if result is not None else None
+        except (TypeError, IndexError, KeyError):
+            records = None
+        self._profiler.record_query(cypher_query_, (perf_counter() - start) * 1000, records)
+        return result
+
+
+_current_profiler: ContextVar[SearchProfiler | None] = ContextVar(
+    'graphiti_search_profiler', default=None
+)
+_current_step: ContextVar[str | None] = ContextVar('graphiti_search_step', default=None)
+
+
+@contextmanager
+def profile_step(name: str) -> Generator[SearchStepProfile | None, None, None]:
+    """Profiles a step of the current search, if it was started with explain=True."""
+    profiler = _current_profiler.get()
+    if profiler is None:
+        yield None
+        return
+
+    with profiler.step(name) as step:
+        yield step
+
+
+@contextmanager
+def profiling(profiler: SearchProfiler) -> Generator[SearchProfiler, None, None]:
+    token = _current_profiler.set(profiler)
+    try:
+        yield profiler
+    finally:
+        _current_profiler.reset(token)
+
+
+def record_cache_hit(kind: str):
+    profiler = _current_profiler.get()
+    if profiler is not None:
+        profiler.profile.cache_hit = kind
@@ -15,12 +15,10 @@ limitations under the License.
 """
 
 import logging
-from collections import defaultdict
 from time import time
 from typing import Any
 
 import numpy as np
-from numpy._typing import NDArray
 from typing_extensions import LiteralString
 
 from graphiti_core.driver.driver import (
@@ -28,20 +26,32 @@ from graphiti_core.driver.driver import (
     GraphProvider,
 )
 from graphiti_core.edges import EntityEdge, get_entity_edge_from_record
+from graphiti_core.embedder.client import EMBEDDING_PREFIX_DIM
 from graphiti_core.graph_queries import (
+    COMMUNITY_NAME_EMBEDDING_INDEX,
+    EDGE_FACT_EMBEDDING_INDEX,
+    ENTITY_NAME_EMBEDDING_INDEX,
+    VECTOR_INDEX_OVERFETCH,
+    get_embedding_prefix_candidates_query,
     get_nodes_query,
+    get_properties_without_embedding_query,
     get_relationships_query,
     get_vector_cosine_func_query,
+    get_vector_index_nodes_query,
+    get_vector_index_relationships_query,
 )
 from graphiti_core.helpers import (
     lucene_sanitize,
-    normalize_l2,
     semaphore_gather,
 )
-from graphiti_core.models.edges.edge_db_queries import get_entity_edge_return_query
+from graphiti_core.models.edges.edge_db_queries import (
+    get_entity_edge_candidate_return_query,
+    get_entity_edge_return_query,
+)
 from graphiti_core.models.nodes.node_db_queries import (
     COMMUNITY_NODE_RETURN,
     EPISODIC_NODE_RETURN,
+    get_entity_node_candidate_return_query,
     get_entity_node_return_query,
 )
 from graphiti_core.nodes import (
@@ -52,6 +62,7 @@ from graphiti_core.nodes import (
     get_entity_node_from_record,
     get_episodic_node_from_record,
 )
+from graphiti_core.search import kernels
 from graphiti_core.search.search_filters import (
     SearchFilters,
     edge_search_filter_query_constructor,
@@ -81,6 +92,54 @@ def calculate_cosine_similarity(vector1: list[float], vector2: list[float]) -> f
     return dot_product / (norm_vector1 * norm_vector2)
 
 
+def _parse_embedding(embedding: str | list[float]) -> list[float]:
+    # Neptune returns embeddings as comma separated strings
+    if isinstance(embedding, str):
+        return list(map(float, embedding.split(',')))
+    return embedding
+
+
+def _use_embedding_prefix(driver: GraphDriver) -> bool:
+    # Only Neo4j saves embedding prefixes, see get_embedding_prefix
+    return driver.provider == GraphProvider.NEO4J and EMBEDDING_PREFIX_DIM > 0
+
+
+def _score_embedding_records(
+    search_vector: list[float], records: list[dict[str, Any]], min_score: float
+) -> list[dict[str, Any]]:
+    """Score records with an `embedding` against the search vector in a single batch."""
+    records = [r for r in records if r['embedding']]
+    if not records:
+        return []
+
+    scores = kernels.cosine_similarities(
+        search_vector, [_parse_embedding(r['embedding']) for r in records]
+    ).tolist()
+    return [
+        {'id': r['id'], 'score': score}
+        for r, score in zip(records, scores, strict=True)
+        if score > min_score
+    ]
+
+
+def _score_embedding_pair_records(
+    records: list[dict[str, Any]], min_score: float
+) -> list[dict[str, Any]]:
+    """Score the source and target embeddings of each record against each other in a batch."""
+    if not records:
+        return []
+
+    scores = kernels.paired_cosine_similarities(
+        [_parse_embedding(r['source_embedding']) for r in records],
+        [_parse_embedding(r['target_embedding']) for r in records],
+    ).tolist()
+    return [
+        {'id': r['id'], 'score': score, 'uuid': r['search_edge_uuid']}
+        for r, score in zip(records, scores, strict=True)
+        if score > min_score
+    ]
+
+
 def fulltext_query(query: str, group_ids: list[str] | None, driver: GraphDriver):
     if driver.provider == GraphProvider.KUZU:
         # Kuzu only supports simple queries.
@@ -89,9 +148,17 @@ def fulltext_query(query: str, group_ids: list[str] | None, driver: GraphDriver)
         return query
     elif driver.provider == GraphProvider.FALKORDB:
         return driver.build_fulltext_query(query, group_ids, MAX_QUERY_LENGTH)
+    lucene_query = lucene_sanitize(query)
+    # If the lucene query is too long return no query
+    query_length = len(lucene_query.split(' '))
+    if query_length >= MAX_QUERY_LENGTH:
+        return ''
+
+    # Past the clause limit the groups are left out of the index query, every fulltext search
+    # also filters its matches by group_id
     group_ids_filter_list = (
         [driver.fulltext_syntax + f'group_id:"{g}"' for g in group_ids]
-        if group_ids is not None
+        if group_ids is not None and query_length + len(group_ids) < MAX_QUERY_LENGTH
         else []
     )
     group_ids_filter = ''
@@ -100,16 +167,30 @@ def fulltext_query(query: str, group_ids: list[str] | None, driver: GraphDriver)
 
     group_ids_filter += ' AND ' if group_ids_filter else ''
 
-    lucene_query = lucene_sanitize(query)
-    # If the lucene query is too long return no query
-    if len(lucene_query.split(' ')) + len(group_ids or '') >= MAX_QUERY_LENGTH:
-        return ''
-
     full_query = group_ids_filter + '(' + lucene_query + ')'
 
     return full_query
 
 
+def _get_edge_return_query(provider: GraphProvider, hydrate: bool, with_embeddings: bool) -> str:
+    # Neptune stores embeddings as strings, so they are loaded separately
+    with_embeddings = with_embeddings and provider != GraphProvider.NEPTUNE
+    if hydrate:
+        return get_entity_edge_return_query(provider) + (
+            ',e.fact_embedding AS fact_embedding' if with_embeddings else ''
+        )
+    return get_entity_edge_candidate_return_query(provider, with_embeddings)
+
+
+def _get_node_return_query(provider: GraphProvider, hydrate: bool, with_embeddings: bool) -> str:
+    with_embeddings = with_embeddings and provider != GraphProvider.NEPTUNE
+    if hydrate:
+        return get_entity_node_return_query(provider) + (
+            ',n.name_embedding AS name_embedding' if with_embeddings else ''
+        )
+    return get_entity_node_candidate_return_query(provider, with_embeddings)
+
+
 async def get_episodes_by_mentions(
     driver: GraphDriver,
     nodes: list[EntityNode],
@@ -167,17 +248,112 @@ async def get_communities_by_nodes(
     return communities
 
 
+def _get_edge_fulltext_score_query(driver: GraphDriver, filter_query: str, limit: int) -> str:
+    # Binds e, n, m and the fulltext score of facts matching $query
+    match_query = """
+    YIELD relationship AS rel, score
+    MATCH (n:Entity)-[e:RELATES_TO {uuid: rel.uuid}]->(m:Entity)
+    """
+    if driver.provider == GraphProvider.KUZU:
+        match_query = """
+        YIELD node, score
+        MATCH (n:Entity)-[:RELATES_TO]->(e:RelatesToNode_ {uuid: node.uuid})-[:RELATES_TO]->(m:Entity)
+        """
+
+    return (
+        get_relationships_query('edge_name_and_fact', limit=limit, provider=driver.provider)
+        + match_query
+        + filter_query
+    )
+
+
+async def _get_edge_similarity_score_query(
+    driver: GraphDriver,
+    search_vector: list[float],
+    filter_queries: list[str],
+    filter_params: dict[str, Any],
+    limit: int,
+    prefix_rescore_factor: int | None,
+) -> str:
+    # Binds e, n, m and the cosine score of facts scoring above $min_score, adding the
+    # parameters it needs to filter_params
+    match_query = """
+        MATCH (n:Entity)-[e:RELATES_TO]->(m:Entity)
+    """
+    # Matches the endpoints of an edge `e` already bound by a vector index query
+    indexed_match_query = """
+        MATCH (n:Entity)-[e]->(m:Entity)
+    """
+    if driver.provider == GraphProvider.KUZU:
+        match_query = """
+            MATCH (n:Entity)-[:RELATES_TO]->(e:RelatesToNode_)-[:RELATES_TO]->(m:Entity)
+        """
+        indexed_match_query = match_query
+
+    filter_query = ''
+    if filter_queries:
+        filter_query = ' WHERE ' + (' AND '.join(filter_queries))
+
+    search_vector_var = '$search_vector'
+    if driver.provider == GraphProvider.KUZU:
+        search_vector_var = f'CAST($search_vector AS FLOAT[{len(search_vector)}])'
+
+    if await driver.vector_index_exists(EDGE_FACT_EMBEDDING_INDEX):
+        filter_params['vector_candidates'] = limit * VECTOR_INDEX_OVERFETCH
+        return (
+            get_vector_index_relationships_query(
+                EDGE_FACT_EMBEDDING_INDEX, 'e', '$search_vector', driver.provider
+            )
+            + indexed_match_query
+            + """
+            WHERE """
+            + ' AND '.join(filter_queries + ['score > $min_score'])
+        )
+
+    if prefix_rescore_factor is not None and _use_embedding_prefix(driver):
+        filter_params['search_prefix'] = search_vector[:EMBEDDING_PREFIX_DIM]
+        filter_params['prefix_candidates'] = limit * prefix_rescore_factor
+        return (
+            match_query
+            + filter_query
+            + get_embedding_prefix_candidates_query('e, n, m', 'e.fact_embedding')
+            + """
+            WITH e, n, m, """
+            + get_vector_cosine_func_query('e.fact_embedding', search_vector_var, driver.provider)
+            + """ AS score
+            WHERE score > $min_score
+            """
+        )
+
+    return (
+        match_query
+        + filter_query
+        + """
+        WITH DISTINCT e, n, m, """
+        + get_vector_cosine_func_query('e.fact_embedding', search_vector_var, driver.provider)
+        + """ AS score
+        WHERE score > $min_score
+        """
+    )
+
+
 async def edge_fulltext_search(
     driver: GraphDriver,
     query: str,
     search_filter: SearchFilters,
     group_ids: list[str] | None = None,
     limit=RELEVANT_SCHEMA_LIMIT,
+    hydrate: bool = True,
+    with_embeddings: bool = False,
 ) -> list[EntityEdge]:
     if driver.search_interface:
-        return await driver.search_interface.edge_fulltext_search(
-            driver, query, search_filter, group_ids, limit
-        )
+        try:
+            return await driver.search_interface.edge_fulltext_search(
+                driver, query, search_filter, group_ids, limit
+            )
+        except NotImplementedError:
+            # The search interface does not handle this search, so run it against the database
+            pass
 
     # fulltext search over facts
     fuzzy_query = fulltext_query(query, group_ids, driver)
@@ -185,16 +361,6 @@ async def edge_fulltext_search(
     if fuzzy_query == '':
         return []
 
-    match_query = """
-    YIELD relationship AS rel, score
-    MATCH (n:Entity)-[e:RELATES_TO {uuid: rel.uuid}]->(m:Entity)
-    """
-    if driver.provider == GraphProvider.KUZU:
-        match_query = """
-        YIELD node, score
-        MATCH (n:Entity)-[:RELATES_TO]->(e:RelatesToNode_ {uuid: node.uuid})-[:RELATES_TO]->(m:Entity)
-        """
-
     filter_queries, filter_params = edge_search_filter_query_constructor(
         search_filter, driver.provider
     )
@@ -255,14 +421,12 @@ async def edge_fulltext_search(
             return []
     else:
         query = (
-            get_relationships_query('edge_name_and_fact', limit=limit, provider=driver.provider)
-            + match_query
-            + filter_query
+            _get_edge_fulltext_score_query(driver, filter_query, limit)
             + """
             WITH e, score, n, m
             RETURN
             """
-            + get_entity_edge_return_query(driver.provider)
+            + _get_edge_return_query(driver.provider, hydrate, with_embeddings)
             + """
             ORDER BY score DESC
             LIMIT $limit
@@ -291,26 +455,24 @@ async def edge_similarity_search(
     group_ids: list[str] | None = None,
     limit: int = RELEVANT_SCHEMA_LIMIT,
     min_score: float = DEFAULT_MIN_SCORE,
+    prefix_rescore_factor: int | None = None,
+    hydrate: bool = True,
+    with_embeddings: bool = False,
 ) -> list[EntityEdge]:
     if driver.search_interface:
-        return await driver.search_interface.edge_similarity_search(
-            driver,
-            search_vector,
-            source_node_uuid,
-            target_node_uuid,
-            search_filter,
-            group_ids,
-            limit,
-            min_score,
-        )
-
-    match_query = """
-        MATCH (n:Entity)-[e:RELATES_TO]->(m:Entity)
-    """
-    if driver.provider == GraphProvider.KUZU:
-        match_query = """
-            MATCH (n:Entity)-[:RELATES_TO]->(e:RelatesToNode_)-[:RELATES_TO]->(m:Entity)
-        """
+        try:
+            return await driver.search_interface.edge_similarity_search(
+                driver,
+                search_vector,
+                source_node_uuid,
+                target_node_uuid,
+                search_filter,
+                group_ids,
+                limit,
+                min_score,
+            )
+        except NotImplementedError:
+            pass
 
     filter_queries, filter_params = edge_search_filter_query_constructor(
         search_filter, driver.provider
@@ -332,10 +494,6 @@ async def edge_similarity_search(
     if filter_queries:
         filter_query = ' WHERE ' + (' AND '.join(filter_queries))
 
-    search_vector_var = '$search_vector'
-    if driver.provider == GraphProvider.KUZU:
-        search_vector_var = f'CAST($search_vector AS FLOAT[{len(search_vector)}])'
-
     if driver.provider == GraphProvider.NEPTUNE:
         query = (
             """
@@ -357,14 +515,7 @@ async def edge_similarity_search(
 
         if len(resp) > 0:
             # Calculate Cosine similarity then return the edge ids
-            input_ids = []
-            for r in resp:
-                if r['embedding']:
-                    score = calculate_cosine_similarity(
-                        search_vector, list(map(float, r['embedding'].split(',')))
-                    )
-                    if score > min_score:
-                        input_ids.append({'id': r['id'], 'score': score})
+            input_ids = _score_embedding_records(search_vector, resp, min_score)
 
             # Match the edge ides and return the values
             query = """
@@ -399,17 +550,16 @@ async def edge_similarity_search(
         else:
             return []
     else:
+        score_query = await _get_edge_similarity_score_query(
+            driver, search_vector, filter_queries, filter_params, limit, prefix_rescore_factor
+        )
+
         query = (
-            match_query
-            + filter_query
+            score_query
             + """
-            WITH DISTINCT e, n, m, """
-            + get_vector_cosine_func_query('e.fact_embedding', search_vector_var, driver.provider)
-            + """ AS score
-            WHERE score > $min_score
             RETURN
             """
-            + get_entity_edge_return_query(driver.provider)
+            + _get_edge_return_query(driver.provider, hydrate, with_embeddings)
             + """
             ORDER BY score DESC
             LIMIT $limit
@@ -430,6 +580,153 @@ async def edge_similarity_search(
     return edges
 
 
+def supports_hybrid_search(driver: GraphDriver) -> bool:
+    """Whether edge_hybrid_search and node_hybrid_search can run against this driver."""
+    return driver.provider == GraphProvider.NEO4J and driver.search_interface is None
+
+
+async def edge_hybrid_search(
+    driver: GraphDriver,
+    query: str,
+    search_vector: list[float],
+    search_filter: SearchFilters,
+    group_ids: list[str] | None = None,
+    limit: int = RELEVANT_SCHEMA_LIMIT,
+    min_score: float = DEFAULT_MIN_SCORE,
+    prefix_rescore_factor: int | None = None,
+    hydrate: bool = True,
+    with_embeddings: bool = False,
+) -> list[list[EntityEdge]]:
+    """
+    Fulltext and cosine similarity search over facts in one query, returning the two ranked
+    result lists in that order. Requires supports_hybrid_search(driver).
+    """
+    fuzzy_query = fulltext_query(query, group_ids, driver)
+    if fuzzy_query == '':
+        return [
+            [],
+            await edge_similarity_search(
+                driver,
+                search_vector,
+                None,
+                None,
+                search_filter,
+                group_ids,
+                limit,
+                min_score,
+                prefix_rescore_factor,
+                hydrate,
+                with_embeddings,
+            ),
+        ]
+
+    filter_queries, filter_params = edge_search_filter_query_constructor(
+        search_filter, driver.provider
+    )
+    if group_ids is not None:
+        filter_queries.append('e.group_id IN $group_ids')
+        filter_params['group_ids'] = group_ids
+
+    filter_query = ''
+    if filter_queries:
+        filter_query = ' WHERE ' + (' AND '.join(filter_queries))
+
+    similarity_score_query = await _get_edge_similarity_score_query(
+        driver, search_vector, filter_queries, filter_params, limit, prefix_rescore_factor
+    )
+
+    records, _, _ = await driver.execute_query(
+        """
+        CALL () {
+        """
+        + _get_edge_fulltext_score_query(driver, filter_query, limit)
+        + """
+            WITH e, n, m, score
+            ORDER BY score DESC
+            LIMIT $limit
+            RETURN 0 AS method, e, n, m, score
+            UNION ALL
+        """
+        + similarity_score_query
+        + """
+            WITH e, n, m, score
+            ORDER BY score DESC
+            LIMIT $limit
+            RETURN 1 AS method, e, n, m, score
+        }
+        WITH method, e, n, m, score
+        ORDER BY method, score DESC
+        RETURN method,
+        """
+        + _get_edge_return_query(driver.provider, hydrate, with_embeddings),
+        query=fuzzy_query,
+        search_vector=search_vector,
+        limit=limit,
+        min_score=min_score,
+        routing_='r',
+        **filter_params,
+    )
+
+    results: list[list[EntityEdge]] = [[], []]
+    for record in records:
+        results[record['method']].append(get_entity_edge_from_record(record, driver.provider))
+
+    return results
+
+
+async def _get_bfs_edges(
+    driver: GraphDriver,
+    edge_uuids: list[str],
+    search_filter: SearchFilters,
+    group_ids: list[str] | None,
+    limit: int,
+    hydrate: bool = True,
+    with_embeddings: bool = False,
+) -> list[EntityEdge]:
+    # Loads the edges an adjacency cache BFS reached, keeping the order they were reached in
+    if not edge_uuids:
+        return []
+
+    filter_queries, filter_params = edge_search_filter_query_constructor(
+        search_filter, driver.provider
+    )
+    if group_ids is not None:
+        filter_queries.append('e.group_id IN $group_ids')
+        filter_params['group_ids'] = group_ids
+
+    filter_query = ''
+    if filter_queries:
+        filter_query = ' WHERE ' + (' AND '.join(filter_queries))
+
+    match_query = """
+        UNWIND $candidates AS candidate
+        MATCH (n:Entity)-[e:RELATES_TO {uuid: candidate.uuid}]->(m:Entity)
+    """
+    if driver.provider == GraphProvider.KUZU:
+        match_query = """
+            UNWIND $candidates AS candidate
+            MATCH (n:Entity)-[:RELATES_TO]->(e:RelatesToNode_ {uuid: candidate.uuid})-[:RELATES_TO]->(m:Entity)
+        """
+
+    records, _, _ = await driver.execute_query(
+        match_query
+        + filter_query
+        + """
+        WITH n, e, m, candidate.rank AS rank
+        ORDER BY rank
+        LIMIT $limit
+        RETURN
+        """
+        + _get_edge_return_query(driver.provider, hydrate, with_embeddings),
+        candidates=[{'uuid': uuid, 'rank': rank} for rank, uuid in enumerate(edge_uuids)],
+        limit=limit,
+        routing_='r',
+        **filter_params,
+    )
+
+    return [get_entity_edge_from_record(record, driver.provider) for record in records]
+
+
 async def edge_bfs_search(
     driver: GraphDriver,
     bfs_origin_node_uuids: list[str] | None,
@@ -437,11 +734,20 @@ async def edge_bfs_search(
     search_filter: SearchFilters,
     group_ids: list[str] | None = None,
     limit: int = RELEVANT_SCHEMA_LIMIT,
+    hydrate: bool = True,
+    with_embeddings: bool = False,
 ) -> list[EntityEdge]:
     # vector similarity search over embedded facts
     if bfs_origin_node_uuids is None or len(bfs_origin_node_uuids) == 0:
         return []
 
+    if driver.adjacency_cache:
+        reached = await driver.adjacency_cache.bfs(driver, bfs_origin_node_uuids, bfs_max_depth)
+        if reached is not None:
+            return await _get_bfs_edges(
+                driver, reached[1], search_filter, group_ids, limit, hydrate, with_embeddings
+            )
+
     filter_queries, filter_params = edge_search_filter_query_constructor(
         search_filter, driver.provider
     )
@@ -483,7 +789,7 @@ async def edge_bfs_search(
                 + """
                 RETURN DISTINCT
                 """
-                + get_entity_edge_return_query(driver.provider)
+                + _get_edge_return_query(driver.provider, hydrate, with_embeddings)
                 + """
                 LIMIT $limit
                 """,
@@ -533,7 +839,7 @@ async def edge_bfs_search(
                 + """
                 RETURN DISTINCT
                 """
-                + get_entity_edge_return_query(driver.provider)
+                + _get_edge_return_query(driver.provider, hydrate, with_embeddings)
                 + """
                 LIMIT $limit
                 """
@@ -553,17 +859,95 @@ async def edge_bfs_search(
     return edges
 
 
+def _get_node_fulltext_score_query(driver: GraphDriver, filter_query: str, limit: int) -> str:
+    # Binds n and the fulltext score of entities matching $query
+    yield_query = 'YIELD node AS n, score'
+    if driver.provider == GraphProvider.KUZU:
+        yield_query = 'WITH node AS n, score'
+
+    return (
+        get_nodes_query('node_name_and_summary', '$query', limit=limit, provider=driver.provider)
+        + yield_query
+        + filter_query
+    )
+
+
+async def _get_node_similarity_score_query(
+    driver: GraphDriver,
+    search_vector: list[float],
+    filter_queries: list[str],
+    filter_params: dict[str, Any],
+    limit: int,
+    prefix_rescore_factor: int | None,
+) -> str:
+    # Binds n and the cosine score of entities scoring above $min_score, adding the parameters
+    # it needs to filter_params
+    filter_query = ''
+    if filter_queries:
+        filter_query = ' WHERE ' + (' AND '.join(filter_queries))
+
+    search_vector_var = '$search_vector'
+    if driver.provider == GraphProvider.KUZU:
+        search_vector_var = f'CAST($search_vector AS FLOAT[{len(search_vector)}])'
+
+    if await driver.vector_index_exists(ENTITY_NAME_EMBEDDING_INDEX):
+        filter_params['vector_candidates'] = limit * VECTOR_INDEX_OVERFETCH
+        return (
+            get_vector_index_nodes_query(
+                ENTITY_NAME_EMBEDDING_INDEX, 'n', '$search_vector', driver.provider
+            )
+            + """
+            WHERE """
+            + ' AND '.join(filter_queries + ['score > $min_score'])
+        )
+
+    if prefix_rescore_factor is not None and _use_embedding_prefix(driver):
+        filter_params['search_prefix'] = search_vector[:EMBEDDING_PREFIX_DIM]
+        filter_params['prefix_candidates'] = limit * prefix_rescore_factor
+        return (
+            """
+            MATCH (n:Entity)
+            """
+            + filter_query
+            + get_embedding_prefix_candidates_query('n', 'n.name_embedding')
+            + """
+            WITH n, """
+            + get_vector_cosine_func_query('n.name_embedding', search_vector_var, driver.provider)
+            + """ AS score
+            WHERE score > $min_score
+            """
+        )
+
+    return (
+        """
+        MATCH (n:Entity)
+        """
+        + filter_query
+        + """
+        WITH n, """
+        + get_vector_cosine_func_query('n.name_embedding', search_vector_var, driver.provider)
+        + """ AS score
+        WHERE score > $min_score
+        """
+    )
+
+
 async def node_fulltext_search(
     driver: GraphDriver,
     query: str,
     search_filter: SearchFilters,
     group_ids: list[str] | None = None,
     limit=RELEVANT_SCHEMA_LIMIT,
+    hydrate: bool = True,
+    with_embeddings: bool = False,
 ) -> list[EntityNode]:
     if driver.search_interface:
-        return await driver.search_interface.node_fulltext_search(
-            driver, query, search_filter, group_ids, limit
-        )
+        try:
+            return await driver.search_interface.node_fulltext_search(
+                driver, query, search_filter, group_ids, limit
+            )
+        except NotImplementedError:
+            pass
 
     # BM25 search to get top nodes
     fuzzy_query = fulltext_query(query, group_ids, driver)
@@ -582,10 +966,6 @@ async def node_fulltext_search(
     if filter_queries:
         filter_query = ' WHERE ' + (' AND '.join(filter_queries))
 
-    yield_query = 'YIELD node AS n, score'
-    if driver.provider == GraphProvider.KUZU:
-        yield_query = 'WITH node AS n, score'
-
     if driver.provider == GraphProvider.NEPTUNE:
         res = driver.run_aoss_query('node_name_and_summary', query, limit=limit)  # pyright: ignore reportAttributeAccessIssue
         if res['hits']['total']['value'] > 0:
@@ -619,18 +999,14 @@ async def node_fulltext_search(
             return []
     else:
         query = (
-            get_nodes_query(
-                'node_name_and_summary', '$query', limit=limit, provider=driver.provider
-            )
-            + yield_query
-            + filter_query
+            _get_node_fulltext_score_query(driver, filter_query, limit)
             + """
             WITH n, score
             ORDER BY score DESC
             LIMIT $limit
             RETURN
             """
-            + get_entity_node_return_query(driver.provider)
+            + _get_node_return_query(driver.provider, hydrate, with_embeddings)
         )
 
         records, _, _ = await driver.execute_query(
@@ -653,11 +1029,17 @@ async def node_similarity_search(
     group_ids: list[str] | None = None,
     limit=RELEVANT_SCHEMA_LIMIT,
     min_score: float = DEFAULT_MIN_SCORE,
+    prefix_rescore_factor: int | None = None,
+    hydrate: bool = True,
+    with_embeddings: bool = False,
 ) -> list[EntityNode]:
     if driver.search_interface:
-        return await driver.search_interface.node_similarity_search(
-            driver, search_vector, search_filter, group_ids, limit, min_score
-        )
+        try:
+            return await driver.search_interface.node_similarity_search(
+                driver, search_vector, search_filter, group_ids, limit, min_score
+            )
+        except NotImplementedError:
+            pass
 
     filter_queries, filter_params = node_search_filter_query_constructor(
         search_filter, driver.provider
@@ -671,10 +1053,6 @@ async def node_similarity_search(
     if filter_queries:
         filter_query = ' WHERE ' + (' AND '.join(filter_queries))
 
-    search_vector_var = '$search_vector'
-    if driver.provider == GraphProvider.KUZU:
-        search_vector_var = f'CAST($search_vector AS FLOAT[{len(search_vector)}])'
-
     if driver.provider == GraphProvider.NEPTUNE:
         query = (
             """
@@ -696,14 +1074,7 @@ async def node_similarity_search(
 
         if len(resp) > 0:
             # Calculate Cosine similarity then return the edge ids
-            input_ids = []
-            for r in resp:
-                if r['embedding']:
-                    score = calculate_cosine_similarity(
-                        search_vector, list(map(float, r['embedding'].split(',')))
-                    )
-                    if score > min_score:
-                        input_ids.append({'id': r['id'], 'score': score})
+            input_ids = _score_embedding_records(search_vector, resp, min_score)
 
             # Match the edge ides and return the values
             query = (
@@ -731,19 +1102,16 @@ async def node_similarity_search(
         else:
             return []
     else:
+        score_query = await _get_node_similarity_score_query(
+            driver, search_vector, filter_queries, filter_params, limit, prefix_rescore_factor
+        )
+
         query = (
-            """
-                                                                                                                                    MATCH (n:Entity)
-                                                                                                                                    """
-            + filter_query
+            score_query
             + """
-            WITH n, """
-            + get_vector_cosine_func_query('n.name_embedding', search_vector_var, driver.provider)
-            + """ AS score
-            WHERE score > $min_score
             RETURN
             """
-            + get_entity_node_return_query(driver.provider)
+            + _get_node_return_query(driver.provider, hydrate, with_embeddings)
             + """
             ORDER BY score DESC
             LIMIT $limit
@@ -764,6 +1132,139 @@ async def node_similarity_search(
     return nodes
 
 
+async def node_hybrid_search(
+    driver: GraphDriver,
+    query: str,
+    search_vector: list[float],
+    search_filter: SearchFilters,
+    group_ids: list[str] | None = None,
+    limit: int = RELEVANT_SCHEMA_LIMIT,
+    min_score: float = DEFAULT_MIN_SCORE,
+    prefix_rescore_factor: int | None = None,
+    hydrate: bool = True,
+    with_embeddings: bool = False,
+) -> list[list[EntityNode]]:
+    """
+    Fulltext and cosine similarity search over entities in one query, returning the two ranked
+    result lists in that order. Requires supports_hybrid_search(driver).
+    """
+    fuzzy_query = fulltext_query(query, group_ids, driver)
+    if fuzzy_query == '':
+        return [
+            [],
+            await node_similarity_search(
+                driver,
+                search_vector,
+                search_filter,
+                group_ids,
+                limit,
+                min_score,
+                prefix_rescore_factor,
+                hydrate,
+                with_embeddings,
+            ),
+        ]
+
+    filter_queries, filter_params = node_search_filter_query_constructor(
+        search_filter, driver.provider
+    )
+    if group_ids is not None:
+        filter_queries.append('n.group_id IN $group_ids')
+        filter_params['group_ids'] = group_ids
+
+    filter_query = ''
+    if filter_queries:
+        filter_query = ' WHERE ' + (' AND '.join(filter_queries))
+
+    similarity_score_query = await _get_node_similarity_score_query(
+        driver, search_vector, filter_queries, filter_params, limit, prefix_rescore_factor
+    )
+
+    records, _, _ = await driver.execute_query(
+        """
+        CALL () {
+        """
+        + _get_node_fulltext_score_query(driver, filter_query, limit)
+        + """
+            WITH n, score
+            ORDER BY score DESC
+            LIMIT $limit
+            RETURN 0 AS method, n, score
+            UNION ALL
+        """
+        + similarity_score_query
+        + """
+            WITH n, score
+            ORDER BY score DESC
+            LIMIT $limit
+            RETURN 1 AS method, n, score
+        }
+        WITH method, n, score
+        ORDER BY method, score DESC
+        RETURN method,
+        """
+        + _get_node_return_query(driver.provider, hydrate, with_embeddings),
+        query=fuzzy_query,
+        search_vector=search_vector,
+        limit=limit,
+        min_score=min_score,
+        routing_='r',
+        **filter_params,
+    )
+
+    results: list[list[EntityNode]] = [[], []]
+    for record in records:
+        results[record['method']].append(get_entity_node_from_record(record, driver.provider))
+
+    return results
+
+
+async def _get_bfs_nodes(
+    driver: GraphDriver,
+    node_uuids: list[str],
+    search_filter: SearchFilters,
+    group_ids: list[str] | None,
+    limit: int,
+    hydrate: bool = True,
+    with_embeddings: bool = False,
+) -> list[EntityNode]:
+    # Loads the entities an adjacency cache BFS reached, keeping the order they were reached in
+    if not node_uuids:
+        return []
+
+    filter_queries, filter_params = node_search_filter_query_constructor(
+        search_filter, driver.provider
+    )
+    if group_ids is not None:
+        filter_queries.append('n.group_id IN $group_ids')
+        filter_params['group_ids'] = group_ids
+
+    filter_query = ''
+    if filter_queries:
+        filter_query = ' WHERE ' + (' AND '.join(filter_queries))
+
+    records, _, _ = await driver.execute_query(
+        """
+        UNWIND $candidates AS candidate
+        MATCH (n:Entity {uuid: candidate.uuid})
+        """
+        + filter_query
+        + """
+        WITH n, candidate.rank AS rank
+        ORDER BY rank
+        LIMIT $limit
+        RETURN
+        """
+        + _get_node_return_query(driver.provider, hydrate, with_embeddings),
+        candidates=[{'uuid': uuid, 'rank': rank} for rank, uuid in enumerate(node_uuids)],
+        limit=limit,
+        routing_='r',
+        **filter_params,
+    )
+
+    return [get_entity_node_from_record(record, driver.provider) for record in records]
+
+
 async def node_bfs_search(
     driver: GraphDriver,
     bfs_origin_node_uuids: list[str] | None,
@@ -771,10 +1272,19 @@ async def node_bfs_search(
     bfs_max_depth: int,
     group_ids: list[str] | None = None,
     limit: int = RELEVANT_SCHEMA_LIMIT,
+    hydrate: bool = True,
+    with_embeddings: bool = False,
 ) -> list[EntityNode]:
     if bfs_origin_node_uuids is None or len(bfs_origin_node_uuids) == 0 or bfs_max_depth < 1:
         return []
 
+    if driver.adjacency_cache:
+        reached = await driver.adjacency_cache.bfs(driver, bfs_origin_node_uuids, bfs_max_depth)
+        if reached is not None:
+            return await _get_bfs_nodes(
+                driver, reached[0], search_filter, group_ids, limit, hydrate, with_embeddings
+            )
+
     filter_queries, filter_params = node_search_filter_query_constructor(
         search_filter, driver.provider
     )
@@ -836,7 +1346,7 @@ async def node_bfs_search(
             + """
             RETURN
             """
-            + get_entity_node_return_query(driver.provider)
+            + _get_node_return_query(driver.provider, hydrate, with_embeddings)
             + """
             LIMIT $limit
             """,
@@ -860,9 +1370,12 @@ async def episode_fulltext_search(
     limit=RELEVANT_SCHEMA_LIMIT,
 ) -> list[EpisodicNode]:
     if driver.search_interface:
-        return await driver.search_interface.episode_fulltext_search(
-            driver, query, _search_filter, group_ids, limit
-        )
+        try:
+            return await driver.search_interface.episode_fulltext_search(
+                driver, query, _search_filter, group_ids, limit
+            )
+        except NotImplementedError:
+            pass
 
     # BM25 search to get top episodes
     fuzzy_query = fulltext_query(query, group_ids, driver)
@@ -1055,14 +1568,7 @@ async def community_similarity_search(
 
         if len(resp) > 0:
             # Calculate Cosine similarity then return the edge ids
-            input_ids = []
-            for r in resp:
-                if r['embedding']:
-                    score = calculate_cosine_similarity(
-                        search_vector, list(map(float, r['embedding'].split(',')))
-                    )
-                    if score > min_score:
-                        input_ids.append({'id': r['id'], 'score': score})
+            input_ids = _score_embedding_records(search_vector, resp, min_score)
 
             # Match the edge ides and return the values
             query = """
@@ -1095,17 +1601,37 @@ async def community_similarity_search(
         if driver.provider == GraphProvider.KUZU:
             search_vector_var = f'CAST($search_vector AS FLOAT[{len(search_vector)}])'
 
+        if await driver.vector_index_exists(COMMUNITY_NAME_EMBEDDING_INDEX):
+            query_params['vector_candidates'] = limit * VECTOR_INDEX_OVERFETCH
+            score_query = (
+                get_vector_index_nodes_query(
+                    COMMUNITY_NAME_EMBEDDING_INDEX, 'c', '$search_vector', driver.provider
+                )
+                + """
+                WHERE score > $min_score
+                """
+                + ('AND c.group_id IN $group_ids' if group_ids is not None else '')
+            )
+        else:
+            score_query = (
+                """
+                MATCH (c:Community)
+                """
+                + group_filter_query
+                + """
+                WITH c,
+                """
+                + get_vector_cosine_func_query(
+                    'c.name_embedding', search_vector_var, driver.provider
+                )
+                + """ AS score
+                WHERE score > $min_score
+                """
+            )
+
         query = (
-            """
-                                                                                                                                    MATCH (c:Community)
-                                                                                                                                    """
-            + group_filter_query
+            score_query
             + """
-            WITH c,
-            """
-            + get_vector_cosine_func_query('c.name_embedding', search_vector_var, driver.provider)
-            + """ AS score
-            WHERE score > $min_score
             RETURN
             """
             + COMMUNITY_NODE_RETURN
@@ -1217,7 +1743,6 @@ async def get_relevant_nodes(
     query_nodes = [
         {
             'uuid': node.uuid,
-            'name': node.name,
             'name_embedding': node.name_embedding,
             'fulltext_query': fulltext_query(node.name, [node.group_id], driver),
         }
@@ -1232,6 +1757,23 @@ async def get_relevant_nodes(
     if filter_queries:
         filter_query = 'WHERE ' + (' AND '.join(filter_queries))
 
+    # Kuzu only accepts a parameter as the vector index query and a search interface serves
+    # one vector at a time, so those search one node at a time
+    if driver.search_interface or (
+        driver.provider == GraphProvider.KUZU
+        and await driver.vector_index_exists(ENTITY_NAME_EMBEDDING_INDEX)
+    ):
+        return list(
+            await semaphore_gather(
+                *[
+                    _get_relevant_nodes_for_node(
+                        driver, node, search_filter, group_id, min_score, limit
+                    )
+                    for node in nodes
+                ]
+            )
+        )
+
     if driver.provider == GraphProvider.KUZU:
         embedding_size = len(nodes[0].name_embedding) if nodes[0].name_embedding is not None else 0
         if embedding_size == 0:
@@ -1272,7 +1814,6 @@ async def get_relevant_nodes(
             WITH node, collect(DISTINCT {
                 uuid: x.uuid,
                 name: x.name,
-                name_embedding: x.name_embedding,
                 group_id: x.group_id,
                 created_at: x.created_at,
                 summary: x.summary,
@@ -1285,19 +1826,44 @@ async def get_relevant_nodes(
             """
         )
     else:
+        has_embeddings = all(node.name_embedding is not None for node in nodes)
+        if has_embeddings and await driver.vector_index_exists(ENTITY_NAME_EMBEDDING_INDEX):
+            filter_params['vector_candidates'] = limit * VECTOR_INDEX_OVERFETCH
+            score_query = (
+                """
+                UNWIND $nodes AS node
+                """
+                + get_vector_index_nodes_query(
+                    ENTITY_NAME_EMBEDDING_INDEX,
+                    'n',
+                    'node.name_embedding',
+                    driver.provider,
+                    carry=['node'],
+                )
+                + """
+                WHERE """
+                + ' AND '.join(filter_queries + ['n.group_id = $group_id', 'score > $min_score'])
+            )
+        else:
+            score_query = (
+                """
+                UNWIND $nodes AS node
+                MATCH (n:Entity {group_id: $group_id})
+                """
+                + filter_query
+                + """
+                WITH node, n, """
+                + get_vector_cosine_func_query(
+                    'n.name_embedding', 'node.name_embedding', driver.provider
+                )
+                + """ AS score
+                WHERE score > $min_score
+                """
+            )
+
         query = (
-            """
-                                                                                                                                    UNWIND $nodes AS node
-                                                                                                                                    MATCH (n:Entity {group_id: $group_id})
-                                                                                                                                    """
-            + filter_query
+            score_query
             + """
-            WITH node, n, """
-            + get_vector_cosine_func_query(
-                'n.name_embedding', 'node.name_embedding', driver.provider
-            )
-            + """ AS score
-            WHERE score > $min_score
             WITH node, collect(n)[..$limit] AS top_vector_nodes, collect(n.uuid) AS vector_node_uuids
             """
             + get_nodes_query(
@@ -1325,12 +1891,13 @@ async def get_relevant_nodes(
             [x IN deduped_nodes | {
                 uuid: x.uuid,
                 name: x.name,
-                name_embedding: x.name_embedding,
                 group_id: x.group_id,
                 created_at: x.created_at,
                 summary: x.summary,
                 labels: labels(x),
-                attributes: properties(x)
+                attributes: """
+            + get_properties_without_embedding_query('x', 'name_embedding', driver.provider)
+            + """
             }] AS matches
             """
         )
@@ -1357,6 +1924,41 @@ async def get_relevant_nodes(
     return relevant_nodes
 
 
+async def _get_relevant_nodes_for_node(
+    driver: GraphDriver,
+    node: EntityNode,
+    search_filter: SearchFilters,
+    group_id: str,
+    min_score: float,
+    limit: int,
+) -> list[EntityNode]:
+    vector_nodes: list[EntityNode] = []
+    if node.name_embedding is not None:
+        vector_nodes = await node_similarity_search(
+            driver, node.name_embedding, search_filter, [group_id], limit, min_score
+        )
+    fulltext_nodes = await node_fulltext_search(driver, node.name, search_filter, [group_id], limit)
+
+    vector_uuids = {vector_node.uuid for vector_node in vector_nodes}
+    return vector_nodes + [
+        fulltext_node for fulltext_node in fulltext_nodes if fulltext_node.uuid not in vector_uuids
+    ]
+
+
+def _get_query_edges(edges: list[EntityEdge]) -> list[dict[str, Any]]:
+    # Only what the relevance queries read, rather than whole serialized edges
+    return [
+        {
+            'uuid': edge.uuid,
+            'source_node_uuid': edge.source_node_uuid,
+            'target_node_uuid': edge.target_node_uuid,
+            'group_id': edge.group_id,
+            'fact_embedding': edge.fact_embedding,
+        }
+        for edge in edges
+    ]
+
+
 async def get_relevant_edges(
     driver: GraphDriver,
     edges: list[EntityEdge],
@@ -1367,6 +1969,7 @@ async def get_relevant_edges(
     if len(edges) == 0:
         return []
 
+    query_edges = _get_query_edges(edges)
     filter_queries, filter_params = edge_search_filter_query_constructor(
         search_filter, driver.provider
     )
@@ -1390,7 +1993,7 @@ async def get_relevant_edges(
         )
         resp, _, _ = await driver.execute_query(
             query,
-            edges=[edge.model_dump() for edge in edges],
+            edges=query_edges,
             limit=limit,
             min_score=min_score,
             routing_='r',
@@ -1398,13 +2001,7 @@ async def get_relevant_edges(
         )
 
         # Calculate Cosine similarity then return the edge ids
-        input_ids = []
-        for r in resp:
-            score = calculate_cosine_similarity(
-                list(map(float, r['source_embedding'].split(','))), r['target_embedding']
-            )
-            if score > min_score:
-                input_ids.append({'id': r['id'], 'score': score, 'uuid': r['search_edge_uuid']})
+        input_ids = _score_embedding_pair_records(resp, min_score)
 
         # Match the edge ides and return the values
         query = """
@@ -1422,7 +2019,6 @@ async def get_relevant_edges(
                 name: e.name,
                 group_id: e.group_id,
                 fact: e.fact,
-                fact_embedding: [x IN split(e.fact_embedding, ",") | toFloat(x)],
                 episodes: split(e.episodes, ","),
                 expired_at: e.expired_at,
                 valid_at: e.valid_at,
@@ -1434,7 +2030,6 @@ async def get_relevant_edges(
         results, _, _ = await driver.execute_query(
             query,
             ids=input_ids,
-            edges=[edge.model_dump() for edge in edges],
             limit=limit,
             min_score=min_score,
             routing_='r',
@@ -1476,7 +2071,6 @@ async def get_relevant_edges(
                         name: e.name,
                         group_id: e.group_id,
                         fact: e.fact,
-                        fact_embedding: e.fact_embedding,
                         episodes: e.episodes,
                         expired_at: e.expired_at,
                         valid_at: e.valid_at,
@@ -1511,19 +2105,20 @@ async def get_relevant_edges(
                         name: e.name,
                         group_id: e.group_id,
                         fact: e.fact,
-                        fact_embedding: e.fact_embedding,
                         episodes: e.episodes,
                         expired_at: e.expired_at,
                         valid_at: e.valid_at,
                         invalid_at: e.invalid_at,
-                        attributes: properties(e)
+                        attributes: """
+                + get_properties_without_embedding_query('e', 'fact_embedding', driver.provider)
+                + """
                     })[..$limit] AS matches
                 """
             )
 
         results, _, _ = await driver.execute_query(
             query,
-            edges=[edge.model_dump() for edge in edges],
+            edges=query_edges,
             limit=limit,
             min_score=min_score,
             routing_='r',
@@ -1552,6 +2147,7 @@ async def get_edge_invalidation_candidates(
     if len(edges) == 0:
         return []
 
+    query_edges = _get_query_edges(edges)
     filter_queries, filter_params = edge_search_filter_query_constructor(
         search_filter, driver.provider
     )
@@ -1577,7 +2173,7 @@ async def get_edge_invalidation_candidates(
         )
         resp, _, _ = await driver.execute_query(
             query,
-            edges=[edge.model_dump() for edge in edges],
+            edges=query_edges,
             limit=limit,
             min_score=min_score,
             routing_='r',
@@ -1585,13 +2181,7 @@ async def get_edge_invalidation_candidates(
         )
 
         # Calculate Cosine similarity then return the edge ids
-        input_ids = []
-        for r in resp:
-            score = calculate_cosine_similarity(
-                list(map(float, r['source_embedding'].split(','))), r['target_embedding']
-            )
-            if score > min_score:
-                input_ids.append({'id': r['id'], 'score': score, 'uuid': r['search_edge_uuid']})
+        input_ids = _score_embedding_pair_records(resp, min_score)
 
         # Match the edge ides and return the values
         query = """
@@ -1609,7 +2199,6 @@ async def get_edge_invalidation_candidates(
                 name: e.name,
                 group_id: e.group_id,
                 fact: e.fact,
-                fact_embedding: [x IN split(e.fact_embedding, ",") | toFloat(x)],
                 episodes: split(e.episodes, ","),
                 expired_at: e.expired_at,
                 valid_at: e.valid_at,
@@ -1620,7 +2209,6 @@ async def get_edge_invalidation_candidates(
         results, _, _ = await driver.execute_query(
             query,
             ids=input_ids,
-            edges=[edge.model_dump() for edge in edges],
             limit=limit,
             min_score=min_score,
             routing_='r',
@@ -1663,7 +2251,6 @@ async def get_edge_invalidation_candidates(
                         name: e.name,
                         group_id: e.group_id,
                         fact: e.fact,
-                        fact_embedding: e.fact_embedding,
                         episodes: e.episodes,
                         expired_at: e.expired_at,
                         valid_at: e.valid_at,
@@ -1675,12 +2262,13 @@ async def get_edge_invalidation_candidates(
         else:
             query = (
                 """
-                                                                                                                                        UNWIND $edges AS edge
-                                                                                                                                        MATCH (n:Entity)-[e:RELATES_TO {group_id: edge.group_id}]->(m:Entity)
-                                                                                                                                        WHERE n.uuid IN [edge.source_node_uuid, edge.target_node_uuid] OR m.uuid IN [edge.target_node_uuid, edge.source_node_uuid]
-                                                                                                                                        """
+                UNWIND $edges AS edge
+                MATCH (n:Entity)-[e:RELATES_TO {group_id: edge.group_id}]-(m:Entity)
+                WHERE n.uuid IN [edge.source_node_uuid, edge.target_node_uuid]
+                """
                 + filter_query
                 + """
+                WITH DISTINCT edge, e
                 WITH edge, e, """
                 + get_vector_cosine_func_query(
                     'e.fact_embedding', 'edge.fact_embedding', driver.provider
@@ -1699,19 +2287,20 @@ async def get_edge_invalidation_candidates(
                         name: e.name,
                         group_id: e.group_id,
                         fact: e.fact,
-                        fact_embedding: e.fact_embedding,
                         episodes: e.episodes,
                         expired_at: e.expired_at,
                         valid_at: e.valid_at,
                         invalid_at: e.invalid_at,
-                        attributes: properties(e)
+                        attributes: """
+                + get_properties_without_embedding_query('e', 'fact_embedding', driver.provider)
+                + """
                     })[..$limit] AS matches
                 """
             )
 
         results, _, _ = await driver.execute_query(
             query,
-            edges=[edge.model_dump() for edge in edges],
+            edges=query_edges,
             limit=limit,
             min_score=min_score,
             routing_='r',
@@ -1733,19 +2322,7 @@ async def get_edge_invalidation_candidates(
 def rrf(
     results: list[list[str]], rank_const=1, min_score: float = 0
 ) -> tuple[list[str], list[float]]:
-    scores: dict[str, float] = defaultdict(float)
-    for result in results:
-        for i, uuid in enumerate(result):
-            scores[uuid] += 1 / (i + rank_const)
-
-    scored_uuids = [term for term in scores.items()]
-    scored_uuids.sort(reverse=True, key=lambda term: term[1])
-
-    sorted_uuids = [term[0] for term in scored_uuids]
-
-    return [uuid for uuid in sorted_uuids if scores[uuid] >= min_score], [
-        scores[uuid] for uuid in sorted_uuids if scores[uuid] >= min_score
-    ]
+    return kernels.rrf(results, rank_const, min_score)
 
 
 async def node_distance_reranker(
@@ -1753,37 +2330,24 @@ async def node_distance_reranker(
     node_uuids: list[str],
     center_node_uuid: str,
     min_score: float = 0,
+    max_depth: int = 1,
 ) -> tuple[list[str], list[float]]:
     # filter out node_uuid center node node uuid
     filtered_uuids = list(filter(lambda node_uuid: node_uuid != center_node_uuid, node_uuids))
     scores: dict[str, float] = {center_node_uuid: 0.0}
 
-    query = """
-    UNWIND $node_uuids AS node_uuid
-    MATCH (center:Entity {uuid: $center_uuid})-[:RELATES_TO]-(n:Entity {uuid: node_uuid})
-    RETURN 1 AS score, node_uuid AS uuid
-    """
-    if driver.provider == GraphProvider.KUZU:
-        query = """
-        UNWIND $node_uuids AS node_uuid
-        MATCH (center:Entity {uuid: $center_uuid})-[:RELATES_TO]->(e:RelatesToNode_)-[:RELATES_TO]->(n:Entity {uuid: node_uuid})
-        RETURN 1 AS score, node_uuid AS uuid
-        """
-
-    # Find the shortest path to center node
-    results, header, _ = await driver.execute_query(
-        query,
-        node_uuids=filtered_uuids,
-        center_uuid=center_node_uuid,
-        routing_='r',
-    )
-    if driver.provider == GraphProvider.FALKORDB:
-        results = [dict(zip(header, row, strict=True)) for row in results]
-
-    for result in results:
-        uuid = result['uuid']
-        score = result['score']
-        scores[uuid] = score
+    distances = None
+    if driver.adjacency_cache:
+        distances = await driver.adjacency_cache.distances(driver, center_node_uuid, max_depth)
+
+    if distances is not None:
+        for uuid in filtered_uuids:
+            if uuid in distances:
+                scores[uuid] = distances[uuid]
+    elif filtered_uuids and max_depth > 0:
+        await _set_center_node_distances(
+            driver, filtered_uuids, center_node_uuid, max_depth, scores
+        )
 
     for uuid in filtered_uuids:
         if uuid not in scores:
@@ -1802,6 +2366,62 @@ async def node_distance_reranker(
     ]
 
 
+async def _set_center_node_distances(
+    driver: GraphDriver,
+    node_uuids: list[str],
+    center_node_uuid: str,
+    max_depth: int,
+    scores: dict[str, float],
+):
+    # Shortest number of hops from the center node in either direction, up to max_depth
+    if driver.provider == GraphProvider.NEO4J:
+        results, _, _ = await driver.execute_query(
+            f"""
+            MATCH (center:Entity {{uuid: $center_uuid}})
+            UNWIND $node_uuids AS node_uuid
+            MATCH (n:Entity {{uuid: node_uuid}})
+            MATCH path = shortestPath((center)-[:RELATES_TO*1..{max_depth}]-(n))
+            RETURN length(path) AS score, node_uuid AS uuid
+            """,
+            node_uuids=node_uuids,
+            center_uuid=center_node_uuid,
+            routing_='r',
+        )
+        for result in results:
+            scores[result['uuid']] = result['score']
+        return
+
+    # Other providers have no bounded shortest path match, and a variable-length path match
+    # lists every path up to max_depth, so expand a breadth-first frontier one hop per query
+    if driver.provider == GraphProvider.KUZU:
+        # Kuzu stores entity edges with an intermediate node
+        neighbors_query = """
+            UNWIND $uuids AS uuid
+            MATCH (:Entity {uuid: uuid})-[:RELATES_TO]-(:RelatesToNode_)-[:RELATES_TO]-(m:Entity)
+            RETURN DISTINCT m.uuid AS uuid
+        """
+    else:
+        neighbors_query = """
+            UNWIND $uuids AS uuid
+            MATCH (:Entity {uuid: uuid})-[:RELATES_TO]-(m:Entity)
+            RETURN DISTINCT m.uuid AS uuid
+        """
+
+    remaining = set(node_uuids)
+    seen = {center_node_uuid}
+    frontier = [center_node_uuid]
+    for depth in range(1, max_depth + 1):
+        if not frontier or not remaining:
+            break
+
+        results, _, _ = await driver.execute_query(neighbors_query, uuids=frontier, routing_='r')
+        frontier = [result['uuid'] for result in results if result['uuid'] not in seen]
+        seen.update(frontier)
+        for uuid in remaining.intersection(frontier):
+            scores[uuid] = depth
+        remaining.difference_update(frontier)
+
+
 async def episode_mentions_reranker(
     driver: GraphDriver, node_uuids: list[list[str]], min_score: float = 0
 ) -> tuple[list[str], list[float]]:
@@ -1809,19 +2429,38 @@ async def episode_mentions_reranker(
     sorted_uuids, _ = rrf(node_uuids)
     scores: dict[str, float] = {}
 
-    # Find the shortest path to center node
-    results, _, _ = await driver.execute_query(
-        """
-        UNWIND $node_uuids AS node_uuid
-        MATCH (episode:Episodic)-[r:MENTIONS]->(n:Entity {uuid: node_uuid})
-        RETURN count(*) AS score, n.uuid AS uuid
-        """,
-        node_uuids=sorted_uuids,
-        routing_='r',
-    )
+    # Writers store mention counts on entities; only entities without one are counted here
+    uncounted_uuids = sorted_uuids
+    if driver.provider != GraphProvider.KUZU:
+        results, _, _ = await driver.execute_query(
+            """
+            UNWIND $node_uuids AS node_uuid
+            MATCH (n:Entity {uuid: node_uuid})
+            RETURN n.mention_count AS score, n.uuid AS uuid
+            """,
+            node_uuids=sorted_uuids,
+            routing_='r',
+        )
+        uncounted_uuids = []
+        for result in results:
+            if result['score'] is None:
+                uncounted_uuids.append(result['uuid'])
+            elif result['score'] > 0:
+                scores[result['uuid']] = result['score']
+
+    if uncounted_uuids:
+        results, _, _ = await driver.execute_query(
+            """
+            UNWIND $node_uuids AS node_uuid
+            MATCH (episode:Episodic)-[r:MENTIONS]->(n:Entity {uuid: node_uuid})
+            RETURN count(*) AS score, n.uuid AS uuid
+            """,
+            node_uuids=uncounted_uuids,
+            routing_='r',
+        )
 
-    for result in results:
-        scores[result['uuid']] = result['score']
+        for result in results:
+            scores[result['uuid']] = result['score']
 
     for uuid in sorted_uuids:
         if uuid not in scores:
@@ -1840,40 +2479,21 @@ def maximal_marginal_relevance(
     candidates: dict[str, list[float]],
     mmr_lambda: float = DEFAULT_MMR_LAMBDA,
     min_score: float = -2.0,
+    limit: int | None = None,
 ) -> tuple[list[str], list[float]]:
     start = time()
-    query_array = np.array(query_vector)
-    candidate_arrays: dict[str, NDArray] = {}
-    for uuid, embedding in candidates.items():
-        candidate_arrays[uuid] = normalize_l2(embedding)
-
-    uuids: list[str] = list(candidate_arrays.keys())
-
-    similarity_matrix = np.zeros((len(uuids), len(uuids)))
-
-    for i, uuid_1 in enumerate(uuids):
-        for j, uuid_2 in enumerate(uuids[:i]):
-            u = candidate_arrays[uuid_1]
-            v = candidate_arrays[uuid_2]
-            similarity = np.dot(u, v)
-
-            similarity_matrix[i, j] = similarity
-            similarity_matrix[j, i] = similarity
+    uuids: list[str] = list(candidates.keys())
+    if not uuids:
+        return [], []
 
-    mmr_scores: dict[str, float] = {}
-    for i, uuid in enumerate(uuids):
-        max_sim = np.max(similarity_matrix[i, :])
-        mmr = mmr_lambda * np.dot(query_array, candidate_arrays[uuid]) + (mmr_lambda - 1) * max_sim
-        mmr_scores[uuid] = mmr
-
-    uuids.sort(reverse=True, key=lambda c: mmr_scores[c])
+    selected, scores = kernels.greedy_mmr(
+        query_vector, list(candidates.values()), mmr_lambda, limit, min_score
+    )
 
     end = time()
     logger.debug(f'Completed MMR reranking in {(end - start) * 1000} ms')
 
-    return [uuid for uuid in uuids if mmr_scores[uuid] >= min_score], [
-        mmr_scores[uuid] for uuid in uuids if mmr_scores[uuid] >= min_score
-    ]
+    return [uuids[i] for i in selected], scores.tolist()
 
 
 async def get_embeddings_for_nodes(
@@ -1993,3 +2613,60 @@ async def get_embeddings_for_edges(
             embeddings_dict[uuid] = embedding
 
     return embeddings_dict
+
+
+async def get_candidate_embeddings_for_nodes(
+    driver: GraphDriver, nodes: list[EntityNode]
+) -> dict[str, list[float]]:
+    # Uses the embeddings candidates were retrieved with and loads the missing ones
+    embeddings_dict = {
+        node.uuid: node.name_embedding for node in nodes if node.name_embedding is not None
+    }
+    missing = [node for node in nodes if node.name_embedding is None]
+    if missing:
+        embeddings_dict.update(await get_embeddings_for_nodes(driver, missing))
+
+    return embeddings_dict
+
+
+async def get_candidate_embeddings_for_edges(
+    driver: GraphDriver, edges: list[EntityEdge]
+) -> dict[str, list[float]]:
+    embeddings_dict = {
+        edge.uuid: edge.fact_embedding for edge in edges if edge.fact_embedding is not None
+    }
+    missing = [edge for edge in edges if edge.fact_embedding is None]
+    if missing:
+        embeddings_dict.update(await get_embeddings_for_edges(driver, missing))
+
+    return embeddings_dict
+
+
+async def hydrate_nodes(driver: GraphDriver, nodes: list[EntityNode]) -> list[EntityNode]:
+    """
+    Load search candidates in full, in their ranked order. A candidate deleted since it was
+    retrieved is returned as retrieved.
+    """
+    if not nodes:
+        return []
+
+    hydrated = {
+        node.uuid: node
+        for node in await EntityNode.get_by_uuids(driver, [node.uuid for node in nodes])
+    }
+    return [hydrated.get(node.uuid, node) for node in nodes]
+
+
+async def hydrate_edges(driver: GraphDriver, edges: list[EntityEdge]) -> list[EntityEdge]:
+    """
+    Load search candidates in full, in their ranked order. A candidate deleted since it was
+    retrieved is returned as retrieved.
+    """
+    if not edges:
+        return []
+
+    hydrated = {
+        edge.uuid: edge
+        for edge in await EntityEdge.get_by_uuids(driver, [edge.uuid for edge in edges])
+    }
+    return [hydrated.get(edge.uuid, edge) for edge in edges]
@@ -0,0 +1,398 @@
+"""
+Copyright 2024, Zep Software, Inc.
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+import json
+import logging
+import os
+from collections.abc import Sequence
+from enum import Enum
+from pathlib import Path
+
+import numpy as np
+from numpy.typing import NDArray
+
+from graphiti_core.search.kernels import (
+    hamming_similarities,
+    int8_similarities,
+    normalize_rows,
+    pack_signs,
+    quantize_int8,
+)
+
+logger = logging.getLogger(__name__)
+
+# Below this many live vectors the index is searched exhaustively
+IVF_TRAIN_THRESHOLD = int(os.getenv('IVF_TRAIN_THRESHOLD', 2048))
+DEFAULT_NPROBE = int(os.getenv('IVF_NPROBE', 8))
+KMEANS_ITERATIONS = 10
+KMEANS_SAMPLE_PER_LIST = 64
+MAX_LISTS = 4096
+INITIAL_CAPACITY = 1024
+
+VECTORS_FILE = 'vectors.f32'
+ALIVE_FILE = 'alive.u8'
+ASSIGNMENTS_FILE = 'assignments.i32'
+CODES_FILE = 'codes.bin'
+SCALES_FILE = 'scales.f32'
+UUIDS_FILE = 'uuids.txt'
+CENTROIDS_FILE = 'centroids.npy'
+META_FILE = 'meta.json'
+
+
+class Quantization(Enum):
+    none = 'none'
+    float16 = 'float16'
+    int8 = 'int8'
+    binary = 'binary'
+
+
+DEFAULT_QUANTIZATION = Quantization(os.getenv('VECTOR_INDEX_QUANTIZATION', 'none'))
+# Quantized indexes rescore this many candidates per result with full-precision vectors,
+# sign bits rank much more coarsely than float16 or int8 codes
+RESCORE_FACTORS = {
+    Quantization.none: 1,
+    Quantization.float16: 2,
+    Quantization.int8: 4,
+    Quantization.binary: 10,
+}
+
+
+class IVFFlatIndex:
+    """
+    Inverted-file index over cosine similarity, built with NumPy.
+
+    Vectors are normalized and appended as rows. Updates overwrite their row in place and
+    deletes tombstone it.
+    Once the index holds IVF_TRAIN_THRESHOLD live vectors it clusters them with spherical
+    k-means into about sqrt(n) lists, and a search only scores the rows of the `nprobe` lists
+    whose centroids are closest to the query. The index retrains whenever it doubles in size.
+
+    With `quantization` set, every vector also gets a float16, int8 or binary (one sign bit per
+    dimension) code. Searches scan the codes, which are 2x, 4x or 32x smaller than the vectors,
+    and only the best `limit * rescore_factor` candidates are rescored exactly. The rescore
+    factor defaults to RESCORE_FACTORS for the quantization.
+
+    When `path` is set, vectors, codes, tombstones and list assignments live in memory-mapped
+    files in that directory, and the index can be reopened with IVFFlatIndex.open. Quantized
+    searches then only page in the full-precision rows of the candidates they rescore.
+    """
+
+    def __init__(
+        self,
+        dim: int,
+        path: str | Path | None = None,
+        nprobe: int = DEFAULT_NPROBE,
+        quantization: Quantization = DEFAULT_QUANTIZATION,
+        rescore_factor: int | None = None,
+    ):
+        self.dim = dim
+        self.path = Path(path) if path is not None else None
+        self.nprobe = nprobe
+        self.quantization = quantization
+        self.rescore_factor = rescore_factor or RESCORE_FACTORS[quantization]
+
+        self.count = 0
+        self.capacity = 0
+        self.uuids: list[str] = []
+        self.rows: dict[str, int] = {}
+        self.centroids: NDArray[np.float32] | None = None
+        self.lists: list[list[int]] = []
+        self.trained_count = 0
+
+        self.vectors: NDArray[np.float32] = np.zeros((0, dim), dtype=np.float32)
+        self.alive: NDArray[np.uint8] = np.zeros(0, dtype=np.uint8)
+        self.assignments: NDArray[np.int32] = np.zeros(0, dtype=np.int32)
+        self.codes: NDArray = np.zeros(0)
+        self.scales: NDArray[np.float32] = np.zeros(0, dtype=np.float32)
+        for _, attribute, dtype, shape in self._layout():
+            setattr(self, attribute, np.zeros((0, *shape), dtype=dtype))
+
+        if self.path is not None:
+            self.path.mkdir(parents=True, exist_ok=True)
+            (self.path / UUIDS_FILE).write_text('')
+            (self.path / CENTROIDS_FILE).unlink(missing_ok=True)
+        self._grow(INITIAL_CAPACITY)
+
+    def __len__(self) -> int:
+        return len(self.rows)
+
+    def __contains__(self, uuid: str) -> bool:
+        return uuid in self.rows
+
+    @classmethod
+    def open(
+        cls,
+        path: str | Path,
+        nprobe: int = DEFAULT_NPROBE,
+        rescore_factor: int | None = None,
+    ) -> 'IVFFlatIndex':
+        path = Path(path)
+        meta = json.loads((path / META_FILE).read_text())
+
+        index = cls.__new__(cls)
+        index.dim = meta['dim']
+        index.path = path
+        index.nprobe = nprobe
+        index.quantization = Quantization(meta.get('quantization', Quantization.none.value))
+        index.rescore_factor = rescore_factor or RESCORE_FACTORS[index.quantization]
+        index.count = meta['count']
+        index.capacity = meta['capacity']
+        index.trained_count = meta['trained_count']
+
+        for name, attribute, dtype, shape in index._layout():
+            setattr(index, attribute, index._map(name, dtype, (index.capacity, *shape)))
+
+        with open(path / UUIDS_FILE) as f:
+            index.uuids = [
+                line.rstrip('\n') for _, line in zip(range(index.count), f, strict=False)
+            ]
+        index.rows = {uuid: row for row, uuid in enumerate(index.uuids) if index.alive[row]}
+
+        centroids_path = path / CENTROIDS_FILE
+        index.centroids = np.load(centroids_path) if centroids_path.exists() else None
+        index.lists = []
+        if index.centroids is not None:
+            index.lists = [[] for _ in range(len(index.centroids))]
+            for row in index.rows.values():
+                index.lists[index.assignments[row]].append(row)
+
+        return index
+
+    def upsert(self, uuids: Sequence[str], vectors: Sequence[Sequence[float]] | NDArray):
+        if len(uuids) == 0:
+            return
+
+        matrix = normalize_rows(vectors)
+        if matrix.shape[1] != self.dim:
+            raise ValueError(f'Expected vectors of dimension {self.dim}, got {matrix.shape[1]}')
+
+        # The last vector wins when a uuid is repeated
+        positions = {uuid: i for i, uuid in enumerate(uuids)}
+
+        # Existing uuids are updated in place so repeated saves do not leave tombstones
+        updated = [(self.rows[uuid], i) for uuid, i in positions.items() if uuid in self.rows]
+        if updated:
+            rows = np.array([row for row, _ in updated], dtype=np.intp)
+            self.vectors[rows] = matrix[[i for _, i in updated]]
+            self._encode(rows)
+            if self.centroids is not None:
+                for row in rows.tolist():
+                    self.lists[self.assignments[row]].remove(row)
+                self._assign(rows)
+
+        new_uuids = [uuid for uuid in positions if uuid not in self.rows]
+        if not new_uuids:
+            return
+
+        if self.count + len(new_uuids) > self.capacity:
+            self._grow(max(self.capacity * 2, self.count + len(new_uuids)))
+
+        start = self.count
+        end = start + len(new_uuids)
+        self.vectors[start:end] = matrix[[positions[uuid] for uuid in new_uuids]]
+        self._encode(np.arange(start, end))
+        self.alive[start:end] = 1
+        self.uuids.extend(new_uuids)
+        for offset, uuid in enumerate(new_uuids):
+            self.rows[uuid] = start + offset
+        self.count = end
+
+        if self.path is not None:
+            with open(self.path / UUIDS_FILE, 'a') as f:
+                f.writelines(f'{uuid}\n' for uuid in new_uuids)
+
+        if self._should_train():
+            self.train()
+        elif self.centroids is not None:
+            self._assign(np.arange(start, end))
+
+    def remove(self, uuids: Sequence[str]):
+        for uuid in uuids:
+            row = self.rows.pop(uuid, None)
+            if row is None:
+                continue
+            self.alive[row] = 0
+            if self.centroids is not None:
+                self.lists[self.assignments[row]].remove(row)
+
+    def search(
+        self, query_vector: Sequence[float], limit: int, min_score: float = -1.0
+    ) -> list[tuple[str, float]]:
+        """Return up to `limit` (uuid, cosine similarity) pairs, most similar first."""
+        if not self.rows or limit <= 0:
+            return []
+
+        query = normalize_rows(query_vector)[0]
+        if self.centroids is None:
+            rows = np.flatnonzero(self.alive[: self.count])
+        else:
+            nprobe = min(self.nprobe, len(self.centroids))
+            probes = np.argpartition(-(self.centroids @ query), nprobe - 1)[:nprobe]
+            rows = np.fromiter(
+                (row for probe in probes for row in self.lists[probe]), dtype=np.intp
+            )
+
+        return self._top_k(rows, query, limit, min_score)
+
+    def score(
+        self, query_vector: Sequence[float], uuids: Sequence[str], min_score: float = -1.0
+    ) -> list[tuple[str, float]]:
+        """Exactly score the given uuids against the query, most similar first."""
+        rows = np.array([self.rows[uuid] for uuid in uuids if uuid in self.rows], dtype=np.intp)
+        return self._top_k(rows, normalize_rows(query_vector)[0], len(rows), min_score)
+
+    def train(self):
+        live_rows = np.array(sorted(self.rows.values()), dtype=np.intp)
+        nlist = int(min(MAX_LISTS, max(1, np.sqrt(len(live_rows)))))
+
+        rng = np.random.default_rng(0)
+        sample_size = min(len(live_rows), nlist * KMEANS_SAMPLE_PER_LIST)
+        sample = self.vectors[rng.choice(live_rows, sample_size, replace=False)]
+        centroids = sample[rng.choice(sample_size, nlist, replace=False)].copy()
+
+        for _ in range(KMEANS_ITERATIONS):
+            labels = np.argmax(sample @ centroids.T, axis=1)
+            sums = np.zeros_like(centroids)
+            np.add.at(sums, labels, sample)
+            empty = np.bincount(labels, minlength=nlist) == 0
+            # Re-seed empty lists with random samples
+            sums[empty] = sample[rng.choice(sample_size, int(empty.sum()))]
+            centroids = normalize_rows(sums)
+
+        self.centroids = centroids
+        self.lists = [[] for _ in range(nlist)]
+        self.trained_count = len(live_rows)
+        self._assign(live_rows)
+        logger.debug(f'Trained IVF index with {nlist} lists over {len(live_rows)} vectors')
+
+    def flush(self):
+        if self.path is None:
+            return
+
+        for _, attribute, _, _ in self._layout():
+            array = getattr(self, attribute)
+            if isinstance(array, np.memmap):
+                array.flush()
+        if self.centroids is not None:
+            np.save(self.path / CENTROIDS_FILE, self.centroids)
+
+        meta = {
+            'dim': self.dim,
+            'count': self.count,
+            'capacity': self.capacity,
+            'trained_count': self.trained_count,
+            'quantization': self.quantization.value,
+        }
+        (self.path / META_FILE).write_text(json.dumps(meta))
+
+    def _layout(self) -> list[tuple[str, str, type, tuple[int, ...]]]:
+        """File name, attribute, dtype and row shape of each per-row array."""
+        layout: list[tuple[str, str, type, tuple[int, ...]]] = [
+            (VECTORS_FILE, 'vectors', np.float32, (self.dim,)),
+            (ALIVE_FILE, 'alive', np.uint8, ()),
+            (ASSIGNMENTS_FILE, 'assignments', np.int32, ()),
+        ]
+        if self.quantization == Quantization.float16:
+            layout.append((CODES_FILE, 'codes', np.float16, (self.dim,)))
+        elif self.quantization == Quantization.int8:
+            layout.append((CODES_FILE, 'codes', np.int8, (self.dim,)))
+            layout.append((SCALES_FILE, 'scales', np.float32, ()))
+        elif self.quantization == Quantization.binary:
+            layout.append((CODES_FILE, 'codes', np.uint8, ((self.dim + 7) // 8,)))
+        return layout
+
+    def _encode(self, rows: NDArray[np.intp]):
+        if self.quantization == Quantization.float16:
+            self.codes[rows] = self.vectors[rows].astype(np.float16)
+        elif self.quantization == Quantization.int8:
+            self.codes[rows], self.scales[rows] = quantize_int8(self.vectors[rows])
+        elif self.quantization == Quantization.binary:
+            self.codes[rows] = pack_signs(self.vectors[rows])
+
+    def _approximate_scores(
+        self, rows: NDArray[np.intp], query: NDArray[np.float32]
+    ) -> NDArray[np.float32]:
+        if self.quantization == Quantization.float16:
+            return self.codes[rows].astype(np.float32) @ query
+        if self.quantization == Quantization.int8:
+            return int8_similarities(query, self.codes[rows], self.scales[rows])
+        return hamming_similarities(query, self.codes[rows])
+
+    def _should_train(self) -> bool:
+        if len(self.rows) < IVF_TRAIN_THRESHOLD:
+            return False
+        return self.centroids is None or len(self.rows) >= 2 * self.trained_count
+
+    def _assign(self, rows: NDArray[np.intp]):
+        if self.centroids is None or len(rows) == 0:
+            return
+
+        rows = rows[self.alive[rows] == 1]
+        labels = np.argmax(self.vectors[rows] @ self.centroids.T, axis=1).astype(np.int32)
+        self.assignments[rows] = labels
+        for row, label in zip(rows.tolist(), labels.tolist(), strict=True):
+            self.lists[label].append(row)
+
+    def _top_k(
+        self, rows: NDArray[np.intp], query: NDArray[np.float32], limit: int, min_score: float
+    ) -> list[tuple[str, float]]:
+        if len(rows) == 0:
+            return []
+
+        shortlist = limit * self.rescore_factor
+        if self.quantization != Quantization.none and shortlist < len(rows):
+            approximate = self._approximate_scores(rows, query)
+            rows = rows[np.argpartition(-approximate, shortlist - 1)[:shortlist]]
+
+        scores = self.vectors[rows] @ query
+        if limit < len(rows):
+            top = np.argpartition(-scores, limit - 1)[:limit]
+            rows, scores = rows[top], scores[top]
+        order = np.argsort(-scores, kind='stable')
+
+        return [
+            (self.uuids[row], score)
+            for row, score in zip(rows[order].tolist(), scores[order].tolist(), strict=True)
+            if score >= min_score
+        ]
+
+    def _grow(self, capacity: int):
+        for name, attribute, _, shape in self._layout():
+            array = getattr(self, attribute)
+            if self.path is None:
+                setattr(self, attribute, _resized(array, (capacity, *shape)))
+            else:
+                setattr(self, attribute, self._remap(name, array, (capacity, *shape)))
+        self.capacity = capacity
+
+    def _map(self, name: str, dtype: type, shape: tuple[int, ...]) -> np.memmap:
+        assert self.path is not None
+        return np.memmap(self.path / name, dtype=dtype, mode='r+', shape=shape)
+
+    def _remap(self, name: str, array: NDArray, shape: tuple[int, ...]) -> np.memmap:
+        assert self.path is not None
+        if isinstance(array, np.memmap):
+            array.flush()
+        # Growing the file keeps existing rows, new bytes are zero-filled
+        with open(self.path / name, 'ab') as f:
+            f.truncate(int(np.prod(shape)) * array.dtype.itemsize)
+        return np.memmap(self.path / name, dtype=array.dtype, mode='r+', shape=shape)
+
+
+def _resized(array: NDArray, shape: tuple[int, ...]) -> NDArray:
+    resized = np.zeros(shape, dtype=array.dtype)
+    resized[: len(array)] = array
+    return resized
@@ -31,12 +31,13 @@ from graphiti_core.driver.driver import (
 from graphiti_core.edges import Edge, EntityEdge, EpisodicEdge, create_entity_edge_embeddings
 from graphiti_core.embedder import EmbedderClient
 from graphiti_core.graphiti_types import GraphitiClients
-from graphiti_core.helpers import normalize_l2, semaphore_gather
+from graphiti_core.helpers import get_embedding_prefix, normalize_l2, semaphore_gather
 from graphiti_core.models.edges.edge_db_queries import (
     get_entity_edge_save_bulk_query,
     get_episodic_edge_save_bulk_query,
 )
 from graphiti_core.models.nodes.node_db_queries import (
+    ENTITY_NODE_STATISTICS_UPDATE,
     get_entity_node_save_bulk_query,
     get_episode_node_save_bulk_query,
 )
@@ -60,6 +61,7 @@ from graphiti_core.utils.maintenance.node_operations import (
     extract_nodes,
     resolve_extracted_nodes,
 )
+from graphiti_core.utils.scheduling import scheduled_call
 
 logger = logging.getLogger(__name__)
 
@@ -147,6 +149,14 @@ async def add_nodes_and_edges_bulk(
     finally:
         await session.close()
 
+    await driver.index_embeddings(entity_nodes, entity_edges)
+    if driver.search_interface:
+        await driver.search_interface.index_entity_nodes(driver, entity_nodes)
+        await driver.search_interface.index_entity_edges(driver, entity_edges)
+    if driver.adjacency_cache:
+        driver.adjacency_cache.add_nodes(driver, entity_nodes)
+        driver.adjacency_cache.add_edges(driver, entity_edges)
+
 
 async def add_nodes_and_edges_bulk_tx(
     tx: GraphDriverSession,
@@ -183,6 +193,9 @@ async def add_nodes_and_edges_bulk_tx(
             entity_data['attributes'] = json.dumps(attributes)
         else:
             entity_data.update(node.attributes or {})
+            name_embedding_prefix = get_embedding_prefix(driver.provider, node.name_embedding)
+            if name_embedding_prefix is not None:
+                entity_data['name_embedding_prefix'] = name_embedding_prefix
 
         nodes.append(entity_data)
 
@@ -210,6 +223,9 @@ async def add_nodes_and_edges_bulk_tx(
             edge_data['attributes'] = json.dumps(attributes)
         else:
             edge_data.update(edge.attributes or {})
+            fact_embedding_prefix = get_embedding_prefix(driver.provider, edge.fact_embedding)
+            if fact_embedding_prefix is not None:
+                edge_data['fact_embedding_prefix'] = fact_embedding_prefix
 
         edges.append(edge_data)
 
@@ -249,6 +265,15 @@ async def add_nodes_and_edges_bulk_tx(
             get_entity_edge_save_bulk_query(driver.provider),
             entity_edges=edges,
         )
+        await tx.run(
+            ENTITY_NODE_STATISTICS_UPDATE,
+            uuids=list(
+                {node.uuid for node in entity_nodes}
+                | {edge.target_node_uuid for edge in episodic_edges}
+                | {edge.source_node_uuid for edge in entity_edges}
+                | {edge.target_node_uuid for edge in entity_edges}
+            ),
+        )
 
 
 async def extract_nodes_and_edges_bulk(
@@ -408,11 +433,17 @@ async def dedupe_edges_bulk(
     _edge_type_map: dict[tuple[str, str], list[str]],
 ) -> dict[str, list[EntityEdge]]:
     embedder = clients.embedder
+    scheduler = getattr(clients, 'scheduler', None)
     min_score = 0.6
 
     # generate embeddings
     await semaphore_gather(
-        *[create_entity_edge_embeddings(embedder, edges) for edges in extracted_edges]
+        *[
+            scheduled_call(
+                scheduler, episode.group_id, create_entity_edge_embeddings(embedder, edges)
+            )
+            for edges, (episode, _) in zip(extracted_edges, episode_tuples, strict=False)
+        ]
     )
 
     # Find similar results
@@ -457,14 +488,18 @@ async def dedupe_edges_bulk(
         tuple[EntityEdge, EntityEdge, list[EntityEdge]]
     ] = await semaphore_gather(
         *[
-            resolve_extracted_edge(
-                clients.llm_client,
-                edge,
-                candidates,
-                candidates,
-                episode,
-                edge_types,
-                set(edge_types),
+            scheduled_call(
+                scheduler,
+                episode.group_id,
+                resolve_extracted_edge(
+                    clients.llm_client,
+                    edge,
+                    candidates,
+                    candidates,
+                    episode,
+                    edge_types,
+                    set(edge_types),
+                ),
             )
             for episode, edge, candidates in dedupe_tuples
         ]
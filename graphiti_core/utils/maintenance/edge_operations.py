@@ -14,11 +14,14 @@ See the License for the specific language governing permissions and
 limitations under the License.
 """
 
+import asyncio
 import logging
+from collections.abc import AsyncIterator
 from datetime import datetime
 from time import time
+from typing import Any
 
-from pydantic import BaseModel
+from pydantic import BaseModel, ValidationError
 from typing_extensions import LiteralString
 
 from graphiti_core.driver.driver import GraphDriver, GraphProvider
@@ -29,21 +32,24 @@ from graphiti_core.edges import (
     create_entity_edge_embeddings,
 )
 from graphiti_core.graphiti_types import GraphitiClients
-from graphiti_core.helpers import MAX_REFLEXION_ITERATIONS, semaphore_gather
+from graphiti_core.helpers import MAX_REFLEXION_ITERATIONS, SEMAPHORE_LIMIT, semaphore_gather
 from graphiti_core.llm_client import LLMClient
 from graphiti_core.llm_client.config import ModelSize
+from graphiti_core.llm_client.errors import StreamInterruptedError
 from graphiti_core.nodes import CommunityNode, EntityNode, EpisodicNode
 from graphiti_core.prompts import prompt_library
 from graphiti_core.prompts.dedupe_edges import EdgeDuplicate
-from graphiti_core.prompts.extract_edges import ExtractedEdges, MissingFacts
+from graphiti_core.prompts.extract_edges import Edge, ExtractedEdges, MissingFacts
 from graphiti_core.search.search import search
 from graphiti_core.search.search_config import SearchResults
 from graphiti_core.search.search_config_recipes import EDGE_HYBRID_SEARCH_RRF
 from graphiti_core.search.search_filters import SearchFilters
 from graphiti_core.utils.datetime_utils import ensure_utc, utc_now
 from graphiti_core.utils.maintenance.dedup_helpers import _normalize_string_exact
+from graphiti_core.utils.scheduling import scheduled, scheduled_call, scheduled_stream
 
 DEFAULT_EDGE_NAME = 'RELATES_TO'
+EXTRACT_EDGES_MAX_TOKENS = 16384
 
 logger = logging.getLogger(__name__)
 
@@ -86,20 +92,13 @@ def build_community_edges(
     return edges
 
 
-async def extract_edges(
-    clients: GraphitiClients,
+def _build_extract_edges_context(
     episode: EpisodicNode,
     nodes: list[EntityNode],
     previous_episodes: list[EpisodicNode],
     edge_type_map: dict[tuple[str, str], list[str]],
-    group_id: str = '',
-    edge_types: dict[str, type[BaseModel]] | None = None,
-) -> list[EntityEdge]:
-    start = time()
-
-    extract_edges_max_tokens = 16384
-    llm_client = clients.llm_client
-
+    edge_types: dict[str, type[BaseModel]] | None,
+) -> dict[str, Any]:
     edge_type_signature_map: dict[str, tuple[str, str]] = {
         edge_type: signature
         for signature, edge_types in edge_type_map.items()
@@ -120,7 +119,7 @@ async def extract_edges(
     )
 
     # Prepare context for LLM
-    context = {
+    return {
         'episode_content': episode.content,
         'nodes': [
             {'id': idx, 'name': node.name, 'entity_types': node.labels}
@@ -132,39 +131,123 @@ async def extract_edges(
         'custom_prompt': '',
     }
 
-    facts_missed = True
-    reflexion_iterations = 0
-    while facts_missed and reflexion_iterations <= MAX_REFLEXION_ITERATIONS:
-        llm_response = await llm_client.generate_response(
-            prompt_library.extract_edges.edge(context),
-            response_model=ExtractedEdges,
-            max_tokens=extract_edges_max_tokens,
-            group_id=group_id,
-            prompt_name='extract_edges.edge',
+
+def _build_entity_edge(
+    edge_data: Edge,
+    nodes: list[EntityNode],
+    episode: EpisodicNode,
+    group_id: str,
+) -> EntityEdge | None:
+    # Validate Edge Date information
+    valid_at = edge_data.valid_at
+    invalid_at = edge_data.invalid_at
+    valid_at_datetime = None
+    invalid_at_datetime = None
+
+    # Filter out empty edges
+    if not edge_data.fact.strip():
+        return None
+
+    source_node_idx = edge_data.source_entity_id
+    target_node_idx = edge_data.target_entity_id
+
+    if len(nodes) == 0:
+        logger.warning('No entities provided for edge extraction')
+        return None
+
+    if not (0 <= source_node_idx < len(nodes) and 0 <= target_node_idx < len(nodes)):
+        logger.warning(
+            f'Invalid entity IDs in edge extraction for {edge_data.relation_type}. '
+            f'source_entity_id: {source_node_idx}, target_entity_id: {target_node_idx}, '
+            f'but only {len(nodes)} entities available (valid range: 0-{len(nodes) - 1})'
         )
-        edges_data = ExtractedEdges(**llm_response).edges
+        return None
+    source_node_uuid = nodes[source_node_idx].uuid
+    target_node_uuid = nodes[target_node_idx].uuid
+
+    if valid_at:
+        try:
+            valid_at_datetime = ensure_utc(datetime.fromisoformat(valid_at.replace('Z', '+00:00')))
+        except ValueError as e:
+            logger.warning(f'WARNING: Error parsing valid_at date: {e}. Input: {valid_at}')
+
+    if invalid_at:
+        try:
+            invalid_at_datetime = ensure_utc(
+                datetime.fromisoformat(invalid_at.replace('Z', '+00:00'))
+            )
+        except ValueError as e:
+            logger.warning(f'WARNING: Error parsing invalid_at date: {e}. Input: {invalid_at}')
+    edge = EntityEdge(
+        source_node_uuid=source_node_uuid,
+        target_node_uuid=target_node_uuid,
+        name=edge_data.relation_type,
+        group_id=group_id,
+        fact=edge_data.fact,
+        episodes=[episode.uuid],
+        created_at=utc_now(),
+        valid_at=valid_at_datetime,
+        invalid_at=invalid_at_datetime,
+    )
+    logger.debug(
+        f'Created new edge: {edge.name} from (UUID: {edge.source_node_uuid}) to (UUID: {edge.target_node_uuid})'
+    )
+
+    return edge
 
-        context['extracted_facts'] = [edge_data.fact for edge_data in edges_data]
 
-        reflexion_iterations += 1
-        if reflexion_iterations < MAX_REFLEXION_ITERATIONS:
-            reflexion_response = await llm_client.generate_response(
-                prompt_library.extract_edges.reflexion(context),
-                response_model=MissingFacts,
-                max_tokens=extract_edges_max_tokens,
+async def extract_edges(
+    clients: GraphitiClients,
+    episode: EpisodicNode,
+    nodes: list[EntityNode],
+    previous_episodes: list[EpisodicNode],
+    edge_type_map: dict[tuple[str, str], list[str]],
+    group_id: str = '',
+    edge_types: dict[str, type[BaseModel]] | None = None,
+) -> list[EntityEdge]:
+    start = time()
+
+    llm_client = clients.llm_client
+    scheduler = getattr(clients, 'scheduler', None)
+
+    context = _build_extract_edges_context(
+        episode, nodes, previous_episodes, edge_type_map, edge_types
+    )
+
+    async with scheduled(scheduler, group_id):
+        facts_missed = True
+        reflexion_iterations = 0
+        while facts_missed and reflexion_iterations <= MAX_REFLEXION_ITERATIONS:
+            llm_response = await llm_client.generate_response(
+                prompt_library.extract_edges.edge(context),
+                response_model=ExtractedEdges,
+                max_tokens=EXTRACT_EDGES_MAX_TOKENS,
                 group_id=group_id,
-                prompt_name='extract_edges.reflexion',
+                prompt_name='extract_edges.edge',
             )
+            edges_data = ExtractedEdges(**llm_response).edges
+
+            context['extracted_facts'] = [edge_data.fact for edge_data in edges_data]
+
+            reflexion_iterations += 1
+            if reflexion_iterations < MAX_REFLEXION_ITERATIONS:
+                reflexion_response = await llm_client.generate_response(
+                    prompt_library.extract_edges.reflexion(context),
+                    response_model=MissingFacts,
+                    max_tokens=EXTRACT_EDGES_MAX_TOKENS,
+                    group_id=group_id,
+                    prompt_name='extract_edges.reflexion',
+                )
 
-            missing_facts = reflexion_response.get('missing_facts', [])
+                missing_facts = reflexion_response.get('missing_facts', [])
 
-            custom_prompt = 'The following facts were missed in a previous extraction: '
-            for fact in missing_facts:
-                custom_prompt += f'\n{fact},'
+                custom_prompt = 'The following facts were missed in a previous extraction: '
+                for fact in missing_facts:
+                    custom_prompt += f'\n{fact},'
 
-            context['custom_prompt'] = custom_prompt
+                context['custom_prompt'] = custom_prompt
 
-            facts_missed = len(missing_facts) != 0
+                facts_missed = len(missing_facts) != 0
 
     end = time()
     logger.debug(f'Extracted new edges: {edges_data} in {(end - start) * 1000} ms')
@@ -175,67 +258,187 @@ async def extract_edges(
     # Convert the extracted data into EntityEdge objects
     edges = []
     for edge_data in edges_data:
-        # Validate Edge Date information
-        valid_at = edge_data.valid_at
-        invalid_at = edge_data.invalid_at
-        valid_at_datetime = None
-        invalid_at_datetime = None
-
-        # Filter out empty edges
-        if not edge_data.fact.strip():
-            continue
+        edge = _build_entity_edge(edge_data, nodes, episode, group_id)
+        if edge is not None:
+            edges.append(edge)
 
-        source_node_idx = edge_data.source_entity_id
-        target_node_idx = edge_data.target_entity_id
+    logger.debug(f'Extracted edges: {[(e.name, e.uuid) for e in edges]}')
 
-        if len(nodes) == 0:
-            logger.warning('No entities provided for edge extraction')
+    return edges
+
+
+async def extract_edges_stream(
+    clients: GraphitiClients,
+    episode: EpisodicNode,
+    nodes: list[EntityNode],
+    previous_episodes: list[EpisodicNode],
+    edge_type_map: dict[tuple[str, str], list[str]],
+    group_id: str = '',
+    edge_types: dict[str, type[BaseModel]] | None = None,
+) -> AsyncIterator[EntityEdge]:
+    """
+    Extract edges from an episode, yielding each edge as soon as the LLM has generated it.
+
+    Reflexion needs the complete set of facts before it can run, so when it is enabled this
+    falls back to extract_edges and yields its results.
+    """
+    if MAX_REFLEXION_ITERATIONS > 0:
+        for edge in await extract_edges(
+            clients, episode, nodes, previous_episodes, edge_type_map, group_id, edge_types
+        ):
+            yield edge
+        return
+
+    start = time()
+
+    context = _build_extract_edges_context(
+        episode, nodes, previous_episodes, edge_type_map, edge_types
+    )
+
+    # The slot is only held while the LLM generates, not while the caller handles an edge
+    stream = scheduled_stream(
+        getattr(clients, 'scheduler', None),
+        group_id,
+        clients.llm_client.generate_response_stream(
+            prompt_library.extract_edges.edge(context),
+            response_model=ExtractedEdges,
+            items_field='edges',
+            max_tokens=EXTRACT_EDGES_MAX_TOKENS,
+            group_id=group_id,
+            prompt_name='extract_edges.edge',
+        ),
+    )
+    edge_count = 0
+    async for item in stream:
+        try:
+            edge_data = Edge(**item)
+        except ValidationError as e:
+            logger.warning(f'Skipping invalid streamed edge {item}: {e}')
             continue
 
-        if not (0 <= source_node_idx < len(nodes) and 0 <= target_node_idx < len(nodes)):
-            logger.warning(
-                f'Invalid entity IDs in edge extraction for {edge_data.relation_type}. '
-                f'source_entity_id: {source_node_idx}, target_entity_id: {target_node_idx}, '
-                f'but only {len(nodes)} entities available (valid range: 0-{len(nodes) - 1})'
-            )
+        edge = _build_entity_edge(edge_data, nodes, episode, group_id)
+        if edge is None:
             continue
-        source_node_uuid = nodes[source_node_idx].uuid
-        target_node_uuid = nodes[target_node_idx].uuid
 
-        if valid_at:
-            try:
-                valid_at_datetime = ensure_utc(
-                    datetime.fromisoformat(valid_at.replace('Z', '+00:00'))
-                )
-            except ValueError as e:
-                logger.warning(f'WARNING: Error parsing valid_at date: {e}. Input: {valid_at}')
+        edge_count += 1
+        yield edge
 
-        if invalid_at:
-            try:
-                invalid_at_datetime = ensure_utc(
-                    datetime.fromisoformat(invalid_at.replace('Z', '+00:00'))
-                )
-            except ValueError as e:
-                logger.warning(f'WARNING: Error parsing invalid_at date: {e}. Input: {invalid_at}')
-        edge = EntityEdge(
-            source_node_uuid=source_node_uuid,
-            target_node_uuid=target_node_uuid,
-            name=edge_data.relation_type,
-            group_id=group_id,
-            fact=edge_data.fact,
-            episodes=[episode.uuid],
-            created_at=utc_now(),
-            valid_at=valid_at_datetime,
-            invalid_at=invalid_at_datetime,
-        )
-        edges.append(edge)
-        logger.debug(
-            f'Created new edge: {edge.name} from (UUID: {edge.source_node_uuid}) to (UUID: {edge.target_node_uuid})'
-        )
+    end = time()
+    logger.debug(f'Streamed {edge_count} extracted edges in {(end - start) * 1000} ms')
 
-    logger.debug(f'Extracted edges: {[(e.name, e.uuid) for e in edges]}')
 
-    return edges
+async def fetch_edge_resolution_candidates(
+    clients: GraphitiClients, extracted_edge: EntityEdge
+) -> tuple[list[EntityEdge], list[EntityEdge]]:
+    """
+    Fetch the related edges and the invalidation candidates used to resolve an extracted edge.
+
+    Embeds the edge fact first if it has not been embedded yet.
+    """
+    if extracted_edge.fact_embedding is None:
+        await create_entity_edge_embeddings(clients.embedder, [extracted_edge])
+
+    valid_edges = await EntityEdge.get_between_nodes(
+        clients.driver, extracted_edge.source_node_uuid, extracted_edge.target_node_uuid
+    )
+
+    related_results, invalidation_results = await semaphore_gather(
+        search(
+            clients,
+            extracted_edge.fact,
+            group_ids=[extracted_edge.group_id],
+            config=EDGE_HYBRID_SEARCH_RRF,
+            search_filter=SearchFilters(edge_uuids=[edge.uuid for edge in valid_edges]),
+        ),
+        search(
+            clients,
+            extracted_edge.fact,
+            group_ids=[extracted_edge.group_id],
+            config=EDGE_HYBRID_SEARCH_RRF,
+            search_filter=SearchFilters(),
+        ),
+    )
+
+    return related_results.edges, invalidation_results.edges
+
+
+async def extract_edges_with_candidates(
+    clients: GraphitiClients,
+    episode: EpisodicNode,
+    nodes: list[EntityNode],
+    previous_episodes: list[EpisodicNode],
+    edge_type_map: dict[tuple[str, str], list[str]],
+    uuid_map: dict[str, str],
+    group_id: str = '',
+    edge_types: dict[str, type[BaseModel]] | None = None,
+) -> tuple[list[EntityEdge], dict[str, tuple[list[EntityEdge], list[EntityEdge]]]]:
+    """
+    Stream edge extraction and fetch resolution candidates for each edge while later edges
+    are still being generated.
+
+    Returns the extracted edges (with node pointers resolved through uuid_map) and a map from
+    edge uuid to its (related edges, invalidation candidates), ready to be passed to
+    resolve_extracted_edges. If the stream breaks off after some edges were streamed, those
+    edges and their candidates are discarded and the edges of a full, non-streamed response
+    are returned without prefetched candidates.
+    """
+    semaphore = asyncio.Semaphore(SEMAPHORE_LIMIT)
+    embedding_lock = asyncio.Lock()
+    unembedded: list[EntityEdge] = []
+
+    async def _embed(edge: EntityEdge):
+        unembedded.append(edge)
+        async with embedding_lock:
+            # Edges streamed while the previous batch was being embedded share a single call
+            if all(queued is not edge for queued in unembedded):
+                return
+            batch = unembedded.copy()
+            unembedded.clear()
+            await create_entity_edge_embeddings(clients.embedder, batch)
+
+    async def _prefetch(
+        edge: EntityEdge,
+    ) -> tuple[str, tuple[list[EntityEdge], list[EntityEdge]]]:
+        async with semaphore:
+            await _embed(edge)
+            return edge.uuid, await fetch_edge_resolution_candidates(clients, edge)
+
+    def _resolve_pointers(edge: EntityEdge):
+        edge.source_node_uuid = uuid_map.get(edge.source_node_uuid, edge.source_node_uuid)
+        edge.target_node_uuid = uuid_map.get(edge.target_node_uuid, edge.target_node_uuid)
+
+    edges: list[EntityEdge] = []
+    tasks: list[asyncio.Task] = []
+    try:
+        async for edge in extract_edges_stream(
+            clients, episode, nodes, previous_episodes, edge_type_map, group_id, edge_types
+        ):
+            # Point the edge at the resolved nodes before fetching its candidates
+            _resolve_pointers(edge)
+            edges.append(edge)
+            tasks.append(asyncio.create_task(_prefetch(edge)))
+
+        candidates = await asyncio.gather(*tasks)
+    except StreamInterruptedError as e:
+        # A regenerated response words facts differently, so streamed edges cannot be merged
+        # with it without saving duplicates. Start over from a single full response instead.
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        logger.warning(f'Edge extraction stream was interrupted, extracting again: {e}')
+
+        edges = await extract_edges(
+            clients, episode, nodes, previous_episodes, edge_type_map, group_id, edge_types
+        )
+        for edge in edges:
+            _resolve_pointers(edge)
+        return edges, {}
+    except BaseException:
+        for task in tasks:
+            task.cancel()
+        raise
+
+    return edges, dict(candidates)
 
 
 async def resolve_extracted_edges(
@@ -245,6 +448,7 @@ async def resolve_extracted_edges(
     entities: list[EntityNode],
     edge_types: dict[str, type[BaseModel]],
     edge_type_map: dict[tuple[str, str], list[str]],
+    prefetched_candidates: dict[str, tuple[list[EntityEdge], list[EntityEdge]]] | None = None,
 ) -> tuple[list[EntityEdge], list[EntityEdge]]:
     # Fast path: deduplicate exact matches within the extracted edges before parallel processing
     seen: dict[tuple[str, str, str], EntityEdge] = {}
@@ -265,12 +469,21 @@ async def resolve_extracted_edges(
     driver = clients.driver
     llm_client = clients.llm_client
     embedder = clients.embedder
-    await create_entity_edge_embeddings(embedder, extracted_edges)
+    scheduler = getattr(clients, 'scheduler', None)
+
+    # Candidates may already have been fetched while extraction was still streaming
+    prefetched_candidates = prefetched_candidates or {}
+    pending_edges = [edge for edge in extracted_edges if edge.uuid not in prefetched_candidates]
+
+    async with scheduled(scheduler, episode.group_id):
+        await create_entity_edge_embeddings(
+            embedder, [edge for edge in pending_edges if edge.fact_embedding is None]
+        )
 
     valid_edges_list: list[list[EntityEdge]] = await semaphore_gather(
         *[
             EntityEdge.get_between_nodes(driver, edge.source_node_uuid, edge.target_node_uuid)
-            for edge in extracted_edges
+            for edge in pending_edges
         ]
     )
 
@@ -283,12 +496,10 @@ async def resolve_extracted_edges(
                 config=EDGE_HYBRID_SEARCH_RRF,
                 search_filter=SearchFilters(edge_uuids=[edge.uuid for edge in valid_edges]),
             )
-            for extracted_edge, valid_edges in zip(extracted_edges, valid_edges_list, strict=True)
+            for extracted_edge, valid_edges in zip(pending_edges, valid_edges_list, strict=True)
         ]
     )
 
-    related_edges_lists: list[list[EntityEdge]] = [result.edges for result in related_edges_results]
-
     edge_invalidation_candidate_results: list[SearchResults] = await semaphore_gather(
         *[
             search(
@@ -298,12 +509,26 @@ async def resolve_extracted_edges(
                 config=EDGE_HYBRID_SEARCH_RRF,
                 search_filter=SearchFilters(),
             )
-            for extracted_edge in extracted_edges
+            for extracted_edge in pending_edges
         ]
     )
 
+    fetched_candidates = {
+        edge.uuid: (related_result.edges, invalidation_result.edges)
+        for edge, related_result, invalidation_result in zip(
+            pending_edges,
+            related_edges_results,
+            edge_invalidation_candidate_results,
+            strict=True,
+        )
+    }
+    candidates = {**prefetched_candidates, **fetched_candidates}
+
+    related_edges_lists: list[list[EntityEdge]] = [
+        candidates[edge.uuid][0] for edge in extracted_edges
+    ]
     edge_invalidation_candidates: list[list[EntityEdge]] = [
-        result.edges for result in edge_invalidation_candidate_results
+        candidates[edge.uuid][1] for edge in extracted_edges
     ]
 
     logger.debug(
@@ -364,14 +589,18 @@ async def resolve_extracted_edges(
     results: list[tuple[EntityEdge, list[EntityEdge], list[EntityEdge]]] = list(
         await semaphore_gather(
             *[
-                resolve_extracted_edge(
-                    llm_client,
-                    extracted_edge,
-                    related_edges,
-                    existing_edges,
-                    episode,
-                    extracted_edge_types,
-                    custom_type_names,
+                scheduled_call(
+                    scheduler,
+                    extracted_edge.group_id,
+                    resolve_extracted_edge(
+                        llm_client,
+                        extracted_edge,
+                        related_edges,
+                        existing_edges,
+                        episode,
+                        extracted_edge_types,
+                        custom_type_names,
+                    ),
                 )
                 for extracted_edge, related_edges, existing_edges, extracted_edge_types in zip(
                     extracted_edges,
@@ -395,10 +624,11 @@ async def resolve_extracted_edges(
 
     logger.debug(f'Resolved edges: {[(e.name, e.uuid) for e in resolved_edges]}')
 
-    await semaphore_gather(
-        create_entity_edge_embeddings(embedder, resolved_edges),
-        create_entity_edge_embeddings(embedder, invalidated_edges),
-    )
+    async with scheduled(scheduler, episode.group_id):
+        await semaphore_gather(
+            create_entity_edge_embeddings(embedder, resolved_edges),
+            create_entity_edge_embeddings(embedder, invalidated_edges),
+        )
 
     return resolved_edges, invalidated_edges
 
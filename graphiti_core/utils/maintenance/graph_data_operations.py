@@ -20,13 +20,18 @@ from datetime import datetime
 from typing_extensions import LiteralString
 
 from graphiti_core.driver.driver import GraphDriver, GraphProvider
+from graphiti_core.graph_queries import KUZU_VECTOR_INDEX_TABLES
+from graphiti_core.helpers import semaphore_gather
 from graphiti_core.models.nodes.node_db_queries import (
+    ENTITY_NODE_STATISTICS_UPDATE,
     EPISODIC_NODE_RETURN,
     EPISODIC_NODE_RETURN_NEPTUNE,
 )
 from graphiti_core.nodes import EpisodeType, EpisodicNode, get_episodic_node_from_record
+from graphiti_core.search.kernels import pagerank
 
 EPISODE_WINDOW_LEN = 3
+ENTITY_STATISTICS_BATCH_SIZE = 1000
 
 logger = logging.getLogger(__name__)
 
@@ -41,6 +46,10 @@ async def clear_data(driver: GraphDriver, group_ids: list[str] | None = None):
             labels = ['Entity', 'Episodic', 'Community']
             if driver.provider == GraphProvider.KUZU:
                 labels.append('RelatesToNode_')
+                # Embedding mirror tables, when the driver keeps vector indexes
+                for index_name, (table, _) in KUZU_VECTOR_INDEX_TABLES.items():
+                    if await driver.vector_index_exists(index_name):
+                        labels.append(table)
 
             for label in labels:
                 await tx.run(
@@ -118,3 +127,76 @@ async def retrieve_episodes(
 
     episodes = [get_episodic_node_from_record(record) for record in result]
     return list(reversed(episodes))  # Return in chronological order
+
+
+async def update_entity_statistics(
+    driver: GraphDriver, group_ids: list[str], centrality: bool = False
+):
+    """
+    Recompute the mention count and degree stored on every entity of the given groups, and
+    optionally a PageRank centrality over their entity edges.
+
+    Writes keep mention counts and degrees current for the entities they touch; this rebuilds
+    them for whole groups, e.g. for graphs written before they were stored.
+    """
+    if driver.provider == GraphProvider.KUZU:
+        logger.warning('Entity statistics are not stored on Kuzu, skipping update')
+        return
+
+    records, _, _ = await driver.execute_query(
+        """
+        MATCH (n:Entity)
+        WHERE n.group_id IN $group_ids
+        RETURN n.uuid AS uuid
+        """,
+        group_ids=group_ids,
+        routing_='r',
+    )
+    uuids = [record['uuid'] for record in records]
+
+    await semaphore_gather(
+        *[
+            driver.execute_query(
+                ENTITY_NODE_STATISTICS_UPDATE,
+                uuids=uuids[i : i + ENTITY_STATISTICS_BATCH_SIZE],
+            )
+            for i in range(0, len(uuids), ENTITY_STATISTICS_BATCH_SIZE)
+        ]
+    )
+
+    if not centrality:
+        return
+
+    records, _, _ = await driver.execute_query(
+        """
+        MATCH (n:Entity)-[e:RELATES_TO]->(m:Entity)
+        WHERE e.group_id IN $group_ids
+        RETURN n.uuid AS source_node_uuid, m.uuid AS target_node_uuid
+        """,
+        group_ids=group_ids,
+        routing_='r',
+    )
+    index = {uuid: i for i, uuid in enumerate(uuids)}
+    edges = [
+        (index[record['source_node_uuid']], index[record['target_node_uuid']])
+        for record in records
+        if record['source_node_uuid'] in index and record['target_node_uuid'] in index
+    ]
+    ranks = pagerank([source for source, _ in edges], [target for _, target in edges], len(uuids))
+
+    scores = [
+        {'uuid': uuid, 'centrality': float(rank)} for uuid, rank in zip(uuids, ranks, strict=True)
+    ]
+    await semaphore_gather(
+        *[
+            driver.execute_query(
+                """
+                UNWIND $scores AS score
+                MATCH (n:Entity {uuid: score.uuid})
+                SET n.centrality = score.centrality
+                """,
+                scores=scores[i : i + ENTITY_STATISTICS_BATCH_SIZE],
+            )
+            for i in range(0, len(scores), ENTITY_STATISTICS_BATCH_SIZE)
+        ]
+    )
@@ -53,6 +53,7 @@ from graphiti_core.utils.maintenance.dedup_helpers import (
 from graphiti_core.utils.maintenance.edge_operations import (
     filter_existing_duplicate_of_edges,
 )
+from graphiti_core.utils.scheduling import scheduled, scheduled_call
 from graphiti_core.utils.text_utils import MAX_SUMMARY_CHARS, truncate_at_sentence
 
 logger = logging.getLogger(__name__)
@@ -94,6 +95,7 @@ async def extract_nodes(
 ) -> list[EntityNode]:
     start = time()
     llm_client = clients.llm_client
+    scheduler = getattr(clients, 'scheduler', None)
     llm_response = {}
     custom_prompt = ''
     entities_missed = True
@@ -129,48 +131,49 @@ async def extract_nodes(
         'source_description': episode.source_description,
     }
 
-    while entities_missed and reflexion_iterations <= MAX_REFLEXION_ITERATIONS:
-        if episode.source == EpisodeType.message:
-            llm_response = await llm_client.generate_response(
-                prompt_library.extract_nodes.extract_message(context),
-                response_model=ExtractedEntities,
-                group_id=episode.group_id,
-                prompt_name='extract_nodes.extract_message',
-            )
-        elif episode.source == EpisodeType.text:
-            llm_response = await llm_client.generate_response(
-                prompt_library.extract_nodes.extract_text(context),
-                response_model=ExtractedEntities,
-                group_id=episode.group_id,
-                prompt_name='extract_nodes.extract_text',
-            )
-        elif episode.source == EpisodeType.json:
-            llm_response = await llm_client.generate_response(
-                prompt_library.extract_nodes.extract_json(context),
-                response_model=ExtractedEntities,
-                group_id=episode.group_id,
-                prompt_name='extract_nodes.extract_json',
-            )
-
-        response_object = ExtractedEntities(**llm_response)
-
-        extracted_entities: list[ExtractedEntity] = response_object.extracted_entities
-
-        reflexion_iterations += 1
-        if reflexion_iterations < MAX_REFLEXION_ITERATIONS:
-            missing_entities = await extract_nodes_reflexion(
-                llm_client,
-                episode,
-                previous_episodes,
-                [entity.name for entity in extracted_entities],
-                episode.group_id,
-            )
-
-            entities_missed = len(missing_entities) != 0
-
-            custom_prompt = 'Make sure that the following entities are extracted: '
-            for entity in missing_entities:
-                custom_prompt += f'\n{entity},'
+    async with scheduled(scheduler, episode.group_id):
+        while entities_missed and reflexion_iterations <= MAX_REFLEXION_ITERATIONS:
+            if episode.source == EpisodeType.message:
+                llm_response = await llm_client.generate_response(
+                    prompt_library.extract_nodes.extract_message(context),
+                    response_model=ExtractedEntities,
+                    group_id=episode.group_id,
+                    prompt_name='extract_nodes.extract_message',
+                )
+            elif episode.source == EpisodeType.text:
+                llm_response = await llm_client.generate_response(
+                    prompt_library.extract_nodes.extract_text(context),
+                    response_model=ExtractedEntities,
+                    group_id=episode.group_id,
+                    prompt_name='extract_nodes.extract_text',
+                )
+            elif episode.source == EpisodeType.json:
+                llm_response = await llm_client.generate_response(
+                    prompt_library.extract_nodes.extract_json(context),
+                    response_model=ExtractedEntities,
+                    group_id=episode.group_id,
+                    prompt_name='extract_nodes.extract_json',
+                )
+
+            response_object = ExtractedEntities(**llm_response)
+
+            extracted_entities: list[ExtractedEntity] = response_object.extracted_entities
+
+            reflexion_iterations += 1
+            if reflexion_iterations < MAX_REFLEXION_ITERATIONS:
+                missing_entities = await extract_nodes_reflexion(
+                    llm_client,
+                    episode,
+                    previous_episodes,
+                    [entity.name for entity in extracted_entities],
+                    episode.group_id,
+                )
+
+                entities_missed = len(missing_entities) != 0
+
+                custom_prompt = 'Make sure that the following entities are extracted: '
+                for entity in missing_entities:
+                    custom_prompt += f'\n{entity},'
 
     filtered_extracted_entities = [entity for entity in extracted_entities if entity.name.strip()]
     end = time()
@@ -403,6 +406,7 @@ async def resolve_extracted_nodes(
     """Search for existing nodes, resolve deterministic matches, then escalate holdouts to the LLM dedupe prompt."""
     llm_client = clients.llm_client
     driver = clients.driver
+    scheduler = getattr(clients, 'scheduler', None)
     existing_nodes = await _collect_candidate_nodes(
         clients,
         extracted_nodes,
@@ -419,15 +423,18 @@ async def resolve_extracted_nodes(
 
     _resolve_with_similarity(extracted_nodes, indexes, state)
 
-    await _resolve_with_llm(
-        llm_client,
-        extracted_nodes,
-        indexes,
-        state,
-        episode,
-        previous_episodes,
-        entity_types,
-    )
+    if state.unresolved_indices:
+        group_id = episode.group_id if episode is not None else extracted_nodes[0].group_id
+        async with scheduled(scheduler, group_id):
+            await _resolve_with_llm(
+                llm_client,
+                extracted_nodes,
+                indexes,
+                state,
+                episode,
+                previous_episodes,
+                entity_types,
+            )
 
     for idx, node in enumerate(extracted_nodes):
         if state.resolved_nodes[idx] is None:
@@ -460,25 +467,34 @@ async def extract_attributes_from_nodes(
 ) -> list[EntityNode]:
     llm_client = clients.llm_client
     embedder = clients.embedder
+    scheduler = getattr(clients, 'scheduler', None)
     updated_nodes: list[EntityNode] = await semaphore_gather(
         *[
-            extract_attributes_from_node(
-                llm_client,
-                node,
-                episode,
-                previous_episodes,
-                (
-                    entity_types.get(next((item for item in node.labels if item != 'Entity'), ''))
-                    if entity_types is not None
-                    else None
+            scheduled_call(
+                scheduler,
+                node.group_id,
+                extract_attributes_from_node(
+                    llm_client,
+                    node,
+                    episode,
+                    previous_episodes,
+                    (
+                        entity_types.get(
+                            next((item for item in node.labels if item != 'Entity'), '')
+                        )
+                        if entity_types is not None
+                        else None
+                    ),
+                    should_summarize_node,
                 ),
-                should_summarize_node,
             )
             for node in nodes
         ]
     )
 
-    await create_entity_node_embeddings(embedder, updated_nodes)
+    if updated_nodes:
+        async with scheduled(scheduler, updated_nodes[0].group_id):
+            await create_entity_node_embeddings(embedder, updated_nodes)
 
     return updated_nodes
 
@@ -0,0 +1,201 @@
+"""
+Copyright 2024, Zep Software, Inc.
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+import asyncio
+import itertools
+from collections import deque
+from collections.abc import AsyncGenerator, AsyncIterator, Awaitable
+from contextlib import asynccontextmanager, suppress
+from contextvars import ContextVar
+from time import monotonic
+from typing import TypeVar
+
+from graphiti_core.helpers import SEMAPHORE_LIMIT
+
+T = TypeVar('T')
+
+# Set while the current task holds a slot, so nested pipeline helpers (and tasks they spawn)
+# do not queue again
+_holding_slot: ContextVar[bool] = ContextVar('graphiti_holding_scheduler_slot', default=False)
+
+
+class GroupQueueStats:
+    def __init__(self):
+        self.count = 0
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+
+    def record(self, wait: float):
+        self.count += 1
+        self.total_wait += wait
+        self.max_wait = max(self.max_wait, wait)
+
+    def snapshot(self) -> dict[str, float]:
+        return {
+            'count': self.count,
+            'total_wait_ms': self.total_wait * 1000,
+            'mean_wait_ms': (self.total_wait / self.count) * 1000 if self.count else 0.0,
+            'max_wait_ms': self.max_wait * 1000,
+        }
+
+
+class GroupFairScheduler:
+    """
+    Weighted fair queuing of LLM and embedder work across group_ids.
+
+    At most `capacity` units of work run at once. When work is waiting, slots are granted in
+    order of virtual finish time, so each group receives capacity in proportion to its weight
+    no matter how much work it has queued. `caps` bounds the concurrent slots of a group.
+    """
+
+    def __init__(
+        self,
+        capacity: int = SEMAPHORE_LIMIT,
+        weights: dict[str, float] | None = None,
+        caps: dict[str, int] | None = None,
+        default_weight: float = 1.0,
+    ):
+        self.capacity = capacity
+        self.weights = weights or {}
+        self.caps = caps or {}
+        self.default_weight = default_weight
+
+        self._in_use = 0
+        self._active: dict[str, int] = {}
+        self._queues: dict[str, deque[tuple[float, int, asyncio.Future]]] = {}
+        self._last_finish: dict[str, float] = {}
+        self._virtual_time = 0.0
+        self._sequence = itertools.count()
+        self._stats: dict[str, GroupQueueStats] = {}
+
+    @asynccontextmanager
+    async def slot(self, group_id: str | None) -> AsyncIterator[None]:
+        """Hold a slot for the duration of the block. Nested acquisitions are free."""
+        if _holding_slot.get():
+            yield
+            return
+
+        group = group_id or ''
+        start = monotonic()
+        await self._acquire(group)
+        self._stats.setdefault(group, GroupQueueStats()).record(monotonic() - start)
+
+        token = _holding_slot.set(True)
+        try:
+            yield
+        finally:
+            self._release(group)
+            # Fails when closed from another context, e.g. an async generator finalized elsewhere
+            with suppress(ValueError):
+                _holding_slot.reset(token)
+
+    def queue_wait_stats(self) -> dict[str, dict[str, float]]:
+        """Per-group queue wait statistics."""
+        return {group: stats.snapshot() for group, stats in self._stats.items()}
+
+    def queue_depths(self) -> dict[str, int]:
+        return {
+            group: sum(1 for _, _, future in queue if not future.done())
+            for group, queue in self._queues.items()
+        }
+
+    async def _acquire(self, group: str):
+        weight = self.weights.get(group, self.default_weight)
+        finish = max(self._virtual_time, self._last_finish.get(group, 0.0)) + 1 / weight
+        self._last_finish[group] = finish
+
+        future: asyncio.Future = asyncio.get_running_loop().create_future()
+        self._queues.setdefault(group, deque()).append((finish, next(self._sequence), future))
+        self._dispatch()
+
+        try:
+            await future
+        except asyncio.CancelledError:
+            if future.done() and not future.cancelled():
+                # The slot was granted after cancellation was requested
+                self._release(group)
+            else:
+                future.cancel()
+                self._dispatch()
+            raise
+
+    def _release(self, group: str):
+        self._in_use -= 1
+        self._active[group] -= 1
+        self._dispatch()
+
+    def _dispatch(self):
+        while self._in_use < self.capacity:
+            best_group: str | None = None
+            best_key: tuple[float, int] | None = None
+            for group, queue in self._queues.items():
+                while queue and queue[0][2].done():
+                    queue.popleft()
+                if not queue:
+                    continue
+                cap = self.caps.get(group)
+                if cap is not None and self._active.get(group, 0) >= cap:
+                    continue
+                key = (queue[0][0], queue[0][1])
+                if best_key is None or key < best_key:
+                    best_group, best_key = group, key
+
+            if best_group is None or best_key is None:
+                return
+
+            self._queues[best_group].popleft()[2].set_result(None)
+            self._in_use += 1
+            self._active[best_group] = self._active.get(best_group, 0) + 1
+            self._virtual_time = max(self._virtual_time, best_key[0])
+
+
+@asynccontextmanager
+async def scheduled(
+    scheduler: GroupFairScheduler | None, group_id: str | None
+) -> AsyncIterator[None]:
+    """Hold a scheduler slot for group_id, or do nothing when no scheduler is configured."""
+    if scheduler is None:
+        yield
+        return
+
+    async with scheduler.slot(group_id):
+        yield
+
+
+async def scheduled_call(
+    scheduler: GroupFairScheduler | None, group_id: str | None, awaitable: Awaitable[T]
+) -> T:
+    async with scheduled(scheduler, group_id):
+        return await awaitable
+
+
+async def scheduled_stream(
+    scheduler: GroupFairScheduler | None, group_id: str | None, stream: AsyncIterator[T]
+) -> AsyncIterator[T]:
+    """
+    Iterate a stream, holding a slot only while each item is awaited. The slot is never held
+    while the consumer handles an item, so it cannot leak into the consumer's context.
+    """
+    try:
+        while True:
+            try:
+                item = await scheduled_call(scheduler, group_id, anext(stream))
+            except StopAsyncIteration:
+                return
+            yield item
+    finally:
+        if isinstance(stream, AsyncGenerator):
+            await stream.aclose()
@@ -5,6 +5,7 @@ Graphiti MCP Server - Exposes Graphiti functionality through the Model Context P
 
 import argparse
 import asyncio
+import json
 import logging
 import os
 import sys
@@ -15,6 +16,11 @@ from dotenv import load_dotenv
 from graphiti_core import Graphiti
 from graphiti_core.edges import EntityEdge
 from graphiti_core.nodes import EpisodeType, EpisodicNode
+from graphiti_core.search.search_config import SearchStage
+from graphiti_core.search.search_config_recipes import (
+    EDGE_HYBRID_SEARCH_NODE_DISTANCE,
+    EDGE_HYBRID_SEARCH_RRF,
+)
 from graphiti_core.search.search_filters import SearchFilters
 from graphiti_core.utils.maintenance.graph_data_operations import clear_data
 from mcp.server.fastmcp import FastMCP
@@ -493,6 +499,9 @@ async def search_memory_facts(
 ) -> FactSearchResponse | ErrorResponse:
     """Search the graph memory for relevant facts.
 
+    Facts from earlier search stages (fulltext hits, then fused results) are sent to the client
+    as log notifications while the final reranked facts are computed.
+
     Args:
         query: The search query
         group_ids: Optional list of group IDs to filter results
@@ -520,12 +529,28 @@ async def search_memory_facts(
             else []
         )
 
-        relevant_edges = await client.search(
-            group_ids=effective_group_ids,
+        search_config = (
+            EDGE_HYBRID_SEARCH_RRF if center_node_uuid is None else EDGE_HYBRID_SEARCH_NODE_DISTANCE
+        ).model_copy(update={'limit': max_facts})
+        ctx = mcp.get_context()
+
+        relevant_edges: list[EntityEdge] = []
+        async for results in client.search_stream(
             query=query,
-            num_results=max_facts,
+            config=search_config,
+            group_ids=effective_group_ids,
             center_node_uuid=center_node_uuid,
-        )
+        ):
+            relevant_edges = results.edges
+            if results.metadata.stage != SearchStage.reranked:
+                await ctx.info(
+                    json.dumps(
+                        {
+                            'stage': results.metadata.stage.value,
+                            'facts': [format_fact_result(edge) for edge in relevant_edges],
+                        }
+                    )
+                )
 
         if not relevant_edges:
             return FactSearchResponse(message='No relevant facts found', facts=[])
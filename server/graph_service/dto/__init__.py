@@ -1,6 +1,13 @@
 from .common import Message, Result
 from .ingest import AddEntityNodeRequest, AddMessagesRequest
-from .retrieve import FactResult, GetMemoryRequest, GetMemoryResponse, SearchQuery, SearchResults
+from .retrieve import (
+    FactResult,
+    GetMemoryRequest,
+    GetMemoryResponse,
+    SearchQuery,
+    SearchResults,
+    SearchStageResults,
+)
 
 __all__ = [
     'SearchQuery',
@@ -8,6 +15,7 @@ __all__ = [
     'AddMessagesRequest',
     'AddEntityNodeRequest',
     'SearchResults',
+    'SearchStageResults',
     'FactResult',
     'Result',
     'GetMemoryRequest',
@@ -30,6 +30,11 @@ class SearchResults(BaseModel):
     facts: list[FactResult]
 
 
+class SearchStageResults(BaseModel):
+    stage: str = Field(..., description='The search stage that produced the facts')
+    facts: list[FactResult]
+
+
 class GetMemoryRequest(BaseModel):
     group_id: str = Field(..., description='The group id of the memory to get')
     max_facts: int = Field(default=10, description='The maximum number of facts to retrieve')
@@ -1,6 +1,8 @@
 from datetime import datetime, timezone
 
 from fastapi import APIRouter, status
+from fastapi.responses import StreamingResponse
+from graphiti_core.search.search_config_recipes import EDGE_HYBRID_SEARCH_RRF  # type: ignore
 
 from graph_service.dto import (
     GetMemoryRequest,
@@ -8,6 +10,7 @@ from graph_service.dto import (
     Message,
     SearchQuery,
     SearchResults,
+    SearchStageResults,
 )
 from graph_service.zep_graphiti import ZepGraphitiDep, get_fact_result_from_edge
 
@@ -27,6 +30,24 @@ async def search(query: SearchQuery, graphiti: ZepGraphitiDep):
     )
 
 
+@router.post('/search/stream', status_code=status.HTTP_200_OK)
+async def search_stream(query: SearchQuery, graphiti: ZepGraphitiDep):
+    # Streams one line of facts per search stage, so the first facts arrive with the bm25 hits
+    async def stages():
+        async for results in graphiti.search_stream(
+            query=query.query,
+            config=EDGE_HYBRID_SEARCH_RRF.model_copy(update={'limit': query.max_facts}),
+            group_ids=query.group_ids,
+        ):
+            stage_results = SearchStageResults(
+                stage=results.metadata.stage.value,
+                facts=[get_fact_result_from_edge(edge) for edge in results.edges],
+            )
+            yield stage_results.model_dump_json() + '\n'
+
+    return StreamingResponse(stages(), media_type='application/x-ndjson')
+
+
 @router.get('/entity-edge/{uuid}', status_code=status.HTTP_200_OK)
 async def get_entity_edge(uuid: str, graphiti: ZepGraphitiDep):
     entity_edge = await graphiti.get_entity_edge(uuid)
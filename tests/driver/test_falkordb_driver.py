@@ -14,6 +14,7 @@ See the License for the specific language governing permissions and
 limitations under the License.
 """
 
+import asyncio
 import os
 import unittest
 from datetime import datetime, timezone
@@ -196,9 +197,7 @@ class TestFalkorDriver:
             # hasattr(self.client, 'aclose') returns False
             # hasattr(self.client.connection, 'aclose') returns False
             # hasattr(self.client.connection, 'close') returns True
-            mock_hasattr.side_effect = lambda obj, attr: (
-                attr == 'close' and obj is mock_connection
-            )
+            mock_hasattr.side_effect = lambda obj, attr: attr == 'close' and obj is mock_connection
 
             await self.driver.close()
 
@@ -216,6 +215,47 @@ class TestFalkorDriver:
 
             mock_execute.assert_called_once_with('CALL db.indexes()')
 
+    @pytest.mark.asyncio
+    @unittest.skipIf(not HAS_FALKORDB, 'FalkorDB is not installed')
+    async def test_vector_index_exists(self):
+        """Test vector indexes are detected by label and property and cached."""
+        with patch.object(self.driver, 'execute_query', new_callable=AsyncMock) as mock_execute:
+            mock_execute.return_value = (
+                [
+                    {
+                        'label': 'Entity',
+                        'types': {'name': ['RANGE'], 'name_embedding': ['VECTOR']},
+                        'entitytype': 'NODE',
+                    }
+                ],
+                None,
+                None,
+            )
+
+            assert await self.driver.vector_index_exists('entity_name_embedding')
+            assert not await self.driver.vector_index_exists('edge_fact_embedding')
+            mock_execute.assert_called_once_with('CALL db.indexes()')
+
+    @pytest.mark.asyncio
+    @unittest.skipIf(not HAS_FALKORDB, 'FalkorDB is not installed')
+    async def test_clone_reuses_drivers_per_graph(self):
+        """Test clones are built once per graph and share the driver's caches."""
+        self.driver.adjacency_cache = MagicMock()
+        with patch.object(
+            FalkorDriver, 'build_indices_and_constraints', new_callable=AsyncMock
+        ) as mock_build:
+            clone = self.driver.clone('group_a')
+            assert self.driver.clone('group_a') is clone
+            assert self.driver.clone(self.driver._database) is self.driver
+            await asyncio.sleep(0)
+
+        mock_build.assert_awaited_once()
+        assert clone._database == 'group_a'
+        assert clone._vector_index_cache is self.driver._vector_index_cache
+        assert clone.adjacency_cache is self.driver.adjacency_cache
+        (shard_driver, _), _ = self.driver.shard_group_ids(['group_a', 'group_b'])
+        assert shard_driver is clone
+
 
 class TestFalkorDriverSession:
     """Test FalkorDB driver session functionality."""
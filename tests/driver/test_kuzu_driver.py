@@ -0,0 +1,481 @@
+"""
+Copyright 2024, Zep Software, Inc.
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from unittest.mock import MagicMock
+
+import pytest
+
+from graphiti_core.driver.driver import GraphProvider
+from graphiti_core.driver.search_interface.local_vector_search import LocalVectorSearchInterface
+from graphiti_core.edges import EntityEdge
+from graphiti_core.graph_queries import (
+    EDGE_FACT_EMBEDDING_INDEX,
+    ENTITY_NAME_EMBEDDING_INDEX,
+    get_fulltext_indices,
+)
+from graphiti_core.graphiti_types import GraphitiClients
+from graphiti_core.nodes import EntityNode
+from graphiti_core.search.adjacency_cache import AdjacencyCache
+from graphiti_core.search.search import edge_search, node_search, search
+from graphiti_core.search.search_cache import SearchResultCache
+from graphiti_core.search.search_config import (
+    EdgeReranker,
+    EdgeSearchConfig,
+    EdgeSearchMethod,
+    NodeReranker,
+    NodeSearchConfig,
+    NodeSearchMethod,
+    SearchConfig,
+)
+from graphiti_core.search.search_filters import SearchFilters
+from graphiti_core.search.search_utils import (
+    edge_bfs_search,
+    edge_similarity_search,
+    get_relevant_nodes,
+    node_bfs_search,
+    node_distance_reranker,
+    node_similarity_search,
+)
+from graphiti_core.tracer import NoOpSpan, NoOpTracer
+from graphiti_core.utils.maintenance.graph_data_operations import clear_data
+
+try:
+    from graphiti_core.driver.kuzu_driver import KuzuDriver
+
+    HAS_KUZU = True
+except ImportError:
+    KuzuDriver = None
+    HAS_KUZU = False
+
+pytestmark = pytest.mark.skipif(not HAS_KUZU, reason='Kuzu is not installed')
+
+GROUP_ID = 'kuzu_vector_group'
+
+
+def _node(name: str, embedding: list[float]) -> EntityNode:
+    return EntityNode(
+        name=name,
+        group_id=GROUP_ID,
+        labels=['Entity'],
+        name_embedding=embedding,
+        created_at=datetime.now(timezone.utc),
+    )
+
+
+@pytest.fixture
+async def driver():
+    assert KuzuDriver is not None
+    driver = KuzuDriver(embedding_dim=3)
+    await driver.execute_query('INSTALL FTS; LOAD FTS;')
+    for query in get_fulltext_indices(GraphProvider.KUZU):
+        await driver.execute_query(query)
+    return driver
+
+
+def test_vector_indexes_only_created_with_embedding_dim():
+    assert KuzuDriver is not None
+    assert KuzuDriver()._vector_indices == set()
+    assert KuzuDriver(embedding_dim=3)._vector_indices == {
+        ENTITY_NAME_EMBEDDING_INDEX,
+        EDGE_FACT_EMBEDDING_INDEX,
+    }
+
+
+@pytest.mark.asyncio
+async def test_similarity_search_uses_vector_index(driver):
+    alice = _node('Alice', [1.0, 0.0, 0.0])
+    bob = _node('Bob', [0.0, 1.0, 0.0])
+    for node in (alice, bob):
+        await node.save(driver)
+    edge = EntityEdge(
+        source_node_uuid=alice.uuid,
+        target_node_uuid=bob.uuid,
+        name='KNOWS',
+        fact='Alice knows Bob',
+        fact_embedding=[0.0, 0.0, 1.0],
+        group_id=GROUP_ID,
+        episodes=[],
+        created_at=datetime.now(timezone.utc),
+    )
+    await edge.save(driver)
+
+    nodes = await node_similarity_search(
+        driver, [0.9, 0.1, 0.0], SearchFilters(), [GROUP_ID], limit=1
+    )
+    assert [node.uuid for node in nodes] == [alice.uuid]
+
+    edges = await edge_similarity_search(
+        driver, [0.0, 0.1, 0.9], None, None, SearchFilters(), [GROUP_ID]
+    )
+    assert [found.uuid for found in edges] == [edge.uuid]
+
+    # Saving again replaces the indexed embedding
+    alice.name_embedding = [0.0, 0.0, 1.0]
+    await alice.save(driver)
+    nodes = await node_similarity_search(driver, [1.0, 0.0, 0.0], SearchFilters(), [GROUP_ID])
+    assert nodes == []
+    nodes = await node_similarity_search(driver, [0.0, 0.0, 1.0], SearchFilters(), [GROUP_ID])
+    assert [node.uuid for node in nodes] == [alice.uuid]
+
+    await bob.delete(driver)
+    nodes = await node_similarity_search(driver, [0.0, 1.0, 0.0], SearchFilters(), [GROUP_ID])
+    assert nodes == []
+
+
+@pytest.mark.asyncio
+async def test_get_relevant_nodes_with_vector_index(driver):
+    alice = _node('Alice', [1.0, 0.0, 0.0])
+    await alice.save(driver)
+
+    relevant = await get_relevant_nodes(
+        driver, [_node('Alice Smith', [0.95, 0.05, 0.0])], SearchFilters()
+    )
+
+    assert [[node.uuid for node in nodes] for nodes in relevant] == [[alice.uuid]]
+
+
+@pytest.mark.asyncio
+async def test_similarity_search_as_of(driver):
+    alice = _node('Alice', [1.0, 0.0, 0.0])
+    bob = _node('Bob', [0.0, 1.0, 0.0])
+    for node in (alice, bob):
+        await node.save(driver)
+
+    def _edge(fact: str, **dates: datetime) -> EntityEdge:
+        return EntityEdge(
+            source_node_uuid=alice.uuid,
+            target_node_uuid=bob.uuid,
+            name='KNOWS',
+            fact=fact,
+            fact_embedding=[0.0, 0.0, 1.0],
+            group_id=GROUP_ID,
+            episodes=[],
+            created_at=datetime(2024, 1, 1, tzinfo=timezone.utc),
+            **dates,
+        )
+
+    edges = {
+        'valid': _edge('valid', valid_at=datetime(2024, 1, 1, tzinfo=timezone.utc)),
+        'invalidated': _edge(
+            'invalidated',
+            valid_at=datetime(2024, 1, 1, tzinfo=timezone.utc),
+            invalid_at=datetime(2024, 3, 1, tzinfo=timezone.utc),
+        ),
+        'expired': _edge('expired', expired_at=datetime(2024, 3, 1, tzinfo=timezone.utc)),
+        'future': _edge('future', valid_at=datetime(2024, 9, 1, tzinfo=timezone.utc)),
+    }
+    for edge in edges.values():
+        await edge.save(driver)
+
+    async def facts(search_filter: SearchFilters) -> set[str]:
+        found = await edge_similarity_search(
+            driver, [0.0, 0.0, 1.0], None, None, search_filter, [GROUP_ID]
+        )
+        return {edge.fact for edge in found}
+
+    as_of = datetime(2024, 6, 1, tzinfo=timezone.utc)
+    assert await facts(SearchFilters()) == set(edges)
+    assert await facts(SearchFilters(as_of=as_of)) == {'valid'}
+    assert await facts(SearchFilters(as_of=as_of, include_expired=True)) == {'valid', 'expired'}
+    assert await facts(SearchFilters(as_of=datetime(2024, 2, 1, tzinfo=timezone.utc))) == {
+        'valid',
+        'invalidated',
+        'expired',
+    }
+
+
+@pytest.mark.asyncio
+async def test_bfs_search_with_adjacency_cache(driver):
+    nodes = [_node(name, [1.0, 0.0, 0.0]) for name in ['Alice', 'Bob', 'Carol', 'Dave']]
+    for node in nodes:
+        await node.save(driver)
+    edges = [
+        EntityEdge(
+            source_node_uuid=source.uuid,
+            target_node_uuid=target.uuid,
+            name='KNOWS',
+            fact=f'{source.name} knows {target.name}',
+            fact_embedding=[0.0, 0.0, 1.0],
+            group_id=GROUP_ID,
+            episodes=[],
+            created_at=datetime.now(timezone.utc),
+        )
+        for source, target in zip(nodes, nodes[1:], strict=False)
+    ]
+    for edge in edges:
+        await edge.save(driver)
+
+    async def search():
+        found_nodes = await node_bfs_search(driver, [nodes[0].uuid], SearchFilters(), 2)
+        found_edges = await edge_bfs_search(driver, [nodes[0].uuid], 2, SearchFilters())
+        reranked = await node_distance_reranker(
+            driver, [node.uuid for node in reversed(nodes)], nodes[0].uuid, max_depth=2
+        )
+        return (
+            {node.uuid for node in found_nodes},
+            {edge.uuid for edge in found_edges},
+            reranked,
+        )
+
+    from_database = await search()
+    driver.adjacency_cache = AdjacencyCache()
+    from_cache = await search()
+
+    assert from_cache == from_database
+    assert from_cache == (
+        {nodes[1].uuid, nodes[2].uuid},
+        {edges[0].uuid, edges[1].uuid},
+        # Graded by hops from the center, Dave is past max_depth
+        ([node.uuid for node in nodes], [10.0, 1.0, 0.5, 0.0]),
+    )
+
+    # Writes go to the cache after it has loaded the group
+    await edges[0].delete(driver)
+    found = await node_bfs_search(driver, [nodes[0].uuid], SearchFilters(), 2)
+    assert found == []
+
+
+@pytest.mark.asyncio
+async def test_deletes_remove_incident_edge_embeddings(driver):
+    alice, bob, carol = (_node(name, [1.0, 0.0, 0.0]) for name in ['Alice', 'Bob', 'Carol'])
+    for node in [alice, bob, carol]:
+        await node.save(driver)
+    for source, target in [(alice, bob), (carol, alice), (bob, carol)]:
+        await EntityEdge(
+            source_node_uuid=source.uuid,
+            target_node_uuid=target.uuid,
+            name='KNOWS',
+            fact=f'{source.name} knows {target.name}',
+            fact_embedding=[0.0, 0.0, 1.0],
+            group_id=GROUP_ID,
+            episodes=[],
+            created_at=datetime.now(timezone.utc),
+        ).save(driver)
+
+    async def count(table):
+        records, _, _ = await driver.execute_query(f'MATCH (x:{table}) RETURN count(x) AS n')
+        return records[0]['n']
+
+    # Both the outgoing and the incoming edge go with Alice
+    await alice.delete(driver)
+    assert await count('EntityEmbedding_') == 2
+    assert await count('RelatesToNodeEmbedding_') == 1
+    assert await count('RelatesToNode_') == 1
+
+    await clear_data(driver, group_ids=[GROUP_ID])
+    assert await count('EntityEmbedding_') == 0
+    assert await count('RelatesToNodeEmbedding_') == 0
+
+
+@pytest.mark.asyncio
+async def test_deletes_keep_local_vector_index_in_sync(driver):
+    alice, bob, carol = (_node(name, [1.0, 0.0, 0.0]) for name in ['Alice', 'Bob', 'Carol'])
+    for node in [alice, bob, carol]:
+        await node.save(driver)
+    edges = [
+        EntityEdge(
+            source_node_uuid=source.uuid,
+            target_node_uuid=target.uuid,
+            name='KNOWS',
+            fact=f'{source.name} knows {target.name}',
+            fact_embedding=[0.0, 0.0, 1.0],
+            group_id=GROUP_ID,
+            episodes=[],
+            created_at=datetime.now(timezone.utc),
+        )
+        for source, target in [(alice, bob), (carol, alice), (bob, carol)]
+    ]
+    for edge in edges:
+        await edge.save(driver)
+
+    interface = LocalVectorSearchInterface()
+    driver.search_interface = interface
+
+    def indexed():
+        return {uuid for index in interface._partitions.values() for uuid in index.rows}
+
+    await interface.node_similarity_search(driver, [1.0, 0.0, 0.0], SearchFilters(), [GROUP_ID])
+    assert indexed() == {alice.uuid, bob.uuid, carol.uuid, *(edge.uuid for edge in edges)}
+
+    await alice.delete(driver)
+    assert indexed() == {bob.uuid, carol.uuid, edges[2].uuid}
+
+    await EntityNode.delete_by_uuids(driver, [bob.uuid])
+    assert indexed() == {carol.uuid}
+
+    await EntityNode.delete_by_group_id(driver, GROUP_ID)
+    assert indexed() == set()
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize('mmr', [False, True])
+async def test_search_hydrates_only_reranked_results(driver, mmr):
+    alice = _node('Alice', [1.0, 0.0, 0.0])
+    alice.summary = 'Alice is an engineer'
+    alice.attributes = {'age': 30}
+    bob = _node('Bob', [0.0, 1.0, 0.0])
+    for node in (alice, bob):
+        await node.save(driver)
+    edge = EntityEdge(
+        source_node_uuid=alice.uuid,
+        target_node_uuid=bob.uuid,
+        name='KNOWS',
+        fact='Alice knows Bob',
+        fact_embedding=[1.0, 0.0, 0.0],
+        group_id=GROUP_ID,
+        episodes=[],
+        attributes={'since': 2020},
+        created_at=datetime.now(timezone.utc),
+    )
+    await edge.save(driver)
+
+    candidates = await node_similarity_search(
+        driver, [1.0, 0.0, 0.0], SearchFilters(), [GROUP_ID], hydrate=False, with_embeddings=True
+    )
+    assert candidates[0].summary == ''
+    assert candidates[0].attributes == {}
+    assert candidates[0].name_embedding == pytest.approx([1.0, 0.0, 0.0])
+
+    nodes, _ = await node_search(
+        driver,
+        MagicMock(),
+        'Alice',
+        [1.0, 0.0, 0.0],
+        [GROUP_ID],
+        NodeSearchConfig(
+            search_methods=[NodeSearchMethod.cosine_similarity],
+            reranker=NodeReranker.mmr if mmr else NodeReranker.rrf,
+        ),
+        SearchFilters(),
+        limit=1,
+    )
+    edges, _ = await edge_search(
+        driver,
+        MagicMock(),
+        'Alice',
+        [1.0, 0.0, 0.0],
+        [GROUP_ID],
+        EdgeSearchConfig(
+            search_methods=[EdgeSearchMethod.cosine_similarity],
+            reranker=EdgeReranker.mmr if mmr else EdgeReranker.rrf,
+        ),
+        SearchFilters(),
+        limit=1,
+    )
+
+    assert [(node.uuid, node.summary, node.attributes) for node in nodes] == [
+        (alice.uuid, 'Alice is an engineer', {'age': 30})
+    ]
+    assert [(found.uuid, found.attributes) for found in edges] == [(edge.uuid, {'since': 2020})]
+    assert nodes[0].name_embedding is None
+
+
+class RecordingTracer(NoOpTracer):
+    def __init__(self):
+        self.spans: list[str] = []
+
+    @contextmanager
+    def start_span(self, name: str):
+        self.spans.append(name)
+        yield NoOpSpan()
+
+
+@pytest.mark.asyncio
+async def test_search_explain_profiles_methods_and_queries(driver):
+    alice = _node('Alice', [1.0, 0.0, 0.0])
+    bob = _node('Bob', [0.0, 1.0, 0.0])
+    for node in (alice, bob):
+        await node.save(driver)
+    await EntityEdge(
+        source_node_uuid=alice.uuid,
+        target_node_uuid=bob.uuid,
+        name='KNOWS',
+        fact='Alice knows Bob',
+        fact_embedding=[1.0, 0.0, 0.0],
+        group_id=GROUP_ID,
+        episodes=[],
+        created_at=datetime.now(timezone.utc),
+    ).save(driver)
+
+    tracer = RecordingTracer()
+    clients = GraphitiClients.model_construct(  # bypass validation to allow test doubles
+        driver=driver,
+        embedder=MagicMock(),
+        cross_encoder=MagicMock(),
+        llm_client=MagicMock(),
+        tracer=tracer,
+    )
+    config = SearchConfig(
+        edge_config=EdgeSearchConfig(
+            search_methods=[EdgeSearchMethod.bm25, EdgeSearchMethod.cosine_similarity]
+        )
+    )
+
+    results = await search(
+        clients, 'Alice', [GROUP_ID], config, SearchFilters(), query_vector=[1.0, 0.0, 0.0]
+    )
+    assert results.profile is None
+
+    results = await search(
+        clients,
+        'Alice',
+        [GROUP_ID],
+        config,
+        SearchFilters(),
+        query_vector=[1.0, 0.0, 0.0],
+        explain=True,
+    )
+
+    profile = results.profile
+    assert profile is not None
+    assert profile.provider == 'kuzu'
+    steps = {step.name: step for step in profile.steps}
+    assert set(steps) == {
+        'edges.bm25',
+        'edges.cosine_similarity',
+        'edges.reciprocal_rank_fusion',
+        'edges.hydrate',
+    }
+    assert steps['edges.cosine_similarity'].candidates == 1
+    assert steps['edges.reciprocal_rank_fusion'].candidates == 1
+    # Every query is attributed to the step that ran it
+    assert {query.step for query in profile.queries} == {
+        'edges.bm25',
+        'edges.cosine_similarity',
+        'edges.hydrate',
+    }
+    assert all(query.query for query in profile.queries)
+    assert profile.duration_ms >= max(step.duration_ms for step in profile.steps)
+    assert tracer.spans[0] == 'search'
+    assert sorted(tracer.spans[1:]) == sorted(f'search.{name}' for name in steps)
+
+    cache = SearchResultCache()
+    for _ in range(2):
+        results = await search(
+            clients,
+            'Alice',
+            [GROUP_ID],
+            config,
+            SearchFilters(),
+            query_vector=[1.0, 0.0, 0.0],
+            cache=cache,
+            explain=True,
+        )
+    assert results.profile is not None
+    assert results.profile.cache_hit == 'exact'
+    assert results.profile.queries == []
@@ -250,6 +250,38 @@ class TestAnthropicClientGenerateResponse:
         assert mock_async_anthropic.messages.create.call_count == 2
         assert result['test_field'] == 'correct_value'
 
+    @pytest.mark.asyncio
+    async def test_unparseable_text_is_reasked(self, anthropic_client, mock_async_anthropic):
+        """Test that text the client cannot parse as JSON is re-asked with the bad output."""
+        content_item1 = MagicMock()
+        content_item1.type = 'text'
+        content_item1.text = '{"test_field": '
+
+        content_item2 = MagicMock()
+        content_item2.type = 'tool_use'
+        content_item2.input = {'test_field': 'correct_value'}
+
+        mock_response1 = MagicMock()
+        mock_response1.content = [content_item1]
+
+        mock_response2 = MagicMock()
+        mock_response2.content = [content_item2]
+
+        mock_async_anthropic.messages.create.side_effect = [mock_response1, mock_response2]
+
+        messages = [
+            Message(role='system', content='System message'),
+            Message(role='user', content='Test message'),
+        ]
+        result = await anthropic_client.generate_response(messages, response_model=ResponseModel)
+
+        assert mock_async_anthropic.messages.create.call_count == 2
+        assert result['test_field'] == 'correct_value'
+        reask_messages = mock_async_anthropic.messages.create.call_args.kwargs['messages']
+        assert [m['role'] for m in reask_messages] == ['user', 'assistant', 'user']
+        assert reask_messages[1]['content'] == '{"test_field": '
+        assert len(messages) == 2
+
 
 if __name__ == '__main__':
     pytest.main(['-v', 'test_anthropic_client.py'])
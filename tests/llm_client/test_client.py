@@ -14,8 +14,15 @@ See the License for the specific language governing permissions and
 limitations under the License.
 """
 
-from graphiti_core.llm_client.client import LLMClient
+import json
+import time
+
+import pytest
+from pydantic import BaseModel, ValidationError
+
+from graphiti_core.llm_client.client import MAX_STRUCTURED_OUTPUT_REASKS, LLMClient
 from graphiti_core.llm_client.config import LLMConfig
+from graphiti_core.prompts.models import Message
 
 
 class MockLLMClient(LLMClient):
@@ -55,3 +62,66 @@ def test_clean_input():
 
     for input_str, expected in test_cases:
         assert client._clean_input(input_str) == expected, f'Failed for input: {repr(input_str)}'
+
+
+class Answer(BaseModel):
+    answer: str
+
+
+class SequenceLLMClient(LLMClient):
+    """Returns (or raises) the queued outputs in order."""
+
+    def __init__(self, outputs):
+        super().__init__(LLMConfig())
+        self.outputs = list(outputs)
+        self.calls = []
+
+    async def _generate_response(
+        self, messages, response_model=None, max_tokens=None, model_size=None
+    ):
+        self.calls.append([m.content for m in messages])
+        output = self.outputs.pop(0)
+        if isinstance(output, Exception):
+            raise output
+        return output
+
+
+@pytest.mark.asyncio
+async def test_generate_response_reasks_without_backoff_on_invalid_output():
+    client = SequenceLLMClient(
+        [json.JSONDecodeError('Expecting value', '{"answer":', 10), {'wrong': 1}, {'answer': 'ok'}]
+    )
+    messages = [Message(role='system', content='system'), Message(role='user', content='user')]
+
+    start = time.monotonic()
+    response = await client.generate_response(messages, response_model=Answer)
+
+    assert response == {'answer': 'ok'}
+    assert time.monotonic() - start < 1
+    assert len(client.calls) == 3
+    assert 'not valid JSON' in client.calls[1][-1]
+    assert 'did not match the required schema' in client.calls[2][-1]
+
+
+@pytest.mark.asyncio
+async def test_generate_response_raises_after_max_reasks():
+    client = SequenceLLMClient([{'wrong': 1}] * (MAX_STRUCTURED_OUTPUT_REASKS + 1))
+    messages = [Message(role='system', content='system'), Message(role='user', content='user')]
+
+    with pytest.raises(ValidationError):
+        await client.generate_response(messages, response_model=Answer)
+
+    assert len(client.calls) == MAX_STRUCTURED_OUTPUT_REASKS + 1
+
+
+@pytest.mark.asyncio
+async def test_generate_response_reask_shows_rejected_output_without_mutating_messages():
+    client = SequenceLLMClient([{'wrong': 1}, {'answer': 'ok'}])
+    messages = [Message(role='system', content='system'), Message(role='user', content='user')]
+
+    await client.generate_response(messages, response_model=Answer)
+
+    assert len(messages) == 2
+    assert len(client.calls[1]) == 4
+    assert client.calls[1][2] == '{"wrong": 1}'
+    assert 'did not match the required schema' in client.calls[1][3]
@@ -0,0 +1,53 @@
+"""
+Copyright 2024, Zep Software, Inc.
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+import json
+
+import pytest
+
+from graphiti_core.llm_client.json_repair import parse_json_output
+
+
+@pytest.mark.parametrize(
+    'raw_output, expected',
+    [
+        ('{"a": 1}', {'a': 1}),
+        ('```json\n{"a": 1}\n```', {'a': 1}),
+        ('Here is the result:\n{"a": [1, 2]}\nHope this helps!', {'a': [1, 2]}),
+        ('{"a": [1, 2,], "b": {"c": 3,},}', {'a': [1, 2], 'b': {'c': 3}}),
+        ('{"edges": [{"fact": "x"}, {"fact": "y"', {'edges': [{'fact': 'x'}, {'fact': 'y'}]}),
+        (
+            '{"edges": [{"fact": "x"}, {"fact": "unterminated',
+            {'edges': [{'fact': 'x'}, {'fact': 'unterminated'}]},
+        ),
+        ('{"edges": [{"fact": "x"}, {"fact":', {'edges': [{'fact': 'x'}]}),
+        (
+            '{"text": "brackets } ] and, commas", "n": 1',
+            {'text': 'brackets } ] and, commas', 'n': 1},
+        ),
+        ('[{"a": 1}, {"b": tr', [{'a': 1}]),
+    ],
+)
+def test_parse_json_output_repairs(raw_output, expected):
+    assert parse_json_output(raw_output) == expected
+
+
+def test_parse_json_output_raises_when_unrepairable():
+    with pytest.raises(json.JSONDecodeError):
+        parse_json_output('no json here')
+
+    with pytest.raises(json.JSONDecodeError):
+        parse_json_output('{"a":')
@@ -0,0 +1,99 @@
+"""
+Copyright 2024, Zep Software, Inc.
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+import pytest
+from pydantic import BaseModel
+
+from graphiti_core.llm_client.client import LLMClient
+from graphiti_core.llm_client.config import LLMConfig, ModelSize
+from graphiti_core.llm_client.routing import ModelRoutingPolicy
+from graphiti_core.prompts.models import Message
+
+
+def _messages(content: str) -> list[Message]:
+    return [Message(role='system', content='system'), Message(role='user', content=content)]
+
+
+def test_policy_routes_short_prompts_to_small_model():
+    policy = ModelRoutingPolicy(small_model_max_prompt_tokens=100)
+
+    assert policy.route(_messages('short'), ModelSize.medium) == ModelSize.small
+    assert policy.route(_messages('x' * 1000), ModelSize.medium) == ModelSize.medium
+
+
+def test_policy_never_upgrades_small_calls():
+    policy = ModelRoutingPolicy(small_model_max_prompt_tokens=0)
+
+    assert policy.route(_messages('x' * 1000), ModelSize.small) == ModelSize.small
+
+
+def test_policy_prompt_rules():
+    policy = ModelRoutingPolicy(
+        small_model_max_prompt_tokens=100,
+        prompt_rules={'pinned': ModelSize.medium, 'generous': 1000},
+    )
+
+    assert policy.route(_messages('short'), ModelSize.medium, 'pinned') == ModelSize.medium
+    assert policy.route(_messages('x' * 2000), ModelSize.medium, 'generous') == ModelSize.small
+    # JSON episodes keep the medium model by default
+    assert (
+        policy.route(_messages('short'), ModelSize.medium, 'extract_nodes.extract_json')
+        == ModelSize.medium
+    )
+
+
+class Answer(BaseModel):
+    answer: str
+
+
+class SizeRecordingClient(LLMClient):
+    def __init__(self, config: LLMConfig, outputs: list[dict]):
+        super().__init__(config)
+        self.outputs = outputs
+        self.sizes: list[ModelSize] = []
+
+    async def _generate_response(
+        self, messages, response_model=None, max_tokens=None, model_size=ModelSize.medium
+    ):
+        self.sizes.append(model_size)
+        return self.outputs.pop(0)
+
+
+@pytest.mark.asyncio
+async def test_client_falls_back_to_requested_model_on_invalid_output():
+    config = LLMConfig(routing_policy=ModelRoutingPolicy(small_model_max_prompt_tokens=1000))
+    client = SizeRecordingClient(config, [{'wrong': 1}, {'answer': 'ok'}])
+
+    response = await client.generate_response(
+        _messages('hi'), response_model=Answer, prompt_name='test.prompt'
+    )
+
+    assert response == {'answer': 'ok'}
+    assert client.sizes == [ModelSize.small, ModelSize.medium]
+    assert client.routing_metrics.snapshot() == {
+        'routed': {'test.prompt:small': 1},
+        'fallbacks': {'test.prompt': 1},
+    }
+
+
+@pytest.mark.asyncio
+async def test_client_without_policy_keeps_requested_size():
+    client = SizeRecordingClient(LLMConfig(), [{'answer': 'ok'}])
+
+    await client.generate_response(_messages('hi'), response_model=Answer)
+
+    assert client.sizes == [ModelSize.medium]
+    assert client.routing_metrics.snapshot() == {'routed': {}, 'fallbacks': {}}
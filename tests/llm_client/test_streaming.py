@@ -0,0 +1,195 @@
+"""
+Copyright 2024, Zep Software, Inc.
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+import json
+
+import pytest
+
+from graphiti_core.llm_client.client import LLMClient
+from graphiti_core.llm_client.config import LLMConfig
+from graphiti_core.llm_client.errors import StreamInterruptedError
+from graphiti_core.llm_client.routing import ModelRoutingPolicy
+from graphiti_core.llm_client.streaming import IncrementalJSONArrayParser
+from graphiti_core.prompts.extract_edges import ExtractedEdges
+from graphiti_core.prompts.models import Message
+
+EDGES = [
+    {
+        'relation_type': 'WORKS_AT',
+        'source_entity_id': 0,
+        'target_entity_id': 1,
+        'fact': 'Alice works at "Acme" {since 2020}',
+        'valid_at': None,
+        'invalid_at': None,
+    },
+    {
+        'relation_type': 'LIVES_IN',
+        'source_entity_id': 0,
+        'target_entity_id': 2,
+        'fact': 'Alice lives in Paris ] [',
+        'valid_at': '2021-01-01T00:00:00Z',
+        'invalid_at': None,
+    },
+]
+
+
+def _chunks(text: str, size: int) -> list[str]:
+    return [text[i : i + size] for i in range(0, len(text), size)]
+
+
+@pytest.mark.parametrize('chunk_size', [1, 3, 17, 10_000])
+def test_parser_emits_items_across_chunk_boundaries(chunk_size):
+    text = json.dumps({'edges': EDGES})
+    parser = IncrementalJSONArrayParser('edges')
+
+    items = []
+    for chunk in _chunks(text, chunk_size):
+        items.extend(parser.feed(chunk))
+
+    assert items == EDGES
+    assert parser.complete
+
+
+def test_parser_emits_each_item_as_soon_as_it_closes():
+    text = json.dumps({'edges': EDGES})
+    first_end = text.index('}, {') + 1
+    parser = IncrementalJSONArrayParser('edges')
+
+    assert parser.feed(text[:first_end]) == [EDGES[0]]
+    assert not parser.complete
+    assert parser.feed(text[first_end:]) == [EDGES[1]]
+    assert parser.complete
+
+
+def test_parser_ignores_other_fields_and_fences():
+    text = (
+        '```json\n'
+        + json.dumps({'notes': [{'a': 1}], 'label': 'edges', 'edges': EDGES[:1], 'extra': [{}]})
+        + '\n```'
+    )
+    parser = IncrementalJSONArrayParser('edges')
+
+    assert parser.feed(text) == EDGES[:1]
+    assert parser.complete
+
+
+def test_parser_truncated_stream_keeps_completed_items():
+    text = json.dumps({'edges': EDGES})
+    parser = IncrementalJSONArrayParser('edges')
+
+    items = parser.feed(text[: len(text) - 20])
+
+    assert items == [EDGES[0]]
+    assert not parser.complete
+
+
+class StreamingLLMClient(LLMClient):
+    supports_streaming = True
+
+    def __init__(self, chunks: list[str], fail_after: int | None = None):
+        super().__init__(LLMConfig())
+        self.chunks = chunks
+        self.fail_after = fail_after
+        self.full_calls = 0
+
+    async def _generate_response(
+        self, messages, response_model=None, max_tokens=None, model_size=None
+    ):
+        self.full_calls += 1
+        return {'edges': EDGES}
+
+    async def _generate_response_stream(
+        self, messages, response_model, max_tokens=None, model_size=None
+    ):
+        for i, chunk in enumerate(self.chunks):
+            if self.fail_after is not None and i == self.fail_after:
+                raise ConnectionError('stream dropped')
+            yield chunk
+
+
+async def _collect(client: LLMClient) -> list[dict]:
+    messages = [Message(role='system', content='system'), Message(role='user', content='user')]
+    return [
+        item
+        async for item in client.generate_response_stream(
+            messages, response_model=ExtractedEdges, items_field='edges'
+        )
+    ]
+
+
+@pytest.mark.asyncio
+async def test_generate_response_stream_yields_streamed_items():
+    client = StreamingLLMClient(_chunks(json.dumps({'edges': EDGES}), 5))
+
+    assert await _collect(client) == EDGES
+    assert client.full_calls == 0
+
+
+@pytest.mark.asyncio
+async def test_generate_response_stream_falls_back_before_first_item():
+    client = StreamingLLMClient(_chunks(json.dumps({'edges': EDGES}), 5), fail_after=2)
+
+    assert await _collect(client) == EDGES
+    assert client.full_calls == 1
+
+
+@pytest.mark.asyncio
+async def test_generate_response_stream_interrupted_after_partial_stream():
+    text = json.dumps({'edges': EDGES})
+    first_end = text.index('}, {') + 1
+    client = StreamingLLMClient([text[:first_end], text[first_end:]], fail_after=1)
+    items = []
+
+    # The caller already holds the first item, so the stream is not silently regenerated
+    with pytest.raises(StreamInterruptedError):
+        async for item in client.generate_response_stream(
+            [Message(role='system', content='system'), Message(role='user', content='user')],
+            response_model=ExtractedEdges,
+            items_field='edges',
+        ):
+            items.append(item)
+
+    assert items == [EDGES[0]]
+    assert client.full_calls == 0
+
+
+@pytest.mark.asyncio
+async def test_generate_response_stream_interrupted_after_truncated_stream():
+    text = json.dumps({'edges': EDGES})
+    client = StreamingLLMClient([text[: len(text) - 20]])
+
+    with pytest.raises(StreamInterruptedError):
+        await _collect(client)
+    assert client.full_calls == 0
+
+
+@pytest.mark.asyncio
+async def test_generate_response_stream_fallback_is_routed_once():
+    client = StreamingLLMClient(_chunks(json.dumps({'edges': EDGES}), 5), fail_after=0)
+    client.routing_policy = ModelRoutingPolicy()
+
+    assert await _collect(client) == EDGES
+    assert client.full_calls == 1
+    assert client.routing_metrics.snapshot()['routed'] == {'unknown:small': 1}
+
+
+@pytest.mark.asyncio
+async def test_generate_response_stream_without_streaming_support():
+    client = StreamingLLMClient([])
+    client.supports_streaming = False
+
+    assert await _collect(client) == EDGES
+    assert client.full_calls == 1
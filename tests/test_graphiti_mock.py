@@ -1928,6 +1928,44 @@ async def test_node_distance_reranker(graph_driver, mock_embedder):
     assert np.allclose(reranked_scores, [1.0, 0.0])
 
 
+@pytest.mark.asyncio
+async def test_node_distance_reranker_multi_hop(graph_driver, mock_embedder):
+    nodes = []
+    for i in range(1, 5):
+        node = EntityNode(
+            name=f'test_entity_{i}',
+            labels=[],
+            created_at=datetime.now(),
+            group_id=group_id,
+        )
+        await node.generate_name_embedding(mock_embedder)
+        await node.save(graph_driver)
+        nodes.append(node)
+
+    # A chain pointing at the center node, so distances only follow edges backwards
+    for source, target in zip(nodes, nodes[1:], strict=False):
+        edge = EntityEdge(
+            source_node_uuid=source.uuid,
+            target_node_uuid=target.uuid,
+            name='RELATES_TO',
+            fact=f'{source.name} relates to {target.name}',
+            created_at=datetime.now(),
+            group_id=group_id,
+        )
+        await edge.generate_embedding(mock_embedder)
+        await edge.save(graph_driver)
+
+    reranked_uuids, reranked_scores = await node_distance_reranker(
+        graph_driver,
+        [node.uuid for node in nodes[:3]],
+        nodes[3].uuid,
+        max_depth=2,
+    )
+
+    assert reranked_uuids == [node.uuid for node in reversed(nodes[:3])]
+    assert np.allclose(reranked_scores, [1.0, 0.5, 0.0])
+
+
 @pytest.mark.asyncio
 async def test_episode_mentions_reranker(graph_driver, mock_embedder):
     if graph_driver.provider == GraphProvider.FALKORDB:
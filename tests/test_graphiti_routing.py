@@ -0,0 +1,146 @@
+"""
+Copyright 2024, Zep Software, Inc.
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+import asyncio
+from datetime import datetime, timezone
+from unittest.mock import MagicMock
+
+import pytest
+
+import graphiti_core.graphiti as graphiti_module
+from graphiti_core.cross_encoder.client import CrossEncoderClient
+from graphiti_core.driver.driver import GraphDriver, GraphProvider
+from graphiti_core.embedder import EmbedderClient
+from graphiti_core.graphiti import Graphiti
+from graphiti_core.llm_client import LLMClient
+from graphiti_core.nodes import EpisodicNode
+
+
+def _driver(database: str) -> MagicMock:
+    driver = MagicMock(spec=GraphDriver)
+    driver.provider = GraphProvider.FALKORDB
+    driver._database = database
+    return driver
+
+
+@pytest.fixture
+def graphiti():
+    driver = _driver('default_db')
+    clones = {group_id: _driver(group_id) for group_id in ['group_a', 'group_b']}
+    driver.clone.side_effect = lambda database: clones[database]
+    driver.shard_group_ids.side_effect = lambda group_ids: (
+        [(clones[group_id], [group_id]) for group_id in group_ids]
+        if group_ids
+        else [(driver, group_ids)]
+    )
+
+    graphiti = Graphiti(
+        graph_driver=driver,
+        llm_client=MagicMock(spec=LLMClient),
+        embedder=MagicMock(spec=EmbedderClient),
+        cross_encoder=MagicMock(spec=CrossEncoderClient),
+    )
+    return graphiti, clones
+
+
+@pytest.mark.asyncio
+async def test_concurrent_add_episode_writes_to_each_group_database(graphiti, monkeypatch):
+    graphiti, clones = graphiti
+    drivers: dict[str, set] = {'group_a': set(), 'group_b': set()}
+
+    async def retrieve_episodes(driver, reference_time, last_n, group_ids, source):
+        drivers[group_ids[0]].add(driver)
+        return []
+
+    async def extract_nodes(clients, episode, *args):
+        # Let the other episode run in between
+        await asyncio.sleep(0)
+        drivers[episode.group_id].add(clients.driver)
+        return []
+
+    async def resolve_extracted_nodes(clients, nodes, episode, *args):
+        drivers[episode.group_id].add(clients.driver)
+        return [], {}, []
+
+    async def extract_edges_with_candidates(clients, episode, *args):
+        await asyncio.sleep(0)
+        drivers[episode.group_id].add(clients.driver)
+        return [], {}
+
+    async def resolve_extracted_edges(clients, edges, episode, *args):
+        drivers[episode.group_id].add(clients.driver)
+        return [], []
+
+    async def extract_attributes_from_nodes(clients, nodes, episode, *args):
+        drivers[episode.group_id].add(clients.driver)
+        return []
+
+    async def add_nodes_and_edges_bulk(driver, episodes, *args):
+        drivers[episodes[0].group_id].add(driver)
+
+    for function in [
+        retrieve_episodes,
+        extract_nodes,
+        resolve_extracted_nodes,
+        extract_edges_with_candidates,
+        resolve_extracted_edges,
+        extract_attributes_from_nodes,
+        add_nodes_and_edges_bulk,
+    ]:
+        monkeypatch.setattr(graphiti_module, function.__name__, function)
+
+    await asyncio.gather(
+        *[
+            graphiti.add_episode(
+                name=group_id,
+                episode_body='body',
+                source_description='test',
+                reference_time=datetime.now(timezone.utc),
+                group_id=group_id,
+            )
+            for group_id in ['group_a', 'group_b']
+        ]
+    )
+
+    assert drivers == {'group_a': {clones['group_a']}, 'group_b': {clones['group_b']}}
+    # The shared driver is never reassigned
+    assert graphiti.clients.driver is graphiti.driver
+    assert graphiti.driver._database == 'default_db'
+
+
+@pytest.mark.asyncio
+async def test_get_nodes_and_edges_by_episode_routes_by_group(graphiti, monkeypatch):
+    graphiti, clones = graphiti
+    looked_up = []
+
+    async def get_by_uuids(driver, uuids):
+        looked_up.append(driver)
+        return []
+
+    monkeypatch.setattr(EpisodicNode, 'get_by_uuids', get_by_uuids)
+
+    results = await graphiti.get_nodes_and_edges_by_episode(['episode'], group_id='group_b')
+    assert results.edges == [] and results.nodes == []
+    assert looked_up == [clones['group_b']]
+
+    # Without a group, every database the driver routes to is searched
+    looked_up.clear()
+    graphiti.driver.shard_group_ids.side_effect = lambda group_ids: [
+        (graphiti.driver, None),
+        (clones['group_a'], None),
+    ]
+    await graphiti.get_nodes_and_edges_by_episode(['episode'])
+    assert looked_up == [graphiti.driver, clones['group_a']]
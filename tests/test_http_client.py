@@ -0,0 +1,164 @@
+"""
+Copyright 2024, Zep Software, Inc.
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+import importlib.util
+from unittest.mock import AsyncMock, MagicMock
+
+import httpx
+import pytest
+
+from graphiti_core.cross_encoder.client import CrossEncoderClient
+from graphiti_core.driver.driver import GraphDriver
+from graphiti_core.embedder.client import EmbedderClient
+from graphiti_core.graphiti import Graphiti
+from graphiti_core.http_client import (
+    HttpClientConfig,
+    SharedHttpClientFactory,
+    inject_http_client,
+)
+from graphiti_core.llm_client.client import LLMClient
+
+
+@pytest.mark.asyncio
+async def test_factory_shares_a_single_client():
+    factory = SharedHttpClientFactory(HttpClientConfig(max_connections=7))
+
+    client = factory.client
+    assert factory.client is client
+
+    await factory.close()
+    assert factory.client is not client
+    await factory.close()
+
+
+@pytest.mark.asyncio
+async def test_pool_stats_counts_requests():
+    factory = SharedHttpClientFactory(HttpClientConfig(max_connections=7))
+    factory.client._transport = httpx.MockTransport(lambda request: httpx.Response(200))
+
+    await factory.client.get('https://example.com/a')
+    await factory.client.get('https://example.com/b')
+
+    stats = factory.pool_stats()
+    assert stats['requests'] == 2
+    assert stats['max_connections'] == 7
+    await factory.close()
+
+
+@pytest.mark.skipif(importlib.util.find_spec('h2') is not None, reason='h2 is installed')
+def test_http2_requires_h2():
+    factory = SharedHttpClientFactory(HttpClientConfig(http2=True))
+
+    with pytest.raises(ImportError, match='h2 is required'):
+        _ = factory.client
+
+
+class FakeSDKClient:
+    def __init__(self, http_client=None):
+        self.http_client = http_client
+        self.closed = False
+
+    def with_options(self, http_client=None):
+        return FakeSDKClient(http_client)
+
+    async def close(self):
+        self.closed = True
+
+
+class FakeProviderClient:
+    def __init__(self, client):
+        self.client = client
+
+
+def test_inject_http_client_rewires_sdk_client():
+    http_client = httpx.AsyncClient()
+    provider = FakeProviderClient(FakeSDKClient())
+
+    assert inject_http_client(provider, http_client)
+    assert provider.client.http_client is http_client
+
+
+def test_inject_http_client_skips_unsupported_clients(caplog):
+    http_client = httpx.AsyncClient()
+    sdk_client = object()
+    provider = FakeProviderClient(sdk_client)
+
+    assert not inject_http_client(provider, http_client)
+    assert provider.client is sdk_client
+    assert 'does not support a shared http client' in caplog.text
+    assert caplog.records[-1].levelname == 'WARNING'
+
+
+def test_inject_http_client_rebuilds_genai_client():
+    genai = pytest.importorskip('google.genai')
+    http_client = httpx.AsyncClient()
+    sdk_client = genai.Client(api_key='key')
+    provider = FakeProviderClient(sdk_client)
+
+    assert inject_http_client(provider, http_client)
+    assert provider.client is not sdk_client
+    api_client = provider.client._api_client
+    assert api_client._async_httpx_client is http_client
+    assert api_client.api_key == 'key'
+    assert api_client._http_options.base_url == sdk_client._api_client._http_options.base_url
+
+
+@pytest.mark.asyncio
+async def test_factory_closes_replaced_clients_and_reinjects_after_close():
+    factory = SharedHttpClientFactory()
+    sdk_client = FakeSDKClient()
+    provider = FakeProviderClient(sdk_client)
+
+    assert factory.inject(provider)
+    shared = factory.client
+    assert provider.client.http_client is shared
+
+    await factory.close()
+
+    # The replaced client's own pool is closed, and the provider moves to a new shared client
+    assert sdk_client.closed
+    assert shared.is_closed
+    assert provider.client.http_client is factory.client
+    assert not factory.client.is_closed
+    await factory.close()
+
+
+def test_pool_stats_tolerates_unexpected_pool_state():
+    factory = SharedHttpClientFactory()
+    factory.client._transport._pool = object()
+
+    stats = factory.pool_stats()
+    assert stats['connections'] == 0
+    assert stats['idle_connections'] == 0
+
+
+@pytest.mark.asyncio
+async def test_graphiti_close_closes_the_shared_client():
+    factory = SharedHttpClientFactory()
+    client = factory.client
+    driver = MagicMock(spec=GraphDriver)
+    driver.close = AsyncMock()
+    graphiti = Graphiti(
+        graph_driver=driver,
+        llm_client=MagicMock(spec=LLMClient),
+        embedder=MagicMock(spec=EmbedderClient),
+        cross_encoder=MagicMock(spec=CrossEncoderClient),
+        http_client_factory=factory,
+    )
+
+    await graphiti.close()
+
+    assert client.is_closed
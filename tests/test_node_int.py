@@ -19,6 +19,9 @@ from uuid import uuid4
 
 import pytest
 
+from graphiti_core.driver.driver import GraphProvider
+from graphiti_core.edges import EpisodicEdge
+from graphiti_core.models.nodes.node_db_queries import ENTITY_NODE_STATISTICS_UPDATE
 from graphiti_core.nodes import (
     CommunityNode,
     EntityNode,
@@ -133,6 +136,50 @@ async def test_entity_node(sample_entity_node, graph_driver):
     await graph_driver.close()
 
 
+@pytest.mark.asyncio
+async def test_entity_node_save_keeps_statistics(sample_entity_node, graph_driver):
+    if graph_driver.provider == GraphProvider.KUZU:
+        pytest.skip('Kuzu does not store entity statistics')
+
+    episode = EpisodicNode(
+        name='Episode',
+        group_id=group_id,
+        created_at=created_at,
+        source=EpisodeType.text,
+        source_description='Test source',
+        content='Some content here',
+        valid_at=valid_at,
+    )
+    await sample_entity_node.save(graph_driver)
+    await episode.save(graph_driver)
+    await EpisodicEdge(
+        source_node_uuid=episode.uuid,
+        target_node_uuid=sample_entity_node.uuid,
+        group_id=group_id,
+        created_at=created_at,
+    ).save(graph_driver)
+    await graph_driver.execute_query(ENTITY_NODE_STATISTICS_UPDATE, uuids=[sample_entity_node.uuid])
+
+    # Saving the entity again replaces its properties but keeps the stored statistics
+    sample_entity_node.summary = 'Updated summary'
+    await sample_entity_node.save(graph_driver)
+
+    records, _, _ = await graph_driver.execute_query(
+        """
+        MATCH (n:Entity {uuid: $uuid})
+        RETURN n.summary AS summary, n.mention_count AS mention_count, n.degree AS degree
+        """,
+        uuid=sample_entity_node.uuid,
+    )
+    assert records[0]['summary'] == 'Updated summary'
+    assert records[0]['mention_count'] == 1
+    assert records[0]['degree'] == 0
+
+    await episode.delete(graph_driver)
+    await sample_entity_node.delete(graph_driver)
+    await graph_driver.close()
+
+
 @pytest.mark.asyncio
 async def test_community_node(sample_community_node, graph_driver):
     uuid = sample_community_node.uuid
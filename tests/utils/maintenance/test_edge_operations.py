@@ -1,3 +1,4 @@
+import asyncio
 from datetime import datetime, timedelta, timezone
 from types import SimpleNamespace
 from unittest.mock import AsyncMock, MagicMock
@@ -6,6 +7,7 @@ import pytest
 from pydantic import BaseModel
 
 from graphiti_core.edges import EntityEdge
+from graphiti_core.llm_client.errors import StreamInterruptedError
 from graphiti_core.nodes import EntityNode, EpisodicNode
 from graphiti_core.search.search_config import SearchResults
 from graphiti_core.utils.maintenance.edge_operations import (
@@ -236,6 +238,166 @@ async def test_resolve_extracted_edges_resets_unmapped_names(monkeypatch):
     assert invalidated_edges == []
 
 
+@pytest.mark.asyncio
+async def test_resolve_extracted_edges_uses_prefetched_candidates(monkeypatch):
+    from graphiti_core.utils.maintenance import edge_operations as edge_ops
+
+    create_embeddings = AsyncMock(return_value=None)
+    monkeypatch.setattr(edge_ops, 'create_entity_edge_embeddings', create_embeddings)
+    get_between_nodes = AsyncMock(return_value=[])
+    monkeypatch.setattr(EntityEdge, 'get_between_nodes', get_between_nodes)
+
+    async def immediate_gather(*aws, max_coroutines=None):
+        return [await aw for aw in aws]
+
+    monkeypatch.setattr(edge_ops, 'semaphore_gather', immediate_gather)
+    search_mock = AsyncMock(return_value=SearchResults())
+    monkeypatch.setattr(edge_ops, 'search', search_mock)
+
+    resolve_mock = AsyncMock(side_effect=lambda llm, edge, related, existing, *args: (edge, [], []))
+    monkeypatch.setattr(edge_ops, 'resolve_extracted_edge', resolve_mock)
+
+    clients = SimpleNamespace(
+        driver=MagicMock(),
+        llm_client=MagicMock(),
+        embedder=MagicMock(),
+        cross_encoder=MagicMock(),
+    )
+
+    def make_edge(fact: str) -> EntityEdge:
+        return EntityEdge(
+            source_node_uuid='source_uuid',
+            target_node_uuid='target_uuid',
+            name='RELATES_TO',
+            group_id='group_1',
+            fact=fact,
+            episodes=[],
+            created_at=datetime.now(timezone.utc),
+        )
+
+    prefetched_edge = make_edge('Prefetched fact')
+    pending_edge = make_edge('Pending fact')
+    related_edge = make_edge('Related fact')
+    candidate_edge = make_edge('Candidate fact')
+
+    episode = EpisodicNode(
+        uuid='episode_uuid',
+        name='Episode',
+        group_id='group_1',
+        source='message',
+        source_description='desc',
+        content='Episode content',
+        valid_at=datetime.now(timezone.utc),
+    )
+
+    await resolve_extracted_edges(
+        clients,
+        [prefetched_edge, pending_edge],
+        episode,
+        [],
+        {},
+        {},
+        {prefetched_edge.uuid: ([related_edge], [candidate_edge])},
+    )
+
+    # Only the edge without prefetched candidates is looked up
+    get_between_nodes.assert_awaited_once()
+    assert search_mock.await_count == 2
+    assert all(call.args[1] == 'Pending fact' for call in search_mock.await_args_list)
+    assert create_embeddings.await_args_list[0].args[1] == [pending_edge]
+
+    prefetched_call = resolve_mock.await_args_list[0]
+    assert prefetched_call.args[2] == [related_edge]
+    assert prefetched_call.args[3] == [candidate_edge]
+
+
+@pytest.mark.asyncio
+async def test_extract_edges_with_candidates_batches_embeddings(monkeypatch):
+    from graphiti_core.utils.maintenance import edge_operations as edge_ops
+
+    def make_edge(fact: str) -> EntityEdge:
+        return EntityEdge(
+            source_node_uuid='source_uuid',
+            target_node_uuid='target_uuid',
+            name='RELATES_TO',
+            group_id='group_1',
+            fact=fact,
+            episodes=[],
+            created_at=datetime.now(timezone.utc),
+        )
+
+    streamed_edges = [make_edge('Fact 1'), make_edge('Fact 2'), make_edge('Fact 3')]
+
+    async def fake_stream(*args, **kwargs):
+        for edge in streamed_edges:
+            yield edge
+
+    monkeypatch.setattr(edge_ops, 'extract_edges_stream', fake_stream)
+    monkeypatch.setattr(
+        edge_ops, 'fetch_edge_resolution_candidates', AsyncMock(return_value=([], []))
+    )
+
+    batches = []
+
+    async def create_batch(facts):
+        batches.append(facts)
+        await asyncio.sleep(0)
+        return [[0.1] for _ in facts]
+
+    clients = SimpleNamespace(embedder=SimpleNamespace(create_batch=create_batch))
+
+    edges, candidates = await edge_ops.extract_edges_with_candidates(
+        clients, MagicMock(), [], [], {}, {}
+    )
+
+    # Edges that arrive while a batch is being embedded are embedded together
+    assert batches == [['Fact 1'], ['Fact 2', 'Fact 3']]
+    assert all(edge.fact_embedding == [0.1] for edge in edges)
+    assert set(candidates) == {edge.uuid for edge in streamed_edges}
+
+
+@pytest.mark.asyncio
+async def test_extract_edges_with_candidates_restarts_after_interrupted_stream(monkeypatch):
+    from graphiti_core.utils.maintenance import edge_operations as edge_ops
+
+    def make_edge(fact: str) -> EntityEdge:
+        return EntityEdge(
+            source_node_uuid='extracted_uuid',
+            target_node_uuid='target_uuid',
+            name='RELATES_TO',
+            group_id='group_1',
+            fact=fact,
+            episodes=[],
+            created_at=datetime.now(timezone.utc),
+        )
+
+    streamed_edge = make_edge('Alice works at Acme')
+    full_edges = [make_edge('Alice is employed by Acme'), make_edge('Alice lives in Paris')]
+
+    async def broken_stream(*args, **kwargs):
+        yield streamed_edge
+        raise StreamInterruptedError('Streaming generation failed after 1 items')
+
+    monkeypatch.setattr(edge_ops, 'extract_edges_stream', broken_stream)
+    monkeypatch.setattr(edge_ops, 'extract_edges', AsyncMock(return_value=full_edges))
+    fetch_candidates = AsyncMock(return_value=([], []))
+    monkeypatch.setattr(edge_ops, 'fetch_edge_resolution_candidates', fetch_candidates)
+
+    async def create_batch(facts):
+        return [[0.1] for _ in facts]
+
+    clients = SimpleNamespace(embedder=SimpleNamespace(create_batch=create_batch))
+
+    edges, candidates = await edge_ops.extract_edges_with_candidates(
+        clients, MagicMock(), [], [], {}, {'extracted_uuid': 'resolved_uuid'}
+    )
+
+    # Only the full response is kept, so the reworded streamed fact is not saved twice
+    assert edges == full_edges
+    assert all(edge.source_node_uuid == 'resolved_uuid' for edge in edges)
+    assert candidates == {}
+
+
 @pytest.mark.asyncio
 async def test_resolve_extracted_edges_keeps_unknown_names(monkeypatch):
     from graphiti_core.utils.maintenance import edge_operations as edge_ops
@@ -0,0 +1,116 @@
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from graphiti_core.driver.driver import GraphProvider
+from graphiti_core.search import adjacency_cache
+from graphiti_core.search.adjacency_cache import AdjacencyCache, GroupAdjacency
+
+EDGES = [
+    ('ab', 'a', 'b'),
+    ('bc', 'b', 'c'),
+    ('cd', 'c', 'd'),
+    ('ea', 'e', 'a'),
+]
+
+
+def _group(edges=EDGES) -> GroupAdjacency:
+    group = GroupAdjacency()
+    for edge in edges:
+        group.add_edge(*edge)
+    group.build()
+    return group
+
+
+def test_bfs_follows_outgoing_edges_by_depth():
+    group = _group()
+
+    assert group.bfs(['a'], 1) == (['b'], ['ab'])
+    assert group.bfs(['a'], 2) == (['b', 'c'], ['ab', 'bc'])
+    assert group.bfs(['a', 'e'], 3) == (['b', 'a', 'c', 'd'], ['ab', 'ea', 'bc', 'cd'])
+    assert group.bfs(['d'], 3) == ([], [])
+    assert group.neighbors('a') == {'b', 'e'}
+    assert group.distances('b', 2) == {'b': 0, 'a': 1, 'c': 1, 'd': 2, 'e': 2}
+    assert group.distances('d', 1) == {'d': 0, 'c': 1}
+
+
+def test_updates_between_rebuilds(monkeypatch):
+    monkeypatch.setattr(adjacency_cache, 'ADJACENCY_REBUILD_MIN_EDGES', 2)
+    group = _group()
+
+    group.add_edge('df', 'd', 'f')
+    assert group.built_edges == 4
+    assert group.bfs(['c'], 2) == (['d', 'f'], ['cd', 'df'])
+
+    group.add_edge('fa', 'f', 'a')
+    assert group.built_edges == 6
+    assert group.bfs(['d'], 2) == (['f', 'a'], ['df', 'fa'])
+
+    group.remove('bc')
+    assert group.bfs(['a'], 3) == (['b'], ['ab'])
+
+    group.remove('a')
+    assert 'a' not in group
+    assert group.neighbors('b') == set()
+    assert group.bfs(['e'], 3) == ([], [])
+
+
+def _driver(edges=EDGES):
+    async def execute_query(query, **kwargs):
+        if 'RETURN DISTINCT n.group_id' in query:
+            known = {uuid for edge in edges for uuid in edge[1:]}
+            return [{'group_id': 'group'}] if known & set(kwargs['uuids']) else [], None, None
+        if 'RETURN n.uuid AS uuid' in query:
+            return [{'uuid': uuid} for uuid in ['a', 'b', 'c', 'd', 'e']], None, None
+        return (
+            [
+                {'uuid': uuid, 'source_node_uuid': source, 'target_node_uuid': target}
+                for uuid, source, target in edges
+            ],
+            None,
+            None,
+        )
+
+    driver = MagicMock()
+    driver.provider = GraphProvider.NEO4J
+    driver._database = 'neo4j'
+    driver.execute_query = AsyncMock(side_effect=execute_query)
+    return driver
+
+
+@pytest.mark.asyncio
+async def test_cache_loads_group_once_and_falls_back_for_unknown_origins():
+    driver = _driver()
+    cache = AdjacencyCache()
+
+    assert await cache.bfs(driver, ['a'], 2) == (['b', 'c'], ['ab', 'bc'])
+    assert await cache.distances(driver, 'c', 1) == {'c': 0, 'b': 1, 'd': 1}
+    # One group lookup and two load queries, only for the first search
+    assert driver.execute_query.await_count == 3
+
+    assert await cache.bfs(driver, ['a', 'episode'], 2) is None
+    assert await cache.distances(driver, 'episode', 1) is None
+
+
+@pytest.mark.asyncio
+async def test_cache_follows_writes_to_loaded_groups():
+    driver = _driver()
+    cache = AdjacencyCache()
+    await cache.bfs(driver, ['a'], 1)
+
+    cache.add_edges(
+        driver,
+        [SimpleNamespace(uuid='dx', group_id='group', source_node_uuid='d', target_node_uuid='x')],
+    )
+    cache.add_nodes(driver, [SimpleNamespace(uuid='y', group_id='group')])
+    cache.remove(driver, ['b'])
+
+    assert await cache.bfs(driver, ['c'], 2) == (['d', 'x'], ['cd', 'dx'])
+    assert await cache.bfs(driver, ['a'], 2) == ([], [])
+    assert await cache.distances(driver, 'y', 3) == {'y': 0}
+
+    cache.remove_group(driver, 'group')
+    driver.execute_query.reset_mock()
+    await cache.bfs(driver, ['a'], 1)
+    assert driver.execute_query.await_count == 3
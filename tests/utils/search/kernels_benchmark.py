@@ -0,0 +1,91 @@
+"""
+Benchmark the vectorized rerank kernels against the previous pure-Python implementations.
+
+Run with: python -m tests.utils.search.kernels_benchmark
+"""
+
+from collections import defaultdict
+from time import perf_counter
+
+import numpy as np
+
+from graphiti_core.helpers import normalize_l2
+from graphiti_core.search import kernels
+from graphiti_core.search.search_utils import calculate_cosine_similarity
+
+EMBEDDING_DIM = 1024
+CANDIDATE_COUNTS = [100, 1_000, 10_000]
+MMR_LIMIT = 10
+# The quadratic loop MMR is too slow to time at 10k candidates
+LOOP_MMR_MAX_CANDIDATES = 1_000
+
+
+def loop_mmr(query_vector, candidates, mmr_lambda=0.5):
+    candidate_arrays = {uuid: normalize_l2(embedding) for uuid, embedding in candidates.items()}
+    uuids = list(candidate_arrays)
+    similarity_matrix = np.zeros((len(uuids), len(uuids)))
+    for i, uuid_1 in enumerate(uuids):
+        for j, uuid_2 in enumerate(uuids[:i]):
+            similarity = np.dot(candidate_arrays[uuid_1], candidate_arrays[uuid_2])
+            similarity_matrix[i, j] = similarity
+            similarity_matrix[j, i] = similarity
+
+    query_array = np.array(query_vector)
+    scores = {
+        uuid: mmr_lambda * np.dot(query_array, candidate_arrays[uuid])
+        + (mmr_lambda - 1) * np.max(similarity_matrix[i, :])
+        for i, uuid in enumerate(uuids)
+    }
+    return sorted(uuids, key=lambda uuid: scores[uuid], reverse=True)
+
+
+def loop_cosine(query_vector, embeddings):
+    return [calculate_cosine_similarity(query_vector, embedding) for embedding in embeddings]
+
+
+def loop_rrf(results, rank_const=1):
+    scores: dict[str, float] = defaultdict(float)
+    for result in results:
+        for i, uuid in enumerate(result):
+            scores[uuid] += 1 / (i + rank_const)
+    return sorted(scores, key=lambda uuid: scores[uuid], reverse=True)
+
+
+def timed(fn, *args) -> float:
+    start = perf_counter()
+    fn(*args)
+    return (perf_counter() - start) * 1000
+
+
+def main():
+    rng = np.random.default_rng(0)
+    print(f'{"kernel":<14}{"candidates":>12}{"before (ms)":>14}{"after (ms)":>14}{"speedup":>10}')
+
+    for count in CANDIDATE_COUNTS:
+        embeddings = rng.normal(size=(count, EMBEDDING_DIM)).astype(np.float32)
+        query = rng.normal(size=EMBEDDING_DIM).astype(np.float32).tolist()
+        embedding_lists = embeddings.tolist()
+        candidates = {str(i): embedding for i, embedding in enumerate(embedding_lists)}
+        rankings = [rng.permutation(count).astype(str).tolist() for _ in range(3)]
+
+        rows = [
+            (
+                'cosine',
+                timed(loop_cosine, query, embedding_lists),
+                timed(kernels.top_k_cosine, query, embedding_lists, MMR_LIMIT),
+            ),
+            (
+                'mmr',
+                timed(loop_mmr, query, candidates)
+                if count <= LOOP_MMR_MAX_CANDIDATES
+                else float('nan'),
+                timed(kernels.greedy_mmr, query, embedding_lists, 0.5, MMR_LIMIT),
+            ),
+            ('rrf', timed(loop_rrf, rankings), timed(kernels.rrf, rankings)),
+        ]
+        for name, before, after in rows:
+            print(f'{name:<14}{count:>12}{before:>14.2f}{after:>14.2f}{before / after:>9.1f}x')
+
+
+if __name__ == '__main__':
+    main()
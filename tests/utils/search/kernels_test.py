@@ -0,0 +1,127 @@
+from collections import defaultdict
+
+import numpy as np
+import pytest
+
+from graphiti_core.search import kernels
+from graphiti_core.search.search_utils import maximal_marginal_relevance, rrf
+
+
+def _reference_rrf(results: list[list[str]], rank_const=1, min_score: float = 0):
+    scores: dict[str, float] = defaultdict(float)
+    for result in results:
+        for i, uuid in enumerate(result):
+            scores[uuid] += 1 / (i + rank_const)
+
+    sorted_uuids = sorted(scores, key=lambda uuid: scores[uuid], reverse=True)
+    return [uuid for uuid in sorted_uuids if scores[uuid] >= min_score], [
+        scores[uuid] for uuid in sorted_uuids if scores[uuid] >= min_score
+    ]
+
+
+def _reference_greedy_mmr(query, candidates, mmr_lambda, k):
+    query = query / np.linalg.norm(query)
+    candidates = candidates / np.linalg.norm(candidates, axis=1, keepdims=True)
+    selected: list[int] = []
+    while len(selected) < k:
+        best, best_score = -1, -np.inf
+        for i in range(len(candidates)):
+            if i in selected:
+                continue
+            redundancy = max((candidates[i] @ candidates[j] for j in selected), default=0.0)
+            score = mmr_lambda * (query @ candidates[i]) - (1 - mmr_lambda) * redundancy
+            if score > best_score:
+                best, best_score = i, score
+        selected.append(best)
+    return selected
+
+
+@pytest.mark.parametrize(
+    'rankings',
+    [
+        [['a', 'b', 'c'], ['c', 'b', 'd']],
+        [['a', 'b'], ['b', 'a']],
+        [[], ['x']],
+        [],
+    ],
+)
+def test_rrf_matches_reference(rankings):
+    uuids, scores = rrf(rankings)
+    expected_uuids, expected_scores = _reference_rrf(rankings)
+
+    assert uuids == expected_uuids
+    assert scores == pytest.approx(expected_scores)
+    assert rrf(rankings, min_score=1) == _reference_rrf(rankings, min_score=1)
+
+
+def test_top_k_cosine_returns_best_candidates_in_order():
+    rng = np.random.default_rng(0)
+    candidates = rng.normal(size=(500, 32))
+    query = rng.normal(size=32)
+
+    indices, scores = kernels.top_k_cosine(query, candidates, 10)
+
+    expected = kernels.cosine_similarities(query, candidates)
+    assert indices.tolist() == np.argsort(-expected)[:10].tolist()
+    assert scores == pytest.approx(np.sort(expected)[::-1][:10], abs=1e-6)
+
+
+def test_cosine_similarities_handle_zero_vectors():
+    scores = kernels.cosine_similarities([1.0, 0.0], [[0.0, 0.0], [2.0, 0.0]])
+
+    assert scores.tolist() == [0.0, 1.0]
+
+
+@pytest.mark.parametrize('full_matrix_max', [kernels.MMR_FULL_MATRIX_MAX_CANDIDATES, 0])
+def test_greedy_mmr_matches_reference(monkeypatch, full_matrix_max):
+    monkeypatch.setattr(kernels, 'MMR_FULL_MATRIX_MAX_CANDIDATES', full_matrix_max)
+    rng = np.random.default_rng(1)
+    candidates = rng.normal(size=(60, 16))
+    query = rng.normal(size=16)
+
+    selected, scores = kernels.greedy_mmr(query, candidates, 0.5, k=15)
+
+    assert selected.tolist() == _reference_greedy_mmr(query, candidates, 0.5, 15)
+    assert len(scores) == 15
+
+
+def test_mmr_prefers_diverse_candidates():
+    candidates = {
+        'relevant': [1.0, 0.0, 0.0],
+        'duplicate': [0.99, 0.05, 0.0],
+        'diverse': [0.6, 0.0, 0.8],
+    }
+
+    uuids, scores = maximal_marginal_relevance([1.0, 0.0, 0.2], candidates, mmr_lambda=0.5)
+
+    assert uuids == ['relevant', 'diverse', 'duplicate']
+    assert scores == sorted(scores, reverse=True)
+    assert maximal_marginal_relevance([1.0, 0.0, 0.0], candidates, limit=1)[0] == ['relevant']
+    assert maximal_marginal_relevance([1.0, 0.0, 0.0], {}) == ([], [])
+
+
+def test_quantized_similarities_approximate_dot_products():
+    rng = np.random.default_rng(3)
+    candidates = kernels.normalize_rows(rng.normal(size=(200, 64)))
+    query = kernels.normalize_rows(rng.normal(size=64))[0]
+    exact = candidates @ query
+
+    codes, scales = kernels.quantize_int8(candidates)
+    assert codes.dtype == np.int8
+    np.testing.assert_allclose(kernels.int8_similarities(query, codes, scales), exact, atol=0.02)
+
+    bits = kernels.pack_signs(candidates)
+    assert bits.shape == (200, 8)
+    approximate = kernels.hamming_similarities(query, bits)
+    assert np.corrcoef(approximate, exact)[0, 1] > 0.5
+
+
+def test_pagerank_ranks_linked_nodes_higher():
+    # 1 and 2 both link to 0, 3 links nowhere
+    ranks = kernels.pagerank([1, 2, 0], [0, 0, 1], 4)
+
+    assert ranks.sum() == pytest.approx(1.0)
+    assert np.argmax(ranks) == 0
+    assert ranks[1] > ranks[2]
+    assert ranks[2] == pytest.approx(ranks[3])
+    assert kernels.pagerank([], [], 0).shape == (0,)
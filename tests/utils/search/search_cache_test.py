@@ -0,0 +1,191 @@
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from graphiti_core.edges import EntityEdge
+from graphiti_core.graphiti_types import GraphitiClients
+from graphiti_core.search.search import search
+from graphiti_core.search.search_cache import SearchResultCache, SemanticQueryCache
+from graphiti_core.search.search_config import SearchResults
+from graphiti_core.search.search_config_recipes import EDGE_HYBRID_SEARCH_RRF
+from graphiti_core.search.search_filters import SearchFilters
+from graphiti_core.utils.datetime_utils import utc_now
+
+
+def _make_edge(fact: str = 'Alice likes tea') -> EntityEdge:
+    return EntityEdge(
+        source_node_uuid='source',
+        target_node_uuid='target',
+        name='LIKES',
+        fact=fact,
+        group_id='group',
+        created_at=utc_now(),
+    )
+
+
+def _key(cache: SearchResultCache, query: str, group_ids: list[str] | None = None):
+    return cache.make_key(query, group_ids, EDGE_HYBRID_SEARCH_RRF, SearchFilters())
+
+
+def test_key_normalizes_query_and_group_order():
+    cache = SearchResultCache()
+
+    assert _key(cache, 'What does  Alice like?', ['b', 'a']) == _key(
+        cache, 'what does alice like? ', ['a', 'b']
+    )
+    assert _key(cache, 'alice', ['a']) != _key(cache, 'alice', ['b'])
+    assert cache.make_key(
+        'alice', ['a'], EDGE_HYBRID_SEARCH_RRF, SearchFilters(node_labels=['Person'])
+    ) != _key(cache, 'alice', ['a'])
+
+
+def test_write_epoch_invalidates_only_written_group():
+    cache = SearchResultCache()
+    results = SearchResults(edges=[_make_edge()])
+    cache.put(_key(cache, 'alice', ['a']), results)
+    cache.put(_key(cache, 'alice', ['b']), results)
+
+    cache.invalidate(['a'])
+
+    assert cache.get(_key(cache, 'alice', ['a'])) is None
+    assert cache.get(_key(cache, 'alice', ['b'])) is not None
+
+
+def test_unscoped_write_invalidates_every_group():
+    cache = SearchResultCache()
+    cache.put(_key(cache, 'alice', ['a']), SearchResults())
+    cache.put(_key(cache, 'alice'), SearchResults())
+
+    cache.invalidate(None)
+
+    assert cache.get(_key(cache, 'alice', ['a'])) is None
+    assert cache.get(_key(cache, 'alice')) is None
+
+
+def test_lru_eviction_and_metrics():
+    cache = SearchResultCache(max_entries=2)
+    for query in ['one', 'two']:
+        cache.put(_key(cache, query), SearchResults())
+
+    assert cache.get(_key(cache, 'one')) is not None
+    cache.put(_key(cache, 'three'), SearchResults())
+
+    assert cache.get(_key(cache, 'two')) is None
+    assert cache.get(_key(cache, 'one')) is not None
+    assert cache.stats() == {
+        'hits': 2,
+        'misses': 1,
+        'evictions': 1,
+        'hit_rate': 2 / 3,
+        'size': 2,
+    }
+
+
+def test_cached_results_are_isolated_from_callers():
+    cache = SearchResultCache()
+    key = _key(cache, 'alice')
+    cache.put(key, SearchResults(edges=[_make_edge()]))
+
+    first = cache.get(key)
+    assert first is not None
+    first.edges[0].fact = 'mutated'
+
+    second = cache.get(key)
+    assert second is not None
+    assert second.edges[0].fact == 'Alice likes tea'
+
+
+@pytest.mark.asyncio
+async def test_search_skips_backends_on_cache_hit():
+    embedder = MagicMock()
+    embedder.create = AsyncMock(return_value=[0.1, 0.2, 0.3])
+    clients = GraphitiClients.model_construct(  # bypass validation to allow test doubles
+        driver=MagicMock(_database='db'),
+        embedder=embedder,
+        cross_encoder=MagicMock(),
+        llm_client=MagicMock(),
+    )
+    cache = SearchResultCache()
+    edge = _make_edge()
+
+    with patch(
+        'graphiti_core.search.search.edge_search', AsyncMock(return_value=([edge], [1.0]))
+    ) as mock_edge_search:
+        for query in ['Alice likes', 'alice  likes']:
+            results = await search(
+                clients,
+                query,
+                ['group'],
+                EDGE_HYBRID_SEARCH_RRF,
+                SearchFilters(),
+                cache=cache,
+            )
+            assert [e.uuid for e in results.edges] == [edge.uuid]
+
+        assert mock_edge_search.await_count == 1
+        assert embedder.create.await_count == 1
+
+        cache.invalidate(['group'])
+        await search(
+            clients, 'Alice likes', ['group'], EDGE_HYBRID_SEARCH_RRF, SearchFilters(), cache=cache
+        )
+
+        assert mock_edge_search.await_count == 2
+
+
+def test_semantic_cache_matches_similar_queries_in_scope():
+    semantic_cache = SemanticQueryCache(similarity_threshold=0.95, max_queries_per_scope=2)
+    results = SearchResults(edges=[_make_edge()])
+    semantic_cache.put('scope', [1.0, 0.0, 0.0], results)
+
+    hit = semantic_cache.get('scope', [0.99, 0.05, 0.0])
+    assert hit is not None
+    assert hit.edges[0].uuid == results.edges[0].uuid
+
+    assert semantic_cache.get('scope', [0.0, 1.0, 0.0]) is None
+    assert semantic_cache.get('other-scope', [1.0, 0.0, 0.0]) is None
+    assert semantic_cache.metrics.snapshot()['hit_rate'] == 1 / 3
+
+
+def test_semantic_cache_replaces_oldest_query_when_full():
+    semantic_cache = SemanticQueryCache(max_queries_per_scope=2)
+    for vector in ([1.0, 0.0, 0.0], [0.0, 1.0, 0.0], [0.0, 0.0, 1.0]):
+        semantic_cache.put('scope', vector, SearchResults())
+
+    assert semantic_cache.get('scope', [1.0, 0.0, 0.0]) is None
+    assert semantic_cache.get('scope', [0.0, 0.0, 1.0]) is not None
+
+
+@pytest.mark.asyncio
+async def test_search_serves_near_duplicate_queries_until_group_is_written():
+    vectors = {
+        'what does alice like': [1.0, 0.0, 0.0],
+        "alice's preferences": [0.98, 0.1, 0.0],
+    }
+    embedder = MagicMock()
+    embedder.create = AsyncMock(side_effect=lambda input_data: vectors[input_data[0]])
+    clients = GraphitiClients.model_construct(  # bypass validation to allow test doubles
+        driver=MagicMock(_database='db'),
+        embedder=embedder,
+        cross_encoder=MagicMock(),
+        llm_client=MagicMock(),
+    )
+    cache = SearchResultCache(semantic_cache=SemanticQueryCache(similarity_threshold=0.95))
+
+    async def run(query: str) -> SearchResults:
+        return await search(
+            clients, query, ['group'], EDGE_HYBRID_SEARCH_RRF, SearchFilters(), cache=cache
+        )
+
+    with patch(
+        'graphiti_core.search.search.edge_search',
+        AsyncMock(return_value=([_make_edge()], [1.0])),
+    ) as mock_edge_search:
+        await run('what does alice like')
+        await run("alice's preferences")
+        assert mock_edge_search.await_count == 1
+        assert cache.stats()['semantic']['hits'] == 1
+
+        cache.invalidate(['group'])
+        await run("alice's preferences")
+        assert mock_edge_search.await_count == 2
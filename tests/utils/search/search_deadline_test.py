@@ -0,0 +1,162 @@
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from graphiti_core.edges import EntityEdge
+from graphiti_core.graphiti_types import GraphitiClients
+from graphiti_core.search.search import search
+from graphiti_core.search.search_cache import SearchResultCache
+from graphiti_core.search.search_config import (
+    EdgeReranker,
+    EdgeSearchConfig,
+    EdgeSearchMethod,
+    SearchConfig,
+    SearchResults,
+)
+from graphiti_core.search.search_filters import SearchFilters
+from graphiti_core.utils.datetime_utils import utc_now
+
+CONFIG = SearchConfig(
+    edge_config=EdgeSearchConfig(
+        search_methods=[
+            EdgeSearchMethod.bm25,
+            EdgeSearchMethod.cosine_similarity,
+            EdgeSearchMethod.bfs,
+        ],
+        reranker=EdgeReranker.cross_encoder,
+    )
+)
+
+
+def _edge(fact: str) -> EntityEdge:
+    return EntityEdge(
+        source_node_uuid='source',
+        target_node_uuid='target',
+        name='RELATES_TO',
+        fact=fact,
+        group_id='group',
+        created_at=utc_now(),
+    )
+
+
+def _clients(rank_delay: float, embed_delay: float = 0) -> GraphitiClients:
+    async def rank(query, passages):
+        await asyncio.sleep(rank_delay)
+        return [(passage, 1.0) for passage in reversed(passages)]
+
+    async def create(input_data):
+        await asyncio.sleep(embed_delay)
+        return [0.1, 0.2, 0.3]
+
+    embedder = MagicMock()
+    embedder.create = create
+    cross_encoder = MagicMock()
+    cross_encoder.rank = rank
+    return GraphitiClients.model_construct(  # bypass validation to allow test doubles
+        driver=MagicMock(_database='db', search_interface=None),
+        embedder=embedder,
+        cross_encoder=cross_encoder,
+        llm_client=MagicMock(),
+    )
+
+
+async def _run(
+    clients: GraphitiClients, bfs_delay: float, similarity_delay: float = 0, **kwargs
+) -> SearchResults:
+    fulltext, similar, neighbor = _edge('fulltext'), _edge('similar'), _edge('neighbor')
+
+    async def bfs_search(*args, **kwargs):
+        await asyncio.sleep(bfs_delay)
+        return [neighbor]
+
+    async def similarity_search(*args, **kwargs):
+        await asyncio.sleep(similarity_delay)
+        return [similar]
+
+    with (
+        patch(
+            'graphiti_core.search.search.edge_fulltext_search',
+            AsyncMock(return_value=[fulltext, similar]),
+        ),
+        patch('graphiti_core.search.search.edge_similarity_search', similarity_search),
+        patch('graphiti_core.search.search.edge_bfs_search', bfs_search),
+        patch(
+            'graphiti_core.search.search.hydrate_edges',
+            AsyncMock(side_effect=lambda driver, edges: edges),
+        ),
+    ):
+        return await search(clients, 'query', ['group'], CONFIG, SearchFilters(), **kwargs)
+
+
+@pytest.mark.asyncio
+async def test_search_without_timeout_runs_every_method():
+    results = await _run(_clients(rank_delay=0), bfs_delay=0.01)
+
+    assert [edge.fact for edge in results.edges] == ['neighbor', 'similar', 'fulltext']
+    metadata = results.metadata.edges
+    assert metadata is not None
+    assert metadata.search_methods == ['bm25', 'cosine_similarity', 'breadth_first_search']
+    assert metadata.reranker == 'cross_encoder'
+    assert not results.metadata.degraded
+    assert results.metadata.nodes is None
+
+
+@pytest.mark.asyncio
+async def test_search_drops_slow_methods_at_deadline():
+    cache = SearchResultCache()
+    clients = _clients(rank_delay=5)
+
+    results = await _run(clients, bfs_delay=5, timeout=0.1, cache=cache)
+
+    # BFS is cancelled and the cross-encoder falls back to rrf over bm25 and cosine results
+    assert [edge.fact for edge in results.edges] == ['similar', 'fulltext']
+    metadata = results.metadata.edges
+    assert metadata is not None
+    assert metadata.search_methods == ['bm25', 'cosine_similarity']
+    assert metadata.skipped == ['breadth_first_search', 'cross_encoder']
+    assert metadata.reranker == 'reciprocal_rank_fusion'
+    assert results.metadata.degraded
+    assert cache.stats()['size'] == 0
+
+
+@pytest.mark.asyncio
+async def test_search_cancels_bfs_first():
+    # BFS is cancelled at its share of the time, the slower similarity search still completes
+    results = await _run(_clients(rank_delay=0), bfs_delay=5, similarity_delay=0.3, timeout=0.5)
+
+    metadata = results.metadata.edges
+    assert metadata is not None
+    assert metadata.search_methods == ['bm25', 'cosine_similarity']
+    assert metadata.skipped == ['breadth_first_search']
+    assert metadata.reranker == 'cross_encoder'
+
+
+@pytest.mark.asyncio
+async def test_search_skips_vector_methods_when_embedding_times_out():
+    cache = SearchResultCache()
+    clients = _clients(rank_delay=0, embed_delay=5)
+
+    results = await _run(clients, bfs_delay=0, timeout=0.1, cache=cache)
+
+    assert [edge.fact for edge in results.edges] == ['neighbor', 'similar', 'fulltext']
+    metadata = results.metadata.edges
+    assert metadata is not None
+    assert metadata.search_methods == ['bm25', 'breadth_first_search']
+    assert metadata.skipped == ['cosine_similarity']
+    assert metadata.reranker == 'cross_encoder'
+    assert cache.stats()['size'] == 0
+
+
+@pytest.mark.asyncio
+async def test_merged_results_combine_metadata():
+    clients = _clients(rank_delay=0)
+    complete = await _run(clients, bfs_delay=0)
+    degraded = await _run(_clients(rank_delay=5), bfs_delay=5, timeout=0.1)
+
+    merged = SearchResults.merge([complete, degraded])
+
+    assert merged.metadata.edges is not None
+    assert merged.metadata.edges.reranker == 'cross_encoder'
+    assert merged.metadata.edges.skipped == ['breadth_first_search', 'cross_encoder']
+    assert merged.metadata.degraded
@@ -0,0 +1,193 @@
+"""
+Copyright 2024, Zep Software, Inc.
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from graphiti_core.edges import EntityEdge
+from graphiti_core.graphiti_types import GraphitiClients
+from graphiti_core.search.search import search
+from graphiti_core.search.search_config import (
+    EdgeReranker,
+    EdgeSearchConfig,
+    EdgeSearchMethod,
+    SearchConfig,
+)
+from graphiti_core.search.search_filters import SearchFilters
+from graphiti_core.utils.datetime_utils import utc_now
+
+
+def _edge(fact: str, group_id: str, episodes: int = 0, source: str = 'source') -> EntityEdge:
+    return EntityEdge(
+        source_node_uuid=source,
+        target_node_uuid='target',
+        name='RELATES_TO',
+        fact=fact,
+        group_id=group_id,
+        episodes=[f'episode {i}' for i in range(episodes)],
+        created_at=utc_now(),
+    )
+
+
+SHARD_EDGES = {
+    'alpha': [_edge('alpha 0.9', 'alpha'), _edge('alpha 0.2', 'alpha')],
+    'beta': [_edge('beta 0.8', 'beta'), _edge('beta 0.7', 'beta')],
+}
+
+
+def _clients() -> GraphitiClients:
+    shards = {
+        group_id: MagicMock(_database=group_id, search_interface=None)
+        for group_id in ('alpha', 'beta')
+    }
+    driver = MagicMock(_database='default', search_interface=None)
+    driver.shard_group_ids = lambda group_ids: [
+        (shards[group_id], [group_id]) for group_id in group_ids
+    ]
+
+    async def rank(query, passages):
+        # Scores are encoded in the facts
+        return sorted(
+            ((passage, float(passage.split()[1])) for passage in passages),
+            key=lambda pair: pair[1],
+            reverse=True,
+        )
+
+    cross_encoder = MagicMock()
+    cross_encoder.rank = rank
+    embedder = MagicMock()
+    embedder.create = AsyncMock(return_value=[0.1, 0.2, 0.3])
+    return GraphitiClients.model_construct(  # bypass validation to allow test doubles
+        driver=driver,
+        embedder=embedder,
+        cross_encoder=cross_encoder,
+        llm_client=MagicMock(),
+    )
+
+
+async def _search(
+    clients: GraphitiClients,
+    reranker: EdgeReranker,
+    group_ids: list[str] | None = None,
+    shard_edges: dict[str, list[EntityEdge]] = SHARD_EDGES,
+    center_node_uuid: str | None = None,
+):
+    async def fulltext_search(driver, query, search_filter, group_ids, limit, **kwargs):
+        # Each shard is searched through its own driver
+        assert group_ids == [driver._database]
+        return shard_edges[driver._database][:limit]
+
+    config = SearchConfig(
+        edge_config=EdgeSearchConfig(
+            search_methods=[EdgeSearchMethod.bm25, EdgeSearchMethod.cosine_similarity],
+            reranker=reranker,
+        ),
+        limit=3,
+    )
+    with (
+        patch('graphiti_core.search.search.edge_fulltext_search', fulltext_search),
+        patch('graphiti_core.search.search.edge_similarity_search', AsyncMock(return_value=[])),
+        patch(
+            'graphiti_core.search.search.hydrate_edges',
+            AsyncMock(side_effect=lambda driver, edges: edges),
+        ),
+    ):
+        return await search(
+            clients,
+            'query',
+            group_ids or list(shard_edges),
+            config,
+            SearchFilters(),
+            center_node_uuid,
+        )
+
+
+@pytest.mark.asyncio
+async def test_scatter_search_ranks_cross_encoder_scores_globally():
+    clients = _clients()
+
+    results = await _search(clients, EdgeReranker.cross_encoder)
+
+    assert [edge.fact for edge in results.edges] == ['alpha 0.9', 'beta 0.8', 'beta 0.7']
+    assert results.edge_reranker_scores == [0.9, 0.8, 0.7]
+    # The query is embedded once for every shard
+    clients.embedder.create.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_scatter_search_fuses_shard_rankings():
+    results = await _search(_clients(), EdgeReranker.rrf)
+
+    # rrf scores are relative to each shard, so the shard rankings are interleaved
+    assert len(results.edges) == 3
+    assert {edge.fact for edge in results.edges[:2]} == {'alpha 0.9', 'beta 0.8'}
+    assert results.edge_reranker_scores == sorted(results.edge_reranker_scores, reverse=True)
+    assert results.metadata.edges is not None
+    assert results.metadata.edges.search_methods == ['bm25', 'cosine_similarity']
+
+
+@pytest.mark.asyncio
+async def test_single_shard_search_uses_the_shard_driver():
+    results = await _search(_clients(), EdgeReranker.cross_encoder, group_ids=['beta'])
+
+    assert [edge.fact for edge in results.edges] == ['beta 0.8', 'beta 0.7']
+
+
+@pytest.mark.asyncio
+async def test_scatter_search_fuses_episode_mentions_rankings():
+    shard_edges = {
+        'alpha': [
+            _edge('alpha few', 'alpha', episodes=1),
+            _edge('alpha many', 'alpha', episodes=3),
+        ],
+        'beta': [_edge('beta few', 'beta', episodes=0), _edge('beta many', 'beta', episodes=2)],
+    }
+
+    results = await _search(_clients(), EdgeReranker.episode_mentions, shard_edges=shard_edges)
+
+    # Mention counts order each shard, the shard rankings are then fused
+    assert [edge.fact for edge in results.edges] == ['alpha many', 'beta many', 'alpha few']
+    assert results.edge_reranker_scores == [1.0, 1.0, 0.5]
+
+
+@pytest.mark.asyncio
+async def test_scatter_search_ranks_node_distances_globally():
+    shard_edges = {
+        'alpha': [
+            _edge('alpha mid', 'alpha', source='mid'),
+            _edge('alpha near', 'alpha', source='near'),
+        ],
+        'beta': [_edge('beta far', 'beta', source='far'), _edge('beta other', 'beta')],
+    }
+    # Only the shard holding the center node can reach it; elsewhere every distance is infinite
+    distances = {'near': 1.0, 'mid': 2.0}
+
+    async def node_distance_reranker(driver, node_uuids, center_node_uuid, **kwargs):
+        scores = {
+            uuid: 1 / distances[uuid] if driver._database == 'alpha' else 0.0 for uuid in node_uuids
+        }
+        ranked = sorted(node_uuids, key=lambda uuid: scores[uuid], reverse=True)
+        return ranked, [scores[uuid] for uuid in ranked]
+
+    with patch('graphiti_core.search.search.node_distance_reranker', node_distance_reranker):
+        results = await _search(
+            _clients(), EdgeReranker.node_distance, shard_edges=shard_edges, center_node_uuid='c'
+        )
+
+    # The center's neighbours are not interleaved with unreachable edges from other shards
+    assert [edge.fact for edge in results.edges][:2] == ['alpha near', 'alpha mid']
+    assert results.edge_reranker_scores == [1.0, 0.5, 0.0]
@@ -0,0 +1,84 @@
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from graphiti_core.edges import EntityEdge
+from graphiti_core.graphiti_types import GraphitiClients
+from graphiti_core.search.search import search_stream
+from graphiti_core.search.search_config import (
+    EdgeReranker,
+    EdgeSearchConfig,
+    EdgeSearchMethod,
+    SearchConfig,
+    SearchStage,
+)
+from graphiti_core.search.search_filters import SearchFilters
+from graphiti_core.utils.datetime_utils import utc_now
+
+
+def _edge(fact: str) -> EntityEdge:
+    return EntityEdge(
+        source_node_uuid='source',
+        target_node_uuid='target',
+        name='RELATES_TO',
+        fact=fact,
+        group_id='group',
+        created_at=utc_now(),
+    )
+
+
+@pytest.mark.asyncio
+async def test_search_stream_yields_each_stage_in_order():
+    fulltext, similar = _edge('fulltext'), _edge('similar')
+    similarity_started = asyncio.Event()
+
+    async def similarity_search(*args, **kwargs):
+        similarity_started.set()
+        await asyncio.sleep(0.05)
+        return [similar]
+
+    async def rank(query, passages):
+        return [(passage, 1.0) for passage in sorted(passages)]
+
+    cross_encoder = MagicMock()
+    cross_encoder.rank = rank
+    embedder = MagicMock()
+    embedder.create = AsyncMock(return_value=[0.1, 0.2, 0.3])
+    clients = GraphitiClients.model_construct(  # bypass validation to allow test doubles
+        driver=MagicMock(_database='db', search_interface=None),
+        embedder=embedder,
+        cross_encoder=cross_encoder,
+        llm_client=MagicMock(),
+    )
+    config = SearchConfig(
+        edge_config=EdgeSearchConfig(
+            search_methods=[EdgeSearchMethod.bm25, EdgeSearchMethod.cosine_similarity],
+            reranker=EdgeReranker.cross_encoder,
+        ),
+        limit=1,
+    )
+
+    with (
+        patch(
+            'graphiti_core.search.search.edge_fulltext_search',
+            AsyncMock(return_value=[fulltext, similar]),
+        ),
+        patch('graphiti_core.search.search.edge_similarity_search', similarity_search),
+        patch(
+            'graphiti_core.search.search.hydrate_edges',
+            AsyncMock(side_effect=lambda driver, edges: edges),
+        ),
+    ):
+        stages = []
+        async for results in search_stream(clients, 'query', ['group'], config, SearchFilters()):
+            if not stages:
+                # Fulltext hits arrive while the similarity search is still running
+                assert similarity_started.is_set()
+            stages.append((results.metadata.stage, [edge.fact for edge in results.edges]))
+
+    assert stages == [
+        (SearchStage.bm25, ['fulltext']),
+        (SearchStage.fused, ['similar']),
+        (SearchStage.reranked, ['fulltext']),
+    ]
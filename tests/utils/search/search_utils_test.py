@@ -1,10 +1,27 @@
+from datetime import datetime
 from unittest.mock import AsyncMock, patch
 
 import pytest
 
+from graphiti_core.driver.driver import GraphProvider
+from graphiti_core.edges import EntityEdge
 from graphiti_core.nodes import EntityNode
+from graphiti_core.search import search_utils
 from graphiti_core.search.search_filters import SearchFilters
-from graphiti_core.search.search_utils import hybrid_node_search
+from graphiti_core.search.search_utils import (
+    MAX_QUERY_LENGTH,
+    edge_similarity_search,
+    episode_mentions_reranker,
+    fulltext_query,
+    get_edge_invalidation_candidates,
+    get_relevant_edges,
+    get_relevant_nodes,
+    hybrid_node_search,
+    node_distance_reranker,
+    node_hybrid_search,
+    node_similarity_search,
+    supports_hybrid_search,
+)
 
 
 @pytest.mark.asyncio
@@ -161,3 +178,226 @@ async def test_hybrid_node_search_with_limit_and_duplicates():
         mock_similarity_search.assert_called_with(
             mock_driver, [0.1, 0.2, 0.3], SearchFilters(), ['1'], 4
         )
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    'provider,index_query,scan_query',
+    [
+        (GraphProvider.NEO4J, 'db.index.vector.queryNodes', 'vector.similarity.cosine'),
+        (GraphProvider.FALKORDB, 'db.idx.vector.queryNodes', 'vec.cosineDistance'),
+    ],
+)
+@pytest.mark.parametrize('index_exists', [True, False])
+async def test_node_similarity_search_uses_vector_index_when_available(
+    provider, index_query, scan_query, index_exists
+):
+    mock_driver = AsyncMock()
+    mock_driver.provider = provider
+    mock_driver.search_interface = None
+    mock_driver.vector_index_exists.return_value = index_exists
+    mock_driver.execute_query.return_value = ([], None, None)
+
+    await node_similarity_search(
+        mock_driver, [0.1, 0.2, 0.3], SearchFilters(node_labels=['Person']), ['1'], limit=5
+    )
+
+    query = mock_driver.execute_query.call_args.args[0]
+    params = mock_driver.execute_query.call_args.kwargs
+    if index_exists:
+        assert index_query in query
+        assert 'n.group_id IN $group_ids' in query
+        assert 'n:Person' in query
+        assert params['vector_candidates'] > 5
+    else:
+        assert scan_query in query
+        assert 'vector_candidates' not in params
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize('provider', [GraphProvider.NEO4J, GraphProvider.FALKORDB])
+async def test_similarity_search_scans_embedding_prefix_first(monkeypatch, provider):
+    monkeypatch.setattr(search_utils, 'EMBEDDING_PREFIX_DIM', 2)
+    mock_driver = AsyncMock()
+    mock_driver.provider = provider
+    mock_driver.search_interface = None
+    mock_driver.vector_index_exists.return_value = False
+    mock_driver.execute_query.return_value = ([], None, None)
+
+    await node_similarity_search(
+        mock_driver, [0.1, 0.2, 0.3], SearchFilters(), ['1'], limit=5, prefix_rescore_factor=4
+    )
+    node_query = mock_driver.execute_query.call_args.args[0]
+    node_params = mock_driver.execute_query.call_args.kwargs
+
+    await edge_similarity_search(
+        mock_driver, [0.1, 0.2, 0.3], None, None, SearchFilters(), ['1'], 5, 0.5, 4
+    )
+    edge_query = mock_driver.execute_query.call_args.args[0]
+    edge_params = mock_driver.execute_query.call_args.kwargs
+
+    if provider == GraphProvider.NEO4J:
+        assert 'n.name_embedding_prefix' in node_query
+        assert 'e.fact_embedding_prefix' in edge_query
+        for params in (node_params, edge_params):
+            assert params['search_prefix'] == [0.1, 0.2]
+            assert params['prefix_candidates'] == 20
+    else:
+        # Only Neo4j stores prefixes, other providers scan the full embeddings
+        assert 'prefix_score' not in node_query
+        assert 'search_prefix' not in edge_params
+
+
+@pytest.mark.asyncio
+async def test_relevant_edge_queries_send_slim_payloads():
+    mock_driver = AsyncMock()
+    mock_driver.provider = GraphProvider.NEO4J
+    mock_driver.execute_query.return_value = ([], None, None)
+    edge = EntityEdge(
+        source_node_uuid='a',
+        target_node_uuid='b',
+        name='KNOWS',
+        fact='Alice knows Bob',
+        fact_embedding=[0.1, 0.2],
+        group_id='1',
+        episodes=['episode'],
+        created_at=datetime.now(),
+    )
+
+    for search in (get_relevant_edges, get_edge_invalidation_candidates):
+        assert await search(mock_driver, [edge], SearchFilters()) == [[]]
+
+        query = mock_driver.execute_query.call_args.args[0]
+        assert mock_driver.execute_query.call_args.kwargs['edges'] == [
+            {
+                'uuid': edge.uuid,
+                'source_node_uuid': 'a',
+                'target_node_uuid': 'b',
+                'group_id': '1',
+                'fact_embedding': [0.1, 0.2],
+            }
+        ]
+        assert 'fact_embedding: e.fact_embedding' not in query
+        assert 'e {.*, fact_embedding: null' in query
+
+
+@pytest.mark.asyncio
+async def test_get_relevant_nodes_uses_search_interface_per_node():
+    mock_driver = AsyncMock()
+    mock_driver.provider = GraphProvider.NEO4J
+    match = EntityNode(name='Alice', group_id='1', labels=[], created_at=datetime.now())
+    mock_driver.search_interface.node_similarity_search.return_value = [match]
+    mock_driver.search_interface.node_fulltext_search.return_value = [match]
+    nodes = [
+        EntityNode(name=name, group_id='1', name_embedding=[0.1], created_at=datetime.now())
+        for name in ('Alice', 'Alice Smith')
+    ]
+
+    relevant = await get_relevant_nodes(mock_driver, nodes, SearchFilters())
+
+    assert relevant == [[match], [match]]
+    assert mock_driver.search_interface.node_similarity_search.call_count == 2
+    mock_driver.execute_query.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_episode_mentions_reranker_reads_stored_counts():
+    mock_driver = AsyncMock()
+    mock_driver.provider = GraphProvider.NEO4J
+    mock_driver.execute_query.side_effect = [
+        (
+            [
+                {'uuid': 'a', 'score': 3},
+                {'uuid': 'b', 'score': None},
+                {'uuid': 'c', 'score': 0},
+            ],
+            None,
+            None,
+        ),
+        ([{'uuid': 'b', 'score': 1}], None, None),
+    ]
+
+    uuids, scores = await episode_mentions_reranker(mock_driver, [['a', 'b', 'c']])
+
+    assert uuids == ['b', 'a', 'c']
+    assert scores == [1, 3, float('inf')]
+    # Only the entity without a stored count is counted live
+    assert mock_driver.execute_query.call_args.kwargs['node_uuids'] == ['b']
+
+
+@pytest.mark.asyncio
+async def test_node_distance_reranker_expands_one_hop_per_query():
+    # A dense graph: every entity of a clique is linked to every other and to the hub
+    clique = [f'c{i}' for i in range(6)]
+    adjacency = {'center': {'hub'}, 'hub': {'center', *clique}, 'far': {'c0'}}
+    for uuid in clique:
+        adjacency[uuid] = {'hub', *clique} - {uuid}
+    adjacency['c0'].add('far')
+
+    async def execute_query(query, uuids, **kwargs):
+        neighbors = set().union(*(adjacency[uuid] for uuid in uuids))
+        return [{'uuid': uuid} for uuid in sorted(neighbors)], None, None
+
+    mock_driver = AsyncMock()
+    mock_driver.provider = GraphProvider.FALKORDB
+    mock_driver.adjacency_cache = None
+    mock_driver.execute_query.side_effect = execute_query
+
+    uuids, scores = await node_distance_reranker(
+        mock_driver, ['far', 'c3', 'hub', 'missing'], 'center', max_depth=4
+    )
+
+    assert uuids == ['hub', 'c3', 'far', 'missing']
+    assert scores == [1.0, 0.5, 1 / 3, 0.0]
+    # One query per hop, rather than a variable-length path match
+    assert mock_driver.execute_query.await_count == 4
+    assert 'RELATES_TO*' not in mock_driver.execute_query.call_args.args[0]
+
+
+@pytest.mark.asyncio
+async def test_node_hybrid_search_runs_both_methods_in_one_query():
+    mock_driver = AsyncMock()
+    mock_driver.provider = GraphProvider.NEO4J
+    mock_driver.search_interface = None
+    mock_driver.vector_index_exists.return_value = True
+    now = datetime.now()
+    mock_driver.execute_query.return_value = (
+        [
+            {'method': 0, 'uuid': 'a', 'name': 'Alice', 'group_id': '1', 'created_at': now},
+            {'method': 1, 'uuid': 'b', 'name': 'Bob', 'group_id': '1', 'created_at': now},
+            {'method': 1, 'uuid': 'a', 'name': 'Alice', 'group_id': '1', 'created_at': now},
+        ],
+        None,
+        None,
+    )
+    assert supports_hybrid_search(mock_driver)
+
+    fulltext, similarity = await node_hybrid_search(
+        mock_driver, 'Alice', [0.1, 0.2], SearchFilters(), ['1'], limit=5, hydrate=False
+    )
+
+    assert [node.uuid for node in fulltext] == ['a']
+    assert [node.uuid for node in similarity] == ['b', 'a']
+    mock_driver.execute_query.assert_awaited_once()
+    query = mock_driver.execute_query.call_args.args[0]
+    assert 'db.index.fulltext.queryNodes' in query
+    assert 'db.index.vector.queryNodes' in query
+    assert 'UNION ALL' in query
+    assert 'n.summary' not in query
+
+    mock_driver.search_interface = AsyncMock()
+    assert not supports_hybrid_search(mock_driver)
+
+
+def test_fulltext_query_leaves_out_groups_past_the_clause_limit():
+    mock_driver = AsyncMock()
+    mock_driver.provider = GraphProvider.NEO4J
+    mock_driver.fulltext_syntax = ''
+
+    assert fulltext_query('alice', ['1', '2'], mock_driver) == (
+        'group_id:"1" OR group_id:"2" AND (alice)'
+    )
+    # The searches filter their matches by group_id, so the query still runs
+    group_ids = [str(i) for i in range(MAX_QUERY_LENGTH)]
+    assert fulltext_query('alice', group_ids, mock_driver) == '(alice)'
+    assert fulltext_query(' '.join(['Alice'] * MAX_QUERY_LENGTH), ['1'], mock_driver) == ''
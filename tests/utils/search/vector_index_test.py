@@ -0,0 +1,252 @@
+from datetime import datetime, timezone
+
+import numpy as np
+import pytest
+
+from graphiti_core.driver.search_interface.local_vector_search import LocalVectorSearchInterface
+from graphiti_core.edges import EntityEdge
+from graphiti_core.nodes import EntityNode
+from graphiti_core.search import vector_index
+from graphiti_core.search.search_filters import SearchFilters
+from graphiti_core.search.vector_index import IVFFlatIndex, Quantization
+
+
+def _clustered_vectors(rng, count: int, dim: int = 32, clusters: int = 20):
+    centers = rng.normal(size=(clusters, dim))
+    return centers[rng.integers(clusters, size=count)] + 0.3 * rng.normal(size=(count, dim))
+
+
+def _brute_force(vectors, query, limit):
+    normalized = vectors / np.linalg.norm(vectors, axis=1, keepdims=True)
+    return np.argsort(-(normalized @ (query / np.linalg.norm(query))))[:limit]
+
+
+def _cosine(a, b) -> float:
+    return float(np.dot(a, b) / (np.linalg.norm(a) * np.linalg.norm(b)))
+
+
+@pytest.mark.parametrize(
+    'quantization,rescore_factor',
+    [
+        (Quantization.none, None),
+        (Quantization.float16, None),
+        (Quantization.int8, None),
+        # 32 sign bits rank too coarsely for the default shortlist
+        (Quantization.binary, 40),
+    ],
+)
+def test_ivf_index_recall_against_brute_force(monkeypatch, quantization, rescore_factor):
+    monkeypatch.setattr(vector_index, 'IVF_TRAIN_THRESHOLD', 500)
+    rng = np.random.default_rng(0)
+    vectors = _clustered_vectors(rng, 2000)
+    uuids = [str(i) for i in range(len(vectors))]
+
+    index = IVFFlatIndex(
+        vectors.shape[1], nprobe=8, quantization=quantization, rescore_factor=rescore_factor
+    )
+    index.upsert(uuids, vectors)
+    assert index.centroids is not None
+
+    recalls = []
+    for query in _clustered_vectors(rng, 20):
+        expected = {str(i) for i in _brute_force(vectors, query, 10)}
+        results = index.search(query, 10)
+        found = {uuid for uuid, _ in results}
+        recalls.append(len(expected & found) / 10)
+        # Returned scores are always exact
+        for uuid, score in results:
+            assert score == pytest.approx(_cosine(vectors[int(uuid)], query), abs=1e-5)
+
+    assert np.mean(recalls) >= 0.9
+
+
+def test_ivf_index_upsert_and_remove():
+    index = IVFFlatIndex(3)
+    index.upsert(['a', 'b'], [[1.0, 0.0, 0.0], [0.0, 1.0, 0.0]])
+    index.upsert(['a'], [[0.0, 0.0, 1.0]])
+
+    assert len(index) == 2
+    assert index.search([0.0, 0.0, 1.0], 1)[0][0] == 'a'
+
+    index.remove(['a'])
+
+    assert 'a' not in index
+    assert [uuid for uuid, _ in index.search([0.0, 0.0, 1.0], 5)] == ['b']
+    assert index.score([0.0, 1.0, 0.0], ['a', 'b']) == [('b', pytest.approx(1.0))]
+
+
+@pytest.mark.parametrize('quantization', [Quantization.none, Quantization.int8])
+def test_ivf_index_reopens_from_disk(tmp_path, monkeypatch, quantization):
+    monkeypatch.setattr(vector_index, 'IVF_TRAIN_THRESHOLD', 100)
+    rng = np.random.default_rng(1)
+    vectors = _clustered_vectors(rng, 3000, dim=8)
+    uuids = [str(i) for i in range(len(vectors))]
+
+    index = IVFFlatIndex(8, path=tmp_path, quantization=quantization)
+    index.upsert(uuids, vectors)
+    index.remove(['0'])
+    index.flush()
+
+    reopened = IVFFlatIndex.open(tmp_path)
+
+    assert reopened.quantization == quantization
+    assert len(reopened) == len(vectors) - 1
+    assert '0' not in reopened
+    assert reopened.search(vectors[5], 3) == index.search(vectors[5], 3)
+
+
+def _node(uuid: str, embedding: list[float], labels: list[str] | None = None) -> EntityNode:
+    return EntityNode(
+        uuid=uuid,
+        name=uuid,
+        group_id='group',
+        labels=labels or [],
+        name_embedding=embedding,
+        created_at=datetime.now(timezone.utc),
+    )
+
+
+def _edge(uuid: str, name: str, embedding: list[float]) -> EntityEdge:
+    return EntityEdge(
+        uuid=uuid,
+        name=name,
+        group_id='group',
+        source_node_uuid='a',
+        target_node_uuid='b',
+        fact=uuid,
+        fact_embedding=embedding,
+        episodes=[],
+        created_at=datetime.now(timezone.utc),
+    )
+
+
+@pytest.fixture
+def graph(monkeypatch):
+    nodes = {
+        node.uuid: node
+        for node in [
+            _node('alice', [1.0, 0.0, 0.0], ['Person']),
+            _node('acme', [0.9, 0.1, 0.0], ['Company']),
+            _node('paris', [0.0, 1.0, 0.0]),
+        ]
+    }
+    edges = {
+        edge.uuid: edge
+        for edge in [
+            _edge('works_at', 'WORKS_AT', [1.0, 0.0, 0.0]),
+            _edge('lives_in', 'LIVES_IN', [0.95, 0.05, 0.0]),
+        ]
+    }
+    loads = []
+
+    def paged(items):
+        async def get_by_group_ids(
+            driver, group_ids, limit=None, uuid_cursor=None, with_embeddings=False
+        ):
+            loads.append(group_ids)
+            ordered = sorted(
+                (item for item in items.values() if item.group_id in group_ids),
+                key=lambda item: item.uuid,
+                reverse=True,
+            )
+            if uuid_cursor is not None:
+                ordered = [item for item in ordered if item.uuid < uuid_cursor]
+            return ordered[:limit]
+
+        return get_by_group_ids
+
+    def by_uuids(items):
+        async def get_by_uuids(driver, uuids):
+            return [items[uuid] for uuid in uuids if uuid in items]
+
+        return get_by_uuids
+
+    monkeypatch.setattr(EntityNode, 'get_by_group_ids', paged(nodes))
+    monkeypatch.setattr(EntityNode, 'get_by_uuids', by_uuids(nodes))
+    monkeypatch.setattr(EntityEdge, 'get_by_group_ids', paged(edges))
+    monkeypatch.setattr(EntityEdge, 'get_by_uuids', by_uuids(edges))
+    return nodes, edges, loads
+
+
+@pytest.mark.asyncio
+async def test_local_search_loads_group_once_and_filters_by_label(graph):
+    nodes, _, loads = graph
+    interface = LocalVectorSearchInterface(bootstrap_page_size=2)
+
+    results = await interface.node_similarity_search(
+        None, [1.0, 0.0, 0.0], SearchFilters(), ['group'], limit=5, min_score=0.5
+    )
+    assert [node.uuid for node in results] == ['alice', 'acme']
+
+    results = await interface.node_similarity_search(
+        None, [1.0, 0.0, 0.0], SearchFilters(node_labels=['Company']), ['group'], min_score=0.5
+    )
+    assert [node.uuid for node in results] == ['acme']
+    # Two pages each of nodes and edges, only for the first search
+    assert len(loads) == 4
+
+    await interface.remove_from_index(None, ['alice'])
+    nodes['new'] = _node('new', [1.0, 0.0, 0.0])
+    await interface.index_entity_nodes(None, [nodes['new']])
+
+    results = await interface.node_similarity_search(
+        None, [1.0, 0.0, 0.0], SearchFilters(), ['group'], limit=5, min_score=0.5
+    )
+    assert [node.uuid for node in results] == ['new', 'acme']
+
+
+@pytest.mark.asyncio
+async def test_local_search_edges_and_unsupported_filters(graph):
+    interface = LocalVectorSearchInterface()
+
+    results = await interface.edge_similarity_search(
+        None, [1.0, 0.0, 0.0], None, None, SearchFilters(edge_types=['LIVES_IN']), ['group']
+    )
+    assert [edge.uuid for edge in results] == ['lives_in']
+
+    results = await interface.edge_similarity_search(
+        None, [0.0, 1.0, 0.0], None, None, SearchFilters(edge_uuids=['works_at']), ['group'], 10, 0
+    )
+    assert [edge.uuid for edge in results] == ['works_at']
+
+    with pytest.raises(NotImplementedError):
+        await interface.edge_similarity_search(
+            None, [1.0, 0.0, 0.0], 'alice', None, SearchFilters(), ['group']
+        )
+    with pytest.raises(NotImplementedError):
+        await interface.node_similarity_search(None, [1.0, 0.0, 0.0], SearchFilters(), None)
+
+
+@pytest.mark.asyncio
+async def test_local_search_persists_loaded_groups(graph, tmp_path):
+    _, _, loads = graph
+    interface = LocalVectorSearchInterface(path=str(tmp_path))
+    await interface.node_similarity_search(None, [1.0, 0.0, 0.0], SearchFilters(), ['group'])
+    load_count = len(loads)
+
+    reopened = LocalVectorSearchInterface(path=str(tmp_path))
+    results = await reopened.node_similarity_search(
+        None, [0.0, 1.0, 0.0], SearchFilters(), ['group']
+    )
+
+    assert [node.uuid for node in results] == ['paris']
+    assert len(loads) == load_count
+
+
+@pytest.mark.asyncio
+async def test_local_search_remove_group(graph, tmp_path):
+    _, _, loads = graph
+    interface = LocalVectorSearchInterface(path=str(tmp_path))
+    await interface.node_similarity_search(None, [1.0, 0.0, 0.0], SearchFilters(), ['group'])
+    load_count = len(loads)
+
+    await interface.remove_group(None, 'group')
+
+    # The group stays loaded and empty, also after a restart
+    for reopened in [interface, LocalVectorSearchInterface(path=str(tmp_path))]:
+        results = await reopened.node_similarity_search(
+            None, [1.0, 0.0, 0.0], SearchFilters(), ['group']
+        )
+        assert results == []
+    assert len(loads) == load_count
+    assert sorted(path.name for path in tmp_path.iterdir()) == ['groups.json', 'partitions.json']
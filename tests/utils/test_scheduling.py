@@ -0,0 +1,165 @@
+import asyncio
+
+import pytest
+
+from graphiti_core.utils.scheduling import (
+    GroupFairScheduler,
+    _holding_slot,
+    scheduled,
+    scheduled_call,
+    scheduled_stream,
+)
+
+
+async def _hold_slot(scheduler: GroupFairScheduler, release: asyncio.Event):
+    async with scheduler.slot('blocker'):
+        await release.wait()
+
+
+async def _run_jobs(scheduler: GroupFairScheduler, jobs: list[str], order: list[str]):
+    unblock = asyncio.Event()
+
+    async def job(group_id: str):
+        async with scheduler.slot(group_id):
+            order.append(group_id)
+
+    # Occupy the only slot so every job queues before dispatch begins
+    blocker = asyncio.create_task(_hold_slot(scheduler, unblock))
+    await asyncio.sleep(0)
+    tasks = [asyncio.create_task(job(group_id)) for group_id in jobs]
+    await asyncio.sleep(0)
+
+    unblock.set()
+    await asyncio.gather(blocker, *tasks)
+
+
+@pytest.mark.asyncio
+async def test_backlogged_group_does_not_starve_others():
+    scheduler = GroupFairScheduler(capacity=1)
+    order: list[str] = []
+
+    await _run_jobs(scheduler, ['bulk'] * 6 + ['interactive'] * 2, order)
+
+    # Equal weights interleave the groups instead of serving the bulk backlog first
+    assert order[:4] == ['bulk', 'interactive', 'bulk', 'interactive']
+
+
+@pytest.mark.asyncio
+async def test_weights_set_share_of_capacity():
+    scheduler = GroupFairScheduler(capacity=1, weights={'heavy': 3.0})
+    order: list[str] = []
+
+    await _run_jobs(scheduler, ['heavy'] * 6 + ['light'] * 6, order)
+
+    assert order[:8].count('heavy') == 6
+    assert order[:8].count('light') == 2
+
+
+@pytest.mark.asyncio
+async def test_caps_bound_concurrent_slots_per_group():
+    scheduler = GroupFairScheduler(capacity=4, caps={'capped': 1})
+    running = 0
+    max_running = 0
+
+    async def job():
+        nonlocal running, max_running
+        async with scheduler.slot('capped'):
+            running += 1
+            max_running = max(max_running, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+
+    await asyncio.gather(*[job() for _ in range(4)])
+
+    assert max_running == 1
+    assert scheduler.queue_wait_stats()['capped']['count'] == 4
+
+
+@pytest.mark.asyncio
+async def test_nested_slots_are_reentrant():
+    scheduler = GroupFairScheduler(capacity=1)
+
+    async def inner():
+        async with scheduled(scheduler, 'group'):
+            return 'done'
+
+    async with scheduler.slot('group'):
+        result = await asyncio.wait_for(scheduled_call(scheduler, 'group', inner()), timeout=1)
+
+    assert result == 'done'
+    assert scheduler.queue_wait_stats()['group']['count'] == 1
+
+
+@pytest.mark.asyncio
+async def test_cancelled_waiter_releases_its_place():
+    scheduler = GroupFairScheduler(capacity=1)
+
+    async def waiter():
+        async with scheduler.slot('group'):
+            pass
+
+    unblock = asyncio.Event()
+    blocker = asyncio.create_task(_hold_slot(scheduler, unblock))
+    await asyncio.sleep(0)
+
+    task = asyncio.create_task(waiter())
+    await asyncio.sleep(0)
+    assert scheduler.queue_depths() == {'blocker': 0, 'group': 1}
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+
+    unblock.set()
+    await blocker
+
+    # The slot is free again and can be acquired immediately
+    await asyncio.wait_for(scheduled_call(scheduler, 'other', asyncio.sleep(0)), timeout=1)
+    assert scheduler.queue_depths()['group'] == 0
+
+
+@pytest.mark.asyncio
+async def test_scheduled_without_scheduler_is_a_no_op():
+    assert await scheduled_call(None, 'group', asyncio.sleep(0, result=1)) == 1
+
+
+@pytest.mark.asyncio
+async def test_cancelled_stream_releases_its_slot():
+    scheduler = GroupFairScheduler(capacity=1)
+    first_item = asyncio.Event()
+    holding: list[bool] = []
+
+    async def items():
+        for i in range(3):
+            yield i
+
+    async def consume():
+        async for _ in scheduled_stream(scheduler, 'group', items()):
+            # The consumer handles items outside the slot
+            holding.append(_holding_slot.get())
+            first_item.set()
+            await asyncio.Event().wait()
+
+    task = asyncio.create_task(consume())
+    await first_item.wait()
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+
+    assert holding == [False]
+    await asyncio.wait_for(scheduled_call(scheduler, 'other', asyncio.sleep(0)), timeout=1)
+
+
+@pytest.mark.asyncio
+async def test_slot_closed_from_another_context_is_released():
+    scheduler = GroupFairScheduler(capacity=1)
+
+    async def holder():
+        async with scheduler.slot('group'):
+            yield
+
+    generator = holder()
+    await asyncio.create_task(anext(generator))
+    # Closing in a different context than the slot was taken in must still free it
+    await asyncio.create_task(generator.aclose())
+
+    await asyncio.wait_for(scheduled_call(scheduler, 'other', asyncio.sleep(0)), timeout=1)